@@ -1,5 +1,10 @@
 #!/bin/bash
 # Purpose: Export n8n workflows from the automation platform
-# Created/Updated: 2025-11-19 19:49
-# Agent: Init Agent
+# Created/Updated: 2026-10-16
+# Agent: BACKEND_AGENT
+#
+# CI entry point; see ops/scripts/export_workflows.py for options.
 
+set -euo pipefail
+
+exec "$(dirname "${BASH_SOURCE[0]}")/../ops/scripts/export_workflows.sh" "$@"
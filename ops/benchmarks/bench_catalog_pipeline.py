@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Purpose: Benchmark each stage of catalog generation on synthetic corpora
+Created/Updated: 2026-10-16
+Agent: BACKEND_AGENT
+
+For each corpus size, generates a synthetic corpus with workflow_corpus.py
+and runs the generate_catalog.py pipeline against it in a fresh interpreter,
+timing each stage:
+- scan: list workflow files and fingerprint them (stat + sha256)
+- parse: stream the catalog fields out of every file
+- extract: build catalog entries from node facts
+- merge: build the catalog and merge it with an existing one
+- dump: write the YAML catalog, JSON sidecar and SQLite index
+
+Per stage it records wall time, throughput (workflows/s) and peak RSS.
+Peak RSS is reset between stages via /proc/self/clear_refs where the
+kernel supports it; otherwise it is the process peak so far. Results are
+written as JSON to --output.
+
+Usage:
+    python ops/benchmarks/bench_catalog_pipeline.py
+    python ops/benchmarks/bench_catalog_pipeline.py --workflows 1000 10000 50000 --output results.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+import yaml
+
+BENCHMARKS_DIR = Path(__file__).parent
+sys.path.insert(0, str(BENCHMARKS_DIR.parent / "scripts"))
+
+from bench_workflow_parsing import peak_rss_mb  # noqa: E402
+from workflow_corpus import generate_corpus  # noqa: E402
+
+DEFAULT_OUTPUT = BENCHMARKS_DIR / "results" / "catalog_pipeline.json"
+STAGES = ["scan", "parse", "extract", "merge", "dump"]
+
+# Share of entries in the simulated existing catalog that carry manual fields,
+# and of workflows that were removed since it was written
+MANUAL_EDIT_RATE = 0.1
+REMOVED_RATE = 0.01
+
+
+def reset_peak_rss() -> bool:
+    """Reset the kernel's peak RSS counter for this process (Linux only)."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def existing_catalog_for(catalog: Dict[str, Any]) -> Dict[str, Any]:
+    """Simulate a previously written catalog with manual edits and since-removed workflows."""
+    existing = json.loads(json.dumps(catalog))
+    workflows = existing["catalog"]["workflows"]
+    edit_every = int(1 / MANUAL_EDIT_RATE)
+    for index, workflow in enumerate(workflows):
+        if index % edit_every == 0:
+            workflow["owner"] = "platform-team"
+            workflow["risk_level"] = "medium"
+    removed_count = max(1, int(len(workflows) * REMOVED_RATE))
+    for index in range(removed_count):
+        workflows.append({**workflows[index], "id": f"removed_workflow_{index:06d}"})
+    return existing
+
+
+def run_pipeline(workflows_dir: Path, output_dir: Path) -> Dict[str, Any]:
+    """Run the catalog pipeline stage by stage against a corpus and measure each stage."""
+    import generate_catalog
+    from catalog_store import write_catalog_index
+
+    generate_catalog.WORKFLOWS_DIR = workflows_dir
+    clear_refs = reset_peak_rss()
+    stages = {}
+    workflow_count = 0
+
+    def measure(stage: str, func):
+        nonlocal workflow_count
+        reset_peak_rss()
+        started = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - started
+        stages[stage] = {
+            "seconds": round(elapsed, 6),
+            "workflows_per_second": round(workflow_count / elapsed, 1) if elapsed > 0 else None,
+            "peak_rss_mb": round(peak_rss_mb(), 1),
+        }
+        return result
+
+    files = generate_catalog.iter_workflow_files()
+    workflow_count = len(files)
+
+    measure("scan", lambda: [(f.stat(), generate_catalog.file_sha256(f)) for f in files])
+    parsed = measure("parse", lambda: [generate_catalog.load_workflow_fields(f) for f in files])
+    entries = measure("extract", lambda: [
+        generate_catalog.extract_workflow_metadata(f, data) for f, data in zip(files, parsed) if data
+    ])
+    del parsed
+
+    existing = existing_catalog_for(generate_catalog.generate_catalog(list(entries)))
+    catalog = measure("merge", lambda: generate_catalog.merge_catalog_updates(
+        existing, generate_catalog.generate_catalog(entries)
+    ))
+
+    def dump():
+        generate_catalog.write_text_atomic(output_dir / "workflows_catalog.yaml",
+                                           generate_catalog.dump_catalog_yaml(catalog))
+        generate_catalog.write_text_atomic(output_dir / "workflows_catalog.json",
+                                           generate_catalog.dump_catalog_json(catalog))
+        write_catalog_index(catalog, output_dir / "workflows_catalog.db")
+    measure("dump", dump)
+
+    return {
+        "workflows": workflow_count,
+        "catalog_entries": len(catalog["catalog"]["workflows"]),
+        "per_stage_peak_rss": clear_refs,
+        "stages": stages,
+        "total_seconds": round(sum(stage["seconds"] for stage in stages.values()), 6),
+    }
+
+
+def benchmark_size(count: int, seed: int) -> Dict[str, Any]:
+    """Generate a corpus of the given size and run the pipeline on it in a fresh interpreter."""
+    with tempfile.TemporaryDirectory() as tmp:
+        workflows_dir = Path(tmp) / "workflows"
+        output_dir = Path(tmp) / "metadata"
+        output_dir.mkdir()
+
+        started = time.perf_counter()
+        corpus_bytes = generate_corpus(workflows_dir, count, seed)
+        generation_seconds = time.perf_counter() - started
+
+        output = subprocess.run(
+            [sys.executable, __file__, "--run-pipeline", str(workflows_dir), str(output_dir)],
+            check=True, capture_output=True, text=True
+        ).stdout
+        result = json.loads(output.splitlines()[-1])
+
+    result["corpus_mb"] = round(corpus_bytes / (1024 * 1024), 1)
+    result["corpus_generation_seconds"] = round(generation_seconds, 3)
+    return result
+
+
+def environment_info() -> Dict[str, Any]:
+    """Describe the machine and library versions the results were measured with."""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "pyyaml": yaml.__version__,
+        "libyaml": bool(yaml.__with_libyaml__),
+    }
+
+
+def print_table(results: List[Dict[str, Any]]):
+    print(f"{'workflows':>9}  {'stage':<8}  {'wall (s)':>9}  {'workflows/s':>12}  {'peak RSS (MB)':>14}")
+    for result in results:
+        for stage in STAGES:
+            metrics = result["stages"][stage]
+            print(f"{result['workflows']:>9}  {stage:<8}  {metrics['seconds']:>9.3f}  "
+                  f"{metrics['workflows_per_second'] or 0:>12.0f}  {metrics['peak_rss_mb']:>14.1f}")
+        print(f"{result['workflows']:>9}  {'total':<8}  {result['total_seconds']:>9.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark catalog generation stages")
+    parser.add_argument("--workflows", type=int, nargs="+", default=[1000, 10000],
+                        help="Corpus sizes to benchmark (e.g. 1000 10000 50000)")
+    parser.add_argument("--seed", type=int, default=0, help="Corpus random seed")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="JSON results file")
+    parser.add_argument("--run-pipeline", nargs=2, type=Path, metavar=("WORKFLOWS_DIR", "OUTPUT_DIR"),
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_pipeline:
+        print(json.dumps(run_pipeline(*args.run_pipeline)))
+        return
+
+    results = [benchmark_size(count, args.seed) for count in args.workflows]
+    print_table(results)
+
+    report = {
+        "benchmark": "catalog_pipeline",
+        "generated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "seed": args.seed,
+        "environment": environment_info(),
+        "results": results,
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2) + "\n", encoding='utf-8')
+    print(f"Results written: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
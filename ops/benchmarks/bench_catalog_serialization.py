@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Purpose: Benchmark catalog dump/load for pure-Python YAML, libyaml and the JSON sidecar
+Created/Updated: 2026-10-16
+Agent: BACKEND_AGENT
+
+Builds synthetic catalogs shaped like generate_catalog.py output and times a
+dump and a load of each with every available backend.
+
+Usage:
+    python ops/benchmarks/bench_catalog_serialization.py
+    python ops/benchmarks/bench_catalog_serialization.py --workflows 1000 10000 50000
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from generate_catalog import generate_catalog  # noqa: E402
+
+DOMAINS = ["shared", "crm", "infra", "meta"]
+SCHEMA_TYPES = ["event", "contact", "incident", "infra_deploy"]
+
+
+def build_workflows(count: int) -> List[Dict[str, Any]]:
+    """Build catalog entries with the same fields extract_workflow_metadata() emits."""
+    workflows = []
+    for index in range(count):
+        domain = DOMAINS[index % len(DOMAINS)]
+        workflow_id = f"{domain}_workflow_{index:06d}"
+        workflows.append({
+            "id": workflow_id,
+            "name": f"{domain.title()} Workflow {index}",
+            "domain": domain,
+            "description": f"Synthetic {domain} workflow number {index} used for serialization benchmarks",
+            "version": "1.0.0",
+            "status": "active",
+            "file_path": f"domains/{domain}/{workflow_id}.json",
+            "endpoints": [f"/webhook/{workflow_id}"] if index % 5 == 0 else [],
+            "dependencies": ["log_event", "error_central_handler"] if index % 3 == 0 else [],
+            "tags": [domain, "synthetic", "notifications" if index % 2 else "logging"],
+            "schema_validation": {"required": True, "schema_type": SCHEMA_TYPES[index % len(SCHEMA_TYPES)]},
+            "observability": {"metrics_enabled": True, "logging_enabled": True},
+        })
+    return workflows
+
+
+def backends() -> List[Tuple[str, Callable[[Any], str], Callable[[str], Any]]]:
+    """List (name, dump, load) for every serialization backend available here."""
+    dump_options = {"sort_keys": False, "default_flow_style": False, "allow_unicode": True}
+    available = [(
+        "yaml (pure Python)",
+        lambda data: yaml.dump(data, Dumper=yaml.SafeDumper, **dump_options),
+        lambda text: yaml.load(text, Loader=yaml.SafeLoader),
+    )]
+    if yaml.__with_libyaml__:
+        available.append((
+            "yaml (libyaml)",
+            lambda data: yaml.dump(data, Dumper=yaml.CSafeDumper, **dump_options),
+            lambda text: yaml.load(text, Loader=yaml.CSafeLoader),
+        ))
+    available.append((
+        "json sidecar",
+        lambda data: json.dumps(data, separators=(",", ":"), ensure_ascii=False),
+        json.loads,
+    ))
+    return available
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark catalog serialization backends")
+    parser.add_argument("--workflows", type=int, nargs="+", default=[1000, 10000],
+                        help="Catalog sizes to benchmark")
+    args = parser.parse_args()
+
+    if not yaml.__with_libyaml__:
+        print("Note: PyYAML was built without libyaml; only the pure-Python YAML backend is available")
+
+    print(f"{'workflows':>9}  {'backend':<20}  {'size (KB)':>10}  {'dump (s)':>9}  {'load (s)':>9}")
+    for count in args.workflows:
+        catalog = generate_catalog(build_workflows(count))
+        for name, dump, load in backends():
+            started = time.perf_counter()
+            text = dump(catalog)
+            dumped = time.perf_counter()
+            loaded = load(text)
+            finished = time.perf_counter()
+
+            if loaded != catalog:
+                print(f"Error: {name} did not round-trip the catalog")
+                sys.exit(1)
+            print(f"{count:>9}  {name:<20}  {len(text.encode()) / 1024:>10.0f}  "
+                  f"{dumped - started:>9.3f}  {finished - dumped:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Purpose: Benchmark email domain classification as the high-risk domain list grows
+Created/Updated: 2026-10-16
+Agent: BACKEND_AGENT
+
+Builds synthetic disposable-domain lists of increasing size and times
+lookups of listed subdomains and unlisted domains with the suffix-set
+classifier (ops/scripts/email_domains.py). The linear substring scan it
+replaced is timed alongside, up to --linear-max domains. With node
+installed, the JavaScript classifier from compute_risk_score.js is timed on
+the same lists.
+
+Usage:
+    python ops/benchmarks/bench_domain_classifier.py
+    python ops/benchmarks/bench_domain_classifier.py --domains 1000 100000 1000000 --lookups 50000
+"""
+
+import argparse
+import json
+import random
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from email_domains import DomainClassifier  # noqa: E402
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+COMPUTE_RISK_SCORE_JS = REPO_ROOT / "shared" / "js_snippets" / "compute_risk_score.js"
+TLDS = ["com", "net", "org", "io", "email", "co.uk"]
+
+NODE_BENCHMARK = """
+const { createDomainClassifier } = require(process.argv[1]);
+const { domains, lookups } = JSON.parse(require('fs').readFileSync(0, 'utf8'));
+const classifier = createDomainClassifier({ high_risk: domains, low_risk: [] });
+let hits = 0;
+const started = process.hrtime.bigint();
+for (const domain of lookups) {
+  if (classifier.isHighRisk(domain)) hits++;
+}
+const elapsed = Number(process.hrtime.bigint() - started);
+process.stdout.write(JSON.stringify({ ns_per_lookup: elapsed / lookups.length, hits }));
+"""
+
+
+def build_domains(count: int, rng: random.Random) -> List[str]:
+    """Synthetic disposable-mail domains."""
+    return [f"mail{index}-{rng.randrange(10 ** 6)}.{rng.choice(TLDS)}" for index in range(count)]
+
+
+def build_lookups(domains: List[str], count: int, rng: random.Random) -> List[str]:
+    """Half subdomains of listed domains, half unlisted corporate-looking domains."""
+    lookups = []
+    for index in range(count):
+        if index % 2:
+            lookups.append(f"inbox.{rng.choice(domains)}")
+        else:
+            lookups.append(f"mx.company{rng.randrange(10 ** 6)}.{rng.choice(TLDS)}")
+    return lookups
+
+
+def time_lookups(classify: Callable[[str], bool], lookups: List[str]) -> Dict[str, float]:
+    started = time.perf_counter()
+    hits = sum(1 for domain in lookups if classify(domain))
+    elapsed = time.perf_counter() - started
+    return {"ns_per_lookup": elapsed / len(lookups) * 1e9, "hits": hits}
+
+
+def time_node(domains: List[str], lookups: List[str]) -> Optional[Dict[str, float]]:
+    if shutil.which("node") is None:
+        return None
+    completed = subprocess.run(
+        ["node", "-e", NODE_BENCHMARK, str(COMPUTE_RISK_SCORE_JS)],
+        input=json.dumps({"domains": domains, "lookups": lookups}),
+        capture_output=True, text=True, check=True
+    )
+    return json.loads(completed.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark email domain classification")
+    parser.add_argument("--domains", type=int, nargs="+", default=[1000, 10000, 100000, 1000000],
+                        help="High-risk list sizes to benchmark")
+    parser.add_argument("--lookups", type=int, default=20000, help="Lookups per list size")
+    parser.add_argument("--linear-max", type=int, default=10000,
+                        help="Largest list size to time the linear substring scan on")
+    parser.add_argument("--seed", type=int, default=16, help="Random seed")
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    results = []
+    print(f"{'domains':>9}  {'suffix set (ns)':>15}  {'node (ns)':>9}  {'linear scan (ns)':>16}  {'hits':>6}")
+    for count in args.domains:
+        domains = build_domains(count, rng)
+        lookups = build_lookups(domains, args.lookups, rng)
+        classifier = DomainClassifier(domains, [])
+
+        result = {"domains": count, "lookups": len(lookups), "suffix_set": time_lookups(classifier.is_high_risk, lookups)}
+        node = time_node(domains, lookups)
+        if node is not None:
+            result["node_suffix_set"] = node
+        if count <= args.linear_max:
+            linear_lookups = lookups[:max(100, len(lookups) * 1000 // count)]
+            result["linear_scan"] = time_lookups(
+                lambda domain: any(listed in domain for listed in domains), linear_lookups
+            )
+        results.append(result)
+
+        node_text = f"{node['ns_per_lookup']:>9.0f}" if node else f"{'-':>9}"
+        linear_text = f"{result['linear_scan']['ns_per_lookup']:>16.0f}" if "linear_scan" in result else f"{'-':>16}"
+        print(f"{count:>9}  {result['suffix_set']['ns_per_lookup']:>15.0f}  {node_text}  {linear_text}  "
+              f"{result['suffix_set']['hits']:>6}")
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps({"results": results}, indent=2) + "\n", encoding='utf-8')
+        print(f"Results written: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Purpose: Benchmark validatePayload() against the precompiled validatePayloadCompiled()
+Created/Updated: 2026-10-16
+Agent: BACKEND_AGENT
+
+Generates seeded event and contact payloads, about one in five invalid,
+limited to fields both validators know so that they judge the same
+payloads, and times validate_payload.js and validate_payload_compiled.js
+on them in one node process. Each validator is warmed up first, then the
+payload list is validated --rounds times. Reports ns per payload, the
+speedup and how many verdicts the two disagree on.
+
+Usage:
+    python ops/benchmarks/bench_js_payload_validation.py
+    python ops/benchmarks/bench_js_payload_validation.py --payloads 100000 --rounds 5 --output results.json
+"""
+
+import argparse
+import json
+import random
+import shutil
+import subprocess
+import sys
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+JS_SNIPPETS_DIR = REPO_ROOT / "shared" / "js_snippets"
+
+NODE_BENCHMARK = """
+const path = require('path');
+const { validatePayload } = require(path.join(process.argv[1], 'validate_payload.js'));
+const { validatePayloadCompiled } = require(path.join(process.argv[1], 'validate_payload_compiled.js'));
+const { schemaType, payloads, rounds } = JSON.parse(require('fs').readFileSync(0, 'utf8'));
+
+function time(validate) {
+  for (let i = 0; i < Math.min(payloads.length, 2000); i++) validate(payloads[i], schemaType);
+  let valid = 0;
+  const started = process.hrtime.bigint();
+  for (let round = 0; round < rounds; round++) {
+    for (const payload of payloads) {
+      if (validate(payload, schemaType).valid) valid++;
+    }
+  }
+  const elapsed = Number(process.hrtime.bigint() - started);
+  return { ns_per_payload: elapsed / (payloads.length * rounds), valid: valid / rounds };
+}
+
+const disagreements = payloads.filter(
+  payload => validatePayload(payload, schemaType).valid !== validatePayloadCompiled(payload, schemaType).valid
+).length;
+process.stdout.write(JSON.stringify({
+  validate_payload: time(validatePayload),
+  compiled: time(validatePayloadCompiled),
+  disagreements
+}));
+"""
+
+STATUSES = ["new", "contacted", "qualified", "converted", "lost", None]
+SOURCES = ["n8n", "backend", "frontend", "infra", "github", "external"]
+ENVS = ["dev", "staging", "prod"]
+INVALID_RATE = 0.2
+
+
+def build_contact(rng: random.Random, index: int) -> Dict[str, Any]:
+    contact = {
+        "email": f"lead{index}@example{rng.randrange(100)}.com",
+        "first_name": rng.choice(["Ann", "Bo", "Chen", None]),
+        "last_name": rng.choice(["Lee", "Ng", None]),
+        "company": rng.choice(["Acme", "Globex", None]),
+        "phone": rng.choice(["+15551234567", None]),
+        "status": rng.choice(STATUSES),
+    }
+    if rng.random() < INVALID_RATE:
+        contact[rng.choice(["email", "status", "first_name", "extra"])] = rng.choice(["not-an-email", "archived", "x" * 150])
+    return contact
+
+
+def build_event(rng: random.Random, index: int) -> Dict[str, Any]:
+    event = {
+        "id": str(uuid.UUID(int=rng.getrandbits(128))),
+        "type": rng.choice(["contact.created", "contact.updated", "infra.deploy.started"]),
+        "source": rng.choice(SOURCES),
+        "env": rng.choice(ENVS),
+        "timestamp": f"2026-10-{rng.randint(1, 28):02d}T{rng.randrange(24):02d}:00:00Z",
+        "correlation_id": rng.choice([f"corr-{index}", None]),
+        "payload": {"contact_id": f"contact-{index}"},
+    }
+    if rng.random() < INVALID_RATE:
+        mutation = rng.choice(["id", "source", "timestamp", "missing"])
+        if mutation == "missing":
+            del event["payload"]
+        else:
+            event[mutation] = {"id": "not-a-uuid", "source": "mainframe", "timestamp": "yesterday"}[mutation]
+    return event
+
+
+BUILDERS = {"event": build_event, "contact": build_contact}
+
+
+def time_node(schema_type: str, payloads: List[Dict[str, Any]], rounds: int) -> Dict[str, Any]:
+    completed = subprocess.run(
+        ["node", "-e", NODE_BENCHMARK, str(JS_SNIPPETS_DIR)],
+        input=json.dumps({"schemaType": schema_type, "payloads": payloads, "rounds": rounds}),
+        capture_output=True, text=True, check=True
+    )
+    return json.loads(completed.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark validatePayload() against validatePayloadCompiled()")
+    parser.add_argument("--payloads", type=int, default=50000, help="Payloads generated per schema type")
+    parser.add_argument("--rounds", type=int, default=3, help="Times each validator validates the payloads")
+    parser.add_argument("--schema-types", nargs="+", choices=sorted(BUILDERS), default=sorted(BUILDERS),
+                        help="Schema types to benchmark")
+    parser.add_argument("--seed", type=int, default=18, help="Random seed")
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    if shutil.which("node") is None:
+        print("❌ node is required for this benchmark", file=sys.stderr)
+        sys.exit(1)
+
+    rng = random.Random(args.seed)
+    results = []
+    print(f"{'schema':>8}  {'payloads':>9}  {'validatePayload (ns)':>20}  {'compiled (ns)':>13}  "
+          f"{'speedup':>7}  {'valid':>7}  {'disagree':>8}")
+    for schema_type in args.schema_types:
+        payloads = [BUILDERS[schema_type](rng, index) for index in range(args.payloads)]
+        result = {"schema_type": schema_type, "payloads": len(payloads), "rounds": args.rounds,
+                  **time_node(schema_type, payloads, args.rounds)}
+        result["speedup"] = result["validate_payload"]["ns_per_payload"] / result["compiled"]["ns_per_payload"]
+        results.append(result)
+        print(f"{schema_type:>8}  {len(payloads):>9}  {result['validate_payload']['ns_per_payload']:>20.0f}  "
+              f"{result['compiled']['ns_per_payload']:>13.0f}  {result['speedup']:>6.1f}x  "
+              f"{result['compiled']['valid']:>7.0f}  {result['disagreements']:>8}")
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps({"results": results}, indent=2) + "\n", encoding='utf-8')
+        print(f"Results written: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Purpose: Benchmark single-pass node extraction against the former per-fact loops
+Created/Updated: 2026-10-16
+Agent: BACKEND_AGENT
+
+Builds synthetic workflows with thousands of nodes and times
+generate_catalog.extract_node_facts() (one dispatch pass over the node
+extractor registry) against the three separate loops it replaced. With
+--extra-facts, both sides also collect facts for additional node types
+(LLM, HTTP, ...), which costs the loop version one more full pass each.
+
+Usage:
+    python ops/benchmarks/bench_node_extraction.py
+    python ops/benchmarks/bench_node_extraction.py --nodes 1000 5000 20000 --repeat 20
+    python ops/benchmarks/bench_node_extraction.py --extra-facts 3
+"""
+
+import argparse
+import random
+import sys
+import timeit
+from pathlib import Path
+from typing import Dict, List, Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from generate_catalog import NODE_EXTRACTORS, extract_node_facts  # noqa: E402
+
+# Rough node-type mix of the exported workflows in workflows/active-workflows
+NODE_TYPE_WEIGHTS = {
+    "n8n-nodes-base.code": 20,
+    "n8n-nodes-base.set": 15,
+    "n8n-nodes-base.if": 10,
+    "n8n-nodes-base.switch": 5,
+    "n8n-nodes-base.httpRequest": 15,
+    "n8n-nodes-base.awsS3": 5,
+    "n8n-nodes-base.notion": 5,
+    "@n8n/n8n-nodes-langchain.agent": 8,
+    "@n8n/n8n-nodes-langchain.openAi": 5,
+    "n8n-nodes-base.webhook": 4,
+    "n8n-nodes-base.executeWorkflow": 6,
+    "n8n-nodes-base.start": 2,
+}
+
+
+def build_nodes(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Build a synthetic node list with the weighted node-type mix."""
+    rng = random.Random(seed)
+    node_types = list(NODE_TYPE_WEIGHTS)
+    weights = list(NODE_TYPE_WEIGHTS.values())
+    nodes = []
+    for index, node_type in enumerate(rng.choices(node_types, weights=weights, k=count)):
+        parameters: Dict[str, Any] = {}
+        if node_type == "n8n-nodes-base.webhook":
+            parameters["path"] = f"hook-{index}"
+        elif node_type == "n8n-nodes-base.executeWorkflow":
+            parameters["workflowId"] = f"sub_workflow_{index % 50}"
+        nodes.append({
+            "id": f"node-{index}",
+            "name": f"Node {index}",
+            "type": node_type,
+            "notes": f"Notes for node {index}",
+            "parameters": parameters,
+        })
+    return nodes
+
+
+# Node types used for --extra-facts, in order
+EXTRA_FACT_TYPES = [
+    "@n8n/n8n-nodes-langchain.agent",
+    "n8n-nodes-base.httpRequest",
+    "@n8n/n8n-nodes-langchain.openAi",
+    "n8n-nodes-base.awsS3",
+    "n8n-nodes-base.notion",
+]
+
+
+def collect_node_name(fact_key: str):
+    """Build an extractor that records node names under fact_key."""
+    def extractor(node: Dict[str, Any], facts: Dict[str, Any]):
+        facts.setdefault(fact_key, []).append(node.get("name"))
+    return extractor
+
+
+def extract_with_loops(workflow_data: Dict[str, Any], extra_types: List[str] = ()) -> Dict[str, Any]:
+    """Reference implementation: one full pass over the nodes per fact."""
+    start_notes = None
+    for node in workflow_data.get("nodes", []):
+        if node.get("type") == "n8n-nodes-base.start":
+            start_notes = node.get("notes", "")
+            break
+
+    endpoints = []
+    for node in workflow_data.get("nodes", []):
+        if node.get("type") == "n8n-nodes-base.webhook":
+            webhook_path = node.get("parameters", {}).get("path", "")
+            if webhook_path:
+                endpoints.append(f"/webhook/{webhook_path}")
+
+    dependencies = []
+    for node in workflow_data.get("nodes", []):
+        if node.get("type") == "n8n-nodes-base.executeWorkflow":
+            sub_workflow = node.get("parameters", {}).get("workflowId", "")
+            if sub_workflow:
+                dependencies.append(sub_workflow)
+
+    facts = {"endpoints": endpoints, "dependencies": dependencies}
+    if start_notes is not None:
+        facts["start_notes"] = start_notes
+
+    for node_type in extra_types:
+        names = [node.get("name") for node in workflow_data.get("nodes", []) if node.get("type") == node_type]
+        if names:
+            facts[node_type] = names
+    return facts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark node fact extraction")
+    parser.add_argument("--nodes", type=int, nargs="+", default=[1000, 5000, 20000],
+                        help="Node counts per synthetic workflow")
+    parser.add_argument("--repeat", type=int, default=10, help="Timing repetitions per case")
+    parser.add_argument("--extra-facts", type=int, default=0, choices=range(len(EXTRA_FACT_TYPES) + 1),
+                        help="Additional node types to collect facts for")
+    args = parser.parse_args()
+
+    extra_types = EXTRA_FACT_TYPES[:args.extra_facts]
+    for node_type in extra_types:
+        NODE_EXTRACTORS.setdefault(node_type, []).append(collect_node_name(node_type))
+
+    print(f"{'nodes':>8}  {'loops (ms)':>11}  {'registry (ms)':>14}  {'speedup':>8}")
+    for count in args.nodes:
+        workflow_data = {"name": f"synthetic_{count}", "nodes": build_nodes(count)}
+        nodes = workflow_data["nodes"]
+
+        if extract_with_loops(workflow_data, extra_types) != extract_node_facts(nodes):
+            print(f"Error: extraction results differ for {count} nodes")
+            sys.exit(1)
+
+        loops = min(timeit.repeat(lambda: extract_with_loops(workflow_data, extra_types),
+                                  number=1, repeat=args.repeat))
+        registry = min(timeit.repeat(lambda: extract_node_facts(nodes), number=1, repeat=args.repeat))
+        print(f"{count:>8}  {loops * 1000:>11.3f}  {registry * 1000:>14.3f}  {loops / registry:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Purpose: Benchmark every payload validation path on schema-generated payloads
+Created/Updated: 2026-10-16
+Agent: BACKEND_AGENT
+
+Generates payloads per schema with payload_generator.py (a share of them
+invalid, with a controlled error mix) and validates them with each path:
+
+    jsonschema         jsonschema.Draft7Validator.is_valid
+    compiled_python    ops/scripts/schema_compiler.py validators
+    validate_payload   shared/js_snippets/validate_payload.js (node)
+    compiled_js        shared/js_snippets/validate_payload_compiled.js (node)
+
+Every call is timed on its own after a warm-up, giving ops/sec and p50/p99
+latency per path and schema. Each path's verdicts are compared with the
+generator's labels: "missed" counts invalid payloads accepted (format
+errors are only asserted by the JS paths), "rejected_valid" counts valid
+payloads rejected. A path that does not know a schema is reported as
+unsupported. The node paths are skipped when node is not installed.
+
+Usage:
+    python ops/benchmarks/bench_payload_validation.py
+    python ops/benchmarks/bench_payload_validation.py --payloads 50000 --invalid-rate 0.3 --mix enum=3 format=1
+    python ops/benchmarks/bench_payload_validation.py --schema-types contact --output results.json
+"""
+
+import argparse
+import json
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from jsonschema import Draft7Validator
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from payload_generator import SCHEMAS_DIR, GeneratedPayload, PayloadGenerator, parse_mix  # noqa: E402
+from schema_compiler import load_validator  # noqa: E402
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+JS_SNIPPETS_DIR = REPO_ROOT / "shared" / "js_snippets"
+SCHEMA_TYPES = sorted(path.name[:-len(".schema.json")] for path in SCHEMAS_DIR.glob("*.schema.json"))
+WARMUP_CALLS = 2000
+
+# Node paths: (snippet file, exported function)
+NODE_PATHS = {
+    "validate_payload": ("validate_payload.js", "validatePayload"),
+    "compiled_js": ("validate_payload_compiled.js", "validatePayloadCompiled"),
+}
+
+NODE_BENCHMARK = """
+const path = require('path');
+const { snippetsDir, paths, schemaType, payloads, warmup } = JSON.parse(require('fs').readFileSync(0, 'utf8'));
+const results = {};
+for (const [name, [file, exported]] of Object.entries(paths)) {
+  const validate = require(path.join(snippetsDir, file))[exported];
+  for (let i = 0; i < Math.min(warmup, payloads.length); i++) validate(payloads[i], schemaType);
+  const latencies = new Float64Array(payloads.length);
+  const verdicts = new Array(payloads.length);
+  let unsupported = true;
+  for (let i = 0; i < payloads.length; i++) {
+    const started = process.hrtime.bigint();
+    const result = validate(payloads[i], schemaType);
+    latencies[i] = Number(process.hrtime.bigint() - started);
+    verdicts[i] = result.valid;
+    if (result.valid || !result.errors[0].startsWith('Unknown schema type')) unsupported = false;
+  }
+  results[name] = { latencies_ns: Array.from(latencies), verdicts, unsupported };
+}
+process.stdout.write(JSON.stringify(results));
+"""
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    return sorted_values[min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))]
+
+
+def summarize(latencies_ns: List[float], verdicts: List[bool], generated: List[GeneratedPayload]) -> Dict[str, Any]:
+    ordered = sorted(latencies_ns)
+    total = sum(ordered)
+    return {
+        "ops_per_sec": len(ordered) / (total / 1e9) if total else 0.0,
+        "p50_us": percentile(ordered, 0.50) / 1000,
+        "p99_us": percentile(ordered, 0.99) / 1000,
+        "missed": sum(1 for verdict, item in zip(verdicts, generated) if verdict and item.error_kind),
+        "rejected_valid": sum(1 for verdict, item in zip(verdicts, generated) if not verdict and not item.error_kind),
+    }
+
+
+def time_python(validate: Callable[[Any], bool], payloads: List[Dict[str, Any]]):
+    """Per-call latencies (ns) and verdicts of a Python validator."""
+    for payload in payloads[:WARMUP_CALLS]:
+        validate(payload)
+    latencies, verdicts = [], []
+    clock = time.perf_counter_ns
+    for payload in payloads:
+        started = clock()
+        verdict = validate(payload)
+        latencies.append(clock() - started)
+        verdicts.append(verdict)
+    return latencies, verdicts
+
+
+def time_node(schema_type: str, payloads: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    if shutil.which("node") is None:
+        return None
+    completed = subprocess.run(
+        ["node", "-e", NODE_BENCHMARK],
+        input=json.dumps({"snippetsDir": str(JS_SNIPPETS_DIR), "paths": NODE_PATHS, "schemaType": schema_type,
+                          "payloads": payloads, "warmup": WARMUP_CALLS}),
+        capture_output=True, text=True, check=True
+    )
+    return json.loads(completed.stdout)
+
+
+def benchmark_schema(schema_type: str, generated: List[GeneratedPayload]) -> Dict[str, Any]:
+    """Results for every validation path on one schema's payloads."""
+    payloads = [item.payload for item in generated]
+    with open(SCHEMAS_DIR / f"{schema_type}.schema.json", 'r', encoding='utf-8') as f:
+        reference = Draft7Validator(json.load(f))
+    compiled = load_validator(schema_type)
+
+    paths: Dict[str, Any] = {}
+    for name, validate in (("jsonschema", reference.is_valid),
+                           ("compiled_python", lambda payload: not compiled(payload))):
+        paths[name] = summarize(*time_python(validate, payloads), generated)
+
+    node = time_node(schema_type, payloads)
+    for name in NODE_PATHS:
+        if node is None:
+            paths[name] = {"skipped": "node is not installed"}
+        elif node[name]["unsupported"]:
+            paths[name] = {"skipped": f"unknown schema type {schema_type}"}
+        else:
+            paths[name] = summarize(node[name]["latencies_ns"], node[name]["verdicts"], generated)
+
+    return {
+        "schema_type": schema_type,
+        "payloads": len(generated),
+        "invalid": sum(1 for item in generated if item.error_kind),
+        "paths": paths,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark payload validation paths on generated payloads")
+    parser.add_argument("--payloads", type=int, default=20000, help="Payloads generated per schema type")
+    parser.add_argument("--invalid-rate", type=float, default=0.2, help="Share of payloads with an injected error")
+    parser.add_argument("--mix", nargs="+", default=[], metavar="KIND[=WEIGHT]",
+                        help="Error kinds and weights (default: every possible kind, evenly)")
+    parser.add_argument("--schema-types", nargs="+", choices=SCHEMA_TYPES, default=SCHEMA_TYPES,
+                        help="Schema types to benchmark")
+    parser.add_argument("--seed", type=int, default=19, help="Random seed")
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix) or None
+    results = []
+    print(f"{'schema':>13}  {'path':>16}  {'ops/sec':>10}  {'p50 (us)':>9}  {'p99 (us)':>9}  "
+          f"{'missed':>7}  {'rejected valid':>14}")
+    for schema_type in args.schema_types:
+        generator = PayloadGenerator.for_schema_type(schema_type, args.seed)
+        result = benchmark_schema(schema_type, generator.generate(args.payloads, args.invalid_rate, mix))
+        results.append(result)
+        for name, metrics in result["paths"].items():
+            if "skipped" in metrics:
+                print(f"{schema_type:>13}  {name:>16}  skipped: {metrics['skipped']}")
+                continue
+            print(f"{schema_type:>13}  {name:>16}  {metrics['ops_per_sec']:>10.0f}  {metrics['p50_us']:>9.2f}  "
+                  f"{metrics['p99_us']:>9.2f}  {metrics['missed']:>7}  {metrics['rejected_valid']:>14}")
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps({"results": results}, indent=2) + "\n", encoding='utf-8')
+        print(f"Results written: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
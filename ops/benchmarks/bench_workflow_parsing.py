@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Purpose: Compare full json.load against streaming partial parsing of workflow exports
+Created/Updated: 2026-10-16
+Agent: BACKEND_AGENT
+
+Generates a synthetic corpus modelled on workflows/active-workflows/notion-aws.json
+with large pinData blobs, then loads it once with json.load and once with
+workflow_stream.stream_workflow_json (catalog fields only). Each mode runs in
+a fresh interpreter so peak RSS is measured independently.
+
+Two pinData shapes are generated: "llm" (few items with long model output
+strings) and "records" (many small API records, e.g. Notion/DynamoDB reads).
+
+Usage:
+    python ops/benchmarks/bench_workflow_parsing.py
+    python ops/benchmarks/bench_workflow_parsing.py --files 20 --pindata-mb 8 --shape records
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from workflow_stream import CATALOG_FIELDS, stream_workflow_json  # noqa: E402
+
+TEMPLATE_FILE = Path(__file__).parent.parent.parent / "workflows" / "active-workflows" / "notion-aws.json"
+
+
+def build_pin_items(shape: str, pindata_mb: float) -> list:
+    """Build pinData items of the given shape totalling roughly pindata_mb."""
+    if shape == "llm":
+        text = "The model said: \"done\".\nSummary with {braces} and [brackets]. " * 40
+        make_item = lambda i: {"json": {"index": i, "output": text, "score": i / 7}}  # noqa: E731
+    else:
+        make_item = lambda i: {"json": {  # noqa: E731
+            "id": f"page-{i}",
+            "name": f"Idea {i}",
+            "properties": {"status": "Done", "votes": i % 17, "labels": ["ai", "ops"], "archived": False},
+            "url": f"https://www.notion.so/page-{i}",
+        }}
+
+    item_size = len(json.dumps(make_item(0)))
+    item_count = max(1, int(pindata_mb * 1024 * 1024 / item_size))
+    return [make_item(i) for i in range(item_count)]
+
+
+def build_corpus(corpus_dir: Path, files: int, pindata_mb: float, shape: str):
+    """Write synthetic workflow exports with roughly pindata_mb of pinData each."""
+    with open(TEMPLATE_FILE, 'r', encoding='utf-8') as f:
+        template = json.load(f)
+
+    pin_items = build_pin_items(shape, pindata_mb)
+
+    for index in range(files):
+        workflow = dict(template)
+        workflow["name"] = f"synthetic_{shape}_workflow_{index}"
+        workflow["pinData"] = {"AI Agent": pin_items}
+        with open(corpus_dir / f"synthetic_{index:04d}.json", 'w', encoding='utf-8') as f:
+            json.dump(workflow, f)
+
+
+def load_corpus(corpus_dir: Path, mode: str) -> dict:
+    """Load every corpus file with the given mode and report wall time and peak RSS."""
+    started = time.perf_counter()
+    nodes = 0
+    for workflow_file in sorted(corpus_dir.glob("*.json")):
+        if mode == "full":
+            with open(workflow_file, 'r', encoding='utf-8') as f:
+                workflow = json.load(f)
+        else:
+            workflow = stream_workflow_json(workflow_file, CATALOG_FIELDS)
+        nodes += len(workflow.get("nodes", []))
+    elapsed = time.perf_counter() - started
+    return {"mode": mode, "seconds": elapsed, "peak_rss_mb": peak_rss_mb(), "nodes": nodes}
+
+
+def peak_rss_mb() -> float:
+    """
+    Peak resident set size of this process in MB.
+
+    Prefers VmHWM, which resets on exec; ru_maxrss also counts the RSS the
+    parent had when it forked this benchmark process.
+    """
+    status_file = Path("/proc/self/status")
+    if status_file.exists():
+        for line in status_file.read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    # ru_maxrss is reported in KiB on Linux, bytes on macOS
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss / (1024 * 1024) if sys.platform == "darwin" else maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark workflow export parsing")
+    parser.add_argument("--files", type=int, default=10, help="Number of synthetic workflow files")
+    parser.add_argument("--pindata-mb", type=float, default=16, help="Approximate pinData size per file (MB)")
+    parser.add_argument("--shape", choices=["llm", "records", "all"], default="all", help="pinData shape")
+    parser.add_argument("--mode", choices=["full", "stream"], help=argparse.SUPPRESS)
+    parser.add_argument("--corpus", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(load_corpus(args.corpus, args.mode)))
+        return
+
+    shapes = ["llm", "records"] if args.shape == "all" else [args.shape]
+    print(f"{'shape':>8}  {'mode':>6}  {'wall (s)':>9}  {'peak RSS (MB)':>14}")
+    for shape in shapes:
+        results = run_shape(shape, args.files, args.pindata_mb)
+        for mode, result in results.items():
+            print(f"{shape:>8}  {mode:>6}  {result['seconds']:>9.3f}  {result['peak_rss_mb']:>14.1f}")
+        full, stream = results["full"], results["stream"]
+        print(f"{shape:>8}  stream vs full: {full['seconds'] / stream['seconds']:.2f}x wall time, "
+              f"{full['peak_rss_mb'] / stream['peak_rss_mb']:.2f}x less peak RSS")
+
+
+def run_shape(shape: str, files: int, pindata_mb: float) -> dict:
+    """Build a corpus of one pinData shape and load it in both modes."""
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus_dir = Path(tmp)
+        build_corpus(corpus_dir, files, pindata_mb, shape)
+
+        results = {}
+        for mode in ("full", "stream"):
+            output = subprocess.run(
+                [sys.executable, __file__, "--mode", mode, "--corpus", str(corpus_dir)],
+                check=True, capture_output=True, text=True
+            ).stdout
+            results[mode] = json.loads(output)
+
+    if results["full"]["nodes"] != results["stream"]["nodes"]:
+        print("Error: node counts differ between modes")
+        sys.exit(1)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+Purpose: Generate valid and deliberately invalid payloads from shared/schemas
+Created/Updated: 2026-10-16
+Agent: BACKEND_AGENT
+
+Valid payloads are built by walking a schema: required properties always,
+optional ones at a fixed rate, enum members, strings sampled from their
+regex pattern (parsed with the standard library's regex parser), email and
+date-time formats, numbers within their bounds, nested objects and arrays.
+
+Invalid payloads are valid payloads with exactly one error injected at a
+site chosen in the generated payload, nested sites included. Error kinds
+are drawn from a weighted mix, limited to the kinds the schema makes
+possible; each generated payload records its kind and path. "format"
+errors only fail validators that assert formats (the JS snippets); Draft 7
+treats format as an annotation.
+
+The same schema, count, mix and seed always produce the same payloads.
+
+Usage:
+    python ops/benchmarks/payload_generator.py contact --count 10000 --output contacts.ndjson
+    python ops/benchmarks/payload_generator.py event --invalid-rate 0.5 --mix enum=2 pattern=1
+"""
+
+import argparse
+import json
+import random
+import re
+import string
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+SCHEMAS_DIR = Path(__file__).parent.parent.parent / "shared" / "schemas"
+
+# Error kinds, and the Draft 7 keyword a validator reports for each
+ERROR_KEYWORDS = {
+    "missing_required": "required",
+    "wrong_type": "type",
+    "pattern": "pattern",
+    "enum": "enum",
+    "format": "format",
+    "length": ("minLength", "maxLength"),
+    "range": ("minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum"),
+    "additional_property": "additionalProperties",
+}
+ERROR_KINDS = tuple(ERROR_KEYWORDS)
+
+OPTIONAL_RATE = 0.7
+NULL_RATE = 0.15
+MAX_UNBOUNDED_REPEAT = 4
+EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+# A value of each JSON type, for wrong_type errors
+TYPE_SAMPLES = {
+    "string": "unexpected text",
+    "integer": 42,
+    "number": 4.5,
+    "boolean": True,
+    "null": None,
+    "array": ["x"],
+    "object": {"k": "v"},
+}
+INVALID_FORMATS = {"email": "not-an-email", "date-time": "yesterday at noon"}
+WORDS = ["alpha", "bravo", "delta", "echo", "lima", "nova", "orbit", "pulse", "quartz", "sierra", "vector"]
+
+
+class GeneratedPayload(NamedTuple):
+    """A generated payload; error_kind and error_path are None for valid payloads."""
+    payload: Dict[str, Any]
+    error_kind: Optional[str]
+    error_path: Optional[str]
+
+
+def sample_pattern(pattern: str, rng: random.Random) -> str:
+    """A string matching a regex pattern (character classes, repeats, groups, alternation)."""
+    return "".join(_sample_nodes(sre_parse.parse(pattern), rng))
+
+
+def _sample_nodes(nodes, rng: random.Random) -> Iterator[str]:
+    for op, arg in nodes:
+        name = str(op)
+        if name == "LITERAL":
+            yield chr(arg)
+        elif name == "ANY":
+            yield rng.choice(string.ascii_letters)
+        elif name == "IN":
+            yield _sample_class(arg, rng)
+        elif name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT"):
+            low, high, item = arg
+            high = low + MAX_UNBOUNDED_REPEAT if high is sre_parse.MAXREPEAT else high
+            for _ in range(rng.randint(low, high)):
+                yield from _sample_nodes(item, rng)
+        elif name in ("SUBPATTERN", "ATOMIC_GROUP"):
+            yield from _sample_nodes(arg[-1] if name == "SUBPATTERN" else arg, rng)
+        elif name == "BRANCH":
+            yield from _sample_nodes(rng.choice(arg[1]), rng)
+        elif name == "AT":
+            continue
+        elif name == "CATEGORY":
+            yield _sample_category(str(arg), rng)
+        else:
+            raise ValueError(f"Unsupported regex construct for sampling: {name}")
+
+
+def _sample_class(items, rng: random.Random) -> str:
+    choices: List[str] = []
+    for op, arg in items:
+        name = str(op)
+        if name == "NEGATE":
+            raise ValueError("Negated character classes are not supported for sampling")
+        if name == "LITERAL":
+            choices.append(chr(arg))
+        elif name == "RANGE":
+            choices.extend(chr(code) for code in range(arg[0], arg[1] + 1))
+        elif name == "CATEGORY":
+            choices.append(_sample_category(str(arg), rng))
+    return rng.choice(choices)
+
+
+def _sample_category(category: str, rng: random.Random) -> str:
+    if category.endswith("DIGIT") and "NOT" not in category:
+        return rng.choice(string.digits)
+    if category.endswith("WORD") and "NOT" not in category:
+        return rng.choice(string.ascii_letters + string.digits + "_")
+    if category.endswith("SPACE") and "NOT" not in category:
+        return " "
+    return rng.choice(string.ascii_letters)
+
+
+def _types(schema: Dict[str, Any]) -> List[str]:
+    declared = schema.get("type", [])
+    return declared if isinstance(declared, list) else [declared]
+
+
+def _child(path: str, key: Any) -> str:
+    if isinstance(key, int):
+        return f"{path}[{key}]"
+    return f"{path}.{key}" if path else key
+
+
+class PayloadGenerator:
+    """Generates payloads for one JSON Schema."""
+
+    def __init__(self, schema: Dict[str, Any], seed: int = 0, optional_rate: float = OPTIONAL_RATE):
+        self.schema = schema
+        self.rng = random.Random(seed)
+        self.optional_rate = optional_rate
+        self.counter = 0
+        self.kinds = self.applicable_kinds()
+
+    @classmethod
+    def for_schema_type(cls, schema_type: str, seed: int = 0, schemas_dir: Path = SCHEMAS_DIR) -> "PayloadGenerator":
+        with open(schemas_dir / f"{schema_type}.schema.json", 'r', encoding='utf-8') as f:
+            return cls(json.load(f), seed)
+
+    # Valid payloads
+
+    def valid(self) -> Dict[str, Any]:
+        self.counter += 1
+        return self._value(self.schema, nullable=False)
+
+    def _value(self, schema: Any, nullable: bool = True) -> Any:
+        if not isinstance(schema, dict) or not schema:
+            return self.rng.choice(WORDS)
+        if "const" in schema:
+            return schema["const"]
+        if "enum" in schema:
+            members = [m for m in schema["enum"] if m is not None or nullable]
+            return self.rng.choice(members or schema["enum"])
+
+        types = _types(schema) or ["string"]
+        non_null = [t for t in types if t != "null"]
+        if not non_null or (nullable and "null" in types and self.rng.random() < NULL_RATE):
+            return None
+        kind = self.rng.choice(non_null)
+        if kind == "object":
+            return self._object(schema)
+        if kind == "array":
+            low = schema.get("minItems", 0)
+            high = schema.get("maxItems", low + 3)
+            return [self._value(schema.get("items", {}), nullable=False) for _ in range(self.rng.randint(low, high))]
+        if kind in ("number", "integer"):
+            return self._number(schema, kind)
+        if kind == "boolean":
+            return self.rng.random() < 0.5
+        return self._string(schema)
+
+    def _object(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        required = set(schema.get("required", []))
+        properties = schema.get("properties", {})
+        result = {}
+        for key, subschema in properties.items():
+            if key in required or self.rng.random() < self.optional_rate:
+                result[key] = self._value(subschema)
+        for key in required - set(properties):
+            result[key] = self.rng.choice(WORDS)
+        if not properties and schema.get("additionalProperties", True) is not False:
+            for index in range(self.rng.randint(0, 3)):
+                result[f"{self.rng.choice(WORDS)}_{index}"] = self.rng.choice([self.rng.choice(WORDS), index, True])
+        return result
+
+    def _number(self, schema: Dict[str, Any], kind: str) -> Any:
+        low = schema.get("minimum", schema.get("exclusiveMinimum", 0))
+        high = schema.get("maximum", schema.get("exclusiveMaximum", low + 1000))
+        if kind == "integer":
+            value = self.rng.randint(int(low), int(high))
+        else:
+            value = round(self.rng.uniform(low, high), 2)
+        if value == schema.get("exclusiveMinimum") or value == schema.get("exclusiveMaximum"):
+            value = (low + high) / 2
+        return value
+
+    def _string(self, schema: Dict[str, Any]) -> str:
+        fmt = schema.get("format")
+        if fmt == "email":
+            value = f"{self.rng.choice(WORDS)}.{self.counter}@{self.rng.choice(WORDS)}.example.com"
+        elif fmt == "date-time":
+            moment = EPOCH + timedelta(seconds=self.rng.randrange(365 * 86400))
+            value = moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+        elif "pattern" in schema:
+            value = sample_pattern(schema["pattern"], self.rng)
+        else:
+            value = f"{self.rng.choice(WORDS)} {self.rng.choice(WORDS)} {self.counter}"
+        low = schema.get("minLength", 0)
+        high = schema.get("maxLength")
+        if high is not None and len(value) > high:
+            value = value[:high]
+        if len(value) < low:
+            value += "x" * (low - len(value))
+        return value
+
+    # Invalid payloads
+
+    def applicable_kinds(self) -> List[str]:
+        """Error kinds this schema makes possible."""
+        kinds = set()
+
+        def walk(schema: Any):
+            if not isinstance(schema, dict):
+                return
+            types = _types(schema)
+            if types and set(types) != set(TYPE_SAMPLES):
+                kinds.add("wrong_type")
+            for key, kind in (("required", "missing_required"), ("pattern", "pattern"), ("enum", "enum")):
+                if schema.get(key):
+                    kinds.add(kind)
+            if schema.get("format") in INVALID_FORMATS:
+                kinds.add("format")
+            if schema.get("maxLength") is not None or schema.get("minLength", 0) > 0:
+                kinds.add("length")
+            if any(key in schema for key in ERROR_KEYWORDS["range"]):
+                kinds.add("range")
+            if schema.get("additionalProperties") is False:
+                kinds.add("additional_property")
+            for subschema in schema.get("properties", {}).values():
+                walk(subschema)
+            walk(schema.get("items"))
+
+        walk(self.schema)
+        return [kind for kind in ERROR_KINDS if kind in kinds]
+
+    def _sites(self, schema: Any, value: Any, path: str) -> Iterator[Tuple[str, str, Any, Any, Any]]:
+        """(kind, path, container, key, subschema) for every error that can be injected in a valid value."""
+        if not isinstance(schema, dict):
+            return
+        if isinstance(value, dict):
+            properties = schema.get("properties", {})
+            for key in schema.get("required", []):
+                if key in value:
+                    yield "missing_required", _child(path, key), value, key, schema
+            if schema.get("additionalProperties") is False:
+                yield "additional_property", _child(path, "unexpected_field"), value, "unexpected_field", schema
+            for key, child in value.items():
+                if key in properties:
+                    yield from self._field_sites(properties[key], value, key, _child(path, key))
+        elif isinstance(value, list):
+            for index in range(len(value)):
+                yield from self._field_sites(schema.get("items", {}), value, index, _child(path, index))
+
+    def _field_sites(self, schema: Any, container: Any, key: Any, path: str):
+        if not isinstance(schema, dict):
+            return
+        value = container[key]
+        if _types(schema):
+            yield "wrong_type", path, container, key, schema
+        if "enum" in schema:
+            yield "enum", path, container, key, schema
+        if isinstance(value, str):
+            if "pattern" in schema:
+                yield "pattern", path, container, key, schema
+            if schema.get("format") in INVALID_FORMATS:
+                yield "format", path, container, key, schema
+            if schema.get("maxLength") is not None or schema.get("minLength", 0) > 0:
+                yield "length", path, container, key, schema
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            if any(bound in schema for bound in ERROR_KEYWORDS["range"]):
+                yield "range", path, container, key, schema
+        yield from self._sites(schema, value, path)
+
+    def _inject(self, kind: str, container: Any, key: Any, schema: Dict[str, Any]) -> bool:
+        """Apply one error in place; False if this site cannot take it."""
+        if kind == "missing_required":
+            del container[key]
+        elif kind == "additional_property":
+            container[key] = self.rng.choice(WORDS)
+        elif kind == "wrong_type":
+            allowed = set(_types(schema))
+            if "number" in allowed:
+                allowed.add("integer")
+            candidates = [t for t in TYPE_SAMPLES if t not in allowed and not (t == "number" and "integer" in allowed)]
+            container[key] = TYPE_SAMPLES[self.rng.choice(candidates)]
+        elif kind == "enum":
+            if _types(schema) and "string" not in _types(schema):
+                return False
+            container[key] = f"not_{self.rng.choice(WORDS)}"
+        elif kind == "pattern":
+            container[key] = f"!{container[key]}!"
+            if re.search(schema["pattern"], container[key]):
+                return False
+        elif kind == "format":
+            container[key] = INVALID_FORMATS[schema["format"]]
+        elif kind == "length":
+            if schema.get("maxLength") is not None:
+                container[key] = "x" * (schema["maxLength"] + 1)
+            else:
+                container[key] = ""
+        elif kind == "range":
+            if "maximum" in schema:
+                container[key] = schema["maximum"] + 1
+            elif "minimum" in schema:
+                container[key] = schema["minimum"] - 1
+            else:
+                container[key] = schema.get("exclusiveMaximum", schema.get("exclusiveMinimum"))
+        return True
+
+    def invalid(self, kind: str, attempts: int = 50) -> GeneratedPayload:
+        """A payload with one error of the given kind."""
+        if kind not in self.kinds:
+            raise ValueError(f"Error kind {kind!r} is not possible for this schema (possible: {self.kinds})")
+        for _ in range(attempts):
+            payload = self.valid()
+            sites = [site for site in self._sites(self.schema, payload, "") if site[0] == kind]
+            self.rng.shuffle(sites)
+            for _, path, container, key, schema in sites:
+                original = container.get(key) if isinstance(container, dict) else container[key]
+                present = not isinstance(container, dict) or key in container
+                if self._inject(kind, container, key, schema):
+                    return GeneratedPayload(payload, kind, path)
+                if present:
+                    container[key] = original
+        raise ValueError(f"Could not inject a {kind!r} error in {attempts} generated payloads")
+
+    def generate(
+        self,
+        count: int,
+        invalid_rate: float = 0.2,
+        mix: Optional[Dict[str, float]] = None
+    ) -> List[GeneratedPayload]:
+        """count payloads, invalid_rate of them invalid with kinds drawn from mix (default: all possible, evenly)."""
+        weights = {kind: weight for kind, weight in (mix or {kind: 1 for kind in self.kinds}).items()
+                   if kind in self.kinds and weight > 0}
+        if invalid_rate > 0 and not weights:
+            raise ValueError(f"No error kind in the mix is possible for this schema (possible: {self.kinds})")
+        kinds, kind_weights = list(weights), list(weights.values())
+        payloads = []
+        for _ in range(count):
+            if self.rng.random() < invalid_rate:
+                payloads.append(self.invalid(self.rng.choices(kinds, kind_weights)[0]))
+            else:
+                payloads.append(GeneratedPayload(self.valid(), None, None))
+        return payloads
+
+
+def parse_mix(items: List[str]) -> Dict[str, float]:
+    """['enum=2', 'pattern'] -> {'enum': 2.0, 'pattern': 1.0}."""
+    mix = {}
+    for item in items:
+        kind, _, weight = item.partition("=")
+        if kind not in ERROR_KINDS:
+            raise argparse.ArgumentTypeError(f"Unknown error kind {kind!r} (known: {', '.join(ERROR_KINDS)})")
+        mix[kind] = float(weight) if weight else 1.0
+    return mix
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate payloads from a shared/schemas schema")
+    parser.add_argument("schema_type", help="Schema type, e.g. contact or infra_deploy")
+    parser.add_argument("--count", type=int, default=1000, help="Number of payloads")
+    parser.add_argument("--invalid-rate", type=float, default=0.2, help="Share of payloads with an injected error")
+    parser.add_argument("--mix", nargs="+", default=[], metavar="KIND[=WEIGHT]",
+                        help=f"Error kinds and weights (default: every possible kind). Kinds: {', '.join(ERROR_KINDS)}")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--schemas-dir", type=Path, default=SCHEMAS_DIR, help="Directory of *.schema.json files")
+    parser.add_argument("--output", type=Path, help="Write NDJSON payloads here (default: stdout)")
+    parser.add_argument("--labels", type=Path, help="Also write {line, error_kind, error_path} NDJSON here")
+    args = parser.parse_args()
+
+    try:
+        generator = PayloadGenerator.for_schema_type(args.schema_type, args.seed, args.schemas_dir)
+        payloads = generator.generate(args.count, args.invalid_rate, parse_mix(args.mix) or None)
+    except (OSError, ValueError, argparse.ArgumentTypeError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        for generated in payloads:
+            output.write(json.dumps(generated.payload) + "\n")
+    finally:
+        if args.output:
+            output.close()
+    if args.labels:
+        with open(args.labels, "w", encoding="utf-8") as f:
+            for line, generated in enumerate(payloads, 1):
+                f.write(json.dumps({"line": line, "error_kind": generated.error_kind,
+                                    "error_path": generated.error_path}) + "\n")
+
+    invalid = sum(1 for generated in payloads if generated.error_kind)
+    print(f"Generated {len(payloads)} {args.schema_type} payloads, {invalid} invalid", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Purpose: Generate synthetic workflow corpora for catalog pipeline benchmarks
+Created/Updated: 2026-10-16
+Agent: BACKEND_AGENT
+
+Node types are drawn from the mix in workflows/active-workflows/*.json,
+reusing the real node parameters as templates. Some workflows also get a
+webhook trigger and executeWorkflow calls at fixed rates, so the catalog
+extractors have endpoints and dependencies to find. Workflows are spread
+round-robin across the domain directories that generate_catalog.py scans.
+The same count and seed always produce the same corpus.
+
+Usage:
+    python ops/benchmarks/workflow_corpus.py /tmp/corpus --workflows 10000
+"""
+
+import argparse
+import copy
+import json
+import random
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+ACTIVE_WORKFLOWS_DIR = Path(__file__).parent.parent.parent / "workflows" / "active-workflows"
+
+CORPUS_DOMAINS = ["domains/shared", "domains/crm", "domains/infra", "domains/meta"]
+
+# Share of workflows exposing a webhook, and of workflows calling sub-workflows
+WEBHOOK_RATE = 0.2
+SUB_WORKFLOW_RATE = 0.35
+MAX_SUB_WORKFLOW_CALLS = 3
+
+
+class NodeMix:
+    """Node-type weights, node templates and workflow sizes taken from real exports."""
+
+    def __init__(self, source_dir: Path = ACTIVE_WORKFLOWS_DIR):
+        self.weights: Counter = Counter()
+        self.templates: Dict[str, Dict[str, Any]] = {}
+        self.node_counts: List[int] = []
+
+        for workflow_file in sorted(source_dir.glob("*.json")):
+            try:
+                with open(workflow_file, 'r', encoding='utf-8') as f:
+                    workflow = json.load(f)
+            except (json.JSONDecodeError, OSError) as e:
+                print(f"Warning: Skipping {workflow_file.name}: {e}")
+                continue
+            nodes = workflow.get("nodes", [])
+            if nodes:
+                self.node_counts.append(len(nodes))
+            for node in nodes:
+                node_type = node.get("type")
+                if not node_type:
+                    continue
+                self.weights[node_type] += 1
+                self.templates.setdefault(node_type, node)
+
+        if not self.weights:
+            raise ValueError(f"No workflow nodes found in {source_dir}")
+        self.types = sorted(self.weights)
+        self.cumulative_weights = []
+        total = 0
+        for node_type in self.types:
+            total += self.weights[node_type]
+            self.cumulative_weights.append(total)
+
+    def sample_types(self, rng: random.Random, count: int) -> List[str]:
+        return rng.choices(self.types, cum_weights=self.cumulative_weights, k=count)
+
+
+def build_workflow(index: int, mix: NodeMix, rng: random.Random, workflow_ids: List[str]) -> Dict[str, Any]:
+    """Build one synthetic n8n workflow export."""
+    workflow_id = workflow_ids[index]
+    node_count = max(2, rng.choice(mix.node_counts) + rng.randint(-3, 3))
+    nodes = []
+
+    if rng.random() < WEBHOOK_RATE:
+        nodes.append({
+            "parameters": {"httpMethod": "POST", "path": workflow_id.replace("_", "-")},
+            "type": "n8n-nodes-base.webhook",
+            "typeVersion": 1,
+        })
+    else:
+        nodes.append({
+            "parameters": {},
+            "type": "n8n-nodes-base.start",
+            "typeVersion": 1,
+            "notes": f"Synthetic workflow {index}",
+        })
+
+    for node_type in mix.sample_types(rng, node_count - 1):
+        node = copy.deepcopy(mix.templates[node_type])
+        nodes.append(node)
+
+    if index and rng.random() < SUB_WORKFLOW_RATE:
+        # Only call workflows with a lower index, so the corpus has no cycles
+        for called in rng.sample(range(index), min(index, rng.randint(1, MAX_SUB_WORKFLOW_CALLS))):
+            nodes.append({
+                "parameters": {"workflowId": workflow_ids[called]},
+                "type": "n8n-nodes-base.executeWorkflow",
+                "typeVersion": 1,
+            })
+
+    connections = {}
+    for position, node in enumerate(nodes):
+        node["id"] = f"{workflow_id}-node-{position}"
+        node["name"] = f"{node['type'].rsplit('.', 1)[-1]} {position}"
+        node["position"] = [position * 220, 0]
+    for source, target in zip(nodes, nodes[1:]):
+        connections[source["name"]] = {"main": [[{"node": target["name"], "type": "main", "index": 0}]]}
+
+    return {
+        "name": workflow_id.replace("_", " ").title(),
+        "nodes": nodes,
+        "connections": connections,
+        "pinData": {},
+        "settings": {"executionOrder": "v1"},
+        "tags": [{"name": "synthetic"}],
+        "meta": {"instanceId": "synthetic"},
+    }
+
+
+def corpus_layout(count: int) -> List[Tuple[str, str]]:
+    """Return (domain directory, workflow ID) for each workflow in a corpus."""
+    layout = []
+    for index in range(count):
+        domain_dir = CORPUS_DOMAINS[index % len(CORPUS_DOMAINS)]
+        layout.append((domain_dir, f"{domain_dir.rsplit('/', 1)[-1]}_synthetic_{index:06d}"))
+    return layout
+
+
+def generate_corpus(workflows_dir: Path, count: int, seed: int = 0, mix: NodeMix = None) -> int:
+    """Write count synthetic workflows under workflows_dir and return the total bytes written."""
+    mix = mix or NodeMix()
+    rng = random.Random(seed)
+    layout = corpus_layout(count)
+    workflow_ids = [workflow_id for _, workflow_id in layout]
+
+    for domain_dir in CORPUS_DOMAINS:
+        (workflows_dir / domain_dir).mkdir(parents=True, exist_ok=True)
+
+    total_bytes = 0
+    for index, (domain_dir, workflow_id) in enumerate(layout):
+        content = json.dumps(build_workflow(index, mix, rng, workflow_ids), indent=2)
+        (workflows_dir / domain_dir / f"{workflow_id}.json").write_text(content, encoding='utf-8')
+        total_bytes += len(content)
+    return total_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic workflow corpus")
+    parser.add_argument("output", type=Path, help="Directory to use as the workflows root")
+    parser.add_argument("--workflows", type=int, default=1000, help="Number of workflows")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    total_bytes = generate_corpus(args.output, args.workflows, args.seed)
+    print(f"Wrote {args.workflows} workflows ({total_bytes / (1024 * 1024):.1f} MB) to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Purpose: Content-addressed, incremental backup store for workflow snapshots
+Created/Updated: 2026-10-16
+Agent: BACKEND_AGENT
+
+A snapshot backs up one or more source trees (by default workflows/ and
+shared/, or an export_workflows.py output directory). Every file is stored
+once as a blob named by the sha256 of its content; JSON files are first
+canonicalized (sorted keys, fixed indent), so reformatting or key order never
+creates a new blob. Each snapshot then writes only a small manifest mapping
+paths to blob hashes. A daily run uploads just the blobs the store does not
+have yet.
+
+Store layout (under a local directory or an S3 bucket prefix):
+
+    blobs/<first two hex digits>/<sha256>.gz   gzip-compressed file content
+    manifests/<snapshot id>.json               {"snapshot", "created_at", "label", "files": {path: {...}}}
+
+Retention deletes manifests older than --keep-days (always keeping the
+newest --keep-last), then deletes blobs no remaining manifest references.
+Do not prune while a snapshot is being written: its blobs are uploaded
+before its manifest and would look unreferenced.
+
+Storage is pluggable: LocalStorage for a directory (file:// URLs, used by
+the tests) and S3Storage for s3://bucket/prefix URLs, which needs boto3.
+
+Usage:
+    python ops/scripts/backup_store.py --store s3://automation-hub-prod-workflows/backups snapshot --label daily
+    python ops/scripts/backup_store.py --store backup-store snapshot --source workflow-export --label n8n
+    python ops/scripts/backup_store.py --store backup-store list
+    python ops/scripts/backup_store.py --store backup-store prune --keep-days 90 --keep-last 7
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from export_workflows import canonical_json, write_atomic
+
+# Base paths
+REPO_ROOT = Path(__file__).parent.parent.parent
+DEFAULT_SOURCES = [REPO_ROOT / "workflows", REPO_ROOT / "shared"]
+
+BLOBS_PREFIX = "blobs/"
+MANIFESTS_PREFIX = "manifests/"
+SNAPSHOT_TIME_FORMAT = "%Y-%m-%dT%H-%M-%SZ"
+LABEL_PATTERN = re.compile(r"^[A-Za-z0-9_.-]+$")
+
+
+class LocalStorage:
+    """Store keys as files under a root directory."""
+
+    def __init__(self, root: Path):
+        self.root = root
+
+    def __repr__(self) -> str:
+        return f"LocalStorage({self.root})"
+
+    def put(self, key: str, data: bytes):
+        path = self.root / key
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(path, data)
+
+    def get(self, key: str) -> bytes:
+        return (self.root / key).read_bytes()
+
+    def open(self, key: str) -> BinaryIO:
+        """A readable stream of the key's content."""
+        return open(self.root / key, 'rb')
+
+    def list(self, prefix: str) -> Iterator[str]:
+        """Keys starting with prefix (a directory prefix ending in '/')."""
+        base = self.root / prefix
+        if not base.is_dir():
+            return
+        for path in base.rglob("*"):
+            if path.is_file() and not path.name.startswith("."):
+                yield path.relative_to(self.root).as_posix()
+
+    def delete(self, keys: Iterable[str]):
+        for key in keys:
+            (self.root / key).unlink(missing_ok=True)
+
+
+class S3Storage:
+    """Store keys as objects under a prefix of an S3 bucket."""
+
+    def __init__(self, bucket: str, prefix: str = "", client: Any = None):
+        if client is None:
+            try:
+                import boto3
+            except ImportError:
+                raise RuntimeError("S3 storage needs boto3 (pip install boto3)") from None
+            client = boto3.client("s3")
+        self.bucket = bucket
+        self.prefix = prefix.strip("/") + "/" if prefix.strip("/") else ""
+        self.client = client
+
+    def __repr__(self) -> str:
+        return f"S3Storage(s3://{self.bucket}/{self.prefix})"
+
+    def put(self, key: str, data: bytes):
+        self.client.put_object(Bucket=self.bucket, Key=self.prefix + key, Body=data)
+
+    def get(self, key: str) -> bytes:
+        return self.client.get_object(Bucket=self.bucket, Key=self.prefix + key)["Body"].read()
+
+    def open(self, key: str) -> BinaryIO:
+        """The object's body, read from the network as the caller consumes it."""
+        return self.client.get_object(Bucket=self.bucket, Key=self.prefix + key)["Body"]
+
+    def list(self, prefix: str) -> Iterator[str]:
+        request = {"Bucket": self.bucket, "Prefix": self.prefix + prefix}
+        while True:
+            response = self.client.list_objects_v2(**request)
+            for item in response.get("Contents", []):
+                yield item["Key"][len(self.prefix):]
+            if not response.get("IsTruncated"):
+                return
+            request["ContinuationToken"] = response["NextContinuationToken"]
+
+    def delete(self, keys: Iterable[str]):
+        keys = list(keys)
+        # DeleteObjects accepts at most 1000 keys per request
+        for start in range(0, len(keys), 1000):
+            objects = [{"Key": self.prefix + key} for key in keys[start:start + 1000]]
+            self.client.delete_objects(Bucket=self.bucket, Delete={"Objects": objects, "Quiet": True})
+
+
+def open_storage(url: str):
+    """Storage for an s3://bucket/prefix URL, a file:// URL or a plain directory path."""
+    if url.startswith("s3://"):
+        bucket, _, prefix = url[len("s3://"):].partition("/")
+        return S3Storage(bucket, prefix)
+    if url.startswith("file://"):
+        url = url[len("file://"):]
+    return LocalStorage(Path(url))
+
+
+def blob_key(digest: str) -> str:
+    return f"{BLOBS_PREFIX}{digest[:2]}/{digest}.gz"
+
+
+def canonical_content(path: Path) -> bytes:
+    """File content as stored: canonical JSON for .json files that parse, raw bytes otherwise."""
+    data = path.read_bytes()
+    if path.suffix == ".json" and data.strip():
+        try:
+            return canonical_json(json.loads(data))
+        except ValueError:
+            pass
+    return data
+
+
+def iter_source_files(sources: List[Path]) -> Iterator[Tuple[str, Path]]:
+    """(snapshot path, file) for every file under the sources, named <source dir name>/<relative path>."""
+    for source in sources:
+        for path in sorted(source.rglob("*")):
+            if path.is_file() and not any(part.startswith(".") for part in path.relative_to(source).parts):
+                yield f"{source.name}/{path.relative_to(source).as_posix()}", path
+
+
+class BackupStore:
+    """Snapshots, listing and retention on top of a storage backend."""
+
+    def __init__(self, storage, jobs: int = 8):
+        self.storage = storage
+        self.jobs = jobs
+        self._known_blobs: Optional[Set[str]] = None
+        self._lock = threading.Lock()
+
+    def known_blobs(self) -> Set[str]:
+        """Hashes of the blobs already in the store, listed once."""
+        if self._known_blobs is None:
+            self._known_blobs = {
+                key.rsplit("/", 1)[-1][:-len(".gz")] for key in self.storage.list(BLOBS_PREFIX) if key.endswith(".gz")
+            }
+        return self._known_blobs
+
+    def _store_file(self, path: Path) -> Tuple[Dict[str, Any], bool]:
+        content = canonical_content(path)
+        digest = hashlib.sha256(content).hexdigest()
+        # Claim the digest before uploading, so identical files in one snapshot upload it once
+        with self._lock:
+            uploaded = digest not in self.known_blobs()
+            self._known_blobs.add(digest)
+        if uploaded:
+            try:
+                self.storage.put(blob_key(digest), gzip.compress(content, mtime=0))
+            except BaseException:
+                with self._lock:
+                    self._known_blobs.discard(digest)
+                raise
+        return {"sha256": digest, "bytes": len(content)}, uploaded
+
+    def snapshot(self, sources: List[Path], label: str = "snapshot",
+                 now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Store every source file not already in the store, then write the snapshot manifest."""
+        if not LABEL_PATTERN.match(label):
+            raise ValueError(f"Invalid snapshot label: {label!r}")
+        created_at = now or datetime.now(timezone.utc)
+        snapshot_id = f"{created_at.strftime(SNAPSHOT_TIME_FORMAT)}-{label}"
+        files = list(iter_source_files(sources))
+        self.known_blobs()
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            results = list(executor.map(lambda item: self._store_file(item[1]), files))
+
+        uploaded = {entry["sha256"]: entry["bytes"] for entry, was_uploaded in results if was_uploaded}
+        manifest = {
+            "snapshot": snapshot_id,
+            "created_at": created_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "label": label,
+            "files": {snapshot_path: entry for (snapshot_path, _), (entry, _) in zip(files, results)},
+        }
+        self.storage.put(f"{MANIFESTS_PREFIX}{snapshot_id}.json", canonical_json(manifest))
+        return {
+            "snapshot": snapshot_id,
+            "files": len(files),
+            "blobs_uploaded": len(uploaded),
+            "bytes_uploaded": sum(uploaded.values()),
+            "bytes_total": sum(entry["bytes"] for entry, _ in results),
+        }
+
+    def snapshots(self) -> List[str]:
+        """Snapshot ids, oldest first."""
+        return sorted(
+            key[len(MANIFESTS_PREFIX):-len(".json")]
+            for key in self.storage.list(MANIFESTS_PREFIX) if key.endswith(".json")
+        )
+
+    def manifest(self, snapshot_id: str) -> Dict[str, Any]:
+        return json.loads(self.storage.get(f"{MANIFESTS_PREFIX}{snapshot_id}.json"))
+
+    def prune(self, keep_days: int, keep_last: int = 1, now: Optional[datetime] = None,
+              dry_run: bool = False) -> Dict[str, Any]:
+        """Delete snapshots past retention, then every blob no remaining snapshot references."""
+        cutoff = (now or datetime.now(timezone.utc)) - timedelta(days=keep_days)
+        snapshots = self.snapshots()
+        protected = set(snapshots[-keep_last:]) if keep_last > 0 else set()
+        expired = [
+            snapshot_id for snapshot_id in snapshots
+            if snapshot_id not in protected and snapshot_time(snapshot_id) < cutoff
+        ]
+        kept = [snapshot_id for snapshot_id in snapshots if snapshot_id not in expired]
+
+        referenced: Set[str] = set()
+        for snapshot_id in kept:
+            referenced.update(entry["sha256"] for entry in self.manifest(snapshot_id)["files"].values())
+        unreferenced = sorted(self.known_blobs() - referenced)
+
+        if not dry_run:
+            self.storage.delete(f"{MANIFESTS_PREFIX}{snapshot_id}.json" for snapshot_id in expired)
+            self.storage.delete(blob_key(digest) for digest in unreferenced)
+            self._known_blobs.difference_update(unreferenced)
+        return {"snapshots_deleted": expired, "snapshots_kept": len(kept), "blobs_deleted": len(unreferenced)}
+
+
+def snapshot_time(snapshot_id: str) -> datetime:
+    """Creation time encoded at the start of a snapshot id."""
+    return datetime.strptime(snapshot_id[:20], SNAPSHOT_TIME_FORMAT).replace(tzinfo=timezone.utc)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Content-addressed workflow backup store")
+    parser.add_argument("--store", required=True, help="s3://bucket/prefix, file:///path or a directory")
+    parser.add_argument("--jobs", type=int, default=8, help="Parallel blob uploads")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    snapshot_parser = commands.add_parser("snapshot", help="Back up source trees as a new snapshot")
+    snapshot_parser.add_argument("--source", type=Path, action="append",
+                                 help="Directory to back up (repeatable; default: workflows/ and shared/)")
+    snapshot_parser.add_argument("--label", default="snapshot", help="Label appended to the snapshot id")
+    snapshot_parser.add_argument("--report", type=Path, help="Write the snapshot result as JSON to this file")
+
+    commands.add_parser("list", help="List snapshots")
+
+    prune_parser = commands.add_parser("prune", help="Apply retention and delete unreferenced blobs")
+    prune_parser.add_argument("--keep-days", type=int, required=True, help="Delete snapshots older than this")
+    prune_parser.add_argument("--keep-last", type=int, default=1, help="Always keep this many newest snapshots")
+    prune_parser.add_argument("--dry-run", action="store_true", help="Only report what would be deleted")
+    args = parser.parse_args()
+
+    try:
+        store = BackupStore(open_storage(args.store), jobs=args.jobs)
+    except RuntimeError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.command == "snapshot":
+        sources = args.source or DEFAULT_SOURCES
+        missing = [str(source) for source in sources if not source.is_dir()]
+        if missing:
+            print(f"❌ Source directory not found: {', '.join(missing)}", file=sys.stderr)
+            sys.exit(1)
+        result = store.snapshot(sources, args.label)
+        print(f"✅ Snapshot {result['snapshot']}: {result['files']} files, {result['blobs_uploaded']} new blobs "
+              f"({result['bytes_uploaded']} of {result['bytes_total']} bytes uploaded) to {store.storage!r}")
+        if args.report:
+            args.report.parent.mkdir(parents=True, exist_ok=True)
+            args.report.write_text(json.dumps(result, indent=2) + "\n", encoding='utf-8')
+    elif args.command == "list":
+        for snapshot_id in store.snapshots():
+            print(snapshot_id)
+    else:
+        result = store.prune(args.keep_days, args.keep_last, dry_run=args.dry_run)
+        verb = "Would delete" if args.dry_run else "Deleted"
+        for snapshot_id in result["snapshots_deleted"]:
+            print(f"  {verb.lower()}: {snapshot_id}")
+        print(f"✅ {verb} {len(result['snapshots_deleted'])} snapshots and {result['blobs_deleted']} blobs; "
+              f"{result['snapshots_kept']} snapshots kept")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Purpose: Indexed SQLite store for the workflows catalog, with a query CLI
+Created/Updated: 2026-10-16
+Agent: BACKEND_AGENT
+
+generate_catalog.py writes workflows/metadata/workflows_catalog.db next to the
+YAML catalog. It indexes workflows by domain, status, schema_type, tag,
+endpoint and dependency, so lookups such as "which workflow exposes this
+webhook?" or "who depends on log_event?" do not need to load and scan the
+whole catalog.
+
+Usage:
+    python ops/scripts/catalog_store.py query --endpoint /webhook/lead-intake
+    python ops/scripts/catalog_store.py query --depends-on log_event
+    python ops/scripts/catalog_store.py query --domain crm --tag notifications --json
+    python ops/scripts/catalog_store.py rebuild
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+# Base paths
+REPO_ROOT = Path(__file__).parent.parent.parent
+METADATA_DIR = REPO_ROOT / "workflows" / "metadata"
+CATALOG_FILE = METADATA_DIR / "workflows_catalog.yaml"
+CATALOG_INDEX_FILE = METADATA_DIR / "workflows_catalog.db"
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE workflows (
+    row INTEGER PRIMARY KEY,
+    id TEXT NOT NULL,
+    name TEXT,
+    domain TEXT,
+    status TEXT,
+    schema_type TEXT,
+    file_path TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE workflow_tags (row INTEGER NOT NULL, tag TEXT NOT NULL);
+CREATE TABLE workflow_endpoints (row INTEGER NOT NULL, endpoint TEXT NOT NULL);
+CREATE TABLE workflow_dependencies (row INTEGER NOT NULL, dependency TEXT NOT NULL);
+CREATE TABLE catalog_info (key TEXT PRIMARY KEY, value TEXT);
+
+CREATE INDEX idx_workflows_id ON workflows (id);
+CREATE INDEX idx_workflows_domain ON workflows (domain);
+CREATE INDEX idx_workflows_status ON workflows (status);
+CREATE INDEX idx_workflows_schema_type ON workflows (schema_type);
+CREATE INDEX idx_workflow_tags ON workflow_tags (tag, row);
+CREATE INDEX idx_workflow_endpoints ON workflow_endpoints (endpoint, row);
+CREATE INDEX idx_workflow_dependencies ON workflow_dependencies (dependency, row);
+"""
+
+
+def write_catalog_index(catalog: Dict[str, Any], index_path: Path = CATALOG_INDEX_FILE):
+    """
+    Build the SQLite index for a catalog.
+
+    The index is built in a temporary file and renamed into place, so
+    concurrent readers always see a complete index.
+    """
+    catalog_data = catalog.get("catalog", {})
+    workflows = catalog_data.get("workflows", [])
+
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = index_path.with_name(index_path.name + ".tmp")
+    if tmp_path.exists():
+        tmp_path.unlink()
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(SCHEMA)
+        with conn:
+            conn.executemany(
+                "INSERT INTO workflows (row, id, name, domain, status, schema_type, file_path, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        row,
+                        workflow.get("id"),
+                        workflow.get("name"),
+                        workflow.get("domain"),
+                        workflow.get("status"),
+                        (workflow.get("schema_validation") or {}).get("schema_type"),
+                        workflow.get("file_path"),
+                        json.dumps(workflow, separators=(",", ":"), ensure_ascii=False),
+                    )
+                    for row, workflow in enumerate(workflows)
+                )
+            )
+            conn.executemany(
+                "INSERT INTO workflow_tags (row, tag) VALUES (?, ?)",
+                _facts(workflows, "tags")
+            )
+            conn.executemany(
+                "INSERT INTO workflow_endpoints (row, endpoint) VALUES (?, ?)",
+                _facts(workflows, "endpoints")
+            )
+            conn.executemany(
+                "INSERT INTO workflow_dependencies (row, dependency) VALUES (?, ?)",
+                _facts(workflows, "dependencies")
+            )
+            conn.executemany(
+                "INSERT INTO catalog_info (key, value) VALUES (?, ?)",
+                [
+                    ("schema_version", str(SCHEMA_VERSION)),
+                    ("catalog_version", str(catalog_data.get("version", ""))),
+                    ("generated_at", str(catalog_data.get("generated_at", ""))),
+                ]
+            )
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, index_path)
+
+
+def _facts(workflows: List[Dict[str, Any]], key: str) -> Iterable[tuple]:
+    """Yield (row, value) pairs for a list-valued workflow field."""
+    for row, workflow in enumerate(workflows):
+        for value in dict.fromkeys(workflow.get(key) or []):
+            if isinstance(value, str):
+                yield row, value
+
+
+class CatalogIndex:
+    """Read-only query interface over a catalog SQLite index."""
+
+    def __init__(self, index_path: Path = CATALOG_INDEX_FILE):
+        if not index_path.exists():
+            raise FileNotFoundError(f"Catalog index not found: {index_path}")
+        self.conn = sqlite3.connect(f"file:{index_path}?mode=ro", uri=True)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def query(self, **filters) -> List[Dict[str, Any]]:
+        """Return catalog entries matching every given filter, in catalog order."""
+        return [json.loads(data) for (data,) in self._select("w.data", **filters)]
+
+    def query_ids(self, **filters) -> List[str]:
+        """Return IDs of workflows matching every given filter, without decoding entries."""
+        return [workflow_id for (workflow_id,) in self._select("w.id", **filters)]
+
+    def _select(
+        self,
+        column: str,
+        domain: Optional[str] = None,
+        status: Optional[str] = None,
+        schema_type: Optional[str] = None,
+        tags: Iterable[str] = (),
+        endpoint: Optional[str] = None,
+        depends_on: Optional[str] = None,
+    ) -> sqlite3.Cursor:
+        """Run an AND-combined filter query selecting a single column."""
+        clauses = []
+        params: List[Any] = []
+        for name, value in (("domain", domain), ("status", status), ("schema_type", schema_type)):
+            if value is not None:
+                clauses.append(f"w.{name} = ?")
+                params.append(value)
+        for tag in tags:
+            clauses.append("w.row IN (SELECT row FROM workflow_tags WHERE tag = ?)")
+            params.append(tag)
+        if endpoint is not None:
+            clauses.append("w.row IN (SELECT row FROM workflow_endpoints WHERE endpoint = ?)")
+            params.append(normalize_endpoint(endpoint))
+        if depends_on is not None:
+            clauses.append("w.row IN (SELECT row FROM workflow_dependencies WHERE dependency = ?)")
+            params.append(depends_on)
+
+        sql = f"SELECT {column} FROM workflows w"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY w.row"
+        return self.conn.execute(sql, params)
+
+
+def normalize_endpoint(endpoint: str) -> str:
+    """Accept a bare webhook path as well as the catalog's /webhook/<path> form."""
+    if endpoint.startswith("/"):
+        return endpoint
+    return f"/webhook/{endpoint}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the indexed workflows catalog")
+    parser.add_argument("--index", type=Path, default=CATALOG_INDEX_FILE, help="Path to the SQLite index")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    query_parser = subparsers.add_parser("query", help="Find workflows matching all given filters")
+    query_parser.add_argument("--domain", help="Workflow domain (shared, crm, infra, meta)")
+    query_parser.add_argument("--status", help="Workflow status (active, draft, deprecated)")
+    query_parser.add_argument("--schema-type", help="Validated schema type (event, contact, ...)")
+    query_parser.add_argument("--tag", action="append", default=[], help="Tag (repeat to require several)")
+    query_parser.add_argument("--endpoint", help="Webhook endpoint, e.g. /webhook/lead-intake or lead-intake")
+    query_parser.add_argument("--depends-on", help="Workflow ID that matches must depend on")
+    query_parser.add_argument("--json", action="store_true", help="Print full catalog entries as JSON")
+    query_parser.add_argument("--timing", action="store_true", help="Print query time to stderr")
+
+    rebuild_parser = subparsers.add_parser("rebuild", help="Rebuild the index from the catalog file")
+    rebuild_parser.add_argument("--catalog", type=Path, default=CATALOG_FILE,
+                                help="Catalog YAML file or JSON sidecar to index")
+
+    args = parser.parse_args()
+
+    if args.command == "rebuild":
+        from generate_catalog import load_catalog_file
+        write_catalog_index(load_catalog_file(args.catalog), args.index)
+        print(f"Catalog index written: {args.index}")
+        return
+
+    try:
+        index = CatalogIndex(args.index)
+    except FileNotFoundError as e:
+        print(f"Error: {e}. Run generate_catalog.py or 'catalog_store.py rebuild' first.")
+        sys.exit(1)
+
+    filters = {
+        "domain": args.domain,
+        "status": args.status,
+        "schema_type": args.schema_type,
+        "tags": args.tag,
+        "endpoint": args.endpoint,
+        "depends_on": args.depends_on,
+    }
+    with index:
+        started = time.perf_counter()
+        matches = index.query(**filters) if args.json else index.query_ids(**filters)
+        elapsed = time.perf_counter() - started
+
+    if args.json:
+        print(json.dumps(matches, indent=2, ensure_ascii=False))
+    else:
+        for workflow_id in matches:
+            print(workflow_id)
+    if args.timing:
+        print(f"{len(matches)} match(es) in {elapsed * 1000:.3f} ms", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
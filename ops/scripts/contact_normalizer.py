@@ -0,0 +1,552 @@
+#!/usr/bin/env python3
+"""
+Purpose: Batch contact normalization with the semantics of shared/js_snippets/normalize_contact.js
+Created/Updated: 2026-10-16
+Agent: BACKEND_AGENT
+
+normalize_contact.js normalizes one contact per n8n Code node call. This
+module applies the same rules to batches of contacts for offline backfills:
+field aliases are resolved per column, and every column is normalized
+through a memo table, so repeated values (statuses, sources, companies,
+tags, dates) are normalized once per batch. Patterns are precompiled.
+
+JavaScript semantics are reproduced where they affect output: || picks the
+first truthy alias ([] and {} are truthy, 0 and "" are not), String()
+formatting of numbers, arrays and objects, the JavaScript whitespace set
+for trim() and \\s, and UTF-16 lengths. tests/test_contact_normalizer.py
+runs both implementations through node on shared fixtures.
+
+Date parsing covers the formats V8 accepts that CRM exports use: ISO 8601
+(date-only as UTC, day overflow rolled into the next month like V8),
+M/D/YYYY with optional time, RFC 2822 and "Mon D, YYYY". Times without an
+offset are read as UTC, which matches node running with TZ=UTC. Strings in
+other formats, which V8 guesses at, normalize to null.
+
+Usage:
+    from contact_normalizer import normalize_contacts
+    normalized, errors = normalize_contacts(contacts)
+
+    python ops/scripts/contact_normalizer.py contacts.ndjson.gz --output normalized.ndjson
+    cat contacts.ndjson | python ops/scripts/contact_normalizer.py - --rejects rejects.ndjson
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from validate_payloads import DEFAULT_CHUNK_SIZE, iter_chunks, open_input
+
+# Field aliases, in the order normalize_contact.js tries them
+FIELD_ALIASES = {
+    "email": ("email", "Email", "email_address"),
+    "first_name": ("first_name", "firstName", "first", "First Name"),
+    "last_name": ("last_name", "lastName", "last", "Last Name"),
+    "company": ("company", "Company", "organization", "Organization"),
+    "phone": ("phone", "Phone", "phone_number", "phoneNumber"),
+    "title": ("title", "Title", "job_title", "jobTitle"),
+    "source": ("source", "Source", "lead_source", "leadSource"),
+    "status": ("status", "Status", "lead_status", "leadStatus"),
+    "tags": ("tags", "Tags", "tag"),
+    "created_at": ("created_at", "createdAt", "Created At", "created"),
+    "updated_at": ("updated_at", "updatedAt", "Updated At", "updated"),
+}
+# Value used when no alias is truthy (the last operand of the || chain)
+FIELD_FALLBACKS = {"email": "", "tags": []}
+ID_ALIASES = ("id", "Id", "ID")
+
+STANDARD_FIELDS = frozenset([
+    "id", "Id", "ID", "email", "Email", "email_address", "emailAddress",
+    "first_name", "firstName", "first", "First Name",
+    "last_name", "lastName", "last", "Last Name",
+    "company", "Company", "organization", "Organization",
+    "phone", "Phone", "phone_number", "phoneNumber",
+    "title", "Title", "job_title", "jobTitle",
+    "source", "Source", "lead_source", "leadSource",
+    "status", "Status", "lead_status", "leadStatus",
+    "tags", "Tags", "tag",
+    "created_at", "createdAt", "Created At", "created",
+    "updated_at", "updatedAt", "Updated At", "updated",
+    "metadata", "Metadata",
+])
+
+STATUS_MAP = {status: status for status in ("new", "contacted", "qualified", "converted", "lost")}
+ENRICHMENT_STATUSES = frozenset(["pending", "in_progress", "completed", "failed"])
+TAG_MAX_LENGTH = 50
+
+# JavaScript's WhiteSpace and LineTerminator code points (trim() and \s)
+JS_WHITESPACE = (
+    "\t\n\v\f\r \u00a0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a"
+    "\u2028\u2029\u202f\u205f\u3000\ufeff"
+)
+_WS = re.escape(JS_WHITESPACE)
+EMAIL_PATTERN = re.compile(rf"[^{_WS}@]+@[^{_WS}@]+\.[^{_WS}@]+")
+PHONE_FORMATTING = re.compile(rf"[{_WS}\-().]")
+UUID_PATTERN = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+
+MONTHS = {name: number for number, name in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], 1)}
+ISO_DATE = re.compile(
+    r"(?P<year>\d{4}|[+-]\d{6})(?:-(?P<month>\d{1,2})(?:-(?P<day>\d{1,2}))?)?"
+    r"(?:[Tt ](?P<hour>\d{2}):(?P<minute>\d{2})(?::(?P<second>\d{2})(?:\.(?P<fraction>\d+))?)?"
+    r"(?P<zone>[Zz]|[+-]\d{2}:?\d{2})?)?"
+)
+US_DATE = re.compile(
+    r"(?P<month>\d{1,2})/(?P<day>\d{1,2})/(?P<year>\d{2}|\d{4})"
+    r"(?: (?P<hour>\d{1,2}):(?P<minute>\d{2})(?::(?P<second>\d{2}))?)?"
+)
+RFC_2822_DATE = re.compile(
+    r"(?:[A-Za-z]{3},? )?(?P<day>\d{1,2}) (?P<month>[A-Za-z]{3}) (?P<year>\d{4})"
+    r"(?: (?P<hour>\d{1,2}):(?P<minute>\d{2})(?::(?P<second>\d{2}))?)?"
+    r"(?: (?:GMT|UTC|UT|Z)?(?P<zone>[+-]\d{4})?)?"
+)
+MONTH_NAME_DATE = re.compile(r"(?P<month>[A-Za-z]{3}) (?P<day>\d{1,2}), (?P<year>\d{4})")
+
+# ECMAScript time values are limited to +-8.64e15 ms around the epoch
+MAX_TIME_MS = 8.64e15
+MS_PER_DAY = 86400000
+
+# Values that can be memoized per column; type is part of the key since True == 1
+_MEMO_TYPES = (str, int, float, bool, type(None))
+_MISSING = object()
+
+
+class ContactNormalizationError(ValueError):
+    """Raised for contacts normalize_contact.js would reject (same messages)."""
+
+
+# --- JavaScript semantics ---------------------------------------------------
+
+def js_truthy(value: Any) -> bool:
+    """JavaScript truthiness of a JSON value: [] and {} are truthy."""
+    if isinstance(value, (list, dict)):
+        return True
+    return bool(value)
+
+
+def js_first(contact: Dict[str, Any], aliases: Sequence[str], fallback: Any = None) -> Any:
+    """contact[a] || contact[b] || ... || fallback."""
+    for alias in aliases:
+        value = contact.get(alias)
+        if js_truthy(value):
+            return value
+    return fallback
+
+
+def js_number(value: float) -> str:
+    """String(number) for a finite JSON number."""
+    value = float(value)
+    if value == 0:
+        return "0"
+    sign = "-" if value < 0 else ""
+    digits_tuple = Decimal(repr(abs(value))).normalize().as_tuple()
+    digits = "".join(map(str, digits_tuple.digits))
+    k = len(digits)
+    n = digits_tuple.exponent + k
+    if k <= n <= 21:
+        text = digits + "0" * (n - k)
+    elif 0 < n <= 21:
+        text = f"{digits[:n]}.{digits[n:]}"
+    elif -6 < n <= 0:
+        text = "0." + "0" * -n + digits
+    else:
+        exponent = n - 1
+        mantissa = digits if k == 1 else f"{digits[0]}.{digits[1:]}"
+        text = f"{mantissa}e{'+' if exponent >= 0 else '-'}{abs(exponent)}"
+    return sign + text
+
+
+def js_string(value: Any) -> str:
+    """String(value) for a JSON value."""
+    if isinstance(value, str):
+        return value
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return js_number(value)
+    if isinstance(value, list):
+        return ",".join("" if item is None else js_string(item) for item in value)
+    return "[object Object]"
+
+
+def js_trim(text: str) -> str:
+    return text.strip(JS_WHITESPACE)
+
+
+def utf16_length(text: str) -> int:
+    """JavaScript string length (UTF-16 code units)."""
+    if text.isascii():
+        return len(text)
+    return len(text.encode("utf-16-le", "surrogatepass")) // 2
+
+
+def utf16_prefix(text: str, length: int) -> str:
+    """text.substring(0, length)."""
+    if text.isascii():
+        return text[:length]
+    return text.encode("utf-16-le", "surrogatepass")[:length * 2].decode("utf-16-le", "surrogatepass")
+
+
+# --- Dates ------------------------------------------------------------------
+
+def _days_from_civil(year: int, month: int, day: int) -> int:
+    """Days since 1970-01-01 for a proleptic Gregorian date (day may overflow the month)."""
+    year -= month <= 2
+    era = (year if year >= 0 else year - 399) // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
+
+
+def _civil_from_days(days: int) -> Tuple[int, int, int]:
+    days += 719468
+    era = (days if days >= 0 else days - 146096) // 146097
+    day_of_era = days - era * 146097
+    year_of_era = (day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096) // 365
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+    month_index = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * month_index + 2) // 5 + 1
+    month = month_index + (3 if month_index < 10 else -9)
+    return year_of_era + era * 400 + (month <= 2), month, day
+
+
+def _time_value(year, month, day, hour=0, minute=0, second=0, millisecond=0, offset_minutes=0) -> Optional[int]:
+    """Epoch milliseconds for date fields, or None when out of range (an Invalid Date)."""
+    if not (1 <= month <= 12 and 1 <= day <= 31 and 0 <= minute <= 59 and 0 <= second <= 59):
+        return None
+    if hour > 24 or (hour == 24 and (minute or second or millisecond)):
+        return None
+    days = _days_from_civil(year, month, day)
+    time_ms = ((days * 24 + hour) * 60 + minute - offset_minutes) * 60000 + second * 1000 + millisecond
+    return time_ms if abs(time_ms) <= MAX_TIME_MS else None
+
+
+def _offset_minutes(zone: Optional[str]) -> Optional[int]:
+    if not zone or zone in "Zz":
+        return 0
+    sign = -1 if zone[0] == "-" else 1
+    digits = zone[1:].replace(":", "")
+    hours, minutes = int(digits[:2]), int(digits[2:])
+    if hours > 23 or minutes > 59:
+        return None
+    return sign * (hours * 60 + minutes)
+
+
+def _two_digit_year(year: str) -> int:
+    value = int(year)
+    if len(year) == 2:
+        return value + (2000 if value < 50 else 1900)
+    return value
+
+
+def parse_js_date(text: str) -> Optional[int]:
+    """Epoch milliseconds of Date.parse(text) for the supported formats, else None."""
+    text = js_trim(text)
+    match = ISO_DATE.fullmatch(text)
+    if match:
+        fields = match.groupdict()
+        if fields["year"] == "-000000":
+            return None
+        offset = _offset_minutes(fields["zone"])
+        if offset is None:
+            return None
+        fraction = (fields["fraction"] or "0")[:3].ljust(3, "0")
+        return _time_value(
+            int(fields["year"]), int(fields["month"] or 1), int(fields["day"] or 1),
+            int(fields["hour"] or 0), int(fields["minute"] or 0), int(fields["second"] or 0),
+            int(fraction), offset
+        )
+
+    match = US_DATE.fullmatch(text)
+    if match:
+        fields = match.groupdict()
+        return _time_value(
+            _two_digit_year(fields["year"]), int(fields["month"]), int(fields["day"]),
+            int(fields["hour"] or 0), int(fields["minute"] or 0), int(fields["second"] or 0)
+        )
+
+    match = RFC_2822_DATE.fullmatch(text) or MONTH_NAME_DATE.fullmatch(text)
+    if match:
+        fields = match.groupdict()
+        month = MONTHS.get(fields["month"].lower())
+        offset = _offset_minutes(fields.get("zone"))
+        if month is None or offset is None:
+            return None
+        return _time_value(
+            int(fields["year"]), month, int(fields["day"]),
+            int(fields.get("hour") or 0), int(fields.get("minute") or 0), int(fields.get("second") or 0),
+            0, offset
+        )
+    return None
+
+
+def iso_string(time_ms: int) -> str:
+    """Date.prototype.toISOString() for an epoch millisecond value."""
+    days, ms_of_day = divmod(time_ms, MS_PER_DAY)
+    year, month, day = _civil_from_days(days)
+    seconds, millisecond = divmod(ms_of_day, 1000)
+    minutes, second = divmod(seconds, 60)
+    hour, minute = divmod(minutes, 60)
+    year_text = f"{year:04d}" if 0 <= year <= 9999 else f"{'+' if year > 0 else '-'}{abs(year):06d}"
+    return f"{year_text}-{month:02d}-{day:02d}T{hour:02d}:{minute:02d}:{second:02d}.{millisecond:03d}Z"
+
+
+# --- Field normalizers (normalize_contact.js counterparts) ------------------
+
+def normalize_email(email: Any) -> str:
+    if not email or not isinstance(email, str):
+        raise ContactNormalizationError("Email is required and must be a string")
+    normalized = js_trim(email).lower()
+    if not EMAIL_PATTERN.fullmatch(normalized):
+        raise ContactNormalizationError(f"Invalid email format: {email}")
+    return normalized
+
+
+def normalize_string(value: Any, max_length: Optional[int] = None) -> Optional[str]:
+    if value is None or value == "":
+        return None
+    normalized = js_trim(js_string(value))
+    if normalized == "":
+        return None
+    if max_length and utf16_length(normalized) > max_length:
+        return utf16_prefix(normalized, max_length)
+    return normalized
+
+
+def normalize_phone(phone: Any) -> Optional[str]:
+    if not js_truthy(phone):
+        return None
+    normalized = PHONE_FORMATTING.sub("", js_string(phone))
+    if not normalized.startswith("+"):
+        length = utf16_length(normalized)
+        if normalized.startswith("1") and length == 11:
+            normalized = "+" + normalized
+        elif length == 10:
+            normalized = "+1" + normalized
+    return normalized or None
+
+
+def normalize_status(status: Any) -> Optional[str]:
+    if not js_truthy(status):
+        return None
+    normalized = js_trim(js_string(status).lower())
+    return STATUS_MAP.get(normalized) or normalized or None
+
+
+def normalize_tags(tags: Any) -> List[str]:
+    if not js_truthy(tags):
+        return []
+    if isinstance(tags, str):
+        tags = tags.split(",")
+    elif not isinstance(tags, list):
+        return []
+    normalized = (normalize_string(tag, TAG_MAX_LENGTH) for tag in tags)
+    return [tag for tag in normalized if tag is not None]
+
+
+def extract_custom_fields(contact: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in contact.items() if key not in STANDARD_FIELDS and value is not None}
+
+
+def normalize_date_time(date_time: Any) -> Optional[str]:
+    if not js_truthy(date_time):
+        return None
+    if isinstance(date_time, (int, float)):
+        # new Date(number): TimeClip truncates toward zero
+        time_ms = int(date_time) if abs(date_time) <= MAX_TIME_MS else None
+    else:
+        time_ms = parse_js_date(js_string(date_time))
+    return None if time_ms is None else iso_string(time_ms)
+
+
+def normalize_uuid(uuid: Any) -> Optional[str]:
+    if not js_truthy(uuid):
+        return None
+    normalized = js_trim(js_string(uuid)).lower()
+    return normalized if UUID_PATTERN.fullmatch(normalized) else None
+
+
+def normalize_metadata(contact: Dict[str, Any]) -> Dict[str, Any]:
+    metadata = {}
+    if "risk_score" in contact or "riskScore" in contact:
+        risk_score = contact.get("risk_score")
+        if not js_truthy(risk_score):
+            risk_score = contact.get("riskScore")
+        if isinstance(risk_score, (int, float)) and not isinstance(risk_score, bool) and 0 <= risk_score <= 100:
+            metadata["risk_score"] = risk_score
+
+    enrichment_status = js_first(contact, ("enrichment_status", "enrichmentStatus"))
+    if enrichment_status is not None:
+        status = js_string(enrichment_status).lower()
+        if status in ENRICHMENT_STATUSES:
+            metadata["enrichment_status"] = status
+
+    last_enriched_at = js_first(contact, ("last_enriched_at", "lastEnrichedAt"))
+    if last_enriched_at is not None:
+        metadata["last_enriched_at"] = normalize_date_time(last_enriched_at)
+    return metadata
+
+
+FIELD_NORMALIZERS: Dict[str, Callable[[Any], Any]] = {
+    "email": normalize_email,
+    "first_name": normalize_string,
+    "last_name": normalize_string,
+    "company": normalize_string,
+    "phone": normalize_phone,
+    "title": normalize_string,
+    "source": normalize_string,
+    "status": normalize_status,
+    "tags": normalize_tags,
+    "created_at": normalize_date_time,
+    "updated_at": normalize_date_time,
+}
+# High-cardinality columns where a memo table costs more than it saves
+UNMEMOIZED_FIELDS = {"email"}
+
+
+# --- Contacts ---------------------------------------------------------------
+
+def normalize_contact(contact: Any) -> Dict[str, Any]:
+    """normalizeContact() for a single contact; raises ContactNormalizationError like the JS throws."""
+    normalized, errors = normalize_contacts([contact])
+    if errors:
+        raise ContactNormalizationError(errors[0]["error"])
+    return normalized[0]
+
+
+def _normalize_column(normalizer: Callable[[Any], Any], column: List[Any], memoize: bool) -> List[Any]:
+    """Normalize one column; exceptions are returned in place of values."""
+    memo: Dict[Tuple[type, Any], Any] = {}
+    results = []
+    for value in column:
+        key = (type(value), value) if memoize and isinstance(value, _MEMO_TYPES) else None
+        result = memo.get(key, _MISSING) if key is not None else _MISSING
+        if result is _MISSING:
+            try:
+                result = normalizer(value)
+            except ContactNormalizationError as e:
+                result = e
+            if key is not None:
+                memo[key] = result
+        results.append(result)
+    return results
+
+
+def normalize_contacts(contacts: Sequence[Any]) -> Tuple[List[Optional[Dict[str, Any]]], List[Dict[str, Any]]]:
+    """
+    Normalize a batch of contacts column by column.
+
+    Returns the normalized contacts, aligned with the input (None where a
+    contact was rejected), and a list of {"index", "error"} rejections.
+    """
+    errors = []
+    rows = []
+    for index, contact in enumerate(contacts):
+        if not isinstance(contact, (dict, list)):
+            errors.append({"index": index, "error": "Contact data must be an object"})
+        else:
+            # An array passes the JS typeof check but has none of the fields
+            rows.append((index, contact if isinstance(contact, dict) else {}))
+
+    columns = {
+        field: _normalize_column(
+            FIELD_NORMALIZERS[field],
+            [js_first(contact, aliases, FIELD_FALLBACKS.get(field)) for _, contact in rows],
+            field not in UNMEMOIZED_FIELDS
+        )
+        for field, aliases in FIELD_ALIASES.items()
+    }
+
+    normalized: List[Optional[Dict[str, Any]]] = [None] * len(contacts)
+    for position, (index, contact) in enumerate(rows):
+        email = columns["email"][position]
+        if isinstance(email, Exception):
+            errors.append({"index": index, "error": str(email)})
+            continue
+        record = {
+            "email": email,
+            "first_name": columns["first_name"][position],
+            "last_name": columns["last_name"][position],
+            "company": columns["company"][position],
+            "phone": columns["phone"][position],
+            "title": columns["title"][position],
+            "source": columns["source"][position],
+            "status": columns["status"][position],
+            # Copied: memoized tag lists are shared between contacts
+            "tags": list(columns["tags"][position]),
+            "custom_fields": extract_custom_fields(contact),
+            "created_at": columns["created_at"][position],
+            "updated_at": columns["updated_at"][position],
+            "metadata": normalize_metadata(contact),
+        }
+        contact_id = js_first(contact, ID_ALIASES)
+        if contact_id is not None:
+            record["id"] = normalize_uuid(contact_id)
+        normalized[index] = record
+
+    errors.sort(key=lambda error: error["index"])
+    return normalized, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Normalize NDJSON contacts like normalize_contact.js")
+    parser.add_argument("input", help="NDJSON file of raw contacts (.gz supported) or - for stdin")
+    parser.add_argument("--output", type=Path, help="Write normalized contacts here (default: stdout)")
+    parser.add_argument("--rejects", type=Path, help="Write rejected contacts and their errors here")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, metavar="LINES",
+                        help=f"Contacts normalized per batch (default: {DEFAULT_CHUNK_SIZE})")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    total = rejected = 0
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    rejects = open(args.rejects, "w", encoding="utf-8") if args.rejects else None
+    try:
+        with open_input(args.input) as stream:
+            for chunk in iter_chunks(stream, args.chunk_size):
+                contacts = []
+                parse_errors = {}
+                for position, (_, line) in enumerate(chunk):
+                    try:
+                        contacts.append(json.loads(line))
+                    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                        contacts.append(None)
+                        parse_errors[position] = f"Invalid JSON: {e}"
+
+                normalized, errors = normalize_contacts(contacts)
+                for error in errors:
+                    error["error"] = parse_errors.get(error["index"], error["error"])
+                for record in normalized:
+                    if record is not None:
+                        output.write(json.dumps(record, ensure_ascii=False) + "\n")
+                if rejects is not None:
+                    for error in errors:
+                        number, line = chunk[error["index"]]
+                        rejects.write(json.dumps({
+                            "line": number,
+                            "error": error["error"],
+                            "record": line.decode("utf-8", errors="replace").rstrip("\r\n"),
+                        }, ensure_ascii=False) + "\n")
+                total += len(chunk)
+                rejected += len(errors)
+    finally:
+        if args.output:
+            output.close()
+        if rejects is not None:
+            rejects.close()
+
+    elapsed = time.perf_counter() - started
+    rate = round(total / elapsed) if elapsed > 0 else 0
+    print(f"Normalized {total - rejected} of {total} contacts in {elapsed:.3f}s ({rate} contacts/s), "
+          f"{rejected} rejected", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
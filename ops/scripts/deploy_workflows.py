@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Purpose: Deploy workflow JSON files to an n8n instance concurrently
+Created/Updated: 2026-10-16
+Agent: BACKEND_AGENT
+
+Lists the workflows already on the instance once, then creates (POST) or
+updates (PUT) local workflows through n8n_client.N8nClient: requests share
+a pool of keep-alive connections and at most --concurrency of them are in
+flight. Failed requests are retried with jittered backoff using the
+environment's workflows.default_retry_attempts/default_retry_delay_ms.
+
+Only workflows that are new or whose content changed are pushed. Both
+sides are canonicalized before hashing: the deployed fields only, keys
+sorted, nodes ordered by name, node ids and positions and runtime
+staticData dropped, and empty settings treated alike. Remote workflows
+with no local file are reported as stale, never deleted, when the whole
+tree is deployed. --force pushes every workflow regardless.
+
+Workflows are matched to remote ones by name, falling back to the file
+name when the JSON has none. Only the fields the public API accepts (name,
+nodes, connections, settings, staticData) are sent. Empty files and
+_metadata stubs are skipped; files sharing a name are deployed once when
+their contents match and fail as a conflict otherwise.
+
+The API key is read from N8N_API_KEY. The base URL comes from --base-url,
+then N8N_BASE_URL, then n8n.base_url in the environment config.
+
+Usage:
+    python ops/scripts/deploy_workflows.py --environment dev
+    python ops/scripts/deploy_workflows.py --environment prod --concurrency 16 --report deploy-report.json
+    python ops/scripts/deploy_workflows.py --environment dev workflows/domains/crm/lead_intake.json
+    python ops/scripts/deploy_workflows.py --environment dev --dry-run
+    python ops/scripts/deploy_workflows.py --environment dev --force
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from n8n_client import N8nApiError, N8nClient, RetryPolicy, load_environment_config
+from validate_workflows import is_placeholder
+
+# Base paths
+REPO_ROOT = Path(__file__).parent.parent.parent
+WORKFLOWS_DIR = REPO_ROOT / "workflows"
+
+# Directories under WORKFLOWS_DIR that hold catalog metadata and packs, not workflows
+EXCLUDED_DIRS = ("metadata", "packs")
+
+# Top-level workflow fields accepted by POST/PUT /api/v1/workflows
+DEPLOY_FIELDS = ("name", "nodes", "connections", "settings", "staticData")
+# Deployed fields n8n rewrites at runtime, left out of content hashes
+VOLATILE_FIELDS = ("staticData",)
+# Node fields that change when a workflow is re-imported or nodes are moved
+VOLATILE_NODE_FIELDS = ("id", "position")
+
+
+def iter_workflow_files(workflows_dir: Path = WORKFLOWS_DIR) -> List[Path]:
+    """Deployable workflow JSON files under workflows_dir, in sorted order."""
+    return sorted(
+        path for path in workflows_dir.rglob("*.json")
+        if not any(part in EXCLUDED_DIRS for part in path.relative_to(workflows_dir).parts[:-1])
+    )
+
+
+def deploy_body(workflow: Dict[str, Any], workflow_file: Path) -> Dict[str, Any]:
+    """The request body for a workflow: API-accepted fields, with name and settings filled in."""
+    body = {field: workflow[field] for field in DEPLOY_FIELDS if field in workflow}
+    body["name"] = workflow.get("name") or workflow_file.stem
+    body.setdefault("nodes", [])
+    body.setdefault("connections", {})
+    body.setdefault("settings", {})
+    return body
+
+
+def canonical_workflow(workflow: Dict[str, Any]) -> Dict[str, Any]:
+    """The deployed content of a local or remote workflow, without volatile fields."""
+    canonical = {
+        field: workflow[field] for field in DEPLOY_FIELDS
+        if field not in VOLATILE_FIELDS and workflow.get(field) not in (None, {}, [])
+    }
+    nodes = [
+        {key: value for key, value in node.items() if key not in VOLATILE_NODE_FIELDS}
+        if isinstance(node, dict) else node
+        for node in canonical.get("nodes", [])
+    ]
+    if nodes:
+        canonical["nodes"] = sorted(nodes, key=lambda node: str(node.get("name")) if isinstance(node, dict) else "")
+    return canonical
+
+
+def content_hash(workflow: Dict[str, Any]) -> str:
+    """sha256 of the canonical workflow serialized with sorted keys."""
+    canonical = json.dumps(canonical_workflow(workflow), sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def plan_deployment(workflow_files: List[Path], remote: List[Dict[str, Any]], force: bool = False,
+                    report_stale: bool = False) -> List[Dict[str, Any]]:
+    """
+    One entry per workflow file: its request body and whether it creates,
+    updates or leaves unchanged a remote workflow, or why it is skipped or
+    failed before any request. With report_stale, remote workflows without a
+    local file follow as "stale" entries.
+    """
+    remote_by_name: Dict[str, Dict[str, Any]] = {}
+    for workflow in remote:
+        remote_by_name.setdefault(workflow.get("name"), workflow)
+
+    plan: List[Dict[str, Any]] = []
+    by_name: Dict[str, Dict[str, Any]] = {}
+    for workflow_file in workflow_files:
+        entry: Dict[str, Any] = {"file": str(workflow_file), "name": None, "action": None}
+        plan.append(entry)
+        try:
+            text = workflow_file.read_text(encoding='utf-8')
+            workflow = json.loads(text) if text.strip() else None
+        except (OSError, UnicodeDecodeError, ValueError) as e:
+            entry.update(action="failed", error=f"Cannot read workflow: {e}")
+            continue
+        if workflow is None or is_placeholder(workflow):
+            entry["action"] = "skipped"
+            continue
+        if not isinstance(workflow, dict):
+            entry.update(action="failed", error="Workflow must be a JSON object")
+            continue
+
+        body = deploy_body(workflow, workflow_file)
+        if not isinstance(body["name"], str):
+            entry.update(action="failed", error="'name' must be a string")
+            continue
+        entry["name"] = body["name"]
+        first = by_name.get(body["name"])
+        if first is not None:
+            if first.get("body") == body:
+                entry.update(action="skipped", duplicate_of=first["file"])
+            else:
+                entry.update(action="failed", error=f"Workflow name also used by {first['file']}")
+            continue
+        by_name[body["name"]] = entry
+        entry.update(body=body, hash=content_hash(body))
+        existing = remote_by_name.get(body["name"])
+        if existing is None:
+            entry["action"] = "create"
+            continue
+        entry["id"] = str(existing.get("id"))
+        if not force and content_hash(existing) == entry["hash"]:
+            entry["action"] = "unchanged"
+        else:
+            entry["action"] = "update"
+
+    if report_stale:
+        for name, workflow in remote_by_name.items():
+            if name not in by_name:
+                plan.append({"file": None, "name": name, "action": "stale", "id": str(workflow.get("id"))})
+    return plan
+
+
+async def _deploy_entry(client: N8nClient, entry: Dict[str, Any]):
+    try:
+        if entry["action"] == "update":
+            await client.update_workflow(entry["id"], entry["body"])
+            entry["action"] = "updated"
+        else:
+            created = await client.create_workflow(entry["body"])
+            entry.update(action="created", id=str((created or {}).get("id")))
+    except N8nApiError as e:
+        entry.update(action="failed", error=str(e))
+
+
+async def deploy_workflows(client: N8nClient, workflow_files: List[Path], dry_run: bool = False,
+                           force: bool = False, report_stale: bool = False) -> Dict[str, Any]:
+    """Create or update the new and changed workflow files on the instance and build the report."""
+    started = time.perf_counter()
+    plan = plan_deployment(workflow_files, await client.list_workflows(), force, report_stale)
+    if not dry_run:
+        await asyncio.gather(*(
+            _deploy_entry(client, entry) for entry in plan if entry["action"] in ("create", "update")
+        ))
+    for entry in plan:
+        entry.pop("body", None)
+
+    actions = [entry["action"] for entry in plan]
+    return {
+        "summary": {
+            "files": sum(1 for entry in plan if entry["file"] is not None),
+            **{action: actions.count(action)
+               for action in ("created", "updated", "unchanged", "skipped", "failed", "stale")},
+            "planned": actions.count("create") + actions.count("update"),
+            "requests": client.requests_sent,
+            "retries": client.retries,
+            "connections": client.pool.connections_opened,
+            "elapsed_seconds": round(time.perf_counter() - started, 3),
+        },
+        "workflows": plan,
+    }
+
+
+def resolve_base_url(environment: str, base_url: Optional[str]) -> Optional[str]:
+    """--base-url, then N8N_BASE_URL, then n8n.base_url from the environment config."""
+    if base_url:
+        return base_url
+    if os.getenv("N8N_BASE_URL"):
+        return os.environ["N8N_BASE_URL"]
+    return (load_environment_config(environment).get("n8n") or {}).get("base_url")
+
+
+async def run(base_url: str, api_key: str, workflow_files: List[Path], concurrency: int,
+              retry: RetryPolicy, dry_run: bool, force: bool, report_stale: bool) -> Dict[str, Any]:
+    async with N8nClient(base_url, api_key, concurrency=concurrency, retry=retry) as client:
+        return await deploy_workflows(client, workflow_files, dry_run, force, report_stale)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Deploy workflow JSON files to n8n")
+    parser.add_argument("files", nargs="*", type=Path, help="Workflow files to deploy (default: all)")
+    parser.add_argument("--environment", default="dev", help="Environment whose config supplies retries and URL")
+    parser.add_argument("--base-url", help="n8n base URL (default: N8N_BASE_URL, then the environment config)")
+    parser.add_argument("--workflows-dir", type=Path, default=WORKFLOWS_DIR, help="Workflows root directory")
+    parser.add_argument("--concurrency", type=int, default=8, help="Maximum requests in flight")
+    parser.add_argument("--dry-run", action="store_true", help="Only report what would be created or updated")
+    parser.add_argument("--force", action="store_true", help="Push every workflow, even if its content is unchanged")
+    parser.add_argument("--report", type=Path, help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    api_key = os.getenv("N8N_API_KEY")
+    if not api_key:
+        print("❌ N8N_API_KEY not set", file=sys.stderr)
+        sys.exit(1)
+    base_url = resolve_base_url(args.environment, args.base_url)
+    if not base_url:
+        print(f"❌ No n8n base URL for environment: {args.environment}", file=sys.stderr)
+        sys.exit(1)
+
+    retry = RetryPolicy.for_environment(args.environment)
+    workflow_files = args.files or iter_workflow_files(args.workflows_dir)
+    print(f"Deploying {len(workflow_files)} workflow files to {base_url} ({args.environment}, "
+          f"concurrency {args.concurrency}, {retry.attempts} retries)...")
+    try:
+        report = asyncio.run(run(base_url, api_key, workflow_files, args.concurrency, retry,
+                                 args.dry_run, args.force, report_stale=not args.files))
+    except N8nApiError as e:
+        print(f"❌ Could not list workflows: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    for entry in report["workflows"]:
+        if entry["action"] == "failed":
+            print(f"❌ {entry['file']}: {entry['error']}")
+        elif entry["action"] == "stale":
+            print(f"⚠️  stale: {entry['name']} (id {entry['id']}) has no workflow file")
+        elif entry["action"] not in ("skipped", "unchanged"):
+            print(f"{'📋' if args.dry_run else '✅'} {entry['action']}: {entry['name']} ({entry['file']})")
+
+    summary = report["summary"]
+    print(f"{summary['files']} files in {summary['elapsed_seconds']}s: {summary['created']} created, "
+          f"{summary['updated']} updated, {summary['unchanged']} unchanged, {summary['skipped']} skipped, "
+          f"{summary['failed']} failed, {summary['stale']} stale "
+          f"({summary['requests']} requests, {summary['retries']} retries, {summary['connections']} connections)")
+
+    if args.report:
+        args.report.parent.mkdir(parents=True, exist_ok=True)
+        args.report.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n", encoding='utf-8')
+        print(f"Report written: {args.report}")
+
+    if summary["failed"]:
+        print(f"\n❌ Deployment failed for {summary['failed']} workflow(s)")
+        sys.exit(1)
+    if args.dry_run:
+        print(f"\n✅ Dry run: {summary['planned']} workflow(s) would be deployed")
+    else:
+        print(f"\n✅ Successfully deployed {summary['created'] + summary['updated']} workflow(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Purpose: Classify email domains against the risk lists in shared/data/email_domain_risk.json
+Created/Updated: 2026-10-16
+Agent: BACKEND_AGENT
+
+High-risk (disposable) domains are kept in a hashed suffix set: a lookup
+checks the domain and each parent domain (mail.tempmail.com, tempmail.com,
+com), so its cost depends on the number of labels, not on the list size.
+Low-risk domains match exactly. Both comparisons are case-insensitive.
+
+compute_risk_score.js builds the same structure from the same file, so
+Python and JavaScript classify every domain identically. Inside n8n the
+snippet cannot require() the file and uses an embedded copy of the lists,
+generated by --embed; --check exits 1 when that copy is stale.
+
+Usage:
+    from email_domains import load_domain_classifier
+    classifier = load_domain_classifier()
+    classifier.classify("user.mailinator.com")  # "high"
+
+    python ops/scripts/email_domains.py mailinator.com gmail.com example.org
+    python ops/scripts/email_domains.py --embed   # regenerate the lists in compute_risk_score.js
+    python ops/scripts/email_domains.py --check   # exit 1 if they are stale
+"""
+
+import argparse
+import json
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+# Base paths
+REPO_ROOT = Path(__file__).parent.parent.parent
+DOMAIN_LISTS_FILE = REPO_ROOT / "shared" / "data" / "email_domain_risk.json"
+COMPUTE_RISK_SCORE_JS = REPO_ROOT / "shared" / "js_snippets" / "compute_risk_score.js"
+
+# Markers around the generated copy of the lists in compute_risk_score.js
+EMBED_BEGIN = "// BEGIN generated from shared/data/email_domain_risk.json by ops/scripts/email_domains.py --embed"
+EMBED_END = "// END generated"
+
+HIGH_RISK = "high"
+LOW_RISK = "low"
+
+
+class DomainClassifier:
+    """Suffix-set lookup of high-risk domains and exact lookup of low-risk domains."""
+
+    def __init__(self, high_risk: Iterable[str], low_risk: Iterable[str]):
+        self.high_risk = frozenset(domain.lower() for domain in high_risk)
+        self.low_risk = frozenset(domain.lower() for domain in low_risk)
+
+    def is_high_risk(self, domain: str) -> bool:
+        """True if the domain or any parent domain is on the high-risk list."""
+        suffix = domain.lower()
+        while True:
+            if suffix in self.high_risk:
+                return True
+            dot = suffix.find(".")
+            if dot == -1:
+                return False
+            suffix = suffix[dot + 1:]
+
+    def is_low_risk(self, domain: str) -> bool:
+        return domain.lower() in self.low_risk
+
+    def classify(self, domain: str) -> Optional[str]:
+        """HIGH_RISK, LOW_RISK or None for domains on neither list."""
+        if self.is_high_risk(domain):
+            return HIGH_RISK
+        if self.is_low_risk(domain):
+            return LOW_RISK
+        return None
+
+
+def load_domain_lists(path: Path = DOMAIN_LISTS_FILE) -> Dict[str, List[str]]:
+    """The high_risk and low_risk lists of a domain lists file."""
+    with open(path, 'r', encoding='utf-8') as f:
+        lists = json.load(f)
+    return {"high_risk": lists.get("high_risk", []), "low_risk": lists.get("low_risk", [])}
+
+
+@lru_cache(maxsize=None)
+def load_domain_classifier(path: Path = DOMAIN_LISTS_FILE) -> DomainClassifier:
+    """Classifier for a domain lists file (cached per path)."""
+    lists = load_domain_lists(path)
+    return DomainClassifier(lists["high_risk"], lists["low_risk"])
+
+
+def embed_domain_lists(source: str, lists: Dict[str, List[str]]) -> str:
+    """The snippet source with the block between the embed markers regenerated from lists."""
+    start = source.index(EMBED_BEGIN) + len(EMBED_BEGIN)
+    end = source.index(EMBED_END, start)
+    return f"{source[:start]}\nconst DEFAULT_DOMAIN_LISTS = {json.dumps(lists, indent=2)};\n{source[end:]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Classify email domains by risk")
+    parser.add_argument("domains", nargs="*", help="Domains or email addresses to classify")
+    parser.add_argument("--lists", type=Path, default=DOMAIN_LISTS_FILE, help="Domain lists JSON file")
+    parser.add_argument("--snippet", type=Path, default=COMPUTE_RISK_SCORE_JS,
+                        help="JavaScript snippet holding the embedded lists")
+    parser.add_argument("--embed", action="store_true", help="Regenerate the lists embedded in the snippet")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if the embedded lists are not up to date")
+    args = parser.parse_args()
+
+    if args.embed or args.check:
+        current = args.snippet.read_text(encoding='utf-8')
+        source = embed_domain_lists(current, load_domain_lists(args.lists))
+        if args.check:
+            if current != source:
+                print(f"❌ {args.snippet} is out of date; run: python ops/scripts/email_domains.py --embed",
+                      file=sys.stderr)
+                sys.exit(1)
+            print(f"✅ {args.snippet} is up to date")
+        else:
+            args.snippet.write_text(source, encoding='utf-8')
+            print(f"Embedded {args.lists} in {args.snippet}")
+        return
+    if not args.domains:
+        parser.error("give domains to classify, --embed or --check")
+
+    classifier = load_domain_classifier(args.lists)
+    for value in args.domains:
+        domain = value.rpartition("@")[2]
+        print(f"{value}: {classifier.classify(domain) or 'unlisted'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Purpose: Export every workflow from an n8n instance to disk, concurrently and resumably
+Created/Updated: 2026-10-16
+Agent: BACKEND_AGENT
+
+Walks the cursor pagination of GET /api/v1/workflows (without pinned data,
+--page-size workflows per page) only to learn workflow ids; the full bodies
+are then fetched with GET /api/v1/workflows/{id} through n8n_client's pooled
+connections, --concurrency at a time, while the next page is listed. Each
+body is written to <output>/workflows/<id>.json as soon as it arrives, in
+canonical form (sorted keys, two-space indent, UTF-8, trailing newline), via
+a temporary file and a rename. Memory holds one page of summaries and the
+bodies in flight, whatever the size of the instance.
+
+After every page a checkpoint (<output>/.export-checkpoint.json) records the
+next cursor, the workflows written so far and any that failed. --resume
+continues from it, retrying the failures first. When the export completes,
+<output>/manifest.json lists every exported workflow with its file, size and
+sha256, and the checkpoint is removed. Workflows deleted between listing and
+fetching are reported, not failed. Export into a new, empty directory: files
+left there by earlier exports are not removed.
+
+Usage:
+    python ops/scripts/export_workflows.py --environment prod --output workflow-export
+    python ops/scripts/export_workflows.py --environment prod --output workflow-export --resume
+    python ops/scripts/export_workflows.py --base-url http://localhost:5678 --output out --concurrency 16
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from n8n_client import N8nApiError, N8nClient, RetryPolicy, load_environment_config
+
+CHECKPOINT_FILE = ".export-checkpoint.json"
+MANIFEST_FILE = "manifest.json"
+WORKFLOWS_SUBDIR = "workflows"
+DEFAULT_PAGE_SIZE = 100
+
+
+def canonical_json(value: Any) -> bytes:
+    """Deterministic serialization: sorted keys, two-space indent, UTF-8, trailing newline."""
+    return (json.dumps(value, sort_keys=True, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def write_atomic(path: Path, data: bytes):
+    """Write data to path through a temporary file, so readers never see a partial file."""
+    # A unique hidden name, so concurrent writers of the same path never share a temporary file
+    fd, temp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(temp_name, path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+class WorkflowExporter:
+    """Exports the workflows of one instance into an output directory."""
+
+    def __init__(self, client: N8nClient, output_dir: Path, page_size: int = DEFAULT_PAGE_SIZE):
+        self.client = client
+        self.output_dir = output_dir
+        self.workflows_dir = output_dir / WORKFLOWS_SUBDIR
+        self.checkpoint_path = output_dir / CHECKPOINT_FILE
+        self.page_size = page_size
+        self.checkpoint: Dict[str, Any] = {"cursor": None, "pages": 0, "exported": {}, "failed": {}}
+        self.deleted: List[str] = []
+
+    def load_checkpoint(self) -> bool:
+        """Continue from a previous run's checkpoint; False if there is none."""
+        if not self.checkpoint_path.exists():
+            return False
+        with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+            self.checkpoint = json.load(f)
+        return True
+
+    def save_checkpoint(self):
+        write_atomic(self.checkpoint_path, canonical_json(self.checkpoint))
+
+    async def export_workflow(self, workflow_id: str):
+        """Fetch one workflow and write it to disk, recording the outcome in the checkpoint."""
+        try:
+            workflow = await self.client.get_workflow(workflow_id)
+        except N8nApiError as e:
+            if e.status == 404:
+                self.deleted.append(workflow_id)
+                self.checkpoint["failed"].pop(workflow_id, None)
+            else:
+                self.checkpoint["failed"][workflow_id] = str(e)
+            return
+        data = canonical_json(workflow)
+        file_name = f"{workflow_id}.json"
+        write_atomic(self.workflows_dir / file_name, data)
+        self.checkpoint["exported"][workflow_id] = {
+            "name": workflow.get("name"),
+            "file": f"{WORKFLOWS_SUBDIR}/{file_name}",
+            "updatedAt": workflow.get("updatedAt"),
+            "bytes": len(data),
+            "sha256": hashlib.sha256(data).hexdigest(),
+        }
+        self.checkpoint["failed"].pop(workflow_id, None)
+
+    async def export_ids(self, workflow_ids):
+        await asyncio.gather(*(self.export_workflow(workflow_id) for workflow_id in workflow_ids))
+
+    async def _list_page(self, cursor: Optional[str]):
+        return await self.client.list_workflow_page(cursor, self.page_size, exclude_pinned_data=True)
+
+    async def run(self) -> Dict[str, Any]:
+        """Export every workflow not yet in the checkpoint; returns the manifest when nothing failed."""
+        started = time.perf_counter()
+        self.workflows_dir.mkdir(parents=True, exist_ok=True)
+
+        # Retry what failed in an earlier run before walking on from its cursor
+        if self.checkpoint["failed"]:
+            await self.export_ids(list(self.checkpoint["failed"]))
+            self.save_checkpoint()
+        if self.checkpoint["pages"] and self.checkpoint["cursor"] is None:
+            next_page = None
+        else:
+            next_page = asyncio.ensure_future(self._list_page(self.checkpoint["cursor"]))
+
+        while next_page is not None:
+            summaries, cursor = await next_page
+            # List the next page while this page's bodies are fetched
+            next_page = asyncio.ensure_future(self._list_page(cursor)) if cursor else None
+            await self.export_ids(
+                str(summary["id"]) for summary in summaries if str(summary["id"]) not in self.checkpoint["exported"]
+            )
+            self.checkpoint.update(cursor=cursor, pages=self.checkpoint["pages"] + 1)
+            self.save_checkpoint()
+
+        summary = {
+            "exported": len(self.checkpoint["exported"]),
+            "failed": len(self.checkpoint["failed"]),
+            "deleted": len(self.deleted),
+            "pages": self.checkpoint["pages"],
+            "requests": self.client.requests_sent,
+            "retries": self.client.retries,
+            "connections": self.client.pool.connections_opened,
+            "elapsed_seconds": round(time.perf_counter() - started, 3),
+        }
+        if self.checkpoint["failed"]:
+            return {"summary": summary, "failed": self.checkpoint["failed"]}
+
+        manifest = {
+            "exported_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "source": self.client.api_url,
+            "count": len(self.checkpoint["exported"]),
+            "workflows": [
+                {"id": workflow_id, **entry}
+                for workflow_id, entry in sorted(self.checkpoint["exported"].items())
+            ],
+        }
+        write_atomic(self.output_dir / MANIFEST_FILE, canonical_json(manifest))
+        self.checkpoint_path.unlink()
+        return {"summary": summary, "failed": {}, "manifest": manifest}
+
+
+async def export_workflows(client: N8nClient, output_dir: Path, page_size: int = DEFAULT_PAGE_SIZE,
+                           resume: bool = False) -> Dict[str, Any]:
+    """Export every workflow on the instance into output_dir (continuing a checkpoint with resume)."""
+    exporter = WorkflowExporter(client, output_dir, page_size)
+    if exporter.load_checkpoint() and not resume:
+        raise FileExistsError(f"{exporter.checkpoint_path} exists; use --resume or remove it")
+    return await exporter.run()
+
+
+async def run(base_url: str, api_key: str, output_dir: Path, concurrency: int, page_size: int,
+              retry: RetryPolicy, resume: bool) -> Dict[str, Any]:
+    async with N8nClient(base_url, api_key, concurrency=concurrency, retry=retry) as client:
+        return await export_workflows(client, output_dir, page_size, resume)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export every workflow from an n8n instance")
+    parser.add_argument("--output", type=Path, required=True, help="Directory to export into")
+    parser.add_argument("--environment", default="dev", help="Environment whose config supplies retries and URL")
+    parser.add_argument("--base-url", help="n8n base URL (default: N8N_BASE_URL, then the environment config)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Maximum requests in flight")
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE, help="Workflows listed per page")
+    parser.add_argument("--resume", action="store_true", help="Continue an interrupted export from its checkpoint")
+    args = parser.parse_args()
+
+    api_key = os.getenv("N8N_API_KEY")
+    if not api_key:
+        print("❌ N8N_API_KEY not set", file=sys.stderr)
+        sys.exit(1)
+    base_url = (args.base_url or os.getenv("N8N_BASE_URL")
+                or (load_environment_config(args.environment).get("n8n") or {}).get("base_url"))
+    if not base_url:
+        print(f"❌ No n8n base URL for environment: {args.environment}", file=sys.stderr)
+        sys.exit(1)
+
+    retry = RetryPolicy.for_environment(args.environment)
+    print(f"Exporting workflows from {base_url} to {args.output} (concurrency {args.concurrency})...")
+    try:
+        result = asyncio.run(run(base_url, api_key, args.output, args.concurrency, args.page_size,
+                                 retry, args.resume))
+    except FileExistsError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+    except N8nApiError as e:
+        print(f"❌ Could not list workflows: {e}; rerun with --resume to continue", file=sys.stderr)
+        sys.exit(1)
+
+    summary = result["summary"]
+    print(f"{summary['exported']} exported, {summary['failed']} failed, {summary['deleted']} deleted while "
+          f"exporting, in {summary['elapsed_seconds']}s ({summary['pages']} pages, {summary['requests']} requests, "
+          f"{summary['retries']} retries, {summary['connections']} connections)")
+    if result["failed"]:
+        for workflow_id, error in result["failed"].items():
+            print(f"❌ {workflow_id}: {error}")
+        print(f"\n❌ Export incomplete; rerun with --resume to retry {summary['failed']} workflow(s)")
+        sys.exit(1)
+    print(f"\n✅ Exported {summary['exported']} workflow(s); manifest: {args.output / MANIFEST_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,14 @@
+#!/bin/bash
+# Purpose: Export n8n workflows from the automation platform
+# Created/Updated: 2026-10-16
+# Agent: BACKEND_AGENT
+#
+# Wrapper around export_workflows.py (paginated, concurrent, resumable export).
+# Needs N8N_API_KEY; the URL comes from --base-url, N8N_BASE_URL or the environment config.
+#
+# Usage:
+#   ops/scripts/export_workflows.sh --environment prod --output workflow-export [--resume]
+
+set -euo pipefail
+
+exec python3 "$(dirname "${BASH_SOURCE[0]}")/export_workflows.py" "$@"
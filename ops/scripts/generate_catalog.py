@@ -6,27 +6,58 @@ Agent: BACKEND_AGENT
 
 This script scans workflow JSON files and generates/updates:
 - workflows/metadata/workflows_catalog.yaml
+- workflows/metadata/workflows_catalog.json (compact sidecar for CI/deploy tooling)
+- workflows/metadata/workflows_catalog.db (SQLite index, see catalog_store.py)
 - workflows/metadata/ownership.yaml (if needed)
 
 Usage:
     python ops/scripts/generate_catalog.py
     python ops/scripts/generate_catalog.py --update-ownership
+    python ops/scripts/generate_catalog.py --incremental
+    python ops/scripts/generate_catalog.py --jobs 8
+    python ops/scripts/generate_catalog.py --watch
+    python ops/scripts/generate_catalog.py --delta-report catalog_delta.json
 """
 
 import argparse
+import hashlib
+import inspect
 import json
 import os
+import time
 import yaml
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Callable, Dict, List, Any, Optional, Tuple
+
+from catalog_store import write_catalog_index
+from workflow_layout import SCAN_DIRS
+from workflow_stream import CATALOG_FIELDS, stream_workflow_json
+from workflow_watch import create_watcher
+
+# Use the libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as CatalogDumper, CSafeLoader as CatalogLoader
+except ImportError:
+    from yaml import SafeDumper as CatalogDumper, SafeLoader as CatalogLoader
 
 # Base paths
 REPO_ROOT = Path(__file__).parent.parent.parent
 WORKFLOWS_DIR = REPO_ROOT / "workflows"
 METADATA_DIR = WORKFLOWS_DIR / "metadata"
 CATALOG_FILE = METADATA_DIR / "workflows_catalog.yaml"
+CATALOG_JSON_FILE = METADATA_DIR / "workflows_catalog.json"
+CATALOG_INDEX_FILE = METADATA_DIR / "workflows_catalog.db"
 OWNERSHIP_FILE = METADATA_DIR / "ownership.yaml"
+MANIFEST_FILE = METADATA_DIR / "workflows_manifest.json"
+MANIFEST_VERSION = 1
+
+# --watch flushes at the latest this long after the first change of a burst
+WATCH_MAX_DELAY_SECONDS = 5.0
+
+# Catalog fields maintained by hand, kept when entries are regenerated
+MANUAL_FIELDS = ["owner", "risk_level", "classification", "maintenance"]
 
 # Domain mappings
 DOMAIN_MAPPINGS = {
@@ -50,6 +81,73 @@ def load_workflow_json(workflow_path: Path) -> Dict[str, Any]:
         return {}
 
 
+def load_workflow_fields(workflow_path: Path) -> Dict[str, Any]:
+    """Stream only the catalog fields of a workflow file, skipping pinData and other blobs."""
+    try:
+        return stream_workflow_json(workflow_path, CATALOG_FIELDS)
+    except (ValueError, FileNotFoundError) as e:
+        print(f"Warning: Could not load {workflow_path}: {e}")
+        return {}
+
+
+def file_sha256(workflow_path: Path, chunk_size: int = 1 << 16) -> str:
+    """Hash a file's content in fixed-size chunks."""
+    digest = hashlib.sha256()
+    with open(workflow_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# Node extractors, keyed by node type. Each extractor receives a node and the
+# shared facts dict for the workflow and records whatever it needs into it.
+NodeExtractor = Callable[[Dict[str, Any], Dict[str, Any]], None]
+NODE_EXTRACTORS: Dict[str, List[NodeExtractor]] = {}
+
+
+def node_extractor(node_type: str) -> Callable[[NodeExtractor], NodeExtractor]:
+    """Register a function as an extractor for nodes of the given type."""
+    def register(func: NodeExtractor) -> NodeExtractor:
+        NODE_EXTRACTORS.setdefault(node_type, []).append(func)
+        return func
+    return register
+
+
+@node_extractor("n8n-nodes-base.start")
+def extract_start_notes(node: Dict[str, Any], facts: Dict[str, Any]):
+    """Use the notes of the first start node as the workflow description."""
+    if "start_notes" not in facts:
+        facts["start_notes"] = node.get("notes", "")
+
+
+@node_extractor("n8n-nodes-base.webhook")
+def extract_webhook_endpoint(node: Dict[str, Any], facts: Dict[str, Any]):
+    """Record webhook nodes as endpoints."""
+    webhook_path = node.get("parameters", {}).get("path", "")
+    if webhook_path:
+        facts["endpoints"].append(f"/webhook/{webhook_path}")
+
+
+@node_extractor("n8n-nodes-base.executeWorkflow")
+def extract_sub_workflow_dependency(node: Dict[str, Any], facts: Dict[str, Any]):
+    """Record executeWorkflow nodes as sub-workflow dependencies."""
+    sub_workflow = node.get("parameters", {}).get("workflowId", "")
+    if sub_workflow:
+        facts["dependencies"].append(sub_workflow)
+
+
+def extract_node_facts(nodes: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Collect node-level facts in a single pass over the workflow's nodes."""
+    facts = {"endpoints": [], "dependencies": []}
+    get_extractors = NODE_EXTRACTORS.get
+    for node in nodes:
+        extractors = get_extractors(node.get("type"))
+        if extractors:
+            for extractor in extractors:
+                extractor(node, facts)
+    return facts
+
+
 def extract_workflow_metadata(workflow_path: Path, workflow_data: Dict[str, Any]) -> Dict[str, Any]:
     """Extract metadata from workflow JSON file."""
     workflow_id = workflow_path.stem
@@ -63,32 +161,12 @@ def extract_workflow_metadata(workflow_path: Path, workflow_data: Dict[str, Any]
             domain = domain_name
             break
     
-    # Extract description from workflow data
+    # Node-level facts (start notes, webhook endpoints, sub-workflow dependencies)
+    facts = extract_node_facts(workflow_data.get("nodes", []))
+    
+    # Extract description from the first start node or workflow settings
     description = workflow_data.get("settings", {}).get("executionOrder", "")
-    if "nodes" in workflow_data:
-        # Try to find description in first node or workflow metadata
-        for node in workflow_data.get("nodes", []):
-            if node.get("type") == "n8n-nodes-base.start":
-                description = node.get("notes", "") or description
-                break
-    
-    # Extract endpoints (webhook nodes)
-    endpoints = []
-    if "nodes" in workflow_data:
-        for node in workflow_data.get("nodes", []):
-            if node.get("type") == "n8n-nodes-base.webhook":
-                webhook_path = node.get("parameters", {}).get("path", "")
-                if webhook_path:
-                    endpoints.append(f"/webhook/{webhook_path}")
-    
-    # Extract dependencies (sub-workflow references)
-    dependencies = []
-    if "nodes" in workflow_data:
-        for node in workflow_data.get("nodes", []):
-            if node.get("type") == "n8n-nodes-base.executeWorkflow":
-                sub_workflow = node.get("parameters", {}).get("workflowId", "")
-                if sub_workflow:
-                    dependencies.append(sub_workflow)
+    description = facts.get("start_notes") or description
     
     return {
         "id": workflow_id,
@@ -98,8 +176,8 @@ def extract_workflow_metadata(workflow_path: Path, workflow_data: Dict[str, Any]
         "version": "1.0.0",
         "status": "active",
         "file_path": str(relative_path),
-        "endpoints": endpoints,
-        "dependencies": dependencies,
+        "endpoints": facts["endpoints"],
+        "dependencies": facts["dependencies"],
         "tags": extract_tags(workflow_data, domain),
         "schema_validation": {
             "required": True,
@@ -117,8 +195,12 @@ def extract_tags(workflow_data: Dict[str, Any], domain: str) -> List[str]:
     tags = [domain]
     
     # Try to extract from workflow metadata
+    # (n8n exports list tags as {"id": ..., "name": ...} objects)
     if "tags" in workflow_data:
-        tags.extend(workflow_data["tags"])
+        for tag in workflow_data["tags"] or []:
+            tag = tag.get("name") if isinstance(tag, dict) else tag
+            if isinstance(tag, str) and tag:
+                tags.append(tag)
     
     # Infer tags from workflow name
     workflow_name = workflow_data.get("name", "").lower()
@@ -133,7 +215,7 @@ def extract_tags(workflow_data: Dict[str, Any], domain: str) -> List[str]:
     if "health" in workflow_name or "check" in workflow_name:
         tags.append("monitoring")
     
-    return list(set(tags))  # Remove duplicates
+    return list(dict.fromkeys(tags))  # Remove duplicates, keep first-seen order
 
 
 def infer_schema_type(workflow_id: str, domain: str) -> str:
@@ -152,31 +234,171 @@ def infer_schema_type(workflow_id: str, domain: str) -> str:
     return "event"  # Default
 
 
-def scan_workflows() -> List[Dict[str, Any]]:
-    """Scan workflow directories and extract metadata."""
-    workflows = []
-    
-    # Scan domains directories
-    domains_dirs = [
-        WORKFLOWS_DIR / "domains" / "shared",
-        WORKFLOWS_DIR / "domains" / "crm",
-        WORKFLOWS_DIR / "domains" / "infra",
-        WORKFLOWS_DIR / "domains" / "meta",
-        WORKFLOWS_DIR / "platform",  # Legacy support
-        WORKFLOWS_DIR / "domain_crm",  # Legacy support
-        WORKFLOWS_DIR / "domain_infra",  # Legacy support
-    ]
-    
-    for domain_dir in domains_dirs:
+def extraction_fingerprint() -> str:
+    """
+    Hash of the code and tables that turn a workflow file into catalog
+    metadata. Cached manifest entries are only reused while it is unchanged,
+    so an extraction fix applies to every file on the next incremental scan.
+    """
+    functions = [load_workflow_fields, extract_node_facts, extract_workflow_metadata, extract_tags, infer_schema_type]
+    functions += [extractor for node_type in sorted(NODE_EXTRACTORS) for extractor in NODE_EXTRACTORS[node_type]]
+    digest = hashlib.sha256(repr((MANIFEST_VERSION, DOMAIN_MAPPINGS, CATALOG_FIELDS, sorted(NODE_EXTRACTORS))).encode())
+    for function in functions:
+        try:
+            digest.update(inspect.getsource(function).encode("utf-8"))
+        except (OSError, TypeError):
+            digest.update(function.__code__.co_code)
+    return digest.hexdigest()
+
+
+# Computed once the extractors above are registered
+EXTRACTION_FINGERPRINT = extraction_fingerprint()
+
+
+def iter_workflow_files() -> List[Path]:
+    """List workflow JSON files in the scanned domain directories, in a stable order."""
+    workflow_files = []
+    for scan_dir in SCAN_DIRS:
+        domain_dir = WORKFLOWS_DIR / scan_dir
         if not domain_dir.exists():
             continue
-        
-        for workflow_file in domain_dir.glob("*.json"):
-            workflow_data = load_workflow_json(workflow_file)
-            if workflow_data:
-                metadata = extract_workflow_metadata(workflow_file, workflow_data)
-                workflows.append(metadata)
-    
+        workflow_files.extend(sorted(domain_dir.glob("*.json")))
+    return workflow_files
+
+
+def load_manifest() -> Dict[str, Any]:
+    """Load the incremental scan manifest, or an empty one if missing or stale."""
+    empty = {"version": MANIFEST_VERSION, "extraction": EXTRACTION_FINGERPRINT, "files": {}}
+    if not MANIFEST_FILE.exists():
+        return empty
+
+    try:
+        with open(MANIFEST_FILE, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (json.JSONDecodeError, OSError) as e:
+        print(f"Warning: Could not load manifest {MANIFEST_FILE}: {e}")
+        return empty
+
+    if (not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION
+            or manifest.get("extraction") != EXTRACTION_FINGERPRINT):
+        # Written by another manifest format or by different extraction code
+        return empty
+    manifest.setdefault("files", {})
+    return manifest
+
+
+def save_manifest(manifest: Dict[str, Any]):
+    """Save the incremental scan manifest next to the catalog."""
+    METADATA_DIR.mkdir(parents=True, exist_ok=True)
+    manifest["extraction"] = EXTRACTION_FINGERPRINT
+    write_text_atomic(MANIFEST_FILE, json.dumps(manifest, separators=(",", ":")))
+
+
+def stat_matches(stat: os.stat_result, cached: Optional[Dict[str, Any]]) -> bool:
+    """Check whether a manifest entry still matches the file's size and mtime."""
+    return bool(cached) and cached.get("size") == stat.st_size and cached.get("mtime_ns") == stat.st_mtime_ns
+
+
+def scan_workflow_file(workflow_file: Path, cached: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Build the manifest entry for a workflow file.
+
+    The cached entry is reused without opening the file when size and mtime
+    match, and without re-parsing it when the content hash matches.
+    """
+    stat = workflow_file.stat()
+    if stat_matches(stat, cached):
+        return cached
+
+    content_hash = file_sha256(workflow_file)
+    if cached and cached.get("sha256") == content_hash:
+        metadata = cached.get("metadata")
+    else:
+        metadata = extract_workflow_file(workflow_file)
+
+    return {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": content_hash,
+        "metadata": metadata,
+    }
+
+
+def extract_workflow_file(workflow_file: Path) -> Optional[Dict[str, Any]]:
+    """Load a workflow file and extract its metadata, or None if it is empty or invalid."""
+    workflow_data = load_workflow_fields(workflow_file)
+    if not workflow_data:
+        return None
+    return extract_workflow_metadata(workflow_file, workflow_data)
+
+
+def _init_scan_worker(workflows_dir: Path):
+    """Give pool workers the parent's WORKFLOWS_DIR (it may be overridden at runtime)."""
+    global WORKFLOWS_DIR
+    WORKFLOWS_DIR = workflows_dir
+
+
+def map_workflow_files(func, *iterables, jobs: int = 1) -> List[Any]:
+    """
+    Apply func over workflow files, optionally across a process pool.
+
+    Results are returned in input order, so output never depends on how the
+    pool schedules work.
+    """
+    items = list(zip(*iterables))
+    if jobs <= 1 or len(items) < 2:
+        return [func(*item) for item in items]
+
+    workers = min(jobs, len(items))
+    chunksize = max(1, len(items) // (workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_scan_worker,
+        initargs=(WORKFLOWS_DIR,)
+    ) as pool:
+        return list(pool.map(func, *zip(*items), chunksize=chunksize))
+
+
+def scan_workflows(manifest: Optional[Dict[str, Any]] = None, jobs: int = 1) -> List[Dict[str, Any]]:
+    """
+    Scan workflow directories and extract metadata.
+
+    When a manifest is given, only new or changed files are parsed and the
+    manifest is updated in place; files no longer on disk are dropped from it
+    so merge_catalog_updates() marks them deprecated. With jobs > 1, parsing
+    and extraction run in a process pool.
+    """
+    workflow_files = iter_workflow_files()
+
+    if manifest is None:
+        results = map_workflow_files(extract_workflow_file, workflow_files, jobs=jobs)
+        return [metadata for metadata in results if metadata]
+
+    cached_files = manifest.get("files", {})
+    relative_paths = [str(f.relative_to(WORKFLOWS_DIR)) for f in workflow_files]
+    scanned_files = {}
+    pending = []
+    for workflow_file, relative_path in zip(workflow_files, relative_paths):
+        cached = cached_files.get(relative_path)
+        if stat_matches(workflow_file.stat(), cached):
+            scanned_files[relative_path] = cached
+        else:
+            pending.append((workflow_file, relative_path, cached))
+
+    if pending:
+        pending_files, pending_paths, pending_cached = zip(*pending)
+        entries = map_workflow_files(scan_workflow_file, pending_files, pending_cached, jobs=jobs)
+        scanned_files.update(zip(pending_paths, entries))
+
+    workflows = []
+    ordered_files = {}
+    for relative_path in relative_paths:
+        entry = scanned_files[relative_path]
+        ordered_files[relative_path] = entry
+        if entry["metadata"]:
+            workflows.append(entry["metadata"])
+
+    manifest["files"] = ordered_files
     return workflows
 
 
@@ -216,57 +438,250 @@ def load_existing_catalog() -> Dict[str, Any]:
     if not CATALOG_FILE.exists():
         return {}
     
+    # The YAML file stays the source of truth: manual edits are made there,
+    # and the JSON sidecar may lag behind them.
     try:
-        with open(CATALOG_FILE, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f) or {}
+        return load_catalog_file(CATALOG_FILE)
     except Exception as e:
         print(f"Warning: Could not load existing catalog: {e}")
         return {}
 
 
+def load_catalog_file(catalog_path: Path) -> Dict[str, Any]:
+    """Load a catalog from its YAML file or JSON sidecar, based on the file suffix."""
+    with open(catalog_path, 'r', encoding='utf-8') as f:
+        if catalog_path.suffix == ".json":
+            return json.load(f) or {}
+        return yaml.load(f, Loader=CatalogLoader) or {}
+
+
 def merge_catalog_updates(existing: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
     """Merge new catalog data with existing, preserving manual edits."""
-    if not existing:
-        return new
+    return merge_catalog_with_delta(existing, new)[0]
+
+
+def merge_catalog_with_delta(
+    existing: Dict[str, Any], new: Dict[str, Any]
+) -> Tuple[Dict[str, Any], Dict[str, List[str]]]:
+    """
+    Merge new catalog data with existing and report what changed.
+    
+    The delta lists workflow IDs that were added, changed, newly deprecated
+    or left unchanged. Merged entries keep scan order, followed by workflows
+    that are no longer present in their existing order. If the merged catalog
+    matches the existing one apart from generated_at, the existing timestamp
+    is kept so that saving it does not rewrite any file.
+    """
+    delta: Dict[str, List[str]] = {"added": [], "changed": [], "deprecated": [], "unchanged": []}
+    existing_catalog = (existing or {}).get("catalog") or {}
     
     # Merge workflows by ID, preserving manual edits in existing
-    existing_workflows = {w.get("id"): w for w in existing.get("catalog", {}).get("workflows", [])}
+    existing_workflows = {w.get("id"): w for w in existing_catalog.get("workflows") or []}
     new_workflows = {w.get("id"): w for w in new.get("catalog", {}).get("workflows", [])}
     
-    # Update existing workflows with new data, but preserve manual fields
     merged_workflows = []
     for workflow_id, new_workflow in new_workflows.items():
-        existing_workflow = existing_workflows.get(workflow_id, {})
-        # Preserve manual fields like owner, risk_level from existing
+        existing_workflow = existing_workflows.get(workflow_id)
         merged = {**new_workflow}
-        if existing_workflow:
-            # Preserve manual edits
-            for key in ["owner", "risk_level", "classification", "maintenance"]:
+        if existing_workflow is None:
+            delta["added"].append(workflow_id)
+        else:
+            # Preserve manual fields like owner, risk_level from existing
+            for key in MANUAL_FIELDS:
                 if key in existing_workflow:
                     merged[key] = existing_workflow[key]
+            delta["unchanged" if merged == existing_workflow else "changed"].append(workflow_id)
         merged_workflows.append(merged)
     
-    # Add workflows that exist in existing but not in new (deprecated workflows)
+    # Keep workflows that exist in existing but not in new, as deprecated
     for workflow_id, existing_workflow in existing_workflows.items():
-        if workflow_id not in new_workflows:
-            existing_workflow["status"] = "deprecated"
-            merged_workflows.append(existing_workflow)
+        if workflow_id in new_workflows:
+            continue
+        already_deprecated = existing_workflow.get("status") == "deprecated"
+        delta["unchanged" if already_deprecated else "deprecated"].append(workflow_id)
+        merged_workflows.append({**existing_workflow, "status": "deprecated"})
+    
+    catalog = new["catalog"]
+    catalog["workflows"] = merged_workflows
+    catalog["total_workflows"] = len(merged_workflows)
     
-    new["catalog"]["workflows"] = merged_workflows
-    new["catalog"]["total_workflows"] = len(merged_workflows)
+    if "generated_at" in existing_catalog and \
+            {**catalog, "generated_at": None} == {**existing_catalog, "generated_at": None}:
+        catalog["generated_at"] = existing_catalog["generated_at"]
     
-    return new
+    return new, delta
+
+
+def format_delta_summary(delta: Dict[str, List[str]]) -> str:
+    """One-line summary of a catalog delta."""
+    return ", ".join(f"{len(delta[kind])} {kind}" for kind in ("added", "changed", "deprecated", "unchanged"))
+
+
+def save_delta_report(delta: Dict[str, List[str]], report_path: Path):
+    """Write a catalog delta as JSON, with per-kind counts."""
+    report = {"summary": {kind: len(ids) for kind, ids in delta.items()}, **delta}
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    write_text_atomic(report_path, json.dumps(report, indent=2) + "\n")
+
+
+def dump_catalog_yaml(catalog: Dict[str, Any]) -> str:
+    """Serialize a catalog to YAML."""
+    return yaml.dump(catalog, Dumper=CatalogDumper, sort_keys=False, default_flow_style=False, allow_unicode=True)
 
 
-def save_catalog(catalog: Dict[str, Any]):
-    """Save catalog to YAML file."""
+def dump_catalog_json(catalog: Dict[str, Any]) -> str:
+    """Serialize a catalog to compact JSON."""
+    return json.dumps(catalog, separators=(",", ":"), ensure_ascii=False)
+
+
+def write_text_atomic(path: Path, content: str):
+    """Write a file via a temporary sibling and rename, so readers never see a partial file."""
+    tmp_file = path.with_name(path.name + ".tmp")
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(tmp_file, path)
+
+
+def write_text_if_changed(path: Path, content: str) -> bool:
+    """Atomically write content unless the file already holds exactly that; return True if written."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == content:
+                return False
+    except (FileNotFoundError, UnicodeDecodeError):
+        pass
+    write_text_atomic(path, content)
+    return True
+
+
+def save_catalog(catalog: Dict[str, Any]) -> bool:
+    """
+    Save catalog to YAML file, its JSON sidecar and the SQLite query index.
+    
+    Outputs whose content is unchanged are left untouched, so unchanged
+    catalogs cause no file writes (and no git diff). Returns True if
+    anything was written.
+    """
     METADATA_DIR.mkdir(parents=True, exist_ok=True)
     
-    with open(CATALOG_FILE, 'w', encoding='utf-8') as f:
-        yaml.dump(catalog, f, sort_keys=False, default_flow_style=False, allow_unicode=True)
-    
-    print(f"Catalog generated: {CATALOG_FILE}")
+    yaml_written = write_text_if_changed(CATALOG_FILE, dump_catalog_yaml(catalog))
+    json_written = write_text_if_changed(CATALOG_JSON_FILE, dump_catalog_json(catalog))
+    # The sidecar is an exact serialization, so it tells whether the index is stale
+    index_written = json_written or not CATALOG_INDEX_FILE.exists()
+    if index_written:
+        write_catalog_index(catalog, CATALOG_INDEX_FILE)
+    
+    written = yaml_written or json_written or index_written
+    if written:
+        print(f"Catalog generated: {CATALOG_FILE}")
+    else:
+        print(f"Catalog unchanged: {CATALOG_FILE}")
     print(f"Total workflows: {catalog.get('catalog', {}).get('total_workflows', 0)}")
+    return written
+
+
+def workflow_sort_key(relative_path: str):
+    """Sort key matching the order iter_workflow_files() lists files in."""
+    scan_dir, _, name = relative_path.rpartition("/")
+    return (SCAN_DIRS.index(scan_dir), name)
+
+
+class LiveCatalog:
+    """In-memory catalog kept in sync with workflow files for --watch mode."""
+
+    def __init__(self, manifest: Dict[str, Any]):
+        self.manifest = manifest
+        self.existing = load_existing_catalog()
+        self._written_mtime_ns = None
+
+    def apply_changes(self, relative_paths: Optional[set] = None) -> bool:
+        """
+        Rescan the given workflow paths (None rescans everything).
+
+        Returns True if any catalog entry was added, changed or removed.
+        """
+        files = self.manifest["files"]
+        if relative_paths is None:
+            current = {str(f.relative_to(WORKFLOWS_DIR)) for f in iter_workflow_files()}
+            relative_paths = current | set(files)
+
+        changed = False
+        for relative_path in relative_paths:
+            if relative_path.rpartition("/")[0] not in SCAN_DIRS:
+                continue
+            cached = files.get(relative_path)
+            try:
+                entry = scan_workflow_file(WORKFLOWS_DIR / relative_path, cached)
+            except FileNotFoundError:
+                entry = None
+
+            if entry is None:
+                files.pop(relative_path, None)
+                changed = changed or bool(cached and cached.get("metadata"))
+                continue
+            if entry["metadata"] != (cached or {}).get("metadata"):
+                changed = True
+            files[relative_path] = entry
+        return changed
+
+    def flush(self):
+        """Merge the in-memory entries into the catalog and write it out atomically."""
+        files = self.manifest["files"]
+        self.manifest["files"] = {path: files[path] for path in sorted(files, key=workflow_sort_key)}
+        workflows = [entry["metadata"] for entry in self.manifest["files"].values() if entry["metadata"]]
+
+        # Pick up manual edits made to the catalog file while watching
+        if CATALOG_FILE.exists() and CATALOG_FILE.stat().st_mtime_ns != self._written_mtime_ns:
+            self.existing = load_existing_catalog()
+
+        merged, delta = merge_catalog_with_delta(self.existing, generate_catalog(workflows))
+        print(f"Catalog delta: {format_delta_summary(delta)}")
+        save_catalog(merged)
+        save_manifest(self.manifest)
+        self.existing = merged
+        self._written_mtime_ns = CATALOG_FILE.stat().st_mtime_ns
+
+
+def watch_catalog(debounce: float = 0.5, poll_interval: float = 1.0, force_polling: bool = False, jobs: int = 1):
+    """Keep the catalog up to date as workflow files change, until interrupted."""
+    manifest = load_manifest()
+    scan_workflows(manifest, jobs=jobs)
+    live = LiveCatalog(manifest)
+    live.flush()
+
+    watcher = create_watcher(WORKFLOWS_DIR, SCAN_DIRS, poll_interval, force_polling)
+    print(f"Watching {WORKFLOWS_DIR} ({type(watcher).__name__}), press Ctrl+C to stop")
+
+    pending = set()
+    full_rescan = False
+    burst_started = None
+    try:
+        while True:
+            dirty = bool(pending) or full_rescan
+            changes = watcher.wait(debounce if dirty else None)
+            now = time.monotonic()
+            if changes is None:
+                full_rescan = True
+            else:
+                pending.update(changes)
+            if (changes is None or changes) and burst_started is None:
+                burst_started = now
+
+            dirty = bool(pending) or full_rescan
+            quiet = changes is not None and not changes
+            if dirty and (quiet or now - burst_started >= WATCH_MAX_DELAY_SECONDS):
+                if live.apply_changes(None if full_rescan else pending):
+                    print(f"Detected changes in {'all' if full_rescan else len(pending)} workflow file(s)")
+                    live.flush()
+                else:
+                    save_manifest(live.manifest)
+                pending = set()
+                full_rescan = False
+                burst_started = None
+    except KeyboardInterrupt:
+        print("Stopped watching")
+    finally:
+        watcher.close()
 
 
 def main():
@@ -276,10 +691,60 @@ def main():
         action="store_true",
         help="Also update ownership.yaml (not implemented yet)"
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=f"Only re-parse workflow files changed since the last run (tracked in {MANIFEST_FILE.name})"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Parse workflow files in N worker processes (0 = one per CPU)"
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and update the catalog as workflow files change (implies --incremental)"
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=0.5,
+        metavar="SECONDS",
+        help="With --watch, wait for this long without changes before writing the catalog"
+    )
+    parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="With --watch, poll for changes instead of using inotify"
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=1.0,
+        metavar="SECONDS",
+        help="With --watch --poll (or without inotify), seconds between polls"
+    )
+    parser.add_argument(
+        "--delta-report",
+        type=Path,
+        metavar="PATH",
+        help="Write the added/changed/deprecated/unchanged workflow IDs to PATH as JSON"
+    )
     args = parser.parse_args()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    
+    if args.watch:
+        watch_catalog(args.debounce, args.poll_interval, args.poll, jobs=jobs)
+        return
     
     print("Scanning workflow files...")
-    workflows = scan_workflows()
+    manifest = load_manifest() if args.incremental else None
+    workflows = scan_workflows(manifest, jobs=jobs)
+    if manifest is not None:
+        save_manifest(manifest)
     
     if not workflows:
         print("Warning: No workflows found")
@@ -292,9 +757,13 @@ def main():
     
     # Load and merge with existing
     existing_catalog = load_existing_catalog()
-    merged_catalog = merge_catalog_updates(existing_catalog, new_catalog)
+    merged_catalog, delta = merge_catalog_with_delta(existing_catalog, new_catalog)
+    print(f"Catalog delta: {format_delta_summary(delta)}")
+    if args.delta_report:
+        save_delta_report(delta, args.delta_report)
+        print(f"Delta report written: {args.delta_report}")
     
-    # Save catalog
+    # Save catalog (only rewritten if its content changed)
     save_catalog(merged_catalog)
     
     if args.update_ownership:
@@ -0,0 +1,475 @@
+#!/usr/bin/env python3
+"""
+Purpose: Generate a precompiled JavaScript payload validator from shared/schemas
+Created/Updated: 2026-10-16
+Agent: BACKEND_AGENT
+
+validatePayload() in shared/js_snippets/validate_payload.js interprets an
+inline copy of the schemas on every call: it rebuilds the schema objects,
+constructs a RegExp per patterned field and scans enum arrays. This module
+generates shared/js_snippets/validate_payload_compiled.js instead, with
+one function per schema in shared/schemas: required-field and property
+checks unrolled, regexes, enum sets and allowed-field sets hoisted to
+module constants, and enum error messages prebuilt.
+
+validatePayloadCompiled(payload, schemaType) is a drop-in for n8n Code
+nodes: same arguments, same { valid, errors } result, and error messages
+in validatePayload's wording. Verdicts follow the Draft 7 schemas exactly,
+as schema_compiler.py does in Python, except that email and date-time
+formats are asserted the way validatePayload asserts them.
+
+The generated file is checked in; regenerate it after changing a schema.
+Schemas using keywords the compiler does not support are rejected.
+
+Usage:
+    python ops/scripts/js_validator_compiler.py           # regenerate the snippet
+    python ops/scripts/js_validator_compiler.py --check   # exit 1 if it is stale
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from schema_compiler import SCHEMAS_DIR, SUPPORTED_KEYWORDS, SchemaCompileError
+
+# Base paths
+REPO_ROOT = Path(__file__).parent.parent.parent
+OUTPUT_FILE = REPO_ROOT / "shared" / "js_snippets" / "validate_payload_compiled.js"
+
+TYPE_TESTS = {
+    "string": "typeof {v} === 'string'",
+    "number": "typeof {v} === 'number'",
+    "integer": "Number.isInteger({v})",
+    "boolean": "typeof {v} === 'boolean'",
+    "null": "{v} === null",
+    "array": "Array.isArray({v})",
+    "object": "typeof {v} === 'object' && {v} !== null && !Array.isArray({v})",
+}
+
+# Formats validatePayload asserts, as (helper function, message)
+FORMAT_CHECKS = {
+    "email": ("isValidEmail", "invalid email format"),
+    "date-time": ("isValidDateTime", "invalid date-time format (expected ISO 8601)"),
+}
+
+RUNTIME = """\
+const EMAIL_PATTERN = /^[^\\s@]+@[^\\s@]+\\.[^\\s@]+$/;
+
+function valueType(value) {
+  if (value === null) return 'null';
+  if (Array.isArray(value)) return 'array';
+  return typeof value;
+}
+
+function isValidEmail(email) {
+  return EMAIL_PATTERN.test(email);
+}
+
+function isValidDateTime(dateTime) {
+  return dateTime.includes('T') && !isNaN(new Date(dateTime).getTime());
+}
+"""
+
+
+class _Path:
+    """A field path as JavaScript string-expression parts: literals and variable names."""
+
+    def __init__(self, parts: Optional[List[Any]] = None):
+        self.parts = parts or []
+
+    def child(self, key: str) -> "_Path":
+        return _Path(self.parts + [("." if self.parts else "") + key])
+
+    def index(self, variable: str) -> "_Path":
+        return _Path(self.parts + ["[", _Var(variable), "]"])
+
+    def key(self, variable: str) -> "_Path":
+        return _Path(self.parts + (["."] if self.parts else []) + [_Var(variable)])
+
+    def js(self, suffix: str = "", prefix: str = "") -> str:
+        """JavaScript expression for prefix + path + suffix, with adjacent literals merged."""
+        pieces: List[Any] = []
+        for part in [prefix, *self.parts, suffix]:
+            if isinstance(part, str) and pieces and isinstance(pieces[-1], str):
+                pieces[-1] += part
+            elif part != "":
+                pieces.append(part)
+        return " + ".join(part.name if isinstance(part, _Var) else _js_string(part) for part in pieces) or "''"
+
+
+class _Var:
+    def __init__(self, name: str):
+        self.name = name
+
+
+def _js_string(text: str) -> str:
+    return "'" + json.dumps(text)[1:-1].replace("\\\"", "\"").replace("'", "\\'") + "'"
+
+
+def _js_literal(value: Any) -> str:
+    return _js_string(value) if isinstance(value, str) else json.dumps(value)
+
+
+def _js_join(values: List[Any]) -> str:
+    """Array.prototype.join(', ') of JSON values, as validatePayload prints enums."""
+    return ", ".join("" if value is None else
+                     ("true" if value is True else "false") if isinstance(value, bool) else
+                     value if isinstance(value, str) else json.dumps(value)
+                     for value in values)
+
+
+def _function_name(schema_type: str) -> str:
+    """'infra_deploy' -> 'validateInfraDeploy'."""
+    return "validate" + "".join(part.capitalize() for part in re.split(r"[^0-9A-Za-z]+", schema_type) if part)
+
+
+class _Emitter:
+    """Accumulates generated source lines and module-level constants."""
+
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+        self.lines: List[str] = []
+        self.constants: List[str] = []
+        self.variables = 0
+
+    def constant(self, kind: str, expression: str) -> str:
+        name = f"{self.prefix}_{kind}_{len(self.constants)}"
+        self.constants.append(f"const {name} = {expression};")
+        return name
+
+    def variable(self, prefix: str = "v") -> str:
+        self.variables += 1
+        return f"{prefix}{self.variables}"
+
+    def line(self, indent: int, text: str):
+        self.lines.append("  " * indent + text)
+
+    def error(self, indent: int, message: str):
+        self.line(indent, f"errors.push({message});")
+
+    def block(self, indent: int, header: str, body: Callable[[], None],
+              prefix: Optional[str] = None, first: Optional[str] = None):
+        """
+        Emit header { body }, with an optional setup line before the header and
+        an optional first line inside it; drop all of it if the body is empty.
+        """
+        start = len(self.lines)
+        if prefix:
+            self.line(indent, prefix)
+        self.line(indent, header + " {")
+        if first:
+            self.line(indent + 1, first)
+        before = len(self.lines)
+        body()
+        if len(self.lines) == before:
+            del self.lines[start:]
+        else:
+            self.line(indent, "}")
+
+
+def _emit_schema(emitter: _Emitter, schema: Any, value: str, path: _Path, indent: int, location: str):
+    """Emit checks for one (sub)schema against the variable named `value`."""
+    if schema is True or schema == {}:
+        return
+    if schema is False:
+        emitter.error(indent, path.js(": no value is allowed here"))
+        return
+    if not isinstance(schema, dict):
+        raise SchemaCompileError(f"{location}: schema must be an object or boolean")
+
+    unsupported = sorted(set(schema) - SUPPORTED_KEYWORDS)
+    if unsupported:
+        raise SchemaCompileError(f"{location}: unsupported keyword(s): {', '.join(unsupported)}")
+    if "type" not in schema:
+        _emit_constraints(emitter, schema, value, path, indent, location, types=None)
+        return
+
+    types = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+    unknown = [t for t in types if t not in TYPE_TESTS]
+    if unknown:
+        raise SchemaCompileError(f"{location}: unknown type(s): {unknown}")
+    test = " || ".join(TYPE_TESTS[t].format(v=value) for t in types)
+    emitter.line(indent, f"if (!({test})) {{")
+    emitter.error(indent + 1, path.js(f": expected type {' or '.join(types)}, got ") + f" + valueType({value})")
+    start = len(emitter.lines)
+    emitter.line(indent, "} else {")
+    before = len(emitter.lines)
+    _emit_constraints(emitter, schema, value, path, indent + 1, location, types=set(types))
+    if len(emitter.lines) == before:
+        del emitter.lines[start:]
+    emitter.line(indent, "}")
+
+
+def _emit_constraints(emitter: _Emitter, schema: Dict[str, Any], value: str, path: _Path, indent: int,
+                      location: str, types: Optional[set]):
+    """Emit the per-type checks, each guarded unless the schema already pins the value's type."""
+    def nested(matching: set) -> int:
+        """1 when guarded() wraps the checks in an if block."""
+        return 0 if types is not None and types <= matching else 1
+
+    def guarded(json_type: str, test: str, body: Callable[[], None]):
+        matching = {json_type, "integer"} if json_type == "number" else {json_type}
+        if types is not None and types <= matching:
+            body()
+        elif types is not None and types <= matching | {"null"} and types & matching:
+            # The type check passed, so anything but null has this type
+            emitter.block(indent, f"if ({value} !== null)", body)
+        elif types is None or types & matching:
+            emitter.block(indent, f"if ({test})", body)
+
+    guarded("string", TYPE_TESTS["string"].format(v=value),
+            lambda: _emit_string(emitter, schema, value, path, indent + nested({"string"})))
+    guarded("number", TYPE_TESTS["number"].format(v=value),
+            lambda: _emit_number(emitter, schema, value, path, indent + nested({"number", "integer"})))
+    if "enum" in schema:
+        _emit_enum(emitter, schema["enum"], value, path, indent, location)
+    if "const" in schema:
+        if isinstance(schema["const"], (dict, list)):
+            raise SchemaCompileError(f"{location}: const must be a string, number, boolean or null")
+        emitter.line(indent, f"if ({value} !== {_js_literal(schema['const'])}) {{")
+        emitter.error(indent + 1, path.js(f": value must be {json.dumps(schema['const'])}"))
+        emitter.line(indent, "}")
+    guarded("array", TYPE_TESTS["array"].format(v=value),
+            lambda: _emit_array(emitter, schema, value, path, indent + nested({"array"}), location))
+    guarded("object", TYPE_TESTS["object"].format(v=value),
+            lambda: _emit_object(emitter, schema, value, path, indent + nested({"object"}), location))
+
+
+def _emit_enum(emitter: _Emitter, values: List[Any], value: str, path: _Path, indent: int, location: str):
+    if any(isinstance(member, (dict, list)) for member in values):
+        raise SchemaCompileError(f"{location}: enum members must be strings, numbers, booleans or null")
+    members = emitter.constant("ENUM", f"new Set([{', '.join(_js_literal(member) for member in values)}])")
+    emitter.line(indent, f"if (!{members}.has({value})) {{")
+    emitter.error(indent + 1, path.js(f": value must be one of: {_js_join(values)}"))
+    emitter.line(indent, "}")
+
+
+def _emit_string(emitter: _Emitter, schema: Dict[str, Any], value: str, path: _Path, indent: int):
+    if "minLength" in schema or "maxLength" in schema:
+        # Draft 7 counts code points; String.length counts UTF-16 code units
+        length = emitter.variable("n")
+        emitter.line(indent, f"const {length} = [...{value}].length;")
+    if "minLength" in schema:
+        emitter.line(indent, f"if ({length} < {int(schema['minLength'])}) {{")
+        emitter.error(indent + 1, path.js(f": string length must be at least {schema['minLength']}"))
+        emitter.line(indent, "}")
+    if "maxLength" in schema:
+        emitter.line(indent, f"if ({length} > {int(schema['maxLength'])}) {{")
+        emitter.error(indent + 1, path.js(f": string length must be at most {schema['maxLength']}"))
+        emitter.line(indent, "}")
+    if "pattern" in schema:
+        pattern = emitter.constant("PATTERN", f"new RegExp({_js_string(schema['pattern'])})")
+        emitter.line(indent, f"if (!{pattern}.test({value})) {{")
+        emitter.error(indent + 1, path.js(": string does not match required pattern"))
+        emitter.line(indent, "}")
+    if schema.get("format") in FORMAT_CHECKS:
+        helper, message = FORMAT_CHECKS[schema["format"]]
+        emitter.line(indent, f"if (!{helper}({value})) {{")
+        emitter.error(indent + 1, path.js(f": {message}"))
+        emitter.line(indent, "}")
+
+
+def _emit_number(emitter: _Emitter, schema: Dict[str, Any], value: str, path: _Path, indent: int):
+    for key, op, wording in (("minimum", "<", "at least"), ("maximum", ">", "at most"),
+                             ("exclusiveMinimum", "<=", "greater than"), ("exclusiveMaximum", ">=", "less than")):
+        if key in schema:
+            emitter.line(indent, f"if ({value} {op} {json.dumps(schema[key])}) {{")
+            emitter.error(indent + 1, path.js(f": value must be {wording} {schema[key]}"))
+            emitter.line(indent, "}")
+
+
+def _emit_object(emitter: _Emitter, schema: Dict[str, Any], value: str, path: _Path, indent: int, location: str):
+    properties = schema.get("properties", {})
+    children = {}
+    for key in schema.get("required", []):
+        if key in properties:
+            children[key] = emitter.variable()
+            emitter.line(indent, f"const {children[key]} = {value}[{_js_string(key)}];")
+            test = f"{children[key]} === undefined"
+        else:
+            test = f"!({_js_string(key)} in {value})"
+        emitter.line(indent, f"if ({test}) {{")
+        emitter.error(indent + 1, path.child(key).js(prefix="Missing required field: "))
+        emitter.line(indent, "}")
+    for key, bound, wording in (("minProperties", "<", "at least"), ("maxProperties", ">", "at most")):
+        if key in schema:
+            emitter.line(indent, f"if (Object.keys({value}).length {bound} {int(schema[key])}) {{")
+            emitter.error(indent + 1, path.js(f": object must have {wording} {schema[key]} properties"))
+            emitter.line(indent, "}")
+
+    for key, subschema in properties.items():
+        child = children.get(key) or emitter.variable()
+        emitter.block(
+            indent, f"if ({child} !== undefined)",
+            lambda: _emit_schema(emitter, subschema, child, path.child(key), indent + 1, f"{location}.{key}"),
+            prefix=None if key in children else f"const {child} = {value}[{_js_string(key)}];"
+        )
+
+    additional = schema.get("additionalProperties", True)
+    if additional is True or additional == {}:
+        return
+    known = emitter.constant("FIELDS", f"new Set([{', '.join(_js_string(key) for key in properties)}])")
+    extra = emitter.variable("k")
+    if additional is False:
+        emitter.line(indent, f"for (const {extra} in {value}) {{")
+        emitter.line(indent + 1, f"if (!{known}.has({extra})) {{")
+        emitter.error(indent + 2, path.key(extra).js(prefix="Unexpected field: "))
+        emitter.line(indent + 1, "}")
+        emitter.line(indent, "}")
+        return
+    child = emitter.variable()
+    emitter.block(
+        indent, f"for (const {extra} in {value})",
+        lambda: emitter.block(
+            indent + 1, f"if (!{known}.has({extra}))",
+            lambda: _emit_schema(emitter, additional, child, path.key(extra), indent + 2,
+                                 f"{location}.additionalProperties"),
+            first=f"const {child} = {value}[{extra}];"
+        )
+    )
+
+
+def _emit_array(emitter: _Emitter, schema: Dict[str, Any], value: str, path: _Path, indent: int, location: str):
+    for key, bound, wording in (("minItems", "<", "at least"), ("maxItems", ">", "at most")):
+        if key in schema:
+            emitter.line(indent, f"if ({value}.length {bound} {int(schema[key])}) {{")
+            emitter.error(indent + 1, path.js(f": array must have {wording} {schema[key]} items"))
+            emitter.line(indent, "}")
+
+    items = schema.get("items", True)
+    if isinstance(items, list):
+        raise SchemaCompileError(f"{location}: tuple-form items is not supported")
+    index = emitter.variable("i")
+    child = emitter.variable()
+    emitter.block(
+        indent, f"for (let {index} = 0; {index} < {value}.length; {index}++)",
+        lambda: _emit_schema(emitter, items, child, path.index(index), indent + 1, f"{location}[]"),
+        first=f"const {child} = {value}[{index}];"
+    )
+
+
+def compile_schema(schema: Dict[str, Any], schema_type: str) -> str:
+    """Generate the JavaScript source of one validator function returning an error array."""
+    if schema.get("type") != "object":
+        raise SchemaCompileError(f"{schema_type}: top-level type must be object")
+    name = _function_name(schema_type)
+    emitter = _Emitter(re.sub(r"([a-z])([A-Z])", r"\1_\2", name[len("validate"):]).upper())
+    # validatePayloadCompiled() has already checked the payload is an object
+    _emit_object(emitter, schema, "payload", _Path(), 1, schema_type)
+
+    return "\n".join([
+        *emitter.constants,
+        "",
+        "/**",
+        f" * Validates a payload against shared/schemas/{schema_type}.schema.json",
+        " * @param {Object} payload - The payload to validate (a non-array object)",
+        " * @returns {Array} Error messages (empty if valid)",
+        " */",
+        f"function {name}(payload) {{",
+        "  const errors = [];",
+        *emitter.lines,
+        "  return errors;",
+        "}",
+    ])
+
+
+def compile_module(schemas: Dict[str, Dict[str, Any]]) -> str:
+    """Generate validate_payload_compiled.js for schemas keyed by schema type."""
+    functions = {schema_type: _function_name(schema_type) for schema_type in schemas}
+    return "\n".join([
+        "/*",
+        " * Purpose: Validate payloads against shared/schemas with precompiled validators",
+        " * Agent: BACKEND_AGENT",
+        " *",
+        " * GENERATED by ops/scripts/js_validator_compiler.py from shared/schemas/*.json.",
+        " * Do not edit; regenerate with: python ops/scripts/js_validator_compiler.py",
+        " *",
+        " * Drop-in for validatePayload() from validate_payload.js, with one unrolled",
+        " * validator per schema and regexes and enum sets built once at load.",
+        " *",
+        " * Usage in n8n Code node:",
+        " *   const validationResult = validatePayloadCompiled($input.item.json, 'contact');",
+        " *   if (!validationResult.valid) {",
+        " *     throw new Error(`Validation failed: ${validationResult.errors.join(', ')}`);",
+        " *   }",
+        " */",
+        "",
+        RUNTIME,
+        *[compile_schema(schema, schema_type) + "\n" for schema_type, schema in schemas.items()],
+        "const compiledValidators = {",
+        *[f"  {_js_string(schema_type)}: {name}," for schema_type, name in functions.items()],
+        "};",
+        "",
+        "/**",
+        " * Validates a payload against a schema in shared/schemas",
+        " * @param {Object} payload - The payload to validate",
+        f" * @param {{string}} schemaType - Type of schema ({', '.join(repr(t) for t in schemas)})",
+        " * @returns {Object} Validation result with 'valid' boolean and 'errors' array",
+        " */",
+        "function validatePayloadCompiled(payload, schemaType) {",
+        "  if (!payload || typeof payload !== 'object' || Array.isArray(payload)) {",
+        "    return { valid: false, errors: ['Payload must be an object'] };",
+        "  }",
+        "  if (!schemaType || typeof schemaType !== 'string') {",
+        "    return { valid: false, errors: ['Schema type must be a string'] };",
+        "  }",
+        "  const validator = Object.prototype.hasOwnProperty.call(compiledValidators, schemaType)",
+        "    ? compiledValidators[schemaType]",
+        "    : null;",
+        "  if (!validator) {",
+        "    return { valid: false, errors: [`Unknown schema type: ${schemaType}`] };",
+        "  }",
+        "  const errors = validator(payload);",
+        "  return { valid: errors.length === 0, errors };",
+        "}",
+        "",
+        "// Export for use in n8n Code nodes",
+        "module.exports = {",
+        "  validatePayloadCompiled,",
+        "  compiledValidators,",
+        *[f"  {name}," for name in functions.values()],
+        "};",
+        "",
+    ])
+
+
+def load_schemas(schemas_dir: Path = SCHEMAS_DIR) -> Dict[str, Dict[str, Any]]:
+    """Every *.schema.json in schemas_dir, keyed by schema type, in name order."""
+    schemas = {}
+    for path in sorted(schemas_dir.glob("*.schema.json")):
+        with open(path, 'r', encoding='utf-8') as f:
+            schemas[path.name[:-len(".schema.json")]] = json.load(f)
+    return schemas
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate validate_payload_compiled.js from shared/schemas")
+    parser.add_argument("--schemas-dir", type=Path, default=SCHEMAS_DIR, help="Directory of *.schema.json files")
+    parser.add_argument("--output", type=Path, default=OUTPUT_FILE, help="JavaScript file to write")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if the output file is not up to date")
+    args = parser.parse_args()
+
+    try:
+        source = compile_module(load_schemas(args.schemas_dir))
+    except SchemaCompileError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.check:
+        current = args.output.read_text(encoding='utf-8') if args.output.exists() else None
+        if current != source:
+            print(f"❌ {args.output} is out of date; run: python ops/scripts/js_validator_compiler.py",
+                  file=sys.stderr)
+            sys.exit(1)
+        print(f"✅ {args.output} is up to date")
+        return
+
+    args.output.write_text(source, encoding='utf-8')
+    print(f"Generated {args.output}")
+
+
+if __name__ == "__main__":
+    main()
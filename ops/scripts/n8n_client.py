@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Purpose: Pooled, concurrent client for the n8n public REST API
+Created/Updated: 2026-10-16
+Agent: BACKEND_AGENT
+
+N8nClient sends requests to {base_url}/api/v1 over a pool of keep-alive
+HTTP(S) connections, so a run of hundreds of calls pays for a handful of
+TCP/TLS handshakes instead of one per call. The coroutine methods run the
+blocking http.client calls in a thread pool, with at most `concurrency`
+requests in flight; callers schedule many of them with asyncio.gather().
+
+Connection errors, 429 and 5xx responses are retried with full-jitter
+exponential backoff (a Retry-After header wins when present). POST is not
+idempotent: a create that timed out or failed with a 5xx may already have
+happened, so it is only retried on 429 and when the connection failed
+before the request was sent. The retry
+budget comes from workflows.default_retry_attempts and
+workflows.default_retry_delay_ms in shared/config/environments.<env>.yaml.
+Only the standard library is used.
+
+Usage:
+    from n8n_client import N8nClient, RetryPolicy
+    retry = RetryPolicy.for_environment("prod")
+    async with N8nClient(base_url, api_key, concurrency=8, retry=retry) as client:
+        workflows = await client.list_workflows()
+"""
+
+import asyncio
+import http.client
+import json
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+import yaml
+
+# Base paths
+REPO_ROOT = Path(__file__).parent.parent.parent
+CONFIG_DIR = REPO_ROOT / "shared" / "config"
+
+API_PREFIX = "/api/v1"
+# Largest page size the n8n public API accepts
+PAGE_LIMIT = 250
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Methods safe to repeat after a request may have reached the server
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+# Errors meaning the server closed an idle keep-alive connection before the request reached it
+STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError)
+
+
+class N8nApiError(RuntimeError):
+    """A request that failed with an HTTP error status, or kept failing after every retry."""
+
+    def __init__(self, method: str, path: str, status: Optional[int], message: str):
+        super().__init__(f"{method} {path}: {f'HTTP {status}: ' if status else ''}{message}")
+        self.method = method
+        self.path = path
+        self.status = status
+
+
+class RequestNotSentError(ConnectionError):
+    """The connection could not be opened, so the server never saw the request."""
+
+
+class RetryPolicy(NamedTuple):
+    """How often, and how long to wait before, a failed request is retried."""
+    attempts: int = 3
+    delay_ms: int = 1000
+    max_delay_ms: int = 30000
+
+    def delay(self, retry: int, rng: random.Random) -> float:
+        """Seconds to wait before retry number `retry` (0-based): full jitter over an exponential cap."""
+        return rng.uniform(0, min(self.max_delay_ms, self.delay_ms * 2 ** retry)) / 1000
+
+    @classmethod
+    def for_environment(cls, environment: str, config_dir: Path = CONFIG_DIR) -> "RetryPolicy":
+        """Retry settings from the environment config's workflows section (defaults if it has none)."""
+        config = load_environment_config(environment, config_dir)
+        workflows = config.get("workflows") or {}
+        return cls(
+            attempts=int(workflows.get("default_retry_attempts", cls._field_defaults["attempts"])),
+            delay_ms=int(workflows.get("default_retry_delay_ms", cls._field_defaults["delay_ms"])),
+        )
+
+
+def load_environment_config(environment: str, config_dir: Path = CONFIG_DIR) -> Dict[str, Any]:
+    """Parsed shared/config/environments.<environment>.yaml, or {} if there is none."""
+    config_file = config_dir / f"environments.{environment}.yaml"
+    if not config_file.exists():
+        return {}
+    with open(config_file, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f) or {}
+
+
+class ConnectionPool:
+    """Thread-safe pool of keep-alive connections to one HTTP(S) host."""
+
+    def __init__(self, base_url: str, timeout: float = 30.0):
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Unsupported n8n URL: {base_url}")
+        self._connection_class = (
+            http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        )
+        self._host = parts.hostname
+        self._port = parts.port
+        self._timeout = timeout
+        self._idle: List[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+
+    def _acquire(self) -> Tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+            self.connections_opened += 1
+        return self._connection_class(self._host, self._port, timeout=self._timeout), False
+
+    @staticmethod
+    def _connect(connection: http.client.HTTPConnection):
+        """Open a new connection, so a failure here is known to precede sending the request."""
+        if connection.sock is None:
+            try:
+                connection.connect()
+            except OSError as e:
+                connection.close()
+                raise RequestNotSentError(f"{type(e).__name__}: {e}") from e
+
+    def _release(self, connection: http.client.HTTPConnection):
+        with self._lock:
+            self._idle.append(connection)
+
+    def request(self, method: str, path: str, body: Optional[bytes], headers: Dict[str, str]
+                ) -> Tuple[int, Dict[str, str], bytes]:
+        """Send one request and read the whole response: (status, headers, body)."""
+        connection, reused = self._acquire()
+        try:
+            try:
+                self._connect(connection)
+                connection.request(method, path, body=body, headers=headers)
+                response = connection.getresponse()
+            except STALE_CONNECTION_ERRORS:
+                if not reused:
+                    raise
+                # The server dropped the idle connection; the request never arrived
+                connection.close()
+                connection, reused = self._acquire()
+                self._connect(connection)
+                connection.request(method, path, body=body, headers=headers)
+                response = connection.getresponse()
+            data = response.read()
+        except BaseException:
+            connection.close()
+            raise
+        if response.will_close:
+            connection.close()
+        else:
+            self._release(connection)
+        return response.status, {key.lower(): value for key, value in response.getheaders()}, data
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+
+class N8nClient:
+    """Async n8n API client with bounded concurrency, connection reuse and retries."""
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        concurrency: int = 8,
+        retry: RetryPolicy = RetryPolicy(),
+        timeout: float = 30.0,
+        rng: Optional[random.Random] = None
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        base_url = base_url.rstrip("/")
+        self.api_url = base_url if base_url.endswith(API_PREFIX) else base_url + API_PREFIX
+        self._path_prefix = urlsplit(self.api_url).path
+        self.concurrency = concurrency
+        self.retry = retry
+        self.pool = ConnectionPool(self.api_url, timeout)
+        self._headers = {"X-N8N-API-KEY": api_key, "Accept": "application/json"}
+        self._rng = rng or random.Random()
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="n8n-api")
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.requests_sent = 0
+        self.retries = 0
+
+    async def __aenter__(self) -> "N8nClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        self.pool.close()
+
+    async def request(self, method: str, path: str, payload: Any = None,
+                      query: Optional[Dict[str, Any]] = None) -> Any:
+        """Send a request to an API path such as /workflows and return the decoded JSON body."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        target = self._path_prefix + path
+        if query:
+            target += "?" + urlencode({key: value for key, value in query.items() if value is not None})
+        headers = dict(self._headers)
+        body = None
+        if payload is not None:
+            body = json.dumps(payload).encode("utf-8")
+            headers["Content-Type"] = "application/json"
+
+        loop = asyncio.get_running_loop()
+        idempotent = method in IDEMPOTENT_METHODS
+        retry = 0
+        while True:
+            async with self._semaphore:
+                self.requests_sent += 1
+                try:
+                    status, response_headers, data = await loop.run_in_executor(
+                        self._executor, self.pool.request, method, target, body, headers
+                    )
+                except (OSError, http.client.HTTPException) as e:
+                    status, response_headers, failure = None, {}, f"{type(e).__name__}: {e}"
+                    retryable = idempotent or isinstance(e, RequestNotSentError)
+                else:
+                    if status < 400:
+                        return json.loads(data) if data else None
+                    failure = data.decode("utf-8", "replace")[:500]
+                    retryable = status == 429 or (idempotent and status in RETRY_STATUSES)
+            if not retryable or retry >= self.retry.attempts:
+                raise N8nApiError(method, path, status, failure)
+            delay = self.retry.delay(retry, self._rng)
+            retry_after = response_headers.get("retry-after", "")
+            if retry_after.isdigit():
+                delay = min(float(retry_after), self.retry.max_delay_ms / 1000)
+            retry += 1
+            self.retries += 1
+            await asyncio.sleep(delay)
+
+    async def list_workflow_page(self, cursor: Optional[str] = None, limit: int = PAGE_LIMIT,
+                                 exclude_pinned_data: bool = False) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """One page of workflows and the cursor of the next page (None after the last)."""
+        query = {"limit": limit, "cursor": cursor, "excludePinnedData": "true" if exclude_pinned_data else None}
+        page = await self.request("GET", "/workflows", query=query)
+        return page.get("data") or [], page.get("nextCursor") or None
+
+    async def list_workflows(self) -> List[Dict[str, Any]]:
+        """Every workflow on the instance, following the API's cursor pagination."""
+        workflows: List[Dict[str, Any]] = []
+        cursor = None
+        while True:
+            page, cursor = await self.list_workflow_page(cursor)
+            workflows.extend(page)
+            if not cursor:
+                return workflows
+
+    async def get_workflow(self, workflow_id: str) -> Dict[str, Any]:
+        return await self.request("GET", f"/workflows/{workflow_id}")
+
+    async def create_workflow(self, workflow: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.request("POST", "/workflows", workflow)
+
+    async def update_workflow(self, workflow_id: str, workflow: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.request("PUT", f"/workflows/{workflow_id}", workflow)
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Purpose: Restore workflows from a backup store snapshot into n8n, in parallel and verified
+Created/Updated: 2026-10-16
+Agent: BACKEND_AGENT
+
+Reads a snapshot manifest from the backup store (backup_store.py; the
+newest snapshot unless --snapshot is given) and selects the workflow JSON
+files under --prefix (default workflows/, without metadata/ and packs/).
+Their blobs are downloaded by --jobs threads while the instance's
+workflows are listed. Each blob is decompressed and hashed as it streams
+to <output>/<snapshot path>; a file whose sha256 or size does not match
+the manifest is discarded and reported, never imported. Files already in
+<output> with the right hash are not downloaded again.
+
+Workflows are then imported with n8n_client's pooled connections, at most
+--concurrency requests in flight, in dependency order: the sub-workflows a
+workflow calls through executeWorkflow nodes (as generate_catalog.py
+extracts them, matched by file stem) are restored first, and each import
+starts as soon as its own dependencies are done. Workflows created with a
+new id have the executeWorkflow references of their dependents rewritten
+to it. Workflows are matched to existing ones by name, as in
+deploy_workflows.py, and only created or updated when their content
+differs, so a restore can be rerun after a failure. Members of a
+dependency cycle are imported together; rerun once to link their new ids.
+
+--dry-run downloads and verifies everything and reports what would be
+created or updated without changing the instance. The report records the
+time spent in each phase and the dependency depth, the number of imports
+that had to run one after another.
+
+Usage:
+    python ops/scripts/restore_workflows.py --store s3://automation-hub-prod-workflows/automation-hub/workflow-store --environment prod
+    python ops/scripts/restore_workflows.py --store backup-store --snapshot 2026-10-16T02-00-00Z-daily --prefix n8n-export/workflows/ --dry-run
+    python ops/scripts/restore_workflows.py --store backup-store --environment dev --jobs 32 --concurrency 16 --report restore-report.json
+"""
+
+import argparse
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from backup_store import BackupStore, blob_key, open_storage
+from deploy_workflows import EXCLUDED_DIRS, content_hash, plan_deployment, resolve_base_url
+from generate_catalog import extract_node_facts
+from n8n_client import N8nApiError, N8nClient, RetryPolicy
+from workflow_graph import WorkflowGraph
+
+DEFAULT_PREFIXES = ["workflows/"]
+EXECUTE_WORKFLOW_TYPE = "n8n-nodes-base.executeWorkflow"
+CHUNK_SIZE = 1 << 16
+
+
+def select_workflow_files(manifest: Dict[str, Any], prefixes: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Manifest entries of the workflow JSON files under any of the prefixes, by snapshot path."""
+    selected = {}
+    for path, entry in sorted(manifest["files"].items()):
+        prefix = next((prefix for prefix in prefixes if path.startswith(prefix)), None)
+        if prefix is None or not path.endswith(".json"):
+            continue
+        if not any(part in EXCLUDED_DIRS for part in path[len(prefix):].split("/")[:-1]):
+            selected[path] = entry
+    return selected
+
+
+def fetch_blob(storage, entry: Dict[str, Any], destination: Path) -> bool:
+    """
+    Stream a blob to destination, decompressing and hashing it as it is
+    read. Raises ValueError when the content does not match the manifest
+    entry. Returns False when destination already held the right content.
+    """
+    if destination.exists() and hashlib.sha256(destination.read_bytes()).hexdigest() == entry["sha256"]:
+        return False
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = destination.with_name(f".{destination.name}.tmp")
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with closing(storage.open(blob_key(entry["sha256"]))) as raw, gzip.GzipFile(fileobj=raw) as blob, \
+                open(temp_path, 'wb') as f:
+            for chunk in iter(lambda: blob.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+                size += len(chunk)
+                f.write(chunk)
+        if digest.hexdigest() != entry["sha256"] or size != entry["bytes"]:
+            raise ValueError(f"Blob does not match the manifest: sha256 {digest.hexdigest()}, {size} bytes "
+                             f"(expected {entry['sha256']}, {entry['bytes']} bytes)")
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    os.replace(temp_path, destination)
+    return True
+
+
+def download_files(storage, files: Dict[str, Dict[str, Any]], output_dir: Path, jobs: int) -> Dict[str, Any]:
+    """Fetch and verify every selected file with a bounded thread pool."""
+    def fetch(item):
+        path, entry = item
+        try:
+            return path, fetch_blob(storage, entry, output_dir / path), None
+        except (OSError, EOFError, ValueError) as e:
+            return path, False, f"{type(e).__name__}: {e}"
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        results = list(executor.map(fetch, files.items()))
+    return {
+        "downloaded": sum(1 for _, fetched, error in results if fetched),
+        "cached": sum(1 for _, fetched, error in results if not fetched and error is None),
+        "failed": {path: error for path, _, error in results if error is not None},
+    }
+
+
+def reference_id(value: Any) -> Optional[str]:
+    """The workflow id of an executeWorkflow workflowId: a plain id or a {"value": id} resource locator."""
+    if isinstance(value, dict):
+        value = value.get("value")
+    return str(value) if isinstance(value, (str, int)) and value != "" else None
+
+
+def workflow_references(workflow: Dict[str, Any]) -> List[str]:
+    """Ids of the sub-workflows a workflow calls, as the catalog extracts them."""
+    references = (reference_id(dep) for dep in extract_node_facts(workflow.get("nodes") or [])["dependencies"])
+    return [reference for reference in references if reference]
+
+
+def remap_references(workflow: Dict[str, Any], id_map: Dict[str, str]) -> Dict[str, Any]:
+    """A copy of the workflow with executeWorkflow references pointed at the ids in id_map."""
+    nodes = []
+    for node in workflow.get("nodes") or []:
+        if isinstance(node, dict) and node.get("type") == EXECUTE_WORKFLOW_TYPE:
+            parameters = node.get("parameters") or {}
+            value = parameters.get("workflowId")
+            target = reference_id(value)
+            if id_map.get(target, target) != target:
+                new_id = id_map[target]
+                node = {**node, "parameters": {
+                    **parameters, "workflowId": {**value, "value": new_id} if isinstance(value, dict) else new_id
+                }}
+        nodes.append(node)
+    return {**workflow, "nodes": nodes}
+
+
+class WorkflowRestorer:
+    """Imports restored workflow files into an instance in dependency order."""
+
+    def __init__(self, client: N8nClient, dry_run: bool = False):
+        self.client = client
+        self.dry_run = dry_run
+        # Entries by snapshot path; workflow ids (file stems) resolve to the first path with that stem
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.path_of: Dict[str, str] = {}
+        # Workflow id in the snapshot -> id on the instance
+        self.id_map: Dict[str, str] = {}
+        self.remote_by_id: Dict[str, Dict[str, Any]] = {}
+
+    async def _import(self, path: str, dependencies: List[str], waits_for: List["asyncio.Future"]):
+        await asyncio.gather(*waits_for)
+        entry = self.entries[path]
+        failed = [dep for dep in dependencies if self.entries[dep]["action"] == "failed"]
+        if failed:
+            entry.update(action="failed", error=f"Dependencies not restored: {', '.join(failed)}")
+            return
+        body = remap_references(entry["body"], self.id_map)
+        existing = self.remote_by_id.get(entry.get("id"))
+        if existing is not None and content_hash(existing) == content_hash(body):
+            entry["action"] = "unchanged"
+            return
+        entry["action"] = "create" if existing is None else "update"
+        if self.dry_run:
+            return
+        try:
+            if existing is not None:
+                await self.client.update_workflow(entry["id"], body)
+                entry["action"] = "updated"
+            else:
+                created = await self.client.create_workflow(body)
+                entry.update(action="created", id=str((created or {}).get("id")))
+                self.id_map[Path(path).stem] = entry["id"]
+        except N8nApiError as e:
+            entry.update(action="failed", error=str(e))
+
+    async def restore(self, workflow_files: Dict[str, Path], remote: List[Dict[str, Any]],
+                      failed: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        Create or update the workflow files (by snapshot path); files in
+        `failed` could not be restored and fail their dependents. Returns
+        the dependency cycles and depth of the import.
+        """
+        self.remote_by_id = {str(workflow.get("id")): workflow for workflow in remote}
+        for path, entry in zip(workflow_files, plan_deployment(list(workflow_files.values()), remote)):
+            self.entries[path] = {**entry, "file": path}
+        for path, error in (failed or {}).items():
+            self.entries[path] = {"file": path, "name": None, "action": "failed", "error": error}
+        for path, entry in sorted(self.entries.items()):
+            key = Path(path).stem
+            self.path_of.setdefault(key, path)
+            if entry.get("id"):
+                self.id_map.setdefault(key, entry["id"])
+
+        dependencies = {
+            path: sorted({
+                self.path_of[ref] for ref in workflow_references(entry["body"])
+                if ref in self.path_of and self.path_of[ref] != path
+            })
+            for path, entry in self.entries.items() if "body" in entry
+        }
+        graph = WorkflowGraph(dependencies)
+        cycle_of = {member: set(cycle) for cycle in graph.cycles() for member in cycle}
+        tasks: Dict[str, asyncio.Future] = {}
+        depth: Dict[str, int] = {}
+        for path in graph.topological_order():
+            if path not in dependencies:
+                continue
+            self.entries[path]["depends_on"] = dependencies[path]
+            # Members of a cycle cannot wait for each other; every other dependency was scheduled earlier
+            earlier = [dep for dep in dependencies[path] if dep not in cycle_of.get(path, ())]
+            depth[path] = 1 + max((depth.get(dep, 0) for dep in earlier), default=0)
+            tasks[path] = asyncio.ensure_future(
+                self._import(path, earlier, [tasks[dep] for dep in earlier if dep in tasks])
+            )
+        await asyncio.gather(*tasks.values())
+        for entry in self.entries.values():
+            entry.pop("body", None)
+            entry.pop("hash", None)
+        return {"cycles": graph.cycles(), "depth": max(depth.values(), default=0)}
+
+
+async def restore_snapshot(client: N8nClient, store: BackupStore, snapshot_id: str, output_dir: Path,
+                           prefixes: List[str] = DEFAULT_PREFIXES, dry_run: bool = False) -> Dict[str, Any]:
+    """Download, verify and import the workflows of one snapshot; returns the restore report."""
+    started = time.perf_counter()
+    files = select_workflow_files(store.manifest(snapshot_id), prefixes)
+    loop = asyncio.get_running_loop()
+
+    # List the instance while the blobs download
+    listing = asyncio.ensure_future(client.list_workflows())
+    download_started = time.perf_counter()
+    try:
+        downloads = await loop.run_in_executor(
+            None, download_files, store.storage, files, output_dir, store.jobs
+        )
+    finally:
+        remote = await listing
+    download_seconds = time.perf_counter() - download_started
+
+    import_started = time.perf_counter()
+    restorer = WorkflowRestorer(client, dry_run)
+    verified = {path: output_dir / path for path in files if path not in downloads["failed"]}
+    graph_info = await restorer.restore(verified, remote, downloads["failed"])
+    import_seconds = time.perf_counter() - import_started
+
+    workflows = list(restorer.entries.values())
+    actions = [entry["action"] for entry in workflows]
+    return {
+        "summary": {
+            "snapshot": snapshot_id,
+            "files": len(files),
+            "bytes": sum(entry["bytes"] for entry in files.values()),
+            "downloaded": downloads["downloaded"],
+            "cached": downloads["cached"],
+            "verification_failures": len(downloads["failed"]),
+            **{action: actions.count(action)
+               for action in ("created", "updated", "unchanged", "skipped", "failed")},
+            "planned": actions.count("create") + actions.count("update"),
+            "dependency_depth": graph_info["depth"],
+            "cycles": graph_info["cycles"],
+            "requests": client.requests_sent,
+            "retries": client.retries,
+            "connections": client.pool.connections_opened,
+            "download_seconds": round(download_seconds, 3),
+            "import_seconds": round(import_seconds, 3),
+            "elapsed_seconds": round(time.perf_counter() - started, 3),
+        },
+        "workflows": workflows,
+    }
+
+
+async def run(base_url: str, api_key: str, store: BackupStore, snapshot_id: str, output_dir: Path,
+              prefixes: List[str], concurrency: int, retry: RetryPolicy, dry_run: bool) -> Dict[str, Any]:
+    async with N8nClient(base_url, api_key, concurrency=concurrency, retry=retry) as client:
+        return await restore_snapshot(client, store, snapshot_id, output_dir, prefixes, dry_run)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Restore workflows from a backup store snapshot into n8n")
+    parser.add_argument("--store", required=True, help="s3://bucket/prefix, file:///path or a directory")
+    parser.add_argument("--snapshot", help="Snapshot id to restore (default: the newest)")
+    parser.add_argument("--prefix", action="append",
+                        help="Snapshot path prefix of the workflows to restore (repeatable; default: workflows/)")
+    parser.add_argument("--output", type=Path, default=Path("restore"), help="Directory to download files into")
+    parser.add_argument("--environment", default="dev", help="Environment whose config supplies retries and URL")
+    parser.add_argument("--base-url", help="n8n base URL (default: N8N_BASE_URL, then the environment config)")
+    parser.add_argument("--jobs", type=int, default=16, help="Parallel blob downloads")
+    parser.add_argument("--concurrency", type=int, default=8, help="Maximum n8n requests in flight")
+    parser.add_argument("--dry-run", action="store_true", help="Download and verify, but only report the imports")
+    parser.add_argument("--report", type=Path, help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    api_key = os.getenv("N8N_API_KEY")
+    if not api_key:
+        print("❌ N8N_API_KEY not set", file=sys.stderr)
+        sys.exit(1)
+    base_url = resolve_base_url(args.environment, args.base_url)
+    if not base_url:
+        print(f"❌ No n8n base URL for environment: {args.environment}", file=sys.stderr)
+        sys.exit(1)
+    try:
+        store = BackupStore(open_storage(args.store), jobs=args.jobs)
+        snapshot_id = args.snapshot or (store.snapshots() or [None])[-1]
+    except RuntimeError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+    if snapshot_id is None:
+        print(f"❌ No snapshots in {store.storage!r}", file=sys.stderr)
+        sys.exit(1)
+
+    retry = RetryPolicy.for_environment(args.environment)
+    print(f"Restoring {snapshot_id} from {store.storage!r} to {base_url} ({args.environment}, "
+          f"{args.jobs} downloads, concurrency {args.concurrency})...")
+    try:
+        report = asyncio.run(run(base_url, api_key, store, snapshot_id, args.output, args.prefix or DEFAULT_PREFIXES,
+                                 args.concurrency, retry, args.dry_run))
+    except N8nApiError as e:
+        print(f"❌ Could not list workflows: {e}", file=sys.stderr)
+        sys.exit(1)
+    except (OSError, KeyError, ValueError) as e:
+        print(f"❌ Could not read snapshot {snapshot_id}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    for entry in report["workflows"]:
+        if entry["action"] == "failed":
+            print(f"❌ {entry['file']}: {entry['error']}")
+        elif entry["action"] not in ("skipped", "unchanged"):
+            print(f"{'📋' if args.dry_run else '✅'} {entry['action']}: {entry['name']} ({entry['file']})")
+    summary = report["summary"]
+    for cycle in summary["cycles"]:
+        print(f"⚠️  dependency cycle: {' <-> '.join(cycle)}; rerun the restore to link their new ids")
+    print(f"{summary['files']} files ({summary['bytes']} bytes): {summary['downloaded']} downloaded, "
+          f"{summary['cached']} already present, {summary['verification_failures']} failed verification "
+          f"in {summary['download_seconds']}s")
+    print(f"{summary['created']} created, {summary['updated']} updated, {summary['unchanged']} unchanged, "
+          f"{summary['skipped']} skipped, {summary['failed']} failed in {summary['import_seconds']}s "
+          f"(dependency depth {summary['dependency_depth']}, {summary['requests']} requests, "
+          f"{summary['retries']} retries, {summary['connections']} connections)")
+
+    if args.report:
+        args.report.parent.mkdir(parents=True, exist_ok=True)
+        args.report.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n", encoding='utf-8')
+        print(f"Report written: {args.report}")
+
+    if summary["failed"]:
+        print(f"\n❌ Restore failed for {summary['failed']} workflow(s) after {summary['elapsed_seconds']}s")
+        sys.exit(1)
+    if args.dry_run:
+        print(f"\n✅ Dry run: {summary['planned']} workflow(s) would be restored")
+    else:
+        print(f"\n✅ Restored {snapshot_id} in {summary['elapsed_seconds']}s")
+
+
+if __name__ == "__main__":
+    main()
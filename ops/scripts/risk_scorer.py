@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Purpose: Score contact/lead risk in bulk with the rules of shared/js_snippets/compute_risk_score.js
+Created/Updated: 2026-10-16
+Agent: BACKEND_AGENT
+
+computeRiskScore() scores one contact per call and rebuilds its domain
+lists and regexes every time. This module scores arrays of contacts:
+each factor's input column is factorized, the factor is evaluated once per
+distinct value, and the weighted sum, rounding and clamping run as NumPy
+array operations. Lookup tables and patterns are built once at import.
+
+Factors and weights match the JS (email domain 20, email format 15,
+phone 15, company 10, source 10, status 10, data completeness 20), and
+the same options object overrides weights. Terms are summed in the JS
+order in float64 and rounded like Math.round, so scores are identical.
+Email domains are classified by email_domains.py from the same lists file
+the JS loads.
+JavaScript value semantics come from contact_normalizer. A non-string
+truthy company is rejected, since company.trim() throws in the JS.
+
+Usage:
+    from risk_scorer import score_contacts
+    scores, errors = score_contacts(contacts)   # scores[i] == -1 where errors name i
+
+    python ops/scripts/risk_scorer.py contacts.ndjson.gz --output scored.ndjson
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from contact_normalizer import EMAIL_PATTERN, js_string, js_trim, js_truthy, utf16_length
+from email_domains import load_domain_classifier
+from validate_payloads import DEFAULT_CHUNK_SIZE, iter_chunks, open_input
+
+DEFAULT_OPTIONS = {
+    "emailDomainWeight": 20,
+    "emailFormatWeight": 15,
+    "phoneWeight": 15,
+    "companyWeight": 10,
+    "sourceWeight": 10,
+    "statusWeight": 10,
+    "dataCompletenessWeight": 20,
+}
+
+# /^[0-9]+@/, /test@/i, /fake@/i, /spam@/i, /temp@/i; JS /i only folds ASCII letters here
+SUSPICIOUS_EMAIL = re.compile(r"^[0-9]+@|(?:test|fake|spam|temp)@", re.IGNORECASE | re.ASCII)
+NON_DIGITS = re.compile(r"[^0-9]")
+REPEATED_DIGIT = re.compile(r"([0-9])\1+")
+SUSPICIOUS_COMPANIES = frozenset(["test", "fake", "spam", "temp", "unknown", "n/a", "na"])
+HIGH_RISK_SOURCES = frozenset(["spam", "unknown", "test", "fake"])
+LOW_RISK_SOURCES = frozenset(["website", "referral", "event", "partner", "organic"])
+IMPORTANT_FIELDS = ("first_name", "last_name", "company", "phone")
+
+REJECTED = -1
+
+
+class RiskScoreError(ValueError):
+    """Raised for contacts computeRiskScore() would throw on."""
+
+
+# Factor multipliers: the share of the factor's weight a value contributes
+
+def email_domain_factor(email: Any) -> float:
+    if not js_truthy(email) or not isinstance(email, str):
+        return 1
+    parts = email.split("@")
+    domain = parts[1] if len(parts) > 1 else ""
+    if not domain:
+        return 1
+    classifier = load_domain_classifier()
+    if classifier.is_high_risk(domain):
+        return 1
+    if classifier.is_low_risk(domain):
+        return 0.1
+    if "." in domain and ".." not in domain:
+        return 0.3
+    return 0.5
+
+
+def email_format_factor(email: Any) -> float:
+    if not js_truthy(email) or not isinstance(email, str):
+        return 1
+    if not EMAIL_PATTERN.fullmatch(email):
+        return 1
+    if SUSPICIOUS_EMAIL.search(email):
+        return 0.8
+    return 0
+
+
+def phone_factor(phone: Any) -> float:
+    if not js_truthy(phone):
+        return 0.7
+    phone_str = js_trim(js_string(phone))
+    if utf16_length(phone_str) < 10:
+        return 0.8
+    if REPEATED_DIGIT.fullmatch(NON_DIGITS.sub("", phone_str)):
+        return 0.6
+    return 0
+
+
+def company_factor(company: Any) -> float:
+    if not js_truthy(company):
+        return 0.5
+    if not isinstance(company, str):
+        raise RiskScoreError("company.trim is not a function")
+    company_str = js_trim(company)
+    if company_str == "":
+        return 0.5
+    if company_str.lower() in SUSPICIOUS_COMPANIES:
+        return 0.7
+    return 0
+
+
+def source_factor(source: Any) -> float:
+    if not js_truthy(source):
+        return 0.4
+    source_str = js_trim(js_string(source)).lower()
+    if source_str in HIGH_RISK_SOURCES:
+        return 0.8
+    if source_str in LOW_RISK_SOURCES:
+        return 0
+    return 0.3
+
+
+def status_factor(status: Any) -> float:
+    if not js_truthy(status):
+        return 0
+    return 0.6 if js_trim(js_string(status)).lower() == "lost" else 0
+
+
+# Factors in the order computeRiskScore() adds them: (contact field, weight option, multiplier)
+FIELD_FACTORS: List[Tuple[str, str, Callable[[Any], float]]] = [
+    ("email", "emailDomainWeight", email_domain_factor),
+    ("email", "emailFormatWeight", email_format_factor),
+    ("phone", "phoneWeight", phone_factor),
+    ("company", "companyWeight", company_factor),
+    ("source", "sourceWeight", source_factor),
+    ("status", "statusWeight", status_factor),
+]
+
+
+def _factorize(column: Sequence[Any]) -> Tuple[np.ndarray, List[Any]]:
+    """Integer codes for a column and its distinct values (unhashable values are not shared)."""
+    index: Dict[Any, int] = {}
+    uniques: List[Any] = []
+    codes = np.empty(len(column), dtype=np.intp)
+    for position, value in enumerate(column):
+        # Type is part of the key since True == 1 == 1.0
+        key = (type(value), value) if isinstance(value, (str, int, float, type(None))) else (id(value),)
+        code = index.get(key)
+        if code is None:
+            code = index[key] = len(uniques)
+            uniques.append(value)
+        codes[position] = code
+    return codes, uniques
+
+
+def js_round(values: np.ndarray) -> np.ndarray:
+    """Math.round: halves round toward +Infinity."""
+    rounded = np.floor(values)
+    return rounded + (values - rounded >= 0.5)
+
+
+def score_contacts(
+    contacts: Sequence[Any],
+    options: Optional[Dict[str, Any]] = None
+) -> Tuple[np.ndarray, List[Dict[str, Any]]]:
+    """
+    Risk scores (0-100) for a batch of contacts.
+
+    Returns an int array aligned with the input, holding REJECTED (-1) for
+    contacts computeRiskScore() would throw on, and a list of
+    {"index", "error"} rejections.
+    """
+    config = {**DEFAULT_OPTIONS, **(options or {})}
+    records = [contact if isinstance(contact, dict) else {} for contact in contacts]
+    rejected = np.array([not isinstance(contact, (dict, list)) for contact in contacts], dtype=bool)
+    errors = {index: "Contact data must be an object" for index in np.flatnonzero(rejected).tolist()}
+
+    risk = np.zeros(len(records), dtype=np.float64)
+    for field, weight_option, factor in FIELD_FACTORS:
+        codes, uniques = _factorize([record.get(field) for record in records])
+        multipliers = np.empty(len(uniques), dtype=np.float64)
+        failing: Dict[int, str] = {}
+        for code, value in enumerate(uniques):
+            try:
+                multipliers[code] = factor(value)
+            except RiskScoreError as e:
+                multipliers[code] = 0
+                failing[code] = str(e)
+        if failing:
+            # One pass over the column, however many distinct values failed
+            failed = np.flatnonzero(np.isin(codes, list(failing)))
+            for index, code in zip(failed.tolist(), codes[failed].tolist()):
+                errors.setdefault(index, failing[code])
+        risk += config[weight_option] * multipliers[codes]
+
+    weight = config["dataCompletenessWeight"]
+    missing_required = np.array([not js_truthy(record.get("email")) for record in records], dtype=np.float64)
+    missing_important = np.array(
+        [sum(not js_truthy(record.get(field)) for field in IMPORTANT_FIELDS) for record in records],
+        dtype=np.float64
+    )
+    risk += (missing_required / 1) * weight * 0.6 + (missing_important / len(IMPORTANT_FIELDS)) * weight * 0.4
+
+    scores = np.clip(js_round(risk), 0, 100).astype(np.int16)
+    if errors:
+        scores[list(errors)] = REJECTED
+    return scores, [{"index": index, "error": errors[index]} for index in sorted(errors)]
+
+
+def compute_risk_score(contact: Any, options: Optional[Dict[str, Any]] = None) -> int:
+    """computeRiskScore() for a single contact; raises RiskScoreError like the JS throws."""
+    scores, errors = score_contacts([contact], options)
+    if errors:
+        raise RiskScoreError(errors[0]["error"])
+    return int(scores[0])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score NDJSON contacts like compute_risk_score.js")
+    parser.add_argument("input", help="NDJSON file of contacts (.gz supported) or - for stdin")
+    parser.add_argument("--output", type=Path, help="Write scored contacts here (default: stdout)")
+    parser.add_argument("--options", type=json.loads, default=None, metavar="JSON",
+                        help='Weight overrides, as in computeRiskScore options, e.g. \'{"phoneWeight": 5}\'')
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE * 10, metavar="LINES",
+                        help=f"Contacts scored per batch (default: {DEFAULT_CHUNK_SIZE * 10})")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    total = rejected = 0
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        with open_input(args.input) as stream:
+            for chunk in iter_chunks(stream, args.chunk_size):
+                contacts = []
+                for number, line in chunk:
+                    try:
+                        contacts.append(json.loads(line))
+                    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                        print(f"⚠️  line {number}: invalid JSON: {e}", file=sys.stderr)
+                        contacts.append(None)
+                scores, errors = score_contacts(contacts, args.options)
+                for (number, _), contact, score in zip(chunk, contacts, scores.tolist()):
+                    if score == REJECTED:
+                        continue
+                    if not isinstance(contact, dict):
+                        # JS scores arrays as objects, but there is no metadata to attach the score to
+                        print(f"⚠️  line {number}: contact is not an object; written without a risk score",
+                              file=sys.stderr)
+                        output.write(json.dumps(contact, ensure_ascii=False) + "\n")
+                        continue
+                    metadata = contact.get("metadata")
+                    scored = {**contact, "metadata": {**(metadata if isinstance(metadata, dict) else {}),
+                                                       "risk_score": score}}
+                    output.write(json.dumps(scored, ensure_ascii=False) + "\n")
+                for error in errors:
+                    print(f"⚠️  line {chunk[error['index']][0]}: {error['error']}", file=sys.stderr)
+                total += len(chunk)
+                rejected += len(errors)
+    finally:
+        if args.output:
+            output.close()
+
+    elapsed = time.perf_counter() - started
+    rate = round(total / elapsed) if elapsed > 0 else 0
+    print(f"Scored {total - rejected} of {total} contacts in {elapsed:.3f}s ({rate} contacts/s), "
+          f"{rejected} rejected", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+Purpose: Compile shared/schemas JSON Schemas into specialised Python validators
+Created/Updated: 2026-10-16
+Agent: BACKEND_AGENT
+
+jsonschema.Draft7Validator walks the schema tree for every payload. This
+module generates one Python function per schema instead, with the walk
+unrolled into straight-line checks, regexes precompiled, enums as frozensets
+and property names as constants. Verdicts match Draft7Validator without a
+format checker: "format" is an annotation and is not asserted.
+
+Generated modules are cached in .cache/schema_validators/, named by schema
+type and a hash of the schema and compiler version, so they are regenerated
+whenever a schema changes. Python's own bytecode cache applies on top.
+
+Schemas using keywords the compiler does not support are rejected when
+compiling, never silently accepted.
+
+Usage:
+    from schema_compiler import load_validator
+    validate_event = load_validator("event")
+    errors = validate_event(payload)  # [] when valid
+
+    python ops/scripts/schema_compiler.py            # precompile every schema
+    python ops/scripts/schema_compiler.py --show event
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Base paths
+REPO_ROOT = Path(__file__).parent.parent.parent
+SCHEMAS_DIR = REPO_ROOT / "shared" / "schemas"
+CACHE_DIR = REPO_ROOT / ".cache" / "schema_validators"
+
+# Bump when generated code changes, so cached validators are rebuilt
+COMPILER_VERSION = 1
+
+Validator = Callable[[Any], List[str]]
+
+# Keywords without validation semantics (format is annotation-only by default in Draft 7)
+ANNOTATION_KEYWORDS = {"$schema", "$id", "$comment", "title", "description", "default", "examples", "format"}
+SUPPORTED_KEYWORDS = ANNOTATION_KEYWORDS | {
+    "type", "enum", "const",
+    "pattern", "minLength", "maxLength",
+    "minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum",
+    "required", "properties", "additionalProperties", "minProperties", "maxProperties",
+    "items", "minItems", "maxItems",
+}
+
+TYPE_TESTS = {
+    "string": "isinstance({v}, str)",
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "boolean": "isinstance({v}, bool)",
+    "null": "{v} is None",
+    "number": "(isinstance({v}, (int, float)) and not isinstance({v}, bool))",
+    "integer": "((isinstance({v}, int) and not isinstance({v}, bool)) or (isinstance({v}, float) and {v}.is_integer()))",
+}
+
+# Loaded validators, keyed by compiled module path
+_validators: Dict[Path, Validator] = {}
+
+
+class SchemaCompileError(ValueError):
+    """Raised for schemas using keywords the compiler cannot translate."""
+
+
+class _Emitter:
+    """Accumulates generated source lines and module-level constants."""
+
+    def __init__(self):
+        self.lines: List[str] = []
+        self.constants: List[str] = []
+        self.variables = 0
+
+    def constant(self, prefix: str, expression: str) -> str:
+        name = f"_{prefix}{len(self.constants)}"
+        self.constants.append(f"{name} = {expression}")
+        return name
+
+    def variable(self, prefix: str = "v") -> str:
+        self.variables += 1
+        return f"{prefix}{self.variables}"
+
+    def line(self, indent: int, text: str):
+        self.lines.append("    " * indent + text)
+
+    def error(self, indent: int, path: str, *parts: Any):
+        """Emit an append of '<path>: <parts>'; str parts are literal text, _Repr parts show a variable."""
+        pieces = [path, json.dumps(": ")]
+        pieces.extend(f"repr({part.variable})" if isinstance(part, _Repr) else json.dumps(part) for part in parts)
+        self.line(indent, f"errors.append({' + '.join(pieces)})")
+
+    def block(self, indent: int, header: str, body: Callable[[], None], prefix: Optional[str] = None):
+        """Emit header (after an optional setup line) and its body; drop both if the body is empty."""
+        start = len(self.lines)
+        if prefix:
+            self.line(indent, prefix)
+        self.line(indent, header)
+        before = len(self.lines)
+        body()
+        if len(self.lines) == before:
+            del self.lines[start:]
+
+
+class _Repr:
+    """Marks a generated variable whose repr() goes into an error message."""
+
+    def __init__(self, variable: str):
+        self.variable = variable
+
+
+def _emit_schema(emitter: _Emitter, schema: Any, value: str, path: str, indent: int, location: str):
+    """Emit checks for one (sub)schema against the variable named `value`."""
+    if schema is True or schema == {}:
+        return
+    if schema is False:
+        emitter.error(indent, path, "no value is allowed here")
+        return
+    if not isinstance(schema, dict):
+        raise SchemaCompileError(f"{location}: schema must be an object or boolean")
+
+    unsupported = sorted(set(schema) - SUPPORTED_KEYWORDS)
+    if unsupported:
+        raise SchemaCompileError(f"{location}: unsupported keyword(s): {', '.join(unsupported)}")
+
+    if "type" in schema:
+        types = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+        unknown = [t for t in types if t not in TYPE_TESTS]
+        if unknown:
+            raise SchemaCompileError(f"{location}: unknown type(s): {unknown}")
+        test = " or ".join(TYPE_TESTS[t].format(v=value) for t in types)
+        emitter.line(indent, f"if not ({test}):")
+        emitter.error(indent + 1, path, f"expected type {' or '.join(types)}, got ", _Repr(value))
+
+    if "enum" in schema:
+        _emit_enum(emitter, schema["enum"], value, path, indent)
+    if "const" in schema:
+        const = emitter.constant("C", repr(schema["const"]))
+        emitter.line(indent, f"if not _equal({value}, {const}):")
+        emitter.error(indent + 1, path, _Repr(value), f" is not {schema['const']!r}")
+
+    emitter.block(indent, f"if isinstance({value}, str):",
+                  lambda: _emit_string(emitter, schema, value, path, indent + 1))
+    emitter.block(indent, f"if {TYPE_TESTS['number'].format(v=value)}:",
+                  lambda: _emit_number(emitter, schema, value, path, indent + 1))
+    emitter.block(indent, f"if isinstance({value}, dict):",
+                  lambda: _emit_object(emitter, schema, value, path, indent + 1, location))
+    emitter.block(indent, f"if isinstance({value}, list):",
+                  lambda: _emit_array(emitter, schema, value, path, indent + 1, location))
+
+
+def _emit_enum(emitter: _Emitter, values: List[Any], value: str, path: str, indent: int):
+    if all(isinstance(member, str) or member is None for member in values):
+        # Only str/None members: a str/None check plus set lookup matches JSON equality
+        members = emitter.constant("E", f"frozenset({values!r})")
+        test = f"({value} is None or isinstance({value}, str)) and {value} in {members}"
+    else:
+        members = emitter.constant("E", repr(values))
+        test = f"any(_equal({value}, member) for member in {members})"
+    emitter.line(indent, f"if not ({test}):")
+    emitter.error(indent + 1, path, _Repr(value), f" is not one of {values!r}")
+
+
+def _emit_string(emitter: _Emitter, schema: Dict[str, Any], value: str, path: str, indent: int):
+    if "pattern" in schema:
+        pattern = emitter.constant("P", f"re.compile({schema['pattern']!r})")
+        emitter.line(indent, f"if not {pattern}.search({value}):")
+        emitter.error(indent + 1, path, _Repr(value), f" does not match {schema['pattern']!r}")
+    if "minLength" in schema:
+        emitter.line(indent, f"if len({value}) < {int(schema['minLength'])}:")
+        emitter.error(indent + 1, path, f"shorter than {schema['minLength']} characters")
+    if "maxLength" in schema:
+        emitter.line(indent, f"if len({value}) > {int(schema['maxLength'])}:")
+        emitter.error(indent + 1, path, f"longer than {schema['maxLength']} characters")
+
+
+def _emit_number(emitter: _Emitter, schema: Dict[str, Any], value: str, path: str, indent: int):
+    for key, op in (("minimum", "<"), ("maximum", ">"), ("exclusiveMinimum", "<="), ("exclusiveMaximum", ">=")):
+        if key in schema:
+            emitter.line(indent, f"if {value} {op} {schema[key]!r}:")
+            emitter.error(indent + 1, path, _Repr(value), f" violates {key} {schema[key]!r}")
+
+
+def _emit_object(emitter: _Emitter, schema: Dict[str, Any], value: str, path: str, indent: int, location: str):
+    for key in schema.get("required", []):
+        emitter.line(indent, f"if {key!r} not in {value}:")
+        emitter.error(indent + 1, path, f"missing required property {key!r}")
+    if "minProperties" in schema:
+        emitter.line(indent, f"if len({value}) < {int(schema['minProperties'])}:")
+        emitter.error(indent + 1, path, f"fewer than {schema['minProperties']} properties")
+    if "maxProperties" in schema:
+        emitter.line(indent, f"if len({value}) > {int(schema['maxProperties'])}:")
+        emitter.error(indent + 1, path, f"more than {schema['maxProperties']} properties")
+
+    properties = schema.get("properties", {})
+    for key, subschema in properties.items():
+        child = emitter.variable()
+        emitter.block(
+            indent, f"if {child} is not _MISSING:",
+            lambda: _emit_schema(emitter, subschema, child, f"{path} + {json.dumps('.' + key)}",
+                                 indent + 1, f"{location}.{key}"),
+            prefix=f"{child} = {value}.get({key!r}, _MISSING)"
+        )
+
+    additional = schema.get("additionalProperties", True)
+    if additional is True or additional == {}:
+        return
+    known = emitter.constant("K", f"frozenset({sorted(properties)!r})")
+    extra = emitter.variable("k")
+    if additional is False:
+        emitter.line(indent, f"if not {known}.issuperset({value}):")
+        emitter.line(indent + 1, f"for {extra} in {value}:")
+        emitter.line(indent + 2, f"if {extra} not in {known}:")
+        emitter.error(indent + 3, path, "unexpected property ", _Repr(extra))
+        return
+    child = emitter.variable()
+    emitter.block(
+        indent, f"for {extra}, {child} in {value}.items():",
+        lambda: emitter.block(
+            indent + 1, f"if {extra} not in {known}:",
+            lambda: _emit_schema(emitter, additional, child, f"{path} + '.' + str({extra})",
+                                 indent + 2, f"{location}.additionalProperties")
+        )
+    )
+
+
+def _emit_array(emitter: _Emitter, schema: Dict[str, Any], value: str, path: str, indent: int, location: str):
+    if "minItems" in schema:
+        emitter.line(indent, f"if len({value}) < {int(schema['minItems'])}:")
+        emitter.error(indent + 1, path, f"fewer than {schema['minItems']} items")
+    if "maxItems" in schema:
+        emitter.line(indent, f"if len({value}) > {int(schema['maxItems'])}:")
+        emitter.error(indent + 1, path, f"more than {schema['maxItems']} items")
+
+    items = schema.get("items", True)
+    if isinstance(items, list):
+        raise SchemaCompileError(f"{location}: tuple-form items is not supported")
+    index = emitter.variable("i")
+    child = emitter.variable()
+    emitter.block(
+        indent, f"for {index}, {child} in enumerate({value}):",
+        lambda: _emit_schema(emitter, items, child, f"{path} + '[' + str({index}) + ']'",
+                             indent + 1, f"{location}[]")
+    )
+
+
+def compile_schema(schema: Dict[str, Any], schema_type: str, schema_hash: str = "") -> str:
+    """Generate the source of a Python module defining validate(payload) -> list of errors."""
+    emitter = _Emitter()
+    _emit_schema(emitter, schema, "payload", "'$'", 1, schema_type)
+    body = emitter.lines or ["    pass"]
+
+    return "\n".join([
+        f"# Generated by ops/scripts/schema_compiler.py from {schema_type}.schema.json. Do not edit.",
+        f"# schema_hash: {schema_hash}",
+        "import re",
+        "",
+        "_MISSING = object()",
+        "",
+        "",
+        "def _equal(a, b):",
+        "    # JSON equality: booleans never equal numbers",
+        "    if isinstance(a, bool) or isinstance(b, bool):",
+        "        return type(a) is type(b) and a == b",
+        "    if isinstance(a, list) and isinstance(b, list):",
+        "        return len(a) == len(b) and all(_equal(x, y) for x, y in zip(a, b))",
+        "    if isinstance(a, dict) and isinstance(b, dict):",
+        "        return a.keys() == b.keys() and all(_equal(a[k], b[k]) for k in a)",
+        "    return a == b",
+        "",
+        "",
+        *emitter.constants,
+        "",
+        "",
+        "def validate(payload):",
+        f'    """Validate a payload against {schema_type}.schema.json; return error messages ([] if valid)."""',
+        "    errors = []",
+        *body,
+        "    return errors",
+        "",
+    ])
+
+
+def schema_hash(schema_bytes: bytes) -> str:
+    """Cache key for a schema: its content plus the compiler version."""
+    digest = hashlib.sha256(f"schema_compiler:{COMPILER_VERSION}\n".encode())
+    digest.update(schema_bytes)
+    return digest.hexdigest()
+
+
+def compiled_module_path(schema_type: str, schema_bytes: bytes, cache_dir: Path = CACHE_DIR) -> Path:
+    """Where the compiled validator for this schema content is cached."""
+    return cache_dir / f"{schema_type}_{schema_hash(schema_bytes)[:16]}.py"
+
+
+def load_validator(
+    schema_type: str,
+    schemas_dir: Path = SCHEMAS_DIR,
+    cache_dir: Path = CACHE_DIR
+) -> Validator:
+    """Return the compiled validator for a schema type, compiling it if the cache is stale."""
+    schema_file = schemas_dir / f"{schema_type}.schema.json"
+    schema_bytes = schema_file.read_bytes()
+    module_path = compiled_module_path(schema_type, schema_bytes, cache_dir)
+
+    if module_path in _validators:
+        return _validators[module_path]
+
+    if not module_path.exists():
+        source = compile_schema(json.loads(schema_bytes), schema_type, schema_hash(schema_bytes))
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = module_path.with_name(f"{module_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(source, encoding='utf-8')
+        os.replace(tmp_path, module_path)
+        # Drop validators compiled from earlier versions of this schema
+        for stale in cache_dir.glob(f"{schema_type}_*.py"):
+            if stale != module_path and len(stale.stem) == len(module_path.stem):
+                stale.unlink(missing_ok=True)
+
+    spec = importlib.util.spec_from_file_location(f"compiled_{module_path.stem}", module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    _validators[module_path] = module.validate
+    return module.validate
+
+
+def load_validators(schemas_dir: Path = SCHEMAS_DIR, cache_dir: Path = CACHE_DIR) -> Dict[str, Validator]:
+    """Compiled validators for every schema in schemas_dir, keyed by schema type."""
+    return {
+        path.name[:-len(".schema.json")]: load_validator(path.name[:-len(".schema.json")], schemas_dir, cache_dir)
+        for path in sorted(schemas_dir.glob("*.schema.json"))
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile shared/schemas into Python validators")
+    parser.add_argument("--schemas-dir", type=Path, default=SCHEMAS_DIR, help="Directory of *.schema.json files")
+    parser.add_argument("--cache-dir", type=Path, default=CACHE_DIR, help="Where compiled validators are cached")
+    parser.add_argument("--show", metavar="SCHEMA_TYPE", help="Print the generated source for one schema")
+    args = parser.parse_args()
+
+    if args.show:
+        schema_bytes = (args.schemas_dir / f"{args.show}.schema.json").read_bytes()
+        print(compile_schema(json.loads(schema_bytes), args.show, schema_hash(schema_bytes)))
+        return
+
+    for schema_type in load_validators(args.schemas_dir, args.cache_dir):
+        schema_bytes = (args.schemas_dir / f"{schema_type}.schema.json").read_bytes()
+        print(f"Compiled {schema_type}: {compiled_module_path(schema_type, schema_bytes, args.cache_dir)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Purpose: Validate NDJSON payload dumps against a shared/schemas schema in bulk
+Created/Updated: 2026-10-16
+Agent: BACKEND_AGENT
+
+Streams an NDJSON file (plain or .gz) or stdin through the compiled
+validator for one schema type (see schema_compiler.py). Lines are read in
+chunks and validated in a process pool with a bounded number of chunks in
+flight, so memory stays flat however long the input is. Results come back
+in input order.
+
+Invalid records go to a failures file, one JSON object per line:
+    {"line": 12, "errors": ["$.id: 'x' does not match ..."], "record": "<original line>"}
+
+The summary reports records per second and a histogram of errors by
+field and kind (array indices collapsed, values dropped).
+
+Usage:
+    python ops/scripts/validate_payloads.py event events-2026-09.ndjson.gz
+    zcat dump.ndjson.gz | python ops/scripts/validate_payloads.py contact - --failures bad.ndjson
+    python ops/scripts/validate_payloads.py event events.ndjson --jobs 8 --report report.json
+"""
+
+import argparse
+import gzip
+import json
+import os
+import re
+import sys
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from schema_compiler import CACHE_DIR, SCHEMAS_DIR, Validator, load_validator
+
+DEFAULT_CHUNK_SIZE = 2000
+# Chunks queued per worker; bounds memory while keeping workers busy
+CHUNKS_IN_FLIGHT_PER_JOB = 2
+
+ARRAY_INDEX = re.compile(r"\[\d+\]")
+# Error detail shapes produced by schema_compiler, most specific first
+ERROR_KINDS = [
+    (re.compile(r"^invalid JSON: .*$", re.DOTALL), "invalid JSON"),
+    (re.compile(r"^missing required property (.+)$"), "missing required property {0}"),
+    (re.compile(r"^expected type (.+), got .*$", re.DOTALL), "expected type {0}"),
+    (re.compile(r"^unexpected property .*$", re.DOTALL), "unexpected property"),
+    (re.compile(r"^.* does not match .*$", re.DOTALL), "pattern"),
+    (re.compile(r"^.* is not one of .*$", re.DOTALL), "enum"),
+    (re.compile(r"^.* violates (\w+) .*$", re.DOTALL), "{0}"),
+    (re.compile(r"^.* is not .*$", re.DOTALL), "const"),
+]
+
+Chunk = List[Tuple[int, bytes]]
+Failure = Dict[str, Any]
+
+# Validator of the current worker process, set by _init_worker
+_worker_validator: Optional[Validator] = None
+
+
+def error_kind(message: str) -> str:
+    """Histogram key for an error message: its JSON path and the kind of failure, without values."""
+    path, _, detail = message.partition(": ")
+    path = ARRAY_INDEX.sub("[]", path)
+    for pattern, template in ERROR_KINDS:
+        match = pattern.match(detail)
+        if match:
+            return f"{path}: {template.format(*match.groups())}"
+    return f"{path}: {detail}"
+
+
+def open_input(source: str) -> BinaryIO:
+    """Binary stream for a file path, a .gz file, or '-' for stdin."""
+    if source == "-":
+        return sys.stdin.buffer
+    if source.endswith(".gz"):
+        return gzip.open(source, "rb")
+    return open(source, "rb")
+
+
+def iter_chunks(stream: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Chunk]:
+    """Yield lists of (line number, line) from an NDJSON stream, skipping blank lines."""
+    numbered = ((number, line) for number, line in enumerate(stream, 1) if line.strip())
+    while True:
+        chunk = list(islice(numbered, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def validate_chunk(chunk: Chunk, validate: Validator) -> Tuple[int, List[Failure]]:
+    """Validate one chunk of lines; return the record count and the failures."""
+    failures = []
+    for number, line in chunk:
+        try:
+            record = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            errors = [f"$: invalid JSON: {e}"]
+        else:
+            errors = validate(record)
+        if errors:
+            failures.append({
+                "line": number,
+                "errors": errors,
+                "record": line.decode("utf-8", errors="replace").rstrip("\r\n"),
+            })
+    return len(chunk), failures
+
+
+def _init_worker(schema_type: str, schemas_dir: Path, cache_dir: Path):
+    global _worker_validator
+    _worker_validator = load_validator(schema_type, schemas_dir, cache_dir)
+
+
+def _validate_chunk_in_worker(chunk: Chunk) -> Tuple[int, List[Failure]]:
+    return validate_chunk(chunk, _worker_validator)
+
+
+def iter_results(
+    chunks: Iterator[Chunk],
+    schema_type: str,
+    jobs: int = 1,
+    schemas_dir: Path = SCHEMAS_DIR,
+    cache_dir: Path = CACHE_DIR
+) -> Iterator[Tuple[int, List[Failure]]]:
+    """Validate chunks (in a process pool when jobs > 1), yielding results in input order."""
+    # Compile once up front so workers only import the cached module
+    validate = load_validator(schema_type, schemas_dir, cache_dir)
+    if jobs <= 1:
+        for chunk in chunks:
+            yield validate_chunk(chunk, validate)
+        return
+
+    # executor.map would consume the whole input up front; keep a bounded window instead
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(schema_type, schemas_dir, cache_dir)
+    ) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_validate_chunk_in_worker, chunk))
+            if len(pending) >= jobs * CHUNKS_IN_FLIGHT_PER_JOB:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def validate_stream(
+    stream: BinaryIO,
+    schema_type: str,
+    failures_out=None,
+    jobs: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    schemas_dir: Path = SCHEMAS_DIR,
+    cache_dir: Path = CACHE_DIR
+) -> Dict[str, Any]:
+    """Validate an NDJSON stream, writing failures to failures_out, and return the summary."""
+    started = time.perf_counter()
+    records = 0
+    invalid = 0
+    histogram = Counter()
+
+    for count, failures in iter_results(iter_chunks(stream, chunk_size), schema_type, jobs, schemas_dir, cache_dir):
+        records += count
+        invalid += len(failures)
+        for failure in failures:
+            histogram.update(error_kind(message) for message in failure["errors"])
+            if failures_out is not None:
+                failures_out.write(json.dumps(failure, ensure_ascii=False) + "\n")
+
+    elapsed = time.perf_counter() - started
+    return {
+        "schema_type": schema_type,
+        "records": records,
+        "valid": records - invalid,
+        "invalid": invalid,
+        "elapsed_seconds": round(elapsed, 3),
+        "records_per_second": round(records / elapsed) if elapsed > 0 else 0,
+        "error_histogram": dict(histogram.most_common()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate NDJSON payloads against a shared/schemas schema")
+    parser.add_argument("schema_type", help="Schema type, e.g. event, contact, incident, infra_deploy")
+    parser.add_argument("input", help="NDJSON file (.gz supported) or - for stdin")
+    parser.add_argument("--failures", type=Path, help="Write invalid records to this NDJSON file")
+    parser.add_argument("--report", type=Path, help="Write the JSON summary to this file")
+    parser.add_argument("--jobs", type=int, default=0, metavar="N",
+                        help="Validate in N worker processes (0 = one per CPU)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, metavar="LINES",
+                        help=f"Lines per worker batch (default: {DEFAULT_CHUNK_SIZE})")
+    parser.add_argument("--top", type=int, default=20, help="Histogram entries to print")
+    args = parser.parse_args()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    if not (SCHEMAS_DIR / f"{args.schema_type}.schema.json").exists():
+        parser.error(f"unknown schema type: {args.schema_type}")
+
+    failures_out = None
+    if args.failures:
+        args.failures.parent.mkdir(parents=True, exist_ok=True)
+        failures_out = open(args.failures, "w", encoding="utf-8")
+    try:
+        with open_input(args.input) as stream:
+            summary = validate_stream(stream, args.schema_type, failures_out, jobs, args.chunk_size)
+    finally:
+        if failures_out is not None:
+            failures_out.close()
+
+    print(f"Validated {summary['records']} {args.schema_type} records in {summary['elapsed_seconds']}s "
+          f"({summary['records_per_second']} records/s, {jobs} jobs): "
+          f"{summary['valid']} valid, {summary['invalid']} invalid")
+    for key, count in list(summary["error_histogram"].items())[:args.top]:
+        print(f"  {count:>10}  {key}")
+    if args.failures:
+        print(f"Failures written: {args.failures}")
+
+    if args.report:
+        args.report.parent.mkdir(parents=True, exist_ok=True)
+        args.report.write_text(json.dumps(summary, indent=2, ensure_ascii=False) + "\n", encoding='utf-8')
+        print(f"Report written: {args.report}")
+
+    if summary["invalid"]:
+        sys.exit(1)
+    print("✅ All records are valid")
+
+
+if __name__ == "__main__":
+    main()
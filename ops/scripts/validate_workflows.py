@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Purpose: Validate n8n workflow files in parallel and emit one machine-readable report
+Created/Updated: 2026-10-16
+Agent: BACKEND_AGENT
+
+Each workflow file is read and parsed once, and every check runs on that
+parsed copy:
+- json_syntax: the file is valid JSON
+- structure: top-level object with a nodes list; nodes have a type and a
+  unique name; connections only reference existing nodes
+- location: the file lives in an approved domain directory
+- naming: lowercase snake_case file name (warning only)
+- schema_reference: schema types used via validatePayload(..., '<type>') and
+  *.schema.json references exist in shared/schemas
+
+Empty files and stubs holding only _metadata are workflow placeholders and
+are skipped. Files are checked in a process pool; the report lists every
+file with its errors and warnings.
+
+Usage:
+    python ops/scripts/validate_workflows.py
+    python ops/scripts/validate_workflows.py --report validation-report.json --jobs 4
+    python ops/scripts/validate_workflows.py workflows/domains/crm/lead_intake.json
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from workflow_layout import SCAN_DIRS
+
+# Base paths
+REPO_ROOT = Path(__file__).parent.parent.parent
+WORKFLOWS_DIR = REPO_ROOT / "workflows"
+SCHEMAS_DIR = REPO_ROOT / "shared" / "schemas"
+
+# Directories under WORKFLOWS_DIR that hold generated metadata, not workflows
+EXCLUDED_DIRS = ["metadata"]
+
+NAMING_PATTERN = re.compile(r"^[a-z0-9_]+\.json$")
+# validatePayload($json, 'contact') / validatePayload(payload, "event", ...)
+VALIDATE_PAYLOAD_CALL = re.compile(r"validatePayload\s*\([^,()]*,\s*['\"]([A-Za-z0-9_-]+)['\"]")
+SCHEMA_FILE_REFERENCE = re.compile(r"([A-Za-z0-9_-]+)\.schema\.json")
+
+
+def load_schema_types(schemas_dir: Path = SCHEMAS_DIR) -> List[str]:
+    """Schema types available in shared/schemas (file names without .schema.json)."""
+    return sorted(path.name[:-len(".schema.json")] for path in schemas_dir.glob("*.schema.json"))
+
+
+def iter_workflow_files(workflows_dir: Path = WORKFLOWS_DIR) -> List[Path]:
+    """All workflow JSON files under workflows_dir, in sorted order."""
+    return sorted(
+        path for path in workflows_dir.rglob("*.json")
+        if path.relative_to(workflows_dir).parts[0] not in EXCLUDED_DIRS
+    )
+
+
+def iter_strings(value: Any) -> Iterable[str]:
+    """Yield every string nested anywhere in a JSON value."""
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            yield item
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+
+
+def is_placeholder(workflow: Any) -> bool:
+    """True for stub files holding only underscore-prefixed keys such as _metadata."""
+    return isinstance(workflow, dict) and all(key.startswith("_") for key in workflow)
+
+
+def check_structure(workflow: Any) -> List[str]:
+    """Structural problems of a parsed workflow."""
+    if not isinstance(workflow, dict):
+        return ["Workflow must be a JSON object"]
+
+    errors = []
+    if "name" in workflow and not isinstance(workflow["name"], str):
+        errors.append("'name' must be a string")
+
+    nodes = workflow.get("nodes")
+    if not isinstance(nodes, list):
+        errors.append("Missing 'nodes' list")
+        return errors
+
+    node_names = set()
+    for position, node in enumerate(nodes):
+        if not isinstance(node, dict):
+            errors.append(f"Node {position} must be an object")
+            continue
+        if not isinstance(node.get("type"), str) or not node.get("type"):
+            errors.append(f"Node {position} is missing a 'type'")
+        name = node.get("name")
+        if name is None:
+            continue
+        if not isinstance(name, str):
+            errors.append(f"Node {position} 'name' must be a string")
+            continue
+        if name in node_names:
+            errors.append(f"Duplicate node name: {name}")
+        node_names.add(name)
+
+    connections = workflow.get("connections", {})
+    if not isinstance(connections, dict):
+        errors.append("'connections' must be an object")
+        return errors
+    for source, outputs in connections.items():
+        if source not in node_names:
+            errors.append(f"Connection from unknown node: {source}")
+        if outputs is None:
+            continue
+        if not isinstance(outputs, dict):
+            errors.append(f"Connections of {source} must be an object")
+            continue
+        for output_type, output in outputs.items():
+            if output is None:
+                continue
+            if not isinstance(output, list):
+                errors.append(f"Connections of {source} ({output_type}) must be a list")
+                continue
+            for branch in output:
+                if branch is None:
+                    continue
+                if not isinstance(branch, list):
+                    errors.append(f"Connection branch of {source} ({output_type}) must be a list")
+                    continue
+                for target in branch:
+                    if not isinstance(target, dict):
+                        errors.append(f"Connection target of {source} ({output_type}) must be an object")
+                        continue
+                    target_name = target.get("node")
+                    if target_name is None:
+                        continue
+                    if not isinstance(target_name, str):
+                        errors.append(f"Connection target of {source} ({output_type}) must name a node")
+                    elif target_name not in node_names:
+                        errors.append(f"Connection from {source} to unknown node: {target_name}")
+    return errors
+
+
+def check_schema_references(workflow: Any, schema_types: Iterable[str]) -> List[str]:
+    """Schema types referenced by the workflow's nodes that do not exist."""
+    if not isinstance(workflow, dict) or not isinstance(workflow.get("nodes"), list):
+        return []
+    known = set(schema_types)
+    referenced = set()
+    for text in iter_strings(workflow["nodes"]):
+        if "validatePayload" in text:
+            referenced.update(VALIDATE_PAYLOAD_CALL.findall(text))
+        if ".schema.json" in text:
+            referenced.update(SCHEMA_FILE_REFERENCE.findall(text))
+    return [f"Unknown schema reference: {schema_type}" for schema_type in sorted(referenced - known)]
+
+
+def validate_workflow_file(workflow_file: Path, workflows_dir: Path, schema_types: List[str]) -> Dict[str, Any]:
+    """Run every check on one workflow file and return its report entry."""
+    try:
+        relative_path: Optional[str] = workflow_file.relative_to(workflows_dir).as_posix()
+    except ValueError:
+        relative_path = None
+    result = {"file": relative_path or workflow_file.as_posix(), "status": "valid", "errors": [], "warnings": []}
+
+    def error(check: str, message: str):
+        result["errors"].append({"check": check, "message": message})
+
+    if relative_path is None:
+        error("location", f"Workflow is not under the workflows dir ({workflows_dir})")
+        result["status"] = "invalid"
+        return result
+
+    try:
+        content = workflow_file.read_bytes()
+    except OSError as e:
+        error("json_syntax", f"Could not read file: {e}")
+        result["status"] = "invalid"
+        return result
+
+    if not content.strip():
+        result["status"] = "placeholder"
+        return result
+
+    try:
+        workflow = json.loads(content)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        error("json_syntax", f"Invalid JSON: {e}")
+    else:
+        if is_placeholder(workflow):
+            result["status"] = "placeholder"
+            return result
+        for message in check_structure(workflow):
+            error("structure", message)
+        for message in check_schema_references(workflow, schema_types):
+            error("schema_reference", message)
+
+    if relative_path.rpartition("/")[0] not in SCAN_DIRS:
+        error("location", "Workflow is not in an approved domain directory")
+    if not NAMING_PATTERN.match(workflow_file.name):
+        result["warnings"].append({
+            "check": "naming",
+            "message": "File name should be lowercase snake_case (see docs/WORKFLOW_NAMING.md)"
+        })
+
+    if result["errors"]:
+        result["status"] = "invalid"
+    return result
+
+
+def validate_file_safely(workflow_file: Path, workflows_dir: Path, schema_types: List[str]) -> Dict[str, Any]:
+    """validate_workflow_file, with an unexpected failure reported as an invalid file instead of raised."""
+    try:
+        return validate_workflow_file(workflow_file, workflows_dir, schema_types)
+    except Exception as e:
+        return {
+            "file": workflow_file.as_posix(),
+            "status": "invalid",
+            "errors": [{"check": "internal", "message": f"Validation failed: {type(e).__name__}: {e}"}],
+            "warnings": [],
+        }
+
+
+def validate_workflows(
+    workflow_files: List[Path],
+    workflows_dir: Path = WORKFLOWS_DIR,
+    schema_types: Optional[List[str]] = None,
+    jobs: int = 1
+) -> Dict[str, Any]:
+    """Validate workflow files (in a process pool when jobs > 1) and build the report."""
+    started = time.perf_counter()
+    if schema_types is None:
+        schema_types = load_schema_types()
+    validate = partial(validate_file_safely, workflows_dir=workflows_dir, schema_types=schema_types)
+
+    if jobs > 1 and len(workflow_files) > 1:
+        # Batch files per task; one task per file would be dominated by IPC
+        chunksize = max(1, len(workflow_files) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(validate, workflow_files, chunksize=chunksize))
+    else:
+        results = [validate(workflow_file) for workflow_file in workflow_files]
+
+    statuses = [result["status"] for result in results]
+    return {
+        "summary": {
+            "files": len(results),
+            "valid": statuses.count("valid"),
+            "invalid": statuses.count("invalid"),
+            "placeholders": statuses.count("placeholder"),
+            "errors": sum(len(result["errors"]) for result in results),
+            "warnings": sum(len(result["warnings"]) for result in results),
+            "elapsed_seconds": round(time.perf_counter() - started, 3),
+        },
+        "schema_types": schema_types,
+        "files": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate n8n workflow files")
+    parser.add_argument("files", nargs="*", type=Path, help="Workflow files to check (default: all)")
+    parser.add_argument("--workflows-dir", type=Path, default=WORKFLOWS_DIR, help="Workflows root directory")
+    parser.add_argument("--report", type=Path, help="Write the JSON report to this file")
+    parser.add_argument("--jobs", type=int, default=0, metavar="N",
+                        help="Validate in N worker processes (0 = one per CPU)")
+    parser.add_argument("--strict", action="store_true", help="Fail on warnings as well as errors")
+    args = parser.parse_args()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    workflows_dir = args.workflows_dir.resolve()
+    workflow_files = [path.resolve() for path in args.files] or iter_workflow_files(workflows_dir)
+    report = validate_workflows(workflow_files, workflows_dir, jobs=jobs)
+
+    for result in report["files"]:
+        for severity, issues in (("❌", result["errors"]), ("⚠️ ", result["warnings"])):
+            for issue in issues:
+                print(f"{severity} {result['file']} [{issue['check']}]: {issue['message']}")
+
+    summary = report["summary"]
+    print(f"Checked {summary['files']} workflow files in {summary['elapsed_seconds']}s: "
+          f"{summary['valid']} valid, {summary['invalid']} invalid, {summary['placeholders']} placeholders, "
+          f"{summary['warnings']} warnings")
+
+    if args.report:
+        args.report.parent.mkdir(parents=True, exist_ok=True)
+        args.report.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n", encoding='utf-8')
+        print(f"Report written: {args.report}")
+
+    if summary["invalid"] or (args.strict and summary["warnings"]):
+        sys.exit(1)
+    print("✅ All workflow files are valid")
+
+
+if __name__ == "__main__":
+    main()
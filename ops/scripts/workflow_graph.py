@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Purpose: Workflow dependency graph built from the catalog's executeWorkflow dependencies
+Created/Updated: 2026-10-16
+Agent: BACKEND_AGENT
+
+Answers deploy-ordering and blast-radius questions:
+- cycles: groups of workflows that (transitively) call each other
+- order: deploy order with every dependency before its dependents
+- dependencies/dependents: transitive closure for any workflow
+
+Cycles are collapsed into strongly connected components, and transitive
+closures are computed once over the component DAG using integer bitsets.
+Recomputing the whole graph for 10k+ workflows takes well under a second.
+
+Usage:
+    python ops/scripts/workflow_graph.py order
+    python ops/scripts/workflow_graph.py cycles
+    python ops/scripts/workflow_graph.py dependents error_central_handler
+    python ops/scripts/workflow_graph.py dependencies lead_intake
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Set
+
+# Base paths
+REPO_ROOT = Path(__file__).parent.parent.parent
+METADATA_DIR = REPO_ROOT / "workflows" / "metadata"
+CATALOG_FILE = METADATA_DIR / "workflows_catalog.yaml"
+CATALOG_JSON_FILE = METADATA_DIR / "workflows_catalog.json"
+
+
+class WorkflowGraph:
+    """Directed graph of workflow -> sub-workflow dependencies."""
+
+    def __init__(self, dependencies: Dict[str, Iterable[str]]):
+        """Build the graph from a mapping of workflow ID to direct dependency IDs."""
+        edges: Dict[str, Set[str]] = {}
+        for workflow_id, deps in dependencies.items():
+            edges.setdefault(workflow_id, set()).update(deps)
+            for dep in deps:
+                edges.setdefault(dep, set())
+
+        self.nodes: List[str] = sorted(edges)
+        # Dependency IDs that no catalog entry defines
+        self.missing: Set[str] = set(self.nodes) - set(dependencies)
+        self._index = {node: i for i, node in enumerate(self.nodes)}
+        self._edges = [sorted(self._index[dep] for dep in edges[node]) for node in self.nodes]
+
+        self._components = self._strongly_connected_components()
+        self._component_of = [0] * len(self.nodes)
+        for component_index, members in enumerate(self._components):
+            for node in members:
+                self._component_of[node] = component_index
+        self._dependency_bits = None
+        self._dependent_bits = None
+        self._closure_cache: Dict[tuple, List[str]] = {}
+
+    @classmethod
+    def from_catalog(cls, catalog: Dict[str, Any]) -> "WorkflowGraph":
+        """Build the graph from a catalog dict as written by generate_catalog.py."""
+        dependencies: Dict[str, List[str]] = {}
+        for workflow in catalog.get("catalog", {}).get("workflows", []):
+            workflow_id = workflow.get("id")
+            if not workflow_id:
+                continue
+            deps = [dep for dep in workflow.get("dependencies") or [] if isinstance(dep, str)]
+            dependencies.setdefault(workflow_id, []).extend(deps)
+        return cls(dependencies)
+
+    def _strongly_connected_components(self) -> List[List[int]]:
+        """
+        Tarjan's algorithm, iterative so deep dependency chains do not hit the recursion limit.
+
+        Components are emitted dependencies-first, i.e. in a valid deploy order.
+        """
+        index_of = [-1] * len(self.nodes)
+        lowlink = [0] * len(self.nodes)
+        on_stack = [False] * len(self.nodes)
+        stack: List[int] = []
+        components: List[List[int]] = []
+        counter = 0
+
+        for root in range(len(self.nodes)):
+            if index_of[root] != -1:
+                continue
+            work = [(root, 0)]
+            while work:
+                node, edge_pos = work[-1]
+                if edge_pos == 0:
+                    index_of[node] = lowlink[node] = counter
+                    counter += 1
+                    stack.append(node)
+                    on_stack[node] = True
+                edges = self._edges[node]
+                while edge_pos < len(edges):
+                    dep = edges[edge_pos]
+                    edge_pos += 1
+                    if index_of[dep] == -1:
+                        work[-1] = (node, edge_pos)
+                        work.append((dep, 0))
+                        break
+                    if on_stack[dep]:
+                        lowlink[node] = min(lowlink[node], index_of[dep])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    if lowlink[node] == index_of[node]:
+                        members = []
+                        while True:
+                            member = stack.pop()
+                            on_stack[member] = False
+                            members.append(member)
+                            if member == node:
+                                break
+                        components.append(sorted(members))
+        return components
+
+    def _is_cyclic(self, members: List[int]) -> bool:
+        return len(members) > 1 or members[0] in self._edges[members[0]]
+
+    def cycles(self) -> List[List[str]]:
+        """Return each dependency cycle as a sorted list of workflow IDs."""
+        return [
+            [self.nodes[node] for node in members]
+            for members in self._components
+            if self._is_cyclic(members)
+        ]
+
+    def has_cycles(self) -> bool:
+        return any(self._is_cyclic(members) for members in self._components)
+
+    def topological_order(self) -> List[str]:
+        """
+        Return workflow IDs with every dependency before its dependents.
+
+        Members of a cycle cannot be ordered among themselves; they are kept
+        together, sorted by ID.
+        """
+        return [self.nodes[node] for members in self._components for node in members]
+
+    def _compute_closures(self):
+        """Compute transitive dependency/dependent bitsets for every component."""
+        component_count = len(self._components)
+        component_edges = [set() for _ in range(component_count)]
+        for node, deps in enumerate(self._edges):
+            source = self._component_of[node]
+            for dep in deps:
+                target = self._component_of[dep]
+                if target != source:
+                    component_edges[source].add(target)
+
+        member_bits = [0] * component_count
+        for component_index, members in enumerate(self._components):
+            for node in members:
+                member_bits[component_index] |= 1 << node
+
+        # Components are in dependencies-first order, so every dependency's
+        # closure is final before it is used.
+        dependency_bits = [0] * component_count
+        for component_index in range(component_count):
+            bits = member_bits[component_index] if self._is_cyclic(self._components[component_index]) else 0
+            for target in component_edges[component_index]:
+                bits |= dependency_bits[target] | member_bits[target]
+            dependency_bits[component_index] = bits
+
+        dependent_bits = [0] * component_count
+        for component_index in reversed(range(component_count)):
+            if self._is_cyclic(self._components[component_index]):
+                dependent_bits[component_index] |= member_bits[component_index]
+            contribution = dependent_bits[component_index] | member_bits[component_index]
+            for target in component_edges[component_index]:
+                dependent_bits[target] |= contribution
+
+        self._dependency_bits = dependency_bits
+        self._dependent_bits = dependent_bits
+
+    def _closure(self, workflow_id: str, kind: str) -> List[str]:
+        key = (kind, workflow_id)
+        if key in self._closure_cache:
+            return self._closure_cache[key]
+        if workflow_id not in self._index:
+            raise KeyError(f"Unknown workflow: {workflow_id}")
+        if self._dependency_bits is None:
+            self._compute_closures()
+
+        component_index = self._component_of[self._index[workflow_id]]
+        bits = (self._dependency_bits if kind == "dependencies" else self._dependent_bits)[component_index]
+        # Bit i of the reversed binary string is node i; nodes are sorted by ID
+        nodes = self.nodes
+        result = [nodes[i] for i, bit in enumerate(bin(bits)[:1:-1]) if bit == "1"]
+        self._closure_cache[key] = result
+        return result
+
+    def dependencies(self, workflow_id: str) -> List[str]:
+        """All workflows the given workflow calls, directly or transitively (sorted)."""
+        return self._closure(workflow_id, "dependencies")
+
+    def dependents(self, workflow_id: str) -> List[str]:
+        """All workflows that call the given workflow, directly or transitively (sorted)."""
+        return self._closure(workflow_id, "dependents")
+
+
+def load_graph(catalog_path: Path) -> WorkflowGraph:
+    """Load a catalog file (YAML or JSON sidecar) and build its dependency graph."""
+    from generate_catalog import load_catalog_file
+    return WorkflowGraph.from_catalog(load_catalog_file(catalog_path))
+
+
+def main():
+    default_catalog = CATALOG_JSON_FILE if CATALOG_JSON_FILE.exists() else CATALOG_FILE
+    parser = argparse.ArgumentParser(description="Query the workflow dependency graph")
+    parser.add_argument("--catalog", type=Path, default=default_catalog,
+                        help="Catalog YAML file or JSON sidecar")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("order", help="Deploy order (dependencies first)")
+    subparsers.add_parser("cycles", help="Dependency cycles")
+    for name, help_text in (("dependencies", "Transitive dependencies of a workflow"),
+                            ("dependents", "Transitive dependents (blast radius) of a workflow")):
+        subparser = subparsers.add_parser(name, help=help_text)
+        subparser.add_argument("workflow_id")
+    args = parser.parse_args()
+
+    graph = load_graph(args.catalog)
+
+    if args.command == "order":
+        result: Any = graph.topological_order()
+    elif args.command == "cycles":
+        result = graph.cycles()
+    else:
+        try:
+            result = getattr(graph, args.command)(args.workflow_id)
+        except KeyError as e:
+            print(f"Error: {e.args[0]}")
+            sys.exit(1)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    elif args.command == "cycles":
+        for cycle in result:
+            print(" <-> ".join(cycle))
+    else:
+        for workflow_id in result:
+            print(workflow_id)
+
+    if args.command == "cycles" and result:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Purpose: Where workflow files live in the repository, shared by catalog and validation tooling
+Created/Updated: 2026-10-16
+Agent: BACKEND_AGENT
+
+Standard library only, so lightweight CI jobs can import it without the
+catalog generator's dependencies.
+"""
+
+# Directories scanned for workflow files, relative to workflows/
+SCAN_DIRS = [
+    "domains/shared",
+    "domains/crm",
+    "domains/infra",
+    "domains/meta",
+    "platform",  # Legacy support
+    "domain_crm",  # Legacy support
+    "domain_infra",  # Legacy support
+]
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Purpose: Stream selected top-level keys out of n8n workflow exports
+Created/Updated: 2026-10-16
+Agent: BACKEND_AGENT
+
+Real n8n exports carry large `pinData` and `meta` blobs that the catalog and
+validators never look at. stream_workflow_json() reads a workflow file in
+fixed-size chunks, decodes only the requested top-level keys and skips every
+other value by scanning its brackets and strings, without building Python
+objects for it. Memory use is bounded by the chunk size plus the kept values.
+Files no larger than one chunk are simply decoded with json.loads, which is
+several times faster than scanning for typical exports without pinData.
+
+Skipped values are only scanned for structure, not validated; use
+json.load() when full syntax checking is required.
+
+Usage:
+    from workflow_stream import stream_workflow_json, CATALOG_FIELDS
+    workflow_data = stream_workflow_json(path, CATALOG_FIELDS)
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+# Top-level keys needed to build catalog entries
+CATALOG_FIELDS = frozenset({"name", "tags", "settings", "nodes"})
+
+STREAM_CHUNK_SIZE = 1 << 18
+
+_QUOTE, _BACKSLASH = ord('"'), ord("\\")
+_LBRACE, _RBRACE = ord("{"), ord("}")
+_LBRACKET, _RBRACKET = ord("["), ord("]")
+_COLON, _COMMA = ord(":"), ord(",")
+
+_WHITESPACE = re.compile(rb"[ \t\r\n]*")
+# Rest of a string after its opening quote, including the closing quote
+_STRING_REST = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+# Everything up to the next bracket, consuming complete strings in one match.
+# Stops early at a string that runs past the end of the buffer.
+_SKIP_TO_BRACKET = re.compile(rb'(?:[^"{}\[\]]+|"[^"\\]*(?:\\.[^"\\]*)*")*', re.DOTALL)
+_SCALAR = re.compile(rb"[^,}\]\s]*")
+
+
+class WorkflowStream:
+    """Chunked byte reader that scans JSON values without decoding them."""
+
+    def __init__(self, f, chunk_size: int = STREAM_CHUNK_SIZE):
+        self._f = f
+        self._chunk_size = chunk_size
+        self.buf = b""
+        self.pos = 0
+
+    def _fill(self) -> bool:
+        """Make sure unread bytes are buffered; return False at end of file."""
+        if self.pos < len(self.buf):
+            return True
+        self.buf = self._f.read(self._chunk_size)
+        self.pos = 0
+        return bool(self.buf)
+
+    def peek(self) -> int:
+        """Skip whitespace and return the next byte without consuming it (-1 at EOF)."""
+        while self._fill():
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+        return -1
+
+    def expect(self, char: int):
+        """Consume the next non-whitespace byte, which must be char."""
+        found = self.peek()
+        if found != char:
+            found_text = "end of file" if found == -1 else repr(chr(found))
+            raise ValueError(f"Expected {chr(char)!r}, found {found_text}")
+        self.pos += 1
+
+    def scan_value(self, capture: bool) -> Optional[bytes]:
+        """Consume the next JSON value, returning its raw bytes if capture is set."""
+        first = self.peek()
+        if first == -1:
+            raise ValueError("Unexpected end of file")
+
+        parts: List[bytes] = []
+        if first not in (_LBRACE, _LBRACKET, _QUOTE):
+            # number, true, false or null
+            while self._fill():
+                match = _SCALAR.match(self.buf, self.pos)
+                if capture:
+                    parts.append(self.buf[self.pos:match.end()])
+                self.pos = match.end()
+                if self.pos < len(self.buf):
+                    break
+            return b"".join(parts) if capture else None
+
+        depth = 0
+        in_string = False
+        escaped = False
+        if first == _QUOTE:
+            # Top-level string: scan it with the in-string branch below
+            if capture:
+                parts.append(b'"')
+            self.pos += 1
+            in_string = True
+
+        while True:
+            if not self._fill():
+                raise ValueError("Unexpected end of file")
+            buf = self.buf
+            start = pos = self.pos
+            end = len(buf)
+            done = False
+            while pos < end:
+                if escaped:
+                    pos += 1
+                    escaped = False
+                elif in_string:
+                    match = _STRING_REST.match(buf, pos)
+                    if match is None:
+                        # String continues in the next chunk; carry a dangling backslash
+                        backslash = end - 1
+                        while backslash >= pos and buf[backslash] == _BACKSLASH:
+                            backslash -= 1
+                        escaped = (end - 1 - backslash) % 2 == 1
+                        pos = end
+                        break
+                    pos = match.end()
+                    in_string = False
+                    if depth == 0:
+                        done = True
+                        break
+                else:
+                    pos = _SKIP_TO_BRACKET.match(buf, pos).end()
+                    if pos >= end:
+                        break
+                    char = buf[pos]
+                    pos += 1
+                    if char == _QUOTE:
+                        # String continues in the next chunk
+                        in_string = True
+                    elif char == _LBRACE or char == _LBRACKET:
+                        depth += 1
+                    else:
+                        depth -= 1
+                        if depth == 0:
+                            done = True
+                            break
+            if capture:
+                parts.append(buf[start:pos])
+            self.pos = pos
+            if done:
+                return b"".join(parts) if capture else None
+
+
+def stream_workflow_json(
+    workflow_path: Path,
+    fields: Iterable[str] = CATALOG_FIELDS,
+    chunk_size: int = STREAM_CHUNK_SIZE
+) -> Dict[str, Any]:
+    """
+    Load only the given top-level keys of a workflow JSON object.
+
+    Keys outside `fields` are kept with a None value, so callers can still
+    tell which keys the export had (and that a file is not an empty object).
+    Raises ValueError (json.JSONDecodeError for kept values) on malformed input.
+    """
+    fields = frozenset(fields)
+    workflow_data: Dict[str, Any] = {}
+
+    with open(workflow_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size <= chunk_size:
+            # Fits in one chunk anyway: json.loads is far faster than scanning
+            return _project_fields(json.loads(f.read()), fields)
+
+        stream = WorkflowStream(f, chunk_size)
+        stream.expect(_LBRACE)
+        if stream.peek() == _RBRACE:
+            return workflow_data
+
+        while True:
+            if stream.peek() != _QUOTE:
+                raise ValueError("Expected a string key in workflow object")
+            key = json.loads(stream.scan_value(capture=True))
+            stream.expect(_COLON)
+            raw = stream.scan_value(capture=key in fields)
+            workflow_data[key] = json.loads(raw) if raw is not None else None
+
+            separator = stream.peek()
+            stream.pos += 1
+            if separator == _RBRACE:
+                break
+            if separator != _COMMA:
+                raise ValueError("Expected ',' or '}' in workflow object")
+
+    return workflow_data
+
+
+def _project_fields(workflow_data: Any, fields: frozenset) -> Dict[str, Any]:
+    """Reduce a fully loaded workflow to the streamed shape (other keys map to None)."""
+    if not isinstance(workflow_data, dict):
+        raise ValueError("Expected a JSON object at the top level of the workflow file")
+    return {key: value if key in fields else None for key, value in workflow_data.items()}
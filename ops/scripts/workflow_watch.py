@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Purpose: Watch workflow directories for changed workflow JSON files
+Created/Updated: 2026-10-16
+Agent: BACKEND_AGENT
+
+Used by generate_catalog.py --watch. On Linux the watcher uses inotify
+through ctypes (no extra dependencies); elsewhere, or if inotify cannot be
+initialised, it falls back to polling file sizes and mtimes.
+
+Both watchers report changes as paths relative to the workflows directory,
+covering files that were created, modified, moved or deleted. Callers check
+whether each path still exists. The inotify watcher returns None instead
+when events were lost or directories came or went, meaning every workflow
+file should be rescanned.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+# inotify event masks (see inotify(7))
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class PollingWatcher:
+    """Detect changes by comparing (size, mtime) snapshots of the watched directories."""
+
+    def __init__(self, workflows_dir: Path, scan_dirs: Iterable[str], interval: float = 1.0):
+        self.workflows_dir = workflows_dir
+        self.scan_dirs = list(scan_dirs)
+        self.interval = interval
+        self._snapshot = self._take_snapshot()
+        self._last_poll = time.monotonic()
+
+    def _take_snapshot(self) -> Dict[str, Tuple[int, int]]:
+        snapshot = {}
+        for scan_dir in self.scan_dirs:
+            domain_dir = self.workflows_dir / scan_dir
+            if not domain_dir.is_dir():
+                continue
+            for workflow_file in domain_dir.glob("*.json"):
+                try:
+                    stat = workflow_file.stat()
+                except FileNotFoundError:
+                    continue
+                snapshot[f"{scan_dir}/{workflow_file.name}"] = (stat.st_size, stat.st_mtime_ns)
+        return snapshot
+
+    def poll(self) -> Set[str]:
+        """Return paths that changed since the previous poll."""
+        snapshot = self._take_snapshot()
+        previous = self._snapshot
+        self._snapshot = snapshot
+        self._last_poll = time.monotonic()
+        changed = {path for path, fingerprint in snapshot.items() if previous.get(path) != fingerprint}
+        changed.update(path for path in previous if path not in snapshot)
+        return changed
+
+    def wait(self, timeout: Optional[float]) -> Set[str]:
+        """Block until the next poll is due (or timeout elapses), then poll and return changed paths."""
+        due_in = max(0.0, self._last_poll + self.interval - time.monotonic())
+        # Poll on an early timeout too: an empty result must mean the tree was quiet
+        time.sleep(due_in if timeout is None else min(timeout, due_in))
+        return self.poll()
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """Receive change events from the kernel through inotify."""
+
+    def __init__(self, workflows_dir: Path, scan_dirs: Iterable[str]):
+        libc_name = ctypes.util.find_library("c")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.workflows_dir = workflows_dir
+        self.scan_dirs = list(scan_dirs)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_init1 failed: {os.strerror(errno)}")
+        self._watches: Dict[int, str] = {}
+        self._watched_dirs: Set[str] = set()
+        self._add_watches()
+
+    def _add_watches(self):
+        """Watch every existing scan directory and its parents (to notice new scan dirs)."""
+        wanted = {""}
+        for scan_dir in self.scan_dirs:
+            parts = scan_dir.split("/")
+            wanted.update("/".join(parts[:depth]) for depth in range(1, len(parts) + 1))
+
+        for relative_dir in sorted(wanted - self._watched_dirs):
+            directory = self.workflows_dir / relative_dir if relative_dir else self.workflows_dir
+            if not directory.is_dir():
+                continue
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+            if wd < 0:
+                continue
+            self._watches[wd] = relative_dir
+            self._watched_dirs.add(relative_dir)
+
+    def _read_events(self) -> Tuple[Set[str], bool]:
+        """Drain pending events, returning changed paths and whether the watch set needs a refresh."""
+        changed: Set[str] = set()
+        refresh = False
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _cookie, name_len = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + name_len].rstrip(b"\0").decode("utf-8", "surrogateescape")
+                offset += name_len
+
+                if mask & IN_Q_OVERFLOW:
+                    refresh = True
+                    continue
+                relative_dir = self._watches.get(wd)
+                if relative_dir is None:
+                    continue
+                if mask & (IN_DELETE_SELF | IN_ISDIR):
+                    # A watched directory went away, or a directory was created/removed
+                    refresh = True
+                    if mask & IN_DELETE_SELF:
+                        self._watches.pop(wd, None)
+                        self._watched_dirs.discard(relative_dir)
+                    continue
+                if relative_dir in self.scan_dirs and name.endswith(".json"):
+                    changed.add(f"{relative_dir}/{name}")
+        return changed, refresh
+
+    def wait(self, timeout: Optional[float]) -> Optional[Set[str]]:
+        """Block until events arrive (or timeout elapses) and return changed paths, or None for a full rescan."""
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+        changed, refresh = self._read_events()
+        if refresh:
+            # Directories appeared/disappeared or events were dropped
+            self._add_watches()
+            return None
+        return changed
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def create_watcher(workflows_dir: Path, scan_dirs: Iterable[str], poll_interval: float = 1.0,
+                   force_polling: bool = False):
+    """Create an inotify watcher where available, otherwise a polling watcher."""
+    scan_dirs = list(scan_dirs)
+    if not force_polling and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(workflows_dir, scan_dirs)
+        except (OSError, AttributeError) as e:
+            print(f"Warning: inotify unavailable ({e}), falling back to polling")
+    return PollingWatcher(workflows_dir, scan_dirs, poll_interval)
@@ -6,8 +6,82 @@
  * Usage in n8n Code node:
  *   const riskScore = computeRiskScore($input.item.json);
  *   return { ...$input.item.json, metadata: { risk_score: riskScore } };
+ *
+ * Email domain lists are loaded once from shared/data/email_domain_risk.json
+ * when require() can reach it, otherwise the embedded copy below is used.
+ * The copy is generated from the same file; after editing the lists run
+ * python ops/scripts/email_domains.py --embed
  */
 
+// Used when the shared domain lists file cannot be loaded (e.g. inside n8n)
+// BEGIN generated from shared/data/email_domain_risk.json by ops/scripts/email_domains.py --embed
+const DEFAULT_DOMAIN_LISTS = {
+  "high_risk": [
+    "tempmail.com",
+    "10minutemail.com",
+    "guerrillamail.com",
+    "mailinator.com",
+    "throwaway.email",
+    "temp-mail.org"
+  ],
+  "low_risk": [
+    "gmail.com",
+    "yahoo.com",
+    "outlook.com",
+    "hotmail.com",
+    "icloud.com",
+    "protonmail.com",
+    "aol.com"
+  ]
+};
+// END generated
+
+/**
+ * Builds an email domain classifier from domain lists
+ * High-risk domains match the domain and its subdomains via a hashed suffix set,
+ * so lookups cost one Set check per label regardless of list size.
+ * Low-risk domains match exactly.
+ * @param {Object} lists - { high_risk: string[], low_risk: string[] }
+ * @returns {Object} Classifier with isHighRisk(domain) and isLowRisk(domain)
+ */
+function createDomainClassifier(lists) {
+  const highRisk = new Set((lists.high_risk || []).map(domain => domain.toLowerCase()));
+  const lowRisk = new Set((lists.low_risk || []).map(domain => domain.toLowerCase()));
+  
+  return {
+    isHighRisk(domain) {
+      let suffix = domain.toLowerCase();
+      while (true) {
+        if (highRisk.has(suffix)) {
+          return true;
+        }
+        const dot = suffix.indexOf('.');
+        if (dot === -1) {
+          return false;
+        }
+        suffix = suffix.slice(dot + 1);
+      }
+    },
+    isLowRisk(domain) {
+      return lowRisk.has(domain.toLowerCase());
+    }
+  };
+}
+
+/**
+ * Loads the shared email domain lists
+ * @returns {Object} Domain lists ({ high_risk, low_risk })
+ */
+function loadDomainLists() {
+  try {
+    return require('../data/email_domain_risk.json');
+  } catch (error) {
+    return DEFAULT_DOMAIN_LISTS;
+  }
+}
+
+const domainClassifier = createDomainClassifier(loadDomainLists());
+
 /**
  * Computes a risk score (0-100) for a contact based on various factors
  * @param {Object} contact - Contact data object (normalized contact preferred)
@@ -73,23 +147,13 @@ function calculateEmailDomainRisk(email, maxWeight) {
     return maxWeight;
   }
   
-  // High-risk domains (disposable email services, etc.)
-  const highRiskDomains = [
-    'tempmail.com', '10minutemail.com', 'guerrillamail.com',
-    'mailinator.com', 'throwaway.email', 'temp-mail.org'
-  ];
-  
-  if (highRiskDomains.some(riskDomain => domain.toLowerCase().includes(riskDomain))) {
+  // High-risk domains (disposable email services, etc.) and their subdomains
+  if (domainClassifier.isHighRisk(domain)) {
     return maxWeight;
   }
   
   // Low-risk domains (known good providers)
-  const lowRiskDomains = [
-    'gmail.com', 'yahoo.com', 'outlook.com', 'hotmail.com',
-    'icloud.com', 'protonmail.com', 'aol.com'
-  ];
-  
-  if (lowRiskDomains.includes(domain.toLowerCase())) {
+  if (domainClassifier.isLowRisk(domain)) {
     return maxWeight * 0.1; // Low risk for known providers
   }
   
@@ -287,6 +351,7 @@ function isValidEmail(email) {
 // Export for use in n8n Code nodes
 module.exports = {
   computeRiskScore,
+  createDomainClassifier,
   calculateEmailDomainRisk,
   calculateEmailFormatRisk,
   calculatePhoneRisk,
@@ -0,0 +1,1126 @@
+/*
+ * Purpose: Validate payloads against shared/schemas with precompiled validators
+ * Agent: BACKEND_AGENT
+ *
+ * GENERATED by ops/scripts/js_validator_compiler.py from shared/schemas/*.json.
+ * Do not edit; regenerate with: python ops/scripts/js_validator_compiler.py
+ *
+ * Drop-in for validatePayload() from validate_payload.js, with one unrolled
+ * validator per schema and regexes and enum sets built once at load.
+ *
+ * Usage in n8n Code node:
+ *   const validationResult = validatePayloadCompiled($input.item.json, 'contact');
+ *   if (!validationResult.valid) {
+ *     throw new Error(`Validation failed: ${validationResult.errors.join(', ')}`);
+ *   }
+ */
+
+const EMAIL_PATTERN = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
+
+function valueType(value) {
+  if (value === null) return 'null';
+  if (Array.isArray(value)) return 'array';
+  return typeof value;
+}
+
+function isValidEmail(email) {
+  return EMAIL_PATTERN.test(email);
+}
+
+function isValidDateTime(dateTime) {
+  return dateTime.includes('T') && !isNaN(new Date(dateTime).getTime());
+}
+
+const CONTACT_PATTERN_0 = new RegExp('^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$');
+const CONTACT_PATTERN_1 = new RegExp('^\\+?[1-9]\\d{1,14}$');
+const CONTACT_ENUM_2 = new Set(['new', 'contacted', 'qualified', 'converted', 'lost', null]);
+const CONTACT_ENUM_3 = new Set(['pending', 'in_progress', 'completed', 'failed', null]);
+const CONTACT_FIELDS_4 = new Set(['id', 'email', 'first_name', 'last_name', 'company', 'phone', 'title', 'source', 'status', 'tags', 'custom_fields', 'created_at', 'updated_at', 'metadata']);
+
+/**
+ * Validates a payload against shared/schemas/contact.schema.json
+ * @param {Object} payload - The payload to validate (a non-array object)
+ * @returns {Array} Error messages (empty if valid)
+ */
+function validateContact(payload) {
+  const errors = [];
+  const v1 = payload['email'];
+  if (v1 === undefined) {
+    errors.push('Missing required field: email');
+  }
+  const v2 = payload['id'];
+  if (v2 !== undefined) {
+    if (!(typeof v2 === 'string' || v2 === null)) {
+      errors.push('id: expected type string or null, got ' + valueType(v2));
+    } else {
+      if (v2 !== null) {
+        if (!CONTACT_PATTERN_0.test(v2)) {
+          errors.push('id: string does not match required pattern');
+        }
+      }
+    }
+  }
+  if (v1 !== undefined) {
+    if (!(typeof v1 === 'string')) {
+      errors.push('email: expected type string, got ' + valueType(v1));
+    } else {
+      const n3 = [...v1].length;
+      if (n3 < 1) {
+        errors.push('email: string length must be at least 1');
+      }
+      if (n3 > 255) {
+        errors.push('email: string length must be at most 255');
+      }
+      if (!isValidEmail(v1)) {
+        errors.push('email: invalid email format');
+      }
+    }
+  }
+  const v4 = payload['first_name'];
+  if (v4 !== undefined) {
+    if (!(typeof v4 === 'string' || v4 === null)) {
+      errors.push('first_name: expected type string or null, got ' + valueType(v4));
+    } else {
+      if (v4 !== null) {
+        const n5 = [...v4].length;
+        if (n5 > 100) {
+          errors.push('first_name: string length must be at most 100');
+        }
+      }
+    }
+  }
+  const v6 = payload['last_name'];
+  if (v6 !== undefined) {
+    if (!(typeof v6 === 'string' || v6 === null)) {
+      errors.push('last_name: expected type string or null, got ' + valueType(v6));
+    } else {
+      if (v6 !== null) {
+        const n7 = [...v6].length;
+        if (n7 > 100) {
+          errors.push('last_name: string length must be at most 100');
+        }
+      }
+    }
+  }
+  const v8 = payload['company'];
+  if (v8 !== undefined) {
+    if (!(typeof v8 === 'string' || v8 === null)) {
+      errors.push('company: expected type string or null, got ' + valueType(v8));
+    } else {
+      if (v8 !== null) {
+        const n9 = [...v8].length;
+        if (n9 > 200) {
+          errors.push('company: string length must be at most 200');
+        }
+      }
+    }
+  }
+  const v10 = payload['phone'];
+  if (v10 !== undefined) {
+    if (!(typeof v10 === 'string' || v10 === null)) {
+      errors.push('phone: expected type string or null, got ' + valueType(v10));
+    } else {
+      if (v10 !== null) {
+        if (!CONTACT_PATTERN_1.test(v10)) {
+          errors.push('phone: string does not match required pattern');
+        }
+      }
+    }
+  }
+  const v11 = payload['title'];
+  if (v11 !== undefined) {
+    if (!(typeof v11 === 'string' || v11 === null)) {
+      errors.push('title: expected type string or null, got ' + valueType(v11));
+    } else {
+      if (v11 !== null) {
+        const n12 = [...v11].length;
+        if (n12 > 100) {
+          errors.push('title: string length must be at most 100');
+        }
+      }
+    }
+  }
+  const v13 = payload['source'];
+  if (v13 !== undefined) {
+    if (!(typeof v13 === 'string' || v13 === null)) {
+      errors.push('source: expected type string or null, got ' + valueType(v13));
+    } else {
+      if (v13 !== null) {
+        const n14 = [...v13].length;
+        if (n14 > 50) {
+          errors.push('source: string length must be at most 50');
+        }
+      }
+    }
+  }
+  const v15 = payload['status'];
+  if (v15 !== undefined) {
+    if (!(typeof v15 === 'string' || v15 === null)) {
+      errors.push('status: expected type string or null, got ' + valueType(v15));
+    } else {
+      if (!CONTACT_ENUM_2.has(v15)) {
+        errors.push('status: value must be one of: new, contacted, qualified, converted, lost, ');
+      }
+    }
+  }
+  const v16 = payload['tags'];
+  if (v16 !== undefined) {
+    if (!(Array.isArray(v16))) {
+      errors.push('tags: expected type array, got ' + valueType(v16));
+    } else {
+      for (let i17 = 0; i17 < v16.length; i17++) {
+        const v18 = v16[i17];
+        if (!(typeof v18 === 'string')) {
+          errors.push('tags[' + i17 + ']: expected type string, got ' + valueType(v18));
+        } else {
+          const n19 = [...v18].length;
+          if (n19 > 50) {
+            errors.push('tags[' + i17 + ']: string length must be at most 50');
+          }
+        }
+      }
+    }
+  }
+  const v20 = payload['custom_fields'];
+  if (v20 !== undefined) {
+    if (!(typeof v20 === 'object' && v20 !== null && !Array.isArray(v20))) {
+      errors.push('custom_fields: expected type object, got ' + valueType(v20));
+    }
+  }
+  const v21 = payload['created_at'];
+  if (v21 !== undefined) {
+    if (!(typeof v21 === 'string' || v21 === null)) {
+      errors.push('created_at: expected type string or null, got ' + valueType(v21));
+    } else {
+      if (v21 !== null) {
+        if (!isValidDateTime(v21)) {
+          errors.push('created_at: invalid date-time format (expected ISO 8601)');
+        }
+      }
+    }
+  }
+  const v22 = payload['updated_at'];
+  if (v22 !== undefined) {
+    if (!(typeof v22 === 'string' || v22 === null)) {
+      errors.push('updated_at: expected type string or null, got ' + valueType(v22));
+    } else {
+      if (v22 !== null) {
+        if (!isValidDateTime(v22)) {
+          errors.push('updated_at: invalid date-time format (expected ISO 8601)');
+        }
+      }
+    }
+  }
+  const v23 = payload['metadata'];
+  if (v23 !== undefined) {
+    if (!(typeof v23 === 'object' && v23 !== null && !Array.isArray(v23))) {
+      errors.push('metadata: expected type object, got ' + valueType(v23));
+    } else {
+      const v24 = v23['risk_score'];
+      if (v24 !== undefined) {
+        if (!(typeof v24 === 'number' || v24 === null)) {
+          errors.push('metadata.risk_score: expected type number or null, got ' + valueType(v24));
+        } else {
+          if (v24 !== null) {
+            if (v24 < 0) {
+              errors.push('metadata.risk_score: value must be at least 0');
+            }
+            if (v24 > 100) {
+              errors.push('metadata.risk_score: value must be at most 100');
+            }
+          }
+        }
+      }
+      const v25 = v23['enrichment_status'];
+      if (v25 !== undefined) {
+        if (!(typeof v25 === 'string' || v25 === null)) {
+          errors.push('metadata.enrichment_status: expected type string or null, got ' + valueType(v25));
+        } else {
+          if (!CONTACT_ENUM_3.has(v25)) {
+            errors.push('metadata.enrichment_status: value must be one of: pending, in_progress, completed, failed, ');
+          }
+        }
+      }
+      const v26 = v23['last_enriched_at'];
+      if (v26 !== undefined) {
+        if (!(typeof v26 === 'string' || v26 === null)) {
+          errors.push('metadata.last_enriched_at: expected type string or null, got ' + valueType(v26));
+        } else {
+          if (v26 !== null) {
+            if (!isValidDateTime(v26)) {
+              errors.push('metadata.last_enriched_at: invalid date-time format (expected ISO 8601)');
+            }
+          }
+        }
+      }
+    }
+  }
+  for (const k27 in payload) {
+    if (!CONTACT_FIELDS_4.has(k27)) {
+      errors.push('Unexpected field: ' + k27);
+    }
+  }
+  return errors;
+}
+
+const EVENT_PATTERN_0 = new RegExp('^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$');
+const EVENT_PATTERN_1 = new RegExp('^[a-z0-9]+(\\.[a-z0-9]+)+$');
+const EVENT_ENUM_2 = new Set(['n8n', 'backend', 'frontend', 'infra', 'github', 'external']);
+const EVENT_ENUM_3 = new Set(['dev', 'staging', 'prod']);
+const EVENT_FIELDS_4 = new Set(['id', 'type', 'source', 'env', 'timestamp', 'correlation_id', 'payload', 'meta']);
+
+/**
+ * Validates a payload against shared/schemas/event.schema.json
+ * @param {Object} payload - The payload to validate (a non-array object)
+ * @returns {Array} Error messages (empty if valid)
+ */
+function validateEvent(payload) {
+  const errors = [];
+  const v1 = payload['id'];
+  if (v1 === undefined) {
+    errors.push('Missing required field: id');
+  }
+  const v2 = payload['type'];
+  if (v2 === undefined) {
+    errors.push('Missing required field: type');
+  }
+  const v3 = payload['source'];
+  if (v3 === undefined) {
+    errors.push('Missing required field: source');
+  }
+  const v4 = payload['env'];
+  if (v4 === undefined) {
+    errors.push('Missing required field: env');
+  }
+  const v5 = payload['timestamp'];
+  if (v5 === undefined) {
+    errors.push('Missing required field: timestamp');
+  }
+  const v6 = payload['payload'];
+  if (v6 === undefined) {
+    errors.push('Missing required field: payload');
+  }
+  if (v1 !== undefined) {
+    if (!(typeof v1 === 'string')) {
+      errors.push('id: expected type string, got ' + valueType(v1));
+    } else {
+      if (!EVENT_PATTERN_0.test(v1)) {
+        errors.push('id: string does not match required pattern');
+      }
+    }
+  }
+  if (v2 !== undefined) {
+    if (!(typeof v2 === 'string')) {
+      errors.push('type: expected type string, got ' + valueType(v2));
+    } else {
+      if (!EVENT_PATTERN_1.test(v2)) {
+        errors.push('type: string does not match required pattern');
+      }
+    }
+  }
+  if (v3 !== undefined) {
+    if (!(typeof v3 === 'string')) {
+      errors.push('source: expected type string, got ' + valueType(v3));
+    } else {
+      if (!EVENT_ENUM_2.has(v3)) {
+        errors.push('source: value must be one of: n8n, backend, frontend, infra, github, external');
+      }
+    }
+  }
+  if (v4 !== undefined) {
+    if (!(typeof v4 === 'string')) {
+      errors.push('env: expected type string, got ' + valueType(v4));
+    } else {
+      if (!EVENT_ENUM_3.has(v4)) {
+        errors.push('env: value must be one of: dev, staging, prod');
+      }
+    }
+  }
+  if (v5 !== undefined) {
+    if (!(typeof v5 === 'string')) {
+      errors.push('timestamp: expected type string, got ' + valueType(v5));
+    } else {
+      if (!isValidDateTime(v5)) {
+        errors.push('timestamp: invalid date-time format (expected ISO 8601)');
+      }
+    }
+  }
+  const v7 = payload['correlation_id'];
+  if (v7 !== undefined) {
+    if (!(typeof v7 === 'string' || v7 === null)) {
+      errors.push('correlation_id: expected type string or null, got ' + valueType(v7));
+    }
+  }
+  if (v6 !== undefined) {
+    if (!(typeof v6 === 'object' && v6 !== null && !Array.isArray(v6))) {
+      errors.push('payload: expected type object, got ' + valueType(v6));
+    }
+  }
+  const v8 = payload['meta'];
+  if (v8 !== undefined) {
+    if (!(typeof v8 === 'object' && v8 !== null && !Array.isArray(v8))) {
+      errors.push('meta: expected type object, got ' + valueType(v8));
+    } else {
+      const v9 = v8['raw'];
+      if (v9 !== undefined) {
+        if (!(typeof v9 === 'object' && v9 !== null && !Array.isArray(v9))) {
+          errors.push('meta.raw: expected type object, got ' + valueType(v9));
+        }
+      }
+      const v10 = v8['tags'];
+      if (v10 !== undefined) {
+        if (!(Array.isArray(v10))) {
+          errors.push('meta.tags: expected type array, got ' + valueType(v10));
+        } else {
+          for (let i11 = 0; i11 < v10.length; i11++) {
+            const v12 = v10[i11];
+            if (!(typeof v12 === 'string')) {
+              errors.push('meta.tags[' + i11 + ']: expected type string, got ' + valueType(v12));
+            }
+          }
+        }
+      }
+      const v13 = v8['version'];
+      if (v13 !== undefined) {
+        if (!(typeof v13 === 'string')) {
+          errors.push('meta.version: expected type string, got ' + valueType(v13));
+        }
+      }
+    }
+  }
+  for (const k14 in payload) {
+    if (!EVENT_FIELDS_4.has(k14)) {
+      errors.push('Unexpected field: ' + k14);
+    }
+  }
+  return errors;
+}
+
+const INCIDENT_PATTERN_0 = new RegExp('^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$');
+const INCIDENT_ENUM_1 = new Set(['n8n', 'backend', 'frontend', 'infra', 'external']);
+const INCIDENT_ENUM_2 = new Set(['low', 'medium', 'high', 'critical']);
+const INCIDENT_ENUM_3 = new Set(['open', 'investigating', 'mitigated', 'resolved', 'closed']);
+const INCIDENT_FIELDS_4 = new Set(['id', 'name', 'run_id']);
+const INCIDENT_FIELDS_5 = new Set(['message', 'code', 'stack', 'type']);
+const INCIDENT_ENUM_6 = new Set(['dev', 'staging', 'prod']);
+const INCIDENT_FIELDS_7 = new Set(['id', 'source', 'severity', 'status', 'event_type', 'workflow', 'error', 'context', 'created_at', 'updated_at', 'resolved_at', 'metadata']);
+
+/**
+ * Validates a payload against shared/schemas/incident.schema.json
+ * @param {Object} payload - The payload to validate (a non-array object)
+ * @returns {Array} Error messages (empty if valid)
+ */
+function validateIncident(payload) {
+  const errors = [];
+  const v1 = payload['id'];
+  if (v1 === undefined) {
+    errors.push('Missing required field: id');
+  }
+  const v2 = payload['source'];
+  if (v2 === undefined) {
+    errors.push('Missing required field: source');
+  }
+  const v3 = payload['severity'];
+  if (v3 === undefined) {
+    errors.push('Missing required field: severity');
+  }
+  const v4 = payload['status'];
+  if (v4 === undefined) {
+    errors.push('Missing required field: status');
+  }
+  const v5 = payload['event_type'];
+  if (v5 === undefined) {
+    errors.push('Missing required field: event_type');
+  }
+  const v6 = payload['error'];
+  if (v6 === undefined) {
+    errors.push('Missing required field: error');
+  }
+  const v7 = payload['context'];
+  if (v7 === undefined) {
+    errors.push('Missing required field: context');
+  }
+  const v8 = payload['created_at'];
+  if (v8 === undefined) {
+    errors.push('Missing required field: created_at');
+  }
+  if (v1 !== undefined) {
+    if (!(typeof v1 === 'string')) {
+      errors.push('id: expected type string, got ' + valueType(v1));
+    } else {
+      if (!INCIDENT_PATTERN_0.test(v1)) {
+        errors.push('id: string does not match required pattern');
+      }
+    }
+  }
+  if (v2 !== undefined) {
+    if (!(typeof v2 === 'string')) {
+      errors.push('source: expected type string, got ' + valueType(v2));
+    } else {
+      if (!INCIDENT_ENUM_1.has(v2)) {
+        errors.push('source: value must be one of: n8n, backend, frontend, infra, external');
+      }
+    }
+  }
+  if (v3 !== undefined) {
+    if (!(typeof v3 === 'string')) {
+      errors.push('severity: expected type string, got ' + valueType(v3));
+    } else {
+      if (!INCIDENT_ENUM_2.has(v3)) {
+        errors.push('severity: value must be one of: low, medium, high, critical');
+      }
+    }
+  }
+  if (v4 !== undefined) {
+    if (!(typeof v4 === 'string')) {
+      errors.push('status: expected type string, got ' + valueType(v4));
+    } else {
+      if (!INCIDENT_ENUM_3.has(v4)) {
+        errors.push('status: value must be one of: open, investigating, mitigated, resolved, closed');
+      }
+    }
+  }
+  if (v5 !== undefined) {
+    if (!(typeof v5 === 'string')) {
+      errors.push('event_type: expected type string, got ' + valueType(v5));
+    } else {
+      const n9 = [...v5].length;
+      if (n9 < 1) {
+        errors.push('event_type: string length must be at least 1');
+      }
+      if (n9 > 100) {
+        errors.push('event_type: string length must be at most 100');
+      }
+    }
+  }
+  const v10 = payload['workflow'];
+  if (v10 !== undefined) {
+    if (!(typeof v10 === 'object' && v10 !== null && !Array.isArray(v10) || v10 === null)) {
+      errors.push('workflow: expected type object or null, got ' + valueType(v10));
+    } else {
+      if (v10 !== null) {
+        const v11 = v10['id'];
+        if (v11 !== undefined) {
+          if (!(typeof v11 === 'string' || v11 === null)) {
+            errors.push('workflow.id: expected type string or null, got ' + valueType(v11));
+          }
+        }
+        const v12 = v10['name'];
+        if (v12 !== undefined) {
+          if (!(typeof v12 === 'string' || v12 === null)) {
+            errors.push('workflow.name: expected type string or null, got ' + valueType(v12));
+          }
+        }
+        const v13 = v10['run_id'];
+        if (v13 !== undefined) {
+          if (!(typeof v13 === 'string' || v13 === null)) {
+            errors.push('workflow.run_id: expected type string or null, got ' + valueType(v13));
+          }
+        }
+        for (const k14 in v10) {
+          if (!INCIDENT_FIELDS_4.has(k14)) {
+            errors.push('Unexpected field: workflow.' + k14);
+          }
+        }
+      }
+    }
+  }
+  if (v6 !== undefined) {
+    if (!(typeof v6 === 'object' && v6 !== null && !Array.isArray(v6))) {
+      errors.push('error: expected type object, got ' + valueType(v6));
+    } else {
+      const v15 = v6['message'];
+      if (v15 === undefined) {
+        errors.push('Missing required field: error.message');
+      }
+      if (v15 !== undefined) {
+        if (!(typeof v15 === 'string')) {
+          errors.push('error.message: expected type string, got ' + valueType(v15));
+        } else {
+          const n16 = [...v15].length;
+          if (n16 < 1) {
+            errors.push('error.message: string length must be at least 1');
+          }
+        }
+      }
+      const v17 = v6['code'];
+      if (v17 !== undefined) {
+        if (!(typeof v17 === 'string' || v17 === null)) {
+          errors.push('error.code: expected type string or null, got ' + valueType(v17));
+        }
+      }
+      const v18 = v6['stack'];
+      if (v18 !== undefined) {
+        if (!(typeof v18 === 'string' || v18 === null)) {
+          errors.push('error.stack: expected type string or null, got ' + valueType(v18));
+        }
+      }
+      const v19 = v6['type'];
+      if (v19 !== undefined) {
+        if (!(typeof v19 === 'string' || v19 === null)) {
+          errors.push('error.type: expected type string or null, got ' + valueType(v19));
+        }
+      }
+      for (const k20 in v6) {
+        if (!INCIDENT_FIELDS_5.has(k20)) {
+          errors.push('Unexpected field: error.' + k20);
+        }
+      }
+    }
+  }
+  if (v7 !== undefined) {
+    if (!(typeof v7 === 'object' && v7 !== null && !Array.isArray(v7))) {
+      errors.push('context: expected type object, got ' + valueType(v7));
+    } else {
+      const v21 = v7['env'];
+      if (v21 === undefined) {
+        errors.push('Missing required field: context.env');
+      }
+      const v22 = v7['service'];
+      if (v22 !== undefined) {
+        if (!(typeof v22 === 'string' || v22 === null)) {
+          errors.push('context.service: expected type string or null, got ' + valueType(v22));
+        }
+      }
+      if (v21 !== undefined) {
+        if (!(typeof v21 === 'string')) {
+          errors.push('context.env: expected type string, got ' + valueType(v21));
+        } else {
+          if (!INCIDENT_ENUM_6.has(v21)) {
+            errors.push('context.env: value must be one of: dev, staging, prod');
+          }
+        }
+      }
+      const v23 = v7['correlation_id'];
+      if (v23 !== undefined) {
+        if (!(typeof v23 === 'string' || v23 === null)) {
+          errors.push('context.correlation_id: expected type string or null, got ' + valueType(v23));
+        }
+      }
+      const v24 = v7['payload'];
+      if (v24 !== undefined) {
+        if (!(typeof v24 === 'object' && v24 !== null && !Array.isArray(v24) || v24 === null)) {
+          errors.push('context.payload: expected type object or null, got ' + valueType(v24));
+        }
+      }
+      const v25 = v7['user_id'];
+      if (v25 !== undefined) {
+        if (!(typeof v25 === 'string' || v25 === null)) {
+          errors.push('context.user_id: expected type string or null, got ' + valueType(v25));
+        }
+      }
+    }
+  }
+  if (v8 !== undefined) {
+    if (!(typeof v8 === 'string')) {
+      errors.push('created_at: expected type string, got ' + valueType(v8));
+    } else {
+      if (!isValidDateTime(v8)) {
+        errors.push('created_at: invalid date-time format (expected ISO 8601)');
+      }
+    }
+  }
+  const v26 = payload['updated_at'];
+  if (v26 !== undefined) {
+    if (!(typeof v26 === 'string' || v26 === null)) {
+      errors.push('updated_at: expected type string or null, got ' + valueType(v26));
+    } else {
+      if (v26 !== null) {
+        if (!isValidDateTime(v26)) {
+          errors.push('updated_at: invalid date-time format (expected ISO 8601)');
+        }
+      }
+    }
+  }
+  const v27 = payload['resolved_at'];
+  if (v27 !== undefined) {
+    if (!(typeof v27 === 'string' || v27 === null)) {
+      errors.push('resolved_at: expected type string or null, got ' + valueType(v27));
+    } else {
+      if (v27 !== null) {
+        if (!isValidDateTime(v27)) {
+          errors.push('resolved_at: invalid date-time format (expected ISO 8601)');
+        }
+      }
+    }
+  }
+  const v28 = payload['metadata'];
+  if (v28 !== undefined) {
+    if (!(typeof v28 === 'object' && v28 !== null && !Array.isArray(v28))) {
+      errors.push('metadata: expected type object, got ' + valueType(v28));
+    } else {
+      const v29 = v28['retry_count'];
+      if (v29 !== undefined) {
+        if (!(typeof v29 === 'number' || v29 === null)) {
+          errors.push('metadata.retry_count: expected type number or null, got ' + valueType(v29));
+        } else {
+          if (v29 !== null) {
+            if (v29 < 0) {
+              errors.push('metadata.retry_count: value must be at least 0');
+            }
+          }
+        }
+      }
+      const v30 = v28['notified'];
+      if (v30 !== undefined) {
+        if (!(typeof v30 === 'boolean' || v30 === null)) {
+          errors.push('metadata.notified: expected type boolean or null, got ' + valueType(v30));
+        }
+      }
+      const v31 = v28['runbook_url'];
+      if (v31 !== undefined) {
+        if (!(typeof v31 === 'string' || v31 === null)) {
+          errors.push('metadata.runbook_url: expected type string or null, got ' + valueType(v31));
+        }
+      }
+    }
+  }
+  for (const k32 in payload) {
+    if (!INCIDENT_FIELDS_7.has(k32)) {
+      errors.push('Unexpected field: ' + k32);
+    }
+  }
+  return errors;
+}
+
+const INFRA_DEPLOY_PATTERN_0 = new RegExp('^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$');
+const INFRA_DEPLOY_ENUM_1 = new Set(['terraform', 'kubernetes', 'docker', 'cloudformation', 'other']);
+const INFRA_DEPLOY_ENUM_2 = new Set(['dev', 'staging', 'prod']);
+const INFRA_DEPLOY_ENUM_3 = new Set(['pending', 'in_progress', 'success', 'failed', 'rolled_back', 'cancelled']);
+const INFRA_DEPLOY_ENUM_4 = new Set(['github_action', 'manual', 'scheduled', 'webhook']);
+const INFRA_DEPLOY_FIELDS_5 = new Set(['type', 'source', 'user', 'commit_sha', 'branch']);
+const INFRA_DEPLOY_FIELDS_6 = new Set(['message', 'code', 'details']);
+const INFRA_DEPLOY_ENUM_7 = new Set(['pending', 'passed', 'failed', null]);
+const INFRA_DEPLOY_ENUM_8 = new Set(['passed', 'failed', 'skipped']);
+const INFRA_DEPLOY_FIELDS_9 = new Set(['id', 'deployment_type', 'environment', 'status', 'triggered_by', 'target', 'created_at', 'started_at', 'completed_at', 'duration_seconds', 'output', 'error', 'post_deploy_checks', 'metadata']);
+
+/**
+ * Validates a payload against shared/schemas/infra_deploy.schema.json
+ * @param {Object} payload - The payload to validate (a non-array object)
+ * @returns {Array} Error messages (empty if valid)
+ */
+function validateInfraDeploy(payload) {
+  const errors = [];
+  const v1 = payload['id'];
+  if (v1 === undefined) {
+    errors.push('Missing required field: id');
+  }
+  const v2 = payload['deployment_type'];
+  if (v2 === undefined) {
+    errors.push('Missing required field: deployment_type');
+  }
+  const v3 = payload['environment'];
+  if (v3 === undefined) {
+    errors.push('Missing required field: environment');
+  }
+  const v4 = payload['status'];
+  if (v4 === undefined) {
+    errors.push('Missing required field: status');
+  }
+  const v5 = payload['triggered_by'];
+  if (v5 === undefined) {
+    errors.push('Missing required field: triggered_by');
+  }
+  const v6 = payload['created_at'];
+  if (v6 === undefined) {
+    errors.push('Missing required field: created_at');
+  }
+  if (v1 !== undefined) {
+    if (!(typeof v1 === 'string')) {
+      errors.push('id: expected type string, got ' + valueType(v1));
+    } else {
+      if (!INFRA_DEPLOY_PATTERN_0.test(v1)) {
+        errors.push('id: string does not match required pattern');
+      }
+    }
+  }
+  if (v2 !== undefined) {
+    if (!(typeof v2 === 'string')) {
+      errors.push('deployment_type: expected type string, got ' + valueType(v2));
+    } else {
+      if (!INFRA_DEPLOY_ENUM_1.has(v2)) {
+        errors.push('deployment_type: value must be one of: terraform, kubernetes, docker, cloudformation, other');
+      }
+    }
+  }
+  if (v3 !== undefined) {
+    if (!(typeof v3 === 'string')) {
+      errors.push('environment: expected type string, got ' + valueType(v3));
+    } else {
+      if (!INFRA_DEPLOY_ENUM_2.has(v3)) {
+        errors.push('environment: value must be one of: dev, staging, prod');
+      }
+    }
+  }
+  if (v4 !== undefined) {
+    if (!(typeof v4 === 'string')) {
+      errors.push('status: expected type string, got ' + valueType(v4));
+    } else {
+      if (!INFRA_DEPLOY_ENUM_3.has(v4)) {
+        errors.push('status: value must be one of: pending, in_progress, success, failed, rolled_back, cancelled');
+      }
+    }
+  }
+  if (v5 !== undefined) {
+    if (!(typeof v5 === 'object' && v5 !== null && !Array.isArray(v5))) {
+      errors.push('triggered_by: expected type object, got ' + valueType(v5));
+    } else {
+      const v7 = v5['type'];
+      if (v7 === undefined) {
+        errors.push('Missing required field: triggered_by.type');
+      }
+      const v8 = v5['source'];
+      if (v8 === undefined) {
+        errors.push('Missing required field: triggered_by.source');
+      }
+      if (v7 !== undefined) {
+        if (!(typeof v7 === 'string')) {
+          errors.push('triggered_by.type: expected type string, got ' + valueType(v7));
+        } else {
+          if (!INFRA_DEPLOY_ENUM_4.has(v7)) {
+            errors.push('triggered_by.type: value must be one of: github_action, manual, scheduled, webhook');
+          }
+        }
+      }
+      if (v8 !== undefined) {
+        if (!(typeof v8 === 'string')) {
+          errors.push('triggered_by.source: expected type string, got ' + valueType(v8));
+        }
+      }
+      const v9 = v5['user'];
+      if (v9 !== undefined) {
+        if (!(typeof v9 === 'string' || v9 === null)) {
+          errors.push('triggered_by.user: expected type string or null, got ' + valueType(v9));
+        }
+      }
+      const v10 = v5['commit_sha'];
+      if (v10 !== undefined) {
+        if (!(typeof v10 === 'string' || v10 === null)) {
+          errors.push('triggered_by.commit_sha: expected type string or null, got ' + valueType(v10));
+        }
+      }
+      const v11 = v5['branch'];
+      if (v11 !== undefined) {
+        if (!(typeof v11 === 'string' || v11 === null)) {
+          errors.push('triggered_by.branch: expected type string or null, got ' + valueType(v11));
+        }
+      }
+      for (const k12 in v5) {
+        if (!INFRA_DEPLOY_FIELDS_5.has(k12)) {
+          errors.push('Unexpected field: triggered_by.' + k12);
+        }
+      }
+    }
+  }
+  const v13 = payload['target'];
+  if (v13 !== undefined) {
+    if (!(typeof v13 === 'object' && v13 !== null && !Array.isArray(v13))) {
+      errors.push('target: expected type object, got ' + valueType(v13));
+    } else {
+      const v14 = v13['resource_type'];
+      if (v14 !== undefined) {
+        if (!(typeof v14 === 'string' || v14 === null)) {
+          errors.push('target.resource_type: expected type string or null, got ' + valueType(v14));
+        }
+      }
+      const v15 = v13['resource_name'];
+      if (v15 !== undefined) {
+        if (!(typeof v15 === 'string' || v15 === null)) {
+          errors.push('target.resource_name: expected type string or null, got ' + valueType(v15));
+        }
+      }
+      const v16 = v13['region'];
+      if (v16 !== undefined) {
+        if (!(typeof v16 === 'string' || v16 === null)) {
+          errors.push('target.region: expected type string or null, got ' + valueType(v16));
+        }
+      }
+      const v17 = v13['terraform_workspace'];
+      if (v17 !== undefined) {
+        if (!(typeof v17 === 'string' || v17 === null)) {
+          errors.push('target.terraform_workspace: expected type string or null, got ' + valueType(v17));
+        }
+      }
+    }
+  }
+  if (v6 !== undefined) {
+    if (!(typeof v6 === 'string')) {
+      errors.push('created_at: expected type string, got ' + valueType(v6));
+    } else {
+      if (!isValidDateTime(v6)) {
+        errors.push('created_at: invalid date-time format (expected ISO 8601)');
+      }
+    }
+  }
+  const v18 = payload['started_at'];
+  if (v18 !== undefined) {
+    if (!(typeof v18 === 'string' || v18 === null)) {
+      errors.push('started_at: expected type string or null, got ' + valueType(v18));
+    } else {
+      if (v18 !== null) {
+        if (!isValidDateTime(v18)) {
+          errors.push('started_at: invalid date-time format (expected ISO 8601)');
+        }
+      }
+    }
+  }
+  const v19 = payload['completed_at'];
+  if (v19 !== undefined) {
+    if (!(typeof v19 === 'string' || v19 === null)) {
+      errors.push('completed_at: expected type string or null, got ' + valueType(v19));
+    } else {
+      if (v19 !== null) {
+        if (!isValidDateTime(v19)) {
+          errors.push('completed_at: invalid date-time format (expected ISO 8601)');
+        }
+      }
+    }
+  }
+  const v20 = payload['duration_seconds'];
+  if (v20 !== undefined) {
+    if (!(typeof v20 === 'number' || v20 === null)) {
+      errors.push('duration_seconds: expected type number or null, got ' + valueType(v20));
+    } else {
+      if (v20 !== null) {
+        if (v20 < 0) {
+          errors.push('duration_seconds: value must be at least 0');
+        }
+      }
+    }
+  }
+  const v21 = payload['output'];
+  if (v21 !== undefined) {
+    if (!(typeof v21 === 'object' && v21 !== null && !Array.isArray(v21) || v21 === null)) {
+      errors.push('output: expected type object or null, got ' + valueType(v21));
+    } else {
+      if (v21 !== null) {
+        const v22 = v21['terraform_output'];
+        if (v22 !== undefined) {
+          if (!(typeof v22 === 'object' && v22 !== null && !Array.isArray(v22) || v22 === null)) {
+            errors.push('output.terraform_output: expected type object or null, got ' + valueType(v22));
+          }
+        }
+        const v23 = v21['resources_created'];
+        if (v23 !== undefined) {
+          if (!(Array.isArray(v23) || v23 === null)) {
+            errors.push('output.resources_created: expected type array or null, got ' + valueType(v23));
+          } else {
+            if (v23 !== null) {
+              for (let i24 = 0; i24 < v23.length; i24++) {
+                const v25 = v23[i24];
+                if (!(typeof v25 === 'string')) {
+                  errors.push('output.resources_created[' + i24 + ']: expected type string, got ' + valueType(v25));
+                }
+              }
+            }
+          }
+        }
+        const v26 = v21['resources_updated'];
+        if (v26 !== undefined) {
+          if (!(Array.isArray(v26) || v26 === null)) {
+            errors.push('output.resources_updated: expected type array or null, got ' + valueType(v26));
+          } else {
+            if (v26 !== null) {
+              for (let i27 = 0; i27 < v26.length; i27++) {
+                const v28 = v26[i27];
+                if (!(typeof v28 === 'string')) {
+                  errors.push('output.resources_updated[' + i27 + ']: expected type string, got ' + valueType(v28));
+                }
+              }
+            }
+          }
+        }
+        const v29 = v21['resources_destroyed'];
+        if (v29 !== undefined) {
+          if (!(Array.isArray(v29) || v29 === null)) {
+            errors.push('output.resources_destroyed: expected type array or null, got ' + valueType(v29));
+          } else {
+            if (v29 !== null) {
+              for (let i30 = 0; i30 < v29.length; i30++) {
+                const v31 = v29[i30];
+                if (!(typeof v31 === 'string')) {
+                  errors.push('output.resources_destroyed[' + i30 + ']: expected type string, got ' + valueType(v31));
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+  const v32 = payload['error'];
+  if (v32 !== undefined) {
+    if (!(typeof v32 === 'object' && v32 !== null && !Array.isArray(v32) || v32 === null)) {
+      errors.push('error: expected type object or null, got ' + valueType(v32));
+    } else {
+      if (v32 !== null) {
+        const v33 = v32['message'];
+        if (v33 !== undefined) {
+          if (!(typeof v33 === 'string')) {
+            errors.push('error.message: expected type string, got ' + valueType(v33));
+          }
+        }
+        const v34 = v32['code'];
+        if (v34 !== undefined) {
+          if (!(typeof v34 === 'string' || v34 === null)) {
+            errors.push('error.code: expected type string or null, got ' + valueType(v34));
+          }
+        }
+        const v35 = v32['details'];
+        if (v35 !== undefined) {
+          if (!(typeof v35 === 'object' && v35 !== null && !Array.isArray(v35) || v35 === null)) {
+            errors.push('error.details: expected type object or null, got ' + valueType(v35));
+          }
+        }
+        for (const k36 in v32) {
+          if (!INFRA_DEPLOY_FIELDS_6.has(k36)) {
+            errors.push('Unexpected field: error.' + k36);
+          }
+        }
+      }
+    }
+  }
+  const v37 = payload['post_deploy_checks'];
+  if (v37 !== undefined) {
+    if (!(typeof v37 === 'object' && v37 !== null && !Array.isArray(v37) || v37 === null)) {
+      errors.push('post_deploy_checks: expected type object or null, got ' + valueType(v37));
+    } else {
+      if (v37 !== null) {
+        const v38 = v37['status'];
+        if (v38 !== undefined) {
+          if (!(typeof v38 === 'string' || v38 === null)) {
+            errors.push('post_deploy_checks.status: expected type string or null, got ' + valueType(v38));
+          } else {
+            if (!INFRA_DEPLOY_ENUM_7.has(v38)) {
+              errors.push('post_deploy_checks.status: value must be one of: pending, passed, failed, ');
+            }
+          }
+        }
+        const v39 = v37['checks'];
+        if (v39 !== undefined) {
+          if (!(Array.isArray(v39) || v39 === null)) {
+            errors.push('post_deploy_checks.checks: expected type array or null, got ' + valueType(v39));
+          } else {
+            if (v39 !== null) {
+              for (let i40 = 0; i40 < v39.length; i40++) {
+                const v41 = v39[i40];
+                if (!(typeof v41 === 'object' && v41 !== null && !Array.isArray(v41))) {
+                  errors.push('post_deploy_checks.checks[' + i40 + ']: expected type object, got ' + valueType(v41));
+                } else {
+                  const v42 = v41['name'];
+                  if (v42 === undefined) {
+                    errors.push('Missing required field: post_deploy_checks.checks[' + i40 + '].name');
+                  }
+                  const v43 = v41['status'];
+                  if (v43 === undefined) {
+                    errors.push('Missing required field: post_deploy_checks.checks[' + i40 + '].status');
+                  }
+                  if (v42 !== undefined) {
+                    if (!(typeof v42 === 'string')) {
+                      errors.push('post_deploy_checks.checks[' + i40 + '].name: expected type string, got ' + valueType(v42));
+                    }
+                  }
+                  if (v43 !== undefined) {
+                    if (!(typeof v43 === 'string')) {
+                      errors.push('post_deploy_checks.checks[' + i40 + '].status: expected type string, got ' + valueType(v43));
+                    } else {
+                      if (!INFRA_DEPLOY_ENUM_8.has(v43)) {
+                        errors.push('post_deploy_checks.checks[' + i40 + '].status: value must be one of: passed, failed, skipped');
+                      }
+                    }
+                  }
+                  const v44 = v41['message'];
+                  if (v44 !== undefined) {
+                    if (!(typeof v44 === 'string' || v44 === null)) {
+                      errors.push('post_deploy_checks.checks[' + i40 + '].message: expected type string or null, got ' + valueType(v44));
+                    }
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+  const v45 = payload['metadata'];
+  if (v45 !== undefined) {
+    if (!(typeof v45 === 'object' && v45 !== null && !Array.isArray(v45))) {
+      errors.push('metadata: expected type object, got ' + valueType(v45));
+    } else {
+      const v46 = v45['approval_required'];
+      if (v46 !== undefined) {
+        if (!(typeof v46 === 'boolean' || v46 === null)) {
+          errors.push('metadata.approval_required: expected type boolean or null, got ' + valueType(v46));
+        }
+      }
+      const v47 = v45['approved_by'];
+      if (v47 !== undefined) {
+        if (!(typeof v47 === 'string' || v47 === null)) {
+          errors.push('metadata.approved_by: expected type string or null, got ' + valueType(v47));
+        }
+      }
+      const v48 = v45['notified_channels'];
+      if (v48 !== undefined) {
+        if (!(Array.isArray(v48) || v48 === null)) {
+          errors.push('metadata.notified_channels: expected type array or null, got ' + valueType(v48));
+        } else {
+          if (v48 !== null) {
+            for (let i49 = 0; i49 < v48.length; i49++) {
+              const v50 = v48[i49];
+              if (!(typeof v50 === 'string')) {
+                errors.push('metadata.notified_channels[' + i49 + ']: expected type string, got ' + valueType(v50));
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+  for (const k51 in payload) {
+    if (!INFRA_DEPLOY_FIELDS_9.has(k51)) {
+      errors.push('Unexpected field: ' + k51);
+    }
+  }
+  return errors;
+}
+
+const compiledValidators = {
+  'contact': validateContact,
+  'event': validateEvent,
+  'incident': validateIncident,
+  'infra_deploy': validateInfraDeploy,
+};
+
+/**
+ * Validates a payload against a schema in shared/schemas
+ * @param {Object} payload - The payload to validate
+ * @param {string} schemaType - Type of schema ('contact', 'event', 'incident', 'infra_deploy')
+ * @returns {Object} Validation result with 'valid' boolean and 'errors' array
+ */
+function validatePayloadCompiled(payload, schemaType) {
+  if (!payload || typeof payload !== 'object' || Array.isArray(payload)) {
+    return { valid: false, errors: ['Payload must be an object'] };
+  }
+  if (!schemaType || typeof schemaType !== 'string') {
+    return { valid: false, errors: ['Schema type must be a string'] };
+  }
+  const validator = Object.prototype.hasOwnProperty.call(compiledValidators, schemaType)
+    ? compiledValidators[schemaType]
+    : null;
+  if (!validator) {
+    return { valid: false, errors: [`Unknown schema type: ${schemaType}`] };
+  }
+  const errors = validator(payload);
+  return { valid: errors.length === 0, errors };
+}
+
+// Export for use in n8n Code nodes
+module.exports = {
+  validatePayloadCompiled,
+  compiledValidators,
+  validateContact,
+  validateEvent,
+  validateIncident,
+  validateInfraDeploy,
+};
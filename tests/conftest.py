@@ -2,11 +2,16 @@
 Pytest configuration and shared fixtures for Automation Hub tests.
 """
 import json
+import sys
 import yaml
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 import pytest
 
+from tests.n8n_stub import N8nStub
+from tests.node_pool import NodeWorkerPool
+from tests.repo_index import RepoIndex
+
 # Base paths
 REPO_ROOT = Path(__file__).parent.parent
 SCHEMAS_DIR = REPO_ROOT / "shared" / "schemas"
@@ -14,6 +19,11 @@ JS_SNIPPETS_DIR = REPO_ROOT / "shared" / "js_snippets"
 CONFIG_DIR = REPO_ROOT / "shared" / "config"
 WORKFLOWS_DIR = REPO_ROOT / "workflows"
 RULES_DIR = REPO_ROOT / ".cursor" / "rules"
+OPS_SCRIPTS_DIR = REPO_ROOT / "ops" / "scripts"
+
+# Make ops/scripts modules importable from tests
+if str(OPS_SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(OPS_SCRIPTS_DIR))
 
 
 @pytest.fixture
@@ -34,6 +44,29 @@ def js_snippets_dir():
     return JS_SNIPPETS_DIR
 
 
+@pytest.fixture(scope="session")
+def node_pool():
+    """Node worker pool with every shared/js_snippets function loaded, started once per session."""
+    if not NodeWorkerPool.available():
+        pytest.skip("node is not installed")
+    pool = NodeWorkerPool()
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def repo_index():
+    """Parsed workflows, schemas and configs, each parsed once per session (per xdist worker)."""
+    return RepoIndex(REPO_ROOT)
+
+
+@pytest.fixture
+def n8n_stub():
+    """Local stub of the n8n public API, serving an empty instance."""
+    with N8nStub() as stub:
+        yield stub
+
+
 @pytest.fixture
 def config_dir():
     """Return config directory path."""
@@ -0,0 +1,187 @@
+"""
+In-process stub of the n8n public REST API for tests.
+
+Serves /api/v1/workflows (list, get, create, update, delete) with X-N8N-API-KEY authentication
+and cursor pagination from an in-memory store, over HTTP/1.1 keep-alive.
+Tests inject failures with fail_next(), slow responses with delay_next(),
+and inspect what the server saw:
+every request in `requests`, and `connections` accepted.
+
+    with N8nStub(api_key="key") as stub:
+        stub.fail_next(2, status=503)
+        ... N8nClient(stub.base_url, "key") ...
+        assert stub.requests.count(("POST", "/api/v1/workflows")) == 3
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+API_PREFIX = "/api/v1"
+# Fields n8n rejects as additional properties on create/update
+ACCEPTED_FIELDS = {"name", "nodes", "connections", "settings", "staticData"}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: "_Server"
+
+    def setup(self):
+        super().setup()
+        with self.server.stub.lock:
+            self.server.stub.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, payload: Any = None, headers: Optional[Dict[str, str]] = None):
+        data = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _handle(self, method: str):
+        stub = self.server.stub
+        parts = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length)) if length else None
+        with stub.lock:
+            stub.requests.append((method, parts.path))
+            failure = next((f for f in stub._failures
+                            if f[0] in (None, method) and f[1] in (None, parts.path)), None)
+            if failure is not None:
+                stub._failures.remove(failure)
+        if failure is not None:
+            _, _, status, headers = failure
+            if status is None:
+                # Drop the connection without answering
+                self.close_connection = True
+                self.request.close()
+                return
+            self._send(status, {"message": "injected failure"}, headers)
+            return
+        if self.headers.get("X-N8N-API-KEY") != stub.api_key:
+            self._send(401, {"message": "unauthorized"})
+            return
+        status, payload = stub.route(method, parts.path, parse_qs(parts.query), body)
+        with stub.lock:
+            delay = next((d for d in stub._delays if d[0] in (None, method) and d[1] in (None, parts.path)), None)
+            if delay is not None:
+                stub._delays.remove(delay)
+        if delay is not None:
+            # The request has been handled; only the response is late
+            time.sleep(delay[2])
+        self._send(status, payload)
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PUT(self):
+        self._handle("PUT")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    stub: "N8nStub"
+
+
+class N8nStub:
+    """A local n8n API stub listening on 127.0.0.1, run in a background thread."""
+
+    def __init__(self, api_key: str = "test-api-key", workflows: Optional[List[Dict[str, Any]]] = None):
+        self.api_key = api_key
+        self.lock = threading.Lock()
+        self.workflows: Dict[str, Dict[str, Any]] = {}
+        self.requests: List[Tuple[str, str]] = []
+        self.connections = 0
+        self._failures: List[Tuple[Optional[str], Optional[str], Optional[int], Dict[str, str]]] = []
+        self._delays: List[Tuple[Optional[str], Optional[str], float]] = []
+        self._next_id = 1
+        for workflow in workflows or []:
+            self.add_workflow(workflow)
+        self._server = _Server(("127.0.0.1", 0), _Handler)
+        self._server.stub = self
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def __enter__(self) -> "N8nStub":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def add_workflow(self, workflow: Dict[str, Any]) -> Dict[str, Any]:
+        """Store a workflow as if it had been created through the API."""
+        with self.lock:
+            stored = {**workflow, "id": str(workflow.get("id") or self._next_id)}
+            self._next_id += 1
+            self.workflows[stored["id"]] = stored
+            return stored
+
+    def fail_next(self, count: int = 1, status: Optional[int] = 503, headers: Optional[Dict[str, str]] = None,
+                  method: Optional[str] = None, path: Optional[str] = None):
+        """
+        Answer the next `count` requests (only those of `method` and to `path`,
+        if given) with `status`; a status of None drops the connection instead.
+        """
+        with self.lock:
+            self._failures.extend([(method, path, status, headers or {})] * count)
+
+    def delay_next(self, seconds: float, count: int = 1, method: Optional[str] = None, path: Optional[str] = None):
+        """Handle the next `count` matching requests normally but hold their responses for `seconds`."""
+        with self.lock:
+            self._delays.extend([(method, path, seconds)] * count)
+
+    def route(self, method: str, path: str, query: Dict[str, List[str]], body: Any) -> Tuple[int, Any]:
+        if not path.startswith(API_PREFIX + "/workflows"):
+            return 404, {"message": "not found"}
+        workflow_id = path[len(API_PREFIX + "/workflows/"):] or None
+
+        if method == "GET" and workflow_id is None:
+            limit = int(query.get("limit", ["100"])[0])
+            start = int(query.get("cursor", ["0"])[0])
+            with self.lock:
+                ordered = sorted(self.workflows.values(), key=lambda workflow: int(workflow["id"]))
+            page = ordered[start:start + limit]
+            next_cursor = str(start + limit) if start + limit < len(ordered) else None
+            return 200, {"data": page, "nextCursor": next_cursor}
+        if method == "GET":
+            workflow = self.workflows.get(workflow_id)
+            return (200, workflow) if workflow else (404, {"message": "not found"})
+
+        if method in ("POST", "PUT"):
+            if not isinstance(body, dict) or "name" not in body:
+                return 400, {"message": "request/body must have required property 'name'"}
+            extra = set(body) - ACCEPTED_FIELDS
+            if extra:
+                return 400, {"message": f"request/body must NOT have additional properties: {sorted(extra)}"}
+            if method == "POST" and workflow_id is None:
+                return 200, self.add_workflow(body)
+            if method == "PUT" and workflow_id in self.workflows:
+                with self.lock:
+                    self.workflows[workflow_id] = {**body, "id": workflow_id}
+                return 200, self.workflows[workflow_id]
+            return 404, {"message": "not found"}
+
+        if method == "DELETE" and workflow_id in self.workflows:
+            with self.lock:
+                return 200, self.workflows.pop(workflow_id)
+        return 404, {"message": "not found"}
@@ -0,0 +1,118 @@
+"""
+Pool of long-lived Node worker processes running shared/js_snippets functions.
+
+Workers (tests/node_worker.js) are started once and load every snippet
+module; calls are sent in batches over a line-delimited JSON protocol, and
+batches are spread across workers from one thread per worker. Each
+worker's stderr is drained by a daemon thread, so snippets that log a lot
+cannot block on a full pipe; its last lines are attached to worker errors.
+"""
+import json
+import os
+import shutil
+import subprocess
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+REPO_ROOT = Path(__file__).parent.parent
+NODE_WORKER_JS = Path(__file__).parent / "node_worker.js"
+JS_SNIPPETS_DIR = REPO_ROOT / "shared" / "js_snippets"
+
+DEFAULT_BATCH_SIZE = 500
+# Lines of worker stderr kept for error messages
+STDERR_TAIL_LINES = 50
+
+
+class NodeCallError(RuntimeError):
+    """Raised when a snippet function throws, carrying the JavaScript error message."""
+
+
+class NodeWorker:
+    """One node process answering requests one at a time."""
+
+    def __init__(self, snippets_dir: Path = JS_SNIPPETS_DIR):
+        self.process = subprocess.Popen(
+            ["node", str(NODE_WORKER_JS), str(snippets_dir)],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            text=True, encoding="utf-8", bufsize=1,
+            env={**os.environ, "TZ": "UTC"}
+        )
+        self.stderr_tail: deque = deque(maxlen=STDERR_TAIL_LINES)
+        self._stderr_thread = threading.Thread(target=self._drain_stderr, daemon=True)
+        self._stderr_thread.start()
+        self.lock = threading.Lock()
+        self.next_id = 0
+        self.functions = self._read()["functions"]
+
+    def _drain_stderr(self):
+        for line in self.process.stderr:
+            self.stderr_tail.append(line.rstrip("\n"))
+
+    def _with_stderr(self, message: str) -> str:
+        tail = "\n".join(self.stderr_tail)
+        return f"{message}\n--- node stderr (last lines) ---\n{tail}" if tail else message
+
+    def _read(self) -> Dict[str, Any]:
+        line = self.process.stdout.readline()
+        if not line:
+            # Let the drain thread collect what the process wrote before exiting
+            self._stderr_thread.join(timeout=5)
+            raise RuntimeError(self._with_stderr("Node worker exited"))
+        return json.loads(line)
+
+    def request(self, function: str, calls: Sequence[Sequence[Any]]) -> List[Dict[str, Any]]:
+        """Run function once per argument list; results are {"value": ...} or {"error": ...}."""
+        with self.lock:
+            self.next_id += 1
+            self.process.stdin.write(json.dumps({"id": self.next_id, "function": function, "calls": calls}) + "\n")
+            self.process.stdin.flush()
+            response = self._read()
+        if "error" in response:
+            raise RuntimeError(self._with_stderr(response["error"]))
+        return response["results"]
+
+    def close(self):
+        self.process.stdin.close()
+        self.process.wait(timeout=10)
+        self._stderr_thread.join(timeout=5)
+        self.process.stdout.close()
+        self.process.stderr.close()
+
+
+class NodeWorkerPool:
+    """Several NodeWorkers; batches of calls are distributed across them."""
+
+    def __init__(self, workers: Optional[int] = None, snippets_dir: Path = JS_SNIPPETS_DIR):
+        count = workers or min(4, os.cpu_count() or 1)
+        self.workers = [NodeWorker(snippets_dir) for _ in range(count)]
+        self.executor = ThreadPoolExecutor(max_workers=count)
+        self.functions = self.workers[0].functions
+
+    @staticmethod
+    def available() -> bool:
+        return shutil.which("node") is not None
+
+    def map(self, function: str, calls: Sequence[Sequence[Any]], batch_size: int = DEFAULT_BATCH_SIZE
+            ) -> List[Dict[str, Any]]:
+        """Results of function(*args) for every argument list, in order."""
+        batches = [calls[start:start + batch_size] for start in range(0, len(calls), batch_size)]
+        futures = [
+            self.executor.submit(self.workers[index % len(self.workers)].request, function, batch)
+            for index, batch in enumerate(batches)
+        ]
+        return [result for future in futures for result in future.result()]
+
+    def call(self, function: str, *args: Any) -> Any:
+        """function(*args) in a worker; raises NodeCallError if it throws."""
+        result = self.workers[0].request(function, [list(args)])[0]
+        if "error" in result:
+            raise NodeCallError(result["error"])
+        return result["value"]
+
+    def close(self):
+        self.executor.shutdown()
+        for worker in self.workers:
+            worker.close()
@@ -0,0 +1,78 @@
+/*
+ * Purpose: Long-lived Node worker that runs shared/js_snippets functions for the test suite
+ * Created/Updated: 2026-10-16
+ * Agent: QA_AGENT
+ *
+ * Loads every shared/js_snippets/*.js module once, then answers requests on
+ * stdin, one JSON object per line:
+ *   {"id": 1, "function": "validatePayload", "calls": [[payload, "contact"], ...]}
+ * with one JSON line per request on stdout:
+ *   {"id": 1, "results": [{"value": {...}}, {"error": "message"}, ...]}
+ * The first line written is {"ready": true, "functions": [...]}.
+ * Driven by tests/node_pool.py.
+ */
+
+const fs = require('fs');
+const path = require('path');
+const readline = require('readline');
+
+const snippetsDir = process.argv[2] || path.join(__dirname, '..', 'shared', 'js_snippets');
+
+/**
+ * Loads exported functions from every snippet, keyed by function name
+ * @param {string} directory - Snippets directory
+ * @returns {Object} Map of function name to function
+ */
+function loadSnippetFunctions(directory) {
+  const functions = {};
+  for (const file of fs.readdirSync(directory).filter(name => name.endsWith('.js')).sort()) {
+    const exported = require(path.join(directory, file));
+    for (const [name, fn] of Object.entries(exported)) {
+      if (typeof fn !== 'function') {
+        continue;
+      }
+      if (name in functions) {
+        throw new Error(`Function ${name} is exported by more than one snippet (${file})`);
+      }
+      functions[name] = fn;
+    }
+  }
+  return functions;
+}
+
+/**
+ * Runs one request against the loaded functions
+ * @param {Object} functions - Map of function name to function
+ * @param {Object} request - { id, function, calls }
+ * @returns {Object} Response with one result per call
+ */
+function handleRequest(functions, request) {
+  const fn = functions[request.function];
+  if (!fn) {
+    return { id: request.id, error: `Unknown function: ${request.function}` };
+  }
+  const results = request.calls.map(args => {
+    try {
+      return { value: fn(...args) };
+    } catch (error) {
+      return { error: error.message };
+    }
+  });
+  return { id: request.id, results };
+}
+
+const functions = loadSnippetFunctions(snippetsDir);
+process.stdout.write(JSON.stringify({ ready: true, functions: Object.keys(functions).sort() }) + '\n');
+
+readline.createInterface({ input: process.stdin }).on('line', line => {
+  if (!line.trim()) {
+    return;
+  }
+  let response;
+  try {
+    response = handleRequest(functions, JSON.parse(line));
+  } catch (error) {
+    response = { id: null, error: `Bad request: ${error.message}` };
+  }
+  process.stdout.write(JSON.stringify(response) + '\n');
+});
@@ -0,0 +1,96 @@
+"""
+Lazily built index of the repository files the test suite inspects.
+
+Workflow JSON files, schemas and environment configs are each found and
+parsed at most once, on first access, and shared by every test
+through the session-scoped repo_index fixture. Parse errors are recorded
+rather than raised, so the tests that check validity can report them.
+
+The index only reads the tree. Under pytest-xdist every worker process
+builds its own copy, so there is no state shared between workers.
+Parsed values are shared between tests and must be treated as read-only.
+"""
+import json
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
+
+import yaml
+
+# Directories under workflows/ that hold catalog metadata and packs, not workflows
+NON_WORKFLOW_DIRS = ("metadata", "packs")
+
+
+class ParsedFile(NamedTuple):
+    """A parsed file; data is None for empty files and files that failed to parse (see error)."""
+    path: Path
+    data: Any
+    error: Optional[str]
+
+    @property
+    def empty(self) -> bool:
+        return self.data is None and self.error is None
+
+
+def _parse(path: Path, loader) -> ParsedFile:
+    try:
+        text = path.read_text(encoding="utf-8")
+        if not text.strip():
+            return ParsedFile(path, None, None)
+        return ParsedFile(path, loader(text), None)
+    except (OSError, UnicodeDecodeError, ValueError, yaml.YAMLError) as e:
+        return ParsedFile(path, None, f"{type(e).__name__}: {e}")
+
+
+class RepoIndex:
+    """Parsed workflows, schemas and configs of one repository checkout."""
+
+    def __init__(self, repo_root: Path):
+        self.repo_root = repo_root
+        self.workflows_dir = repo_root / "workflows"
+        self.schemas_dir = repo_root / "shared" / "schemas"
+        self.config_dir = repo_root / "shared" / "config"
+        self._texts: Dict[Path, str] = {}
+
+    @cached_property
+    def workflow_files(self) -> List[Path]:
+        """Workflow JSON files under workflows/, excluding metadata and packs, sorted."""
+        return sorted(
+            path for path in self.workflows_dir.rglob("*.json")
+            if not any(part in NON_WORKFLOW_DIRS for part in path.relative_to(self.workflows_dir).parts[:-1])
+        )
+
+    @cached_property
+    def workflows(self) -> List[ParsedFile]:
+        """Every workflow file, parsed."""
+        return [_parse(path, json.loads) for path in self.workflow_files]
+
+    @cached_property
+    def schemas(self) -> Dict[str, ParsedFile]:
+        """shared/schemas/*.json keyed by file name."""
+        return {path.name: _parse(path, json.loads) for path in sorted(self.schemas_dir.glob("*.json"))}
+
+    def schema(self, name: str) -> Dict[str, Any]:
+        """A parsed schema by file name, e.g. 'event.schema.json'; fails if missing or invalid."""
+        parsed = self.schemas[name]
+        if parsed.error:
+            raise ValueError(f"{parsed.path}: {parsed.error}")
+        return parsed.data
+
+    @cached_property
+    def configs(self) -> Dict[str, ParsedFile]:
+        """shared/config/*.yaml keyed by file name."""
+        return {path.name: _parse(path, yaml.safe_load) for path in sorted(self.config_dir.glob("*.yaml"))}
+
+    def config(self, name: str) -> Dict[str, Any]:
+        """A parsed config by file name, e.g. 'environments.dev.yaml'; fails if missing or invalid."""
+        parsed = self.configs[name]
+        if parsed.error:
+            raise ValueError(f"{parsed.path}: {parsed.error}")
+        return parsed.data
+
+    def file_text(self, path: Path) -> str:
+        """Raw text of a file, read once."""
+        if path not in self._texts:
+            self._texts[path] = path.read_text(encoding="utf-8")
+        return self._texts[path]
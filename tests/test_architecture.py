@@ -28,9 +28,9 @@ class TestDirectoryStructure:
             full_path = repo_root / dir_path
             assert full_path.exists(), f"Required directory missing: {dir_path}"
     
-    def test_workflows_in_approved_directories(self, repo_root):
+    def test_workflows_in_approved_directories(self, repo_index):
         """Test that workflows are in approved directories."""
-        workflows_dir = repo_root / "workflows"
+        workflows_dir = repo_index.workflows_dir
         
         approved_patterns = [
             "domains/shared",
@@ -42,17 +42,10 @@ class TestDirectoryStructure:
             "domain_infra"
         ]
         
-        # Find all JSON files in workflows directory
-        workflow_files = list(workflows_dir.rglob("*.json"))
-        
-        for workflow_file in workflow_files:
+        for workflow_file in repo_index.workflow_files:
             relative_path = str(workflow_file.relative_to(workflows_dir))
             is_approved = any(pattern in relative_path for pattern in approved_patterns)
             
-            # Allow metadata and other non-workflow JSON files
-            if "metadata" in relative_path or "packs" in relative_path:
-                continue
-            
             # If it's a workflow file, it should be in approved directory
             if is_approved:
                 continue
@@ -0,0 +1,177 @@
+"""
+Tests for the content-addressed workflow backup store.
+"""
+import gzip
+import hashlib
+import io
+import json
+import subprocess
+import sys
+import pytest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from backup_store import BackupStore, LocalStorage, S3Storage, blob_key, open_storage
+
+REPO_ROOT = Path(__file__).parent.parent
+BACKUP_SCRIPT = REPO_ROOT / "ops" / "scripts" / "backup_store.py"
+DAY_ONE = datetime(2026, 10, 1, 2, 0, tzinfo=timezone.utc)
+
+
+class FakeS3Client:
+    """The subset of the boto3 S3 client used by S3Storage, in memory, with small list pages."""
+
+    def __init__(self, page_size=3):
+        self.objects = {}
+        self.page_size = page_size
+        self.puts = 0
+
+    def put_object(self, Bucket, Key, Body):
+        self.objects[(Bucket, Key)] = Body
+        self.puts += 1
+
+    def get_object(self, Bucket, Key):
+        return {"Body": io.BytesIO(self.objects[(Bucket, Key)])}
+
+    def list_objects_v2(self, Bucket, Prefix, ContinuationToken=None):
+        keys = sorted(key for bucket, key in self.objects if bucket == Bucket and key.startswith(Prefix))
+        start = int(ContinuationToken or 0)
+        page = keys[start:start + self.page_size]
+        truncated = start + self.page_size < len(keys)
+        response = {"Contents": [{"Key": key} for key in page], "IsTruncated": truncated}
+        if truncated:
+            response["NextContinuationToken"] = str(start + self.page_size)
+        return response
+
+    def delete_objects(self, Bucket, Delete):
+        for item in Delete["Objects"]:
+            self.objects.pop((Bucket, item["Key"]), None)
+
+
+@pytest.fixture
+def source(tmp_path):
+    """A small workflows tree."""
+    workflows = tmp_path / "src" / "workflows"
+    (workflows / "crm").mkdir(parents=True)
+    (workflows / "crm" / "lead_intake.json").write_text(json.dumps({"name": "lead_intake", "nodes": []}))
+    (workflows / "crm" / "lead_enrichment.json").write_text(json.dumps({"name": "lead_enrichment", "nodes": []}))
+    (workflows / "README.md").write_text("# Workflows\n")
+    return workflows
+
+
+@pytest.fixture(params=["local", "s3"])
+def store(request, tmp_path):
+    if request.param == "local":
+        return BackupStore(LocalStorage(tmp_path / "store"))
+    return BackupStore(S3Storage("backups", "automation-hub/workflows", client=FakeS3Client()))
+
+
+class TestSnapshots:
+    """Test content addressing and incremental snapshots."""
+
+    def test_snapshot_stores_blobs_and_manifest(self, store, source):
+        result = store.snapshot([source], "daily", now=DAY_ONE)
+        assert result["snapshot"] == "2026-10-01T02-00-00Z-daily"
+        assert result["files"] == result["blobs_uploaded"] == 3
+
+        manifest = store.manifest(result["snapshot"])
+        entry = manifest["files"]["workflows/crm/lead_intake.json"]
+        content = gzip.decompress(store.storage.get(blob_key(entry["sha256"])))
+        assert hashlib.sha256(content).hexdigest() == entry["sha256"]
+        assert json.loads(content) == {"name": "lead_intake", "nodes": []}
+
+    def test_unchanged_files_are_not_uploaded_again(self, store, source):
+        store.snapshot([source], "daily", now=DAY_ONE)
+        (source / "crm" / "lead_intake.json").write_text(json.dumps({"name": "lead_intake", "nodes": [{}]}))
+        result = BackupStore(store.storage).snapshot([source], "daily", now=DAY_ONE + timedelta(days=1))
+        assert result["blobs_uploaded"] == 1
+        assert len(store.snapshots()) == 2
+
+    def test_json_is_canonicalized_before_hashing(self, store, source):
+        first = store.snapshot([source], "daily", now=DAY_ONE)
+        (source / "crm" / "lead_intake.json").write_text('{\n    "nodes": [],\n    "name": "lead_intake"\n}')
+        second = store.snapshot([source], "daily", now=DAY_ONE + timedelta(days=1))
+        assert second["blobs_uploaded"] == 0
+        assert store.manifest(first["snapshot"])["files"] == store.manifest(second["snapshot"])["files"]
+
+    def test_identical_files_share_a_blob(self, store, source):
+        (source / "copy.json").write_text((source / "crm" / "lead_intake.json").read_text())
+        result = store.snapshot([source], "daily", now=DAY_ONE)
+        assert result["files"] == 4
+        assert result["blobs_uploaded"] == 3
+
+    def test_many_identical_files_upload_one_blob(self, store, source):
+        for index in range(32):
+            (source / f"copy_{index}.json").write_text(json.dumps({"name": "copy"}))
+        result = store.snapshot([source], "daily", now=DAY_ONE)
+        assert result["blobs_uploaded"] == 4
+        blobs = [key for key in store.storage.list("blobs/")]
+        assert len(blobs) == 4
+        if isinstance(store.storage, S3Storage):
+            # Four blobs and the manifest
+            assert store.storage.client.puts == 5
+
+    def test_invalid_label_is_rejected(self, store, source):
+        with pytest.raises(ValueError, match="label"):
+            store.snapshot([source], "../daily")
+
+
+class TestRetention:
+    """Test manifest pruning and blob garbage collection."""
+
+    def test_prune_deletes_old_snapshots_and_orphaned_blobs(self, store, source):
+        for day in range(5):
+            (source / "crm" / "lead_intake.json").write_text(json.dumps({"name": "lead_intake", "day": day}))
+            store.snapshot([source], "daily", now=DAY_ONE + timedelta(days=day))
+
+        result = store.prune(keep_days=2, now=DAY_ONE + timedelta(days=4))
+
+        assert len(result["snapshots_deleted"]) == 2
+        assert result["blobs_deleted"] == 2
+        remaining = store.snapshots()
+        assert len(remaining) == 3
+        for snapshot_id in remaining:
+            for entry in store.manifest(snapshot_id)["files"].values():
+                assert gzip.decompress(store.storage.get(blob_key(entry["sha256"])))
+
+    def test_keep_last_protects_newest_snapshots(self, store, source):
+        store.snapshot([source], "daily", now=DAY_ONE)
+        store.snapshot([source], "daily", now=DAY_ONE + timedelta(days=1))
+        result = store.prune(keep_days=0, keep_last=1, now=DAY_ONE + timedelta(days=365))
+        assert result["snapshots_deleted"] == ["2026-10-01T02-00-00Z-daily"]
+        assert result["blobs_deleted"] == 0
+        assert store.snapshots() == ["2026-10-02T02-00-00Z-daily"]
+
+    def test_dry_run_deletes_nothing(self, store, source):
+        store.snapshot([source], "daily", now=DAY_ONE)
+        store.snapshot([source], "daily", now=DAY_ONE + timedelta(days=1))
+        result = store.prune(keep_days=0, keep_last=0, now=DAY_ONE + timedelta(days=30), dry_run=True)
+        assert len(result["snapshots_deleted"]) == 2
+        assert len(store.snapshots()) == 2
+
+
+def test_open_streams_stored_content(store, source):
+    result = store.snapshot([source], "daily", now=DAY_ONE)
+    key = f"manifests/{result['snapshot']}.json"
+    stream = store.storage.open(key)
+    assert stream.read(10) + stream.read() == store.storage.get(key)
+    stream.close()
+
+
+def test_open_storage_urls(tmp_path):
+    assert isinstance(open_storage(str(tmp_path)), LocalStorage)
+    assert open_storage(f"file://{tmp_path}").root == tmp_path
+
+
+def test_cli_snapshot_list_and_prune(source, tmp_path):
+    """The CLI snapshots a source directory into a local store."""
+    store_dir = tmp_path / "store"
+
+    def run(*args):
+        return subprocess.run([sys.executable, str(BACKUP_SCRIPT), "--store", str(store_dir), *args],
+                              capture_output=True, text=True, check=True).stdout
+
+    assert "3 new blobs" in run("snapshot", "--source", str(source), "--label", "ci")
+    assert "0 new blobs" in run("snapshot", "--source", str(source), "--label", "ci2")
+    assert len(run("list").split()) == 2
+    assert "Deleted 0 snapshots" in run("prune", "--keep-days", "90")
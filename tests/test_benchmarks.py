@@ -0,0 +1,128 @@
+"""
+Smoke tests for the benchmark corpus generator and the pipeline, classifier and validation benchmarks.
+"""
+import json
+import shutil
+import subprocess
+import sys
+import pytest
+from pathlib import Path
+
+BENCHMARKS_DIR = Path(__file__).parent.parent / "ops" / "benchmarks"
+if str(BENCHMARKS_DIR) not in sys.path:
+    sys.path.insert(0, str(BENCHMARKS_DIR))
+
+from workflow_corpus import NodeMix, generate_corpus  # noqa: E402
+
+
+class TestWorkflowCorpus:
+    """Test synthetic corpus generation."""
+
+    def test_corpus_is_deterministic(self, tmp_path):
+        """The same size and seed produce identical files."""
+        generate_corpus(tmp_path / "a", 12, seed=3)
+        generate_corpus(tmp_path / "b", 12, seed=3)
+        files_a = sorted(p.relative_to(tmp_path / "a") for p in (tmp_path / "a").rglob("*.json"))
+        files_b = sorted(p.relative_to(tmp_path / "b") for p in (tmp_path / "b").rglob("*.json"))
+        assert files_a == files_b and len(files_a) == 12
+        for rel in files_a:
+            assert (tmp_path / "a" / rel).read_text() == (tmp_path / "b" / rel).read_text()
+
+    def test_corpus_uses_active_workflow_node_types(self, tmp_path):
+        """Generated nodes come from the active-workflows mix plus catalog-relevant nodes."""
+        mix = NodeMix()
+        generate_corpus(tmp_path, 40, mix=mix)
+        allowed = set(mix.types) | {
+            "n8n-nodes-base.start", "n8n-nodes-base.webhook", "n8n-nodes-base.executeWorkflow"
+        }
+        seen = set()
+        for workflow_file in tmp_path.rglob("*.json"):
+            workflow = json.loads(workflow_file.read_text())
+            seen.update(node["type"] for node in workflow["nodes"])
+        assert seen <= allowed
+        assert "n8n-nodes-base.executeWorkflow" in seen
+        assert "n8n-nodes-base.webhook" in seen
+
+
+class TestCatalogPipelineBenchmark:
+    """Test the stage-by-stage catalog pipeline benchmark."""
+
+    def test_writes_results_file(self, tmp_path):
+        """A small run records every stage in the JSON results file."""
+        output = tmp_path / "results.json"
+        subprocess.run(
+            [sys.executable, str(BENCHMARKS_DIR / "bench_catalog_pipeline.py"),
+             "--workflows", "20", "--output", str(output)],
+            check=True, capture_output=True, text=True
+        )
+        report = json.loads(output.read_text())
+        result = report["results"][0]
+        assert result["workflows"] == 20
+        assert list(result["stages"]) == ["scan", "parse", "extract", "merge", "dump"]
+        for metrics in result["stages"].values():
+            assert metrics["seconds"] >= 0
+            assert metrics["peak_rss_mb"] > 0
+
+
+class TestDomainClassifierBenchmark:
+    """Test the email domain classifier benchmark."""
+
+    def test_writes_results_file(self, tmp_path):
+        """A small run times every list size, finding every listed subdomain."""
+        output = tmp_path / "results.json"
+        subprocess.run(
+            [sys.executable, str(BENCHMARKS_DIR / "bench_domain_classifier.py"),
+             "--domains", "100", "1000", "--lookups", "200", "--output", str(output)],
+            check=True, capture_output=True, text=True
+        )
+        results = json.loads(output.read_text())["results"]
+        assert [result["domains"] for result in results] == [100, 1000]
+        for result in results:
+            assert result["suffix_set"]["hits"] == 100
+            assert result["linear_scan"]["ns_per_lookup"] > 0
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+class TestJsPayloadValidationBenchmark:
+    """Test the validatePayload() vs validatePayloadCompiled() benchmark."""
+
+    def test_writes_results_file(self, tmp_path):
+        """A small run times both validators per schema type, with no verdict disagreements."""
+        output = tmp_path / "results.json"
+        subprocess.run(
+            [sys.executable, str(BENCHMARKS_DIR / "bench_js_payload_validation.py"),
+             "--payloads", "300", "--rounds", "1", "--output", str(output)],
+            check=True, capture_output=True, text=True
+        )
+        results = json.loads(output.read_text())["results"]
+        assert [result["schema_type"] for result in results] == ["contact", "event"]
+        for result in results:
+            assert result["disagreements"] == 0
+            assert 0 < result["compiled"]["valid"] < 300
+            assert result["validate_payload"]["ns_per_payload"] > 0
+
+
+class TestPayloadValidationBenchmark:
+    """Test the benchmark of every validation path on generated payloads."""
+
+    def test_writes_results_file(self, tmp_path):
+        """A small run reports every path, and the compiled validators judge by the labels."""
+        output = tmp_path / "results.json"
+        subprocess.run(
+            [sys.executable, str(BENCHMARKS_DIR / "bench_payload_validation.py"), "--payloads", "300",
+             "--schema-types", "contact", "incident", "--mix", "enum", "pattern", "--output", str(output)],
+            check=True, capture_output=True, text=True
+        )
+        results = json.loads(output.read_text())["results"]
+        assert [result["schema_type"] for result in results] == ["contact", "incident"]
+        for result in results:
+            paths = result["paths"]
+            assert set(paths) == {"jsonschema", "compiled_python", "validate_payload", "compiled_js"}
+            for name in ("jsonschema", "compiled_python"):
+                assert paths[name]["ops_per_sec"] > 0
+                assert paths[name]["p99_us"] >= paths[name]["p50_us"]
+                assert paths[name]["missed"] == paths[name]["rejected_valid"] == 0
+            if shutil.which("node"):
+                assert paths["compiled_js"]["missed"] == paths["compiled_js"]["rejected_valid"] == 0
+        if shutil.which("node"):
+            assert "skipped" in results[1]["paths"]["validate_payload"]
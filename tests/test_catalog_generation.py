@@ -135,3 +135,345 @@ class TestCatalogMergingLogic:
         # Script should have logic to preserve manual fields
         assert "existing" in content.lower() or "preserve" in content.lower() or "manual" in content.lower()
 
+
+
+@pytest.fixture
+def catalog_env(tmp_path, monkeypatch):
+    """Point generate_catalog at a temporary workflows tree."""
+    import generate_catalog
+
+    workflows_dir = tmp_path / "workflows"
+    metadata_dir = workflows_dir / "metadata"
+    monkeypatch.setattr(generate_catalog, "WORKFLOWS_DIR", workflows_dir)
+    monkeypatch.setattr(generate_catalog, "METADATA_DIR", metadata_dir)
+    monkeypatch.setattr(generate_catalog, "CATALOG_FILE", metadata_dir / "workflows_catalog.yaml")
+    monkeypatch.setattr(generate_catalog, "CATALOG_JSON_FILE", metadata_dir / "workflows_catalog.json")
+    monkeypatch.setattr(generate_catalog, "CATALOG_INDEX_FILE", metadata_dir / "workflows_catalog.db")
+    monkeypatch.setattr(generate_catalog, "MANIFEST_FILE", metadata_dir / "workflows_manifest.json")
+    return generate_catalog
+
+
+def write_workflow(workflows_dir, relative_path, workflow):
+    """Write a workflow JSON file under the temporary workflows tree."""
+    workflow_file = workflows_dir / relative_path
+    workflow_file.parent.mkdir(parents=True, exist_ok=True)
+    workflow_file.write_text(json.dumps(workflow))
+    return workflow_file
+
+
+class TestIncrementalCatalogScan:
+    """Test manifest-based incremental scanning."""
+    
+    def test_unchanged_files_are_not_reparsed(self, catalog_env):
+        """Test that a second incremental scan reuses cached metadata."""
+        write_workflow(catalog_env.WORKFLOWS_DIR, "platform/log_event.json", {"name": "Log Event", "nodes": []})
+        
+        manifest = catalog_env.load_manifest()
+        first = catalog_env.scan_workflows(manifest)
+        catalog_env.save_manifest(manifest)
+        
+        with patch.object(catalog_env, "extract_workflow_metadata") as mock_extract:
+            second = catalog_env.scan_workflows(catalog_env.load_manifest())
+        
+        mock_extract.assert_not_called()
+        assert second == first
+    
+    def test_extraction_changes_invalidate_the_manifest(self, catalog_env, monkeypatch):
+        """Cached metadata from older extraction code is not reused."""
+        write_workflow(catalog_env.WORKFLOWS_DIR, "platform/log_event.json", {"name": "Log Event", "nodes": []})
+        manifest = catalog_env.load_manifest()
+        catalog_env.scan_workflows(manifest)
+        catalog_env.save_manifest(manifest)
+        assert catalog_env.load_manifest()["files"]
+
+        monkeypatch.setattr(catalog_env, "EXTRACTION_FINGERPRINT", "changed-extraction-code")
+        assert catalog_env.load_manifest()["files"] == {}
+
+    def test_fingerprint_covers_node_extractors(self, catalog_env, monkeypatch):
+        """Registering or changing a node extractor changes the fingerprint."""
+        before = catalog_env.extraction_fingerprint()
+        monkeypatch.setitem(catalog_env.NODE_EXTRACTORS, "n8n-nodes-base.slack", [lambda node, facts: None])
+        assert catalog_env.extraction_fingerprint() != before
+
+    def test_changed_files_are_reparsed(self, catalog_env):
+        """Test that content changes are picked up."""
+        workflow_file = write_workflow(catalog_env.WORKFLOWS_DIR, "platform/log_event.json", {"name": "Log Event"})
+        manifest = catalog_env.load_manifest()
+        catalog_env.scan_workflows(manifest)
+        
+        workflow_file.write_text(json.dumps({"name": "Log Event v2"}))
+        workflows = catalog_env.scan_workflows(manifest)
+        
+        assert workflows[0]["name"] == "Log Event v2"
+    
+    def test_deleted_files_become_deprecated(self, catalog_env):
+        """Test that deleted files drop out of the manifest and are deprecated on merge."""
+        write_workflow(catalog_env.WORKFLOWS_DIR, "platform/log_event.json", {"name": "Log Event"})
+        removed = write_workflow(catalog_env.WORKFLOWS_DIR, "platform/notify_slack.json", {"name": "Notify Slack"})
+        manifest = catalog_env.load_manifest()
+        existing = catalog_env.generate_catalog(catalog_env.scan_workflows(manifest))
+        
+        removed.unlink()
+        workflows = catalog_env.scan_workflows(manifest)
+        merged = catalog_env.merge_catalog_updates(existing, catalog_env.generate_catalog(workflows))
+        
+        assert "platform/notify_slack.json" not in manifest["files"]
+        statuses = {w["id"]: w["status"] for w in merged["catalog"]["workflows"]}
+        assert statuses == {"log_event": "active", "notify_slack": "deprecated"}
+
+
+class TestParallelCatalogScan:
+    """Test process-pool scanning."""
+    
+    def test_parallel_scan_matches_serial(self, catalog_env):
+        """Test that --jobs output is identical to a serial scan."""
+        for index in range(12):
+            write_workflow(
+                catalog_env.WORKFLOWS_DIR,
+                f"domains/crm/lead_step_{index:02d}.json",
+                {"name": f"Lead Step {index}", "tags": ["crm", f"step-{index}"], "nodes": []}
+            )
+        
+        serial = catalog_env.scan_workflows(jobs=1)
+        parallel = catalog_env.scan_workflows(jobs=4)
+        
+        assert parallel == serial
+        assert [w["id"] for w in parallel] == sorted(w["id"] for w in parallel)
+    
+    def test_parallel_incremental_scan_matches_serial(self, catalog_env):
+        """Test that parallel incremental scans produce the same manifest order."""
+        for name in ["notify_slack", "log_event", "approvals_generic"]:
+            write_workflow(catalog_env.WORKFLOWS_DIR, f"platform/{name}.json", {"name": name})
+        
+        serial_manifest = catalog_env.load_manifest()
+        parallel_manifest = catalog_env.load_manifest()
+        
+        assert catalog_env.scan_workflows(serial_manifest) == \
+            catalog_env.scan_workflows(parallel_manifest, jobs=3)
+        assert list(parallel_manifest["files"]) == list(serial_manifest["files"])
+    
+    def test_tags_are_deterministic(self, catalog_env):
+        """Test that tag de-duplication keeps a stable order."""
+        tags = catalog_env.extract_tags({"name": "Notify Slack", "tags": ["shared", "alerts"]}, "shared")
+        assert tags == ["shared", "alerts", "notifications"]
+
+    def test_tags_accept_n8n_tag_objects(self, catalog_env):
+        """Test that n8n export tag objects contribute their names."""
+        tags = catalog_env.extract_tags({"name": "Digest", "tags": [{"id": "1", "name": "alerts"}]}, "meta")
+        assert tags == ["meta", "alerts"]
+
+
+class TestNodeExtractorRegistry:
+    """Test single-pass node extraction."""
+    
+    def test_builtin_extractors(self, catalog_env):
+        """Test start notes, webhook endpoints and dependencies come from one pass."""
+        nodes = [
+            {"type": "n8n-nodes-base.webhook", "parameters": {"path": "lead-intake"}},
+            {"type": "n8n-nodes-base.start", "notes": "First start"},
+            {"type": "n8n-nodes-base.executeWorkflow", "parameters": {"workflowId": "log_event"}},
+            {"type": "n8n-nodes-base.start", "notes": "Second start"},
+            {"type": "n8n-nodes-base.webhook", "parameters": {}},
+        ]
+        
+        facts = catalog_env.extract_node_facts(nodes)
+        
+        assert facts == {
+            "endpoints": ["/webhook/lead-intake"],
+            "dependencies": ["log_event"],
+            "start_notes": "First start",
+        }
+    
+    def test_registered_extractor_is_dispatched(self, catalog_env, monkeypatch):
+        """Test that extractors registered for a node type receive matching nodes."""
+        monkeypatch.setattr(catalog_env, "NODE_EXTRACTORS", {
+            node_type: list(extractors) for node_type, extractors in catalog_env.NODE_EXTRACTORS.items()
+        })
+        
+        @catalog_env.node_extractor("n8n-nodes-base.scheduleTrigger")
+        def extract_schedule(node, facts):
+            facts.setdefault("schedules", []).append(node["parameters"]["rule"])
+        
+        facts = catalog_env.extract_node_facts([
+            {"type": "n8n-nodes-base.scheduleTrigger", "parameters": {"rule": "daily"}},
+            {"type": "n8n-nodes-base.code", "parameters": {}},
+        ])
+        
+        assert facts["schedules"] == ["daily"]
+
+
+class TestCatalogSerialization:
+    """Test YAML catalog and JSON sidecar output."""
+    
+    def test_save_writes_matching_yaml_and_json(self, catalog_env):
+        """Test that the JSON sidecar holds the same catalog as the YAML file."""
+        write_workflow(catalog_env.WORKFLOWS_DIR, "platform/notify_slack.json", {"name": "Notify Slack ✅"})
+        catalog = catalog_env.generate_catalog(catalog_env.scan_workflows())
+        
+        catalog_env.save_catalog(catalog)
+        
+        from_yaml = catalog_env.load_catalog_file(catalog_env.CATALOG_FILE)
+        from_json = catalog_env.load_catalog_file(catalog_env.CATALOG_JSON_FILE)
+        assert from_yaml == from_json == catalog
+        assert not list(catalog_env.METADATA_DIR.glob("*.tmp"))
+    
+    def test_existing_catalog_is_read_from_yaml(self, catalog_env):
+        """Test that manual edits in the YAML file win over a stale sidecar."""
+        catalog_env.METADATA_DIR.mkdir(parents=True)
+        catalog_env.CATALOG_FILE.write_text("catalog:\n  workflows:\n    - id: log_event\n      owner: platform\n")
+        catalog_env.CATALOG_JSON_FILE.write_text('{"catalog": {"workflows": []}}')
+        
+        existing = catalog_env.load_existing_catalog()
+        
+        assert existing["catalog"]["workflows"][0]["owner"] == "platform"
+
+
+class TestCatalogDelta:
+    """Test change-aware merging and write-only-if-changed output."""
+
+    def test_delta_classifies_workflows(self, catalog_env):
+        """Test that every workflow lands in exactly one delta bucket, in catalog order."""
+        existing = catalog_env.generate_catalog([
+            {"id": "log_event", "status": "active", "owner": "platform"},
+            {"id": "notify_slack", "status": "active"},
+            {"id": "old_sync", "status": "active"},
+            {"id": "retired", "status": "deprecated"},
+        ])
+        new = catalog_env.generate_catalog([
+            {"id": "lead_intake", "status": "active"},
+            {"id": "log_event", "status": "active"},
+            {"id": "notify_slack", "status": "active", "tags": ["alerts"]},
+        ])
+
+        merged, delta = catalog_env.merge_catalog_with_delta(existing, new)
+
+        assert delta == {
+            "added": ["lead_intake"],
+            "changed": ["notify_slack"],
+            "deprecated": ["old_sync"],
+            "unchanged": ["log_event", "retired"],
+        }
+        workflows = merged["catalog"]["workflows"]
+        assert [w["id"] for w in workflows] == ["lead_intake", "log_event", "notify_slack", "old_sync", "retired"]
+        assert workflows[1]["owner"] == "platform"
+        assert existing["catalog"]["workflows"][2]["status"] == "active"
+
+    def test_unchanged_catalog_is_not_rewritten(self, catalog_env):
+        """Test that a second run keeps generated_at and leaves every output file untouched."""
+        write_workflow(catalog_env.WORKFLOWS_DIR, "platform/log_event.json", {"name": "Log Event"})
+        assert catalog_env.save_catalog(catalog_env.generate_catalog(catalog_env.scan_workflows()))
+        outputs = [catalog_env.CATALOG_FILE, catalog_env.CATALOG_JSON_FILE, catalog_env.CATALOG_INDEX_FILE]
+        before = {path: path.stat().st_mtime_ns for path in outputs}
+
+        with patch.object(catalog_env, "datetime") as fake_datetime:
+            fake_datetime.utcnow.return_value.isoformat.return_value = "2099-01-01T00:00:00"
+            merged, delta = catalog_env.merge_catalog_with_delta(
+                catalog_env.load_existing_catalog(),
+                catalog_env.generate_catalog(catalog_env.scan_workflows())
+            )
+
+        assert delta["unchanged"] == ["log_event"]
+        assert not catalog_env.save_catalog(merged)
+        assert {path: path.stat().st_mtime_ns for path in outputs} == before
+
+    def test_changed_catalog_is_rewritten(self, catalog_env):
+        """Test that a content change refreshes generated_at and rewrites the outputs."""
+        write_workflow(catalog_env.WORKFLOWS_DIR, "platform/log_event.json", {"name": "Log Event"})
+        catalog_env.save_catalog(catalog_env.generate_catalog(catalog_env.scan_workflows()))
+
+        write_workflow(catalog_env.WORKFLOWS_DIR, "platform/log_event.json", {"name": "Log Event v2"})
+        merged, delta = catalog_env.merge_catalog_with_delta(
+            catalog_env.load_existing_catalog(),
+            catalog_env.generate_catalog(catalog_env.scan_workflows())
+        )
+
+        assert delta["changed"] == ["log_event"]
+        assert catalog_env.save_catalog(merged)
+        assert catalog_env.load_catalog_file(catalog_env.CATALOG_JSON_FILE) == merged
+
+    def test_delta_report_file(self, catalog_env, tmp_path):
+        """Test that the delta report carries IDs and per-kind counts."""
+        report_path = tmp_path / "reports" / "delta.json"
+        catalog_env.save_delta_report({"added": ["a"], "changed": [], "deprecated": [], "unchanged": ["b"]}, report_path)
+
+        report = json.loads(report_path.read_text())
+        assert report["summary"] == {"added": 1, "changed": 0, "deprecated": 0, "unchanged": 1}
+        assert report["added"] == ["a"]
+
+
+class TestWatchMode:
+    """Test the live catalog used by --watch."""
+    
+    def test_live_catalog_applies_only_affected_entries(self, catalog_env):
+        """Test that changed, created and deleted files update the catalog on flush."""
+        write_workflow(catalog_env.WORKFLOWS_DIR, "platform/log_event.json", {"name": "Log Event"})
+        removed = write_workflow(catalog_env.WORKFLOWS_DIR, "platform/notify_slack.json", {"name": "Notify Slack"})
+        manifest = catalog_env.load_manifest()
+        catalog_env.scan_workflows(manifest)
+        live = catalog_env.LiveCatalog(manifest)
+        live.flush()
+        
+        removed.unlink()
+        write_workflow(catalog_env.WORKFLOWS_DIR, "domain_crm/lead_intake.json", {"name": "Lead Intake"})
+        with patch.object(catalog_env, "extract_workflow_metadata", wraps=catalog_env.extract_workflow_metadata) as spy:
+            changed = live.apply_changes({"platform/notify_slack.json", "domain_crm/lead_intake.json"})
+        live.flush()
+        
+        assert changed
+        assert spy.call_count == 1
+        catalog = catalog_env.load_catalog_file(catalog_env.CATALOG_FILE)
+        statuses = {w["id"]: w["status"] for w in catalog["catalog"]["workflows"]}
+        assert statuses == {"log_event": "active", "lead_intake": "active", "notify_slack": "deprecated"}
+        assert list(live.manifest["files"]) == ["platform/log_event.json", "domain_crm/lead_intake.json"]
+    
+    def test_unchanged_content_is_not_a_change(self, catalog_env):
+        """Test that rewriting a file with identical content does not trigger a flush."""
+        workflow_file = write_workflow(catalog_env.WORKFLOWS_DIR, "platform/log_event.json", {"name": "Log Event"})
+        manifest = catalog_env.load_manifest()
+        catalog_env.scan_workflows(manifest)
+        live = catalog_env.LiveCatalog(manifest)
+        
+        workflow_file.write_text(workflow_file.read_text())
+        
+        assert not live.apply_changes({"platform/log_event.json"})
+    
+    @pytest.mark.parametrize("force_polling", [True, False])
+    def test_watcher_reports_changed_paths(self, tmp_path, force_polling):
+        """Test that both watcher backends report created, modified and deleted files."""
+        import sys
+        from workflow_watch import create_watcher
+        
+        if not force_polling and not sys.platform.startswith("linux"):
+            pytest.skip("inotify is only available on Linux")
+        
+        scan_dir = tmp_path / "platform"
+        scan_dir.mkdir()
+        existing = scan_dir / "log_event.json"
+        existing.write_text("{}")
+        watcher = create_watcher(tmp_path, ["platform"], poll_interval=0.01, force_polling=force_polling)
+        try:
+            existing.write_text('{"name": "changed"}')
+            (scan_dir / "notify_slack.json").write_text("{}")
+            (scan_dir / "notes.txt").write_text("ignored")
+            existing.unlink()
+            
+            changed = set()
+            for _ in range(20):
+                changed |= watcher.wait(0.05) or set()
+                if {"platform/log_event.json", "platform/notify_slack.json"} <= changed:
+                    break
+        finally:
+            watcher.close()
+        
+        assert changed == {"platform/log_event.json", "platform/notify_slack.json"}
+    
+    def test_polling_watcher_scans_before_short_timeouts(self, tmp_path):
+        """Test that a debounce timeout shorter than the poll interval still sees new writes."""
+        from workflow_watch import PollingWatcher
+        
+        (tmp_path / "platform").mkdir()
+        watcher = PollingWatcher(tmp_path, ["platform"], interval=60)
+        (tmp_path / "platform" / "log_event.json").write_text("{}")
+        
+        assert watcher.wait(0.01) == {"platform/log_event.json"}
+        assert watcher.wait(0.01) == set()
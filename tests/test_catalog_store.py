@@ -0,0 +1,91 @@
+"""
+Tests for the SQLite catalog index and query CLI.
+"""
+import subprocess
+import sys
+import pytest
+
+from catalog_store import CatalogIndex, write_catalog_index
+
+
+@pytest.fixture
+def catalog():
+    """Small catalog covering every indexed field."""
+    return {
+        "catalog": {
+            "version": "1.0.0",
+            "generated_at": "2025-11-20T00:00:00Z",
+            "workflows": [
+                {
+                    "id": "error_central_handler", "domain": "shared", "status": "active",
+                    "endpoints": [], "dependencies": ["log_event", "notify_slack"],
+                    "tags": ["shared", "error-handling"],
+                    "schema_validation": {"required": True, "schema_type": "incident"},
+                },
+                {
+                    "id": "lead_intake", "domain": "crm", "status": "active",
+                    "endpoints": ["/webhook/lead-intake"], "dependencies": ["log_event"],
+                    "tags": ["crm", "notifications"],
+                    "schema_validation": {"required": True, "schema_type": "contact"},
+                },
+                {
+                    "id": "lead_sync_to_crm", "domain": "crm", "status": "deprecated",
+                    "endpoints": [], "dependencies": [],
+                    "tags": ["crm"],
+                    "schema_validation": {"required": True, "schema_type": "contact"},
+                },
+            ]
+        }
+    }
+
+
+@pytest.fixture
+def index_path(tmp_path, catalog):
+    """Build an index for the sample catalog."""
+    path = tmp_path / "workflows_catalog.db"
+    write_catalog_index(catalog, path)
+    return path
+
+
+class TestCatalogIndexQueries:
+    """Test indexed catalog lookups."""
+    
+    def ids(self, index_path, **filters):
+        with CatalogIndex(index_path) as index:
+            return [w["id"] for w in index.query(**filters)]
+    
+    def test_query_by_endpoint(self, index_path):
+        """Test webhook endpoint lookups, with and without the /webhook/ prefix."""
+        assert self.ids(index_path, endpoint="/webhook/lead-intake") == ["lead_intake"]
+        assert self.ids(index_path, endpoint="lead-intake") == ["lead_intake"]
+    
+    def test_query_by_dependency(self, index_path):
+        """Test reverse dependency lookups."""
+        assert self.ids(index_path, depends_on="log_event") == ["error_central_handler", "lead_intake"]
+    
+    def test_query_combines_filters(self, index_path):
+        """Test that domain, tag, status and schema filters are AND-combined."""
+        assert self.ids(index_path, domain="crm", tags=["notifications"]) == ["lead_intake"]
+        assert self.ids(index_path, domain="crm", status="deprecated") == ["lead_sync_to_crm"]
+        assert self.ids(index_path, schema_type="contact", tags=["crm", "notifications"]) == ["lead_intake"]
+    
+    def test_query_returns_full_entries(self, index_path, catalog):
+        """Test that entries round-trip through the index unchanged."""
+        with CatalogIndex(index_path) as index:
+            assert index.query() == catalog["catalog"]["workflows"]
+    
+    def test_rebuild_replaces_index(self, index_path, catalog):
+        """Test that rewriting the index drops removed workflows."""
+        catalog["catalog"]["workflows"] = catalog["catalog"]["workflows"][:1]
+        write_catalog_index(catalog, index_path)
+        
+        assert self.ids(index_path) == ["error_central_handler"]
+    
+    def test_query_cli(self, index_path, repo_root):
+        """Test the query subcommand output."""
+        result = subprocess.run(
+            [sys.executable, str(repo_root / "ops" / "scripts" / "catalog_store.py"),
+             "--index", str(index_path), "query", "--depends-on", "log_event", "--domain", "crm"],
+            capture_output=True, text=True, check=True
+        )
+        assert result.stdout.split() == ["lead_intake"]
@@ -1,11 +1,8 @@
 """
 Tests for environment configuration files.
 """
-import yaml
 import pytest
 import re
-from pathlib import Path
-from unittest.mock import patch, MagicMock
 
 
 class TestConfigValidation:
@@ -21,32 +18,23 @@ class TestConfigValidation:
         config_file = config_dir / "environments.prod.yaml"
         assert config_file.exists(), "environments.prod.yaml not found"
     
-    def test_dev_config_valid_yaml(self, config_dir):
+    def test_dev_config_valid_yaml(self, repo_index):
         """Test that dev config is valid YAML."""
-        config_file = config_dir / "environments.dev.yaml"
+        parsed = repo_index.configs["environments.dev.yaml"]
         
-        with open(config_file, 'r') as f:
-            try:
-                yaml.safe_load(f)
-            except yaml.YAMLError as e:
-                pytest.fail(f"Invalid YAML in {config_file}: {e}")
+        if parsed.error:
+            pytest.fail(f"Invalid YAML in {parsed.path}: {parsed.error}")
     
-    def test_prod_config_valid_yaml(self, config_dir):
+    def test_prod_config_valid_yaml(self, repo_index):
         """Test that prod config is valid YAML."""
-        config_file = config_dir / "environments.prod.yaml"
+        parsed = repo_index.configs["environments.prod.yaml"]
         
-        with open(config_file, 'r') as f:
-            try:
-                yaml.safe_load(f)
-            except yaml.YAMLError as e:
-                pytest.fail(f"Invalid YAML in {config_file}: {e}")
+        if parsed.error:
+            pytest.fail(f"Invalid YAML in {parsed.path}: {parsed.error}")
     
-    def test_dev_config_structure(self, config_dir):
+    def test_dev_config_structure(self, repo_index):
         """Test dev config has required structure."""
-        config_file = config_dir / "environments.dev.yaml"
-        
-        with open(config_file, 'r') as f:
-            config = yaml.safe_load(f)
+        config = repo_index.config("environments.dev.yaml")
         
         assert "environment" in config
         assert config["environment"] == "dev"
@@ -54,21 +42,18 @@ class TestConfigValidation:
         assert "aws" in config
         assert "external_services" in config
     
-    def test_prod_config_structure(self, config_dir):
+    def test_prod_config_structure(self, repo_index):
         """Test prod config has required structure."""
-        config_file = config_dir / "environments.prod.yaml"
-        
-        with open(config_file, 'r') as f:
-            config = yaml.safe_load(f)
+        config = repo_index.config("environments.prod.yaml")
         
         assert "environment" in config
         assert config["environment"] == "prod"
         assert "n8n" in config
         assert "aws" in config
     
-    def test_config_no_hardcoded_secrets(self, config_dir):
+    def test_config_no_hardcoded_secrets(self, repo_index):
         """Test that configs don't contain hardcoded secrets."""
-        config_files = list(config_dir.glob("*.yaml"))
+        config_files = [parsed.path for parsed in repo_index.configs.values()]
         
         secret_patterns = [
             r'password\s*:\s*["\']([^"\']+)["\']',
@@ -78,8 +63,7 @@ class TestConfigValidation:
         ]
         
         for config_file in config_files:
-            with open(config_file, 'r') as f:
-                content = f.read()
+            content = repo_index.file_text(config_file)
             
             for pattern in secret_patterns:
                 matches = re.finditer(pattern, content, re.IGNORECASE)
@@ -98,15 +82,14 @@ class TestConfigValidation:
                     # If we get here, it's a potential hardcoded secret
                     pytest.fail(f"Potential hardcoded secret in {config_file}: {match.group(0)}")
     
-    def test_config_aws_secrets_manager_arns(self, config_dir):
+    def test_config_aws_secrets_manager_arns(self, repo_index):
         """Test that AWS Secrets Manager ARNs are properly formatted."""
-        config_files = list(config_dir.glob("*.yaml"))
+        config_files = [parsed.path for parsed in repo_index.configs.values()]
         
         arn_pattern = r'arn:aws:secretsmanager:[^:]+:[^:]+:secret:[^"\'\s]+'
         
         for config_file in config_files:
-            with open(config_file, 'r') as f:
-                content = f.read()
+            content = repo_index.file_text(config_file)
             
             # Check if any secret references exist
             if "secret" in content.lower() or "api_key" in content.lower():
@@ -119,40 +102,28 @@ class TestConfigValidation:
                         continue
                     # Otherwise, warn but don't fail (may be using env vars)
     
-    def test_config_n8n_settings(self, config_dir):
+    def test_config_n8n_settings(self, repo_index):
         """Test n8n configuration settings."""
-        config_file = config_dir / "environments.dev.yaml"
-        
-        with open(config_file, 'r') as f:
-            config = yaml.safe_load(f)
+        config = repo_index.config("environments.dev.yaml")
         
         assert "n8n" in config
         n8n_config = config["n8n"]
         assert "base_url" in n8n_config
         assert "api_endpoint" in n8n_config or "api_key_secret_arn" in n8n_config
     
-    def test_config_aws_settings(self, config_dir):
+    def test_config_aws_settings(self, repo_index):
         """Test AWS configuration settings."""
-        config_file = config_dir / "environments.dev.yaml"
-        
-        with open(config_file, 'r') as f:
-            config = yaml.safe_load(f)
+        config = repo_index.config("environments.dev.yaml")
         
         assert "aws" in config
         aws_config = config["aws"]
         assert "region" in aws_config
         assert "secrets_manager" in aws_config or "s3" in aws_config
     
-    def test_config_environment_differences(self, config_dir):
+    def test_config_environment_differences(self, repo_index):
         """Test that dev and prod configs have appropriate differences."""
-        dev_file = config_dir / "environments.dev.yaml"
-        prod_file = config_dir / "environments.prod.yaml"
-        
-        with open(dev_file, 'r') as f:
-            dev_config = yaml.safe_load(f)
-        
-        with open(prod_file, 'r') as f:
-            prod_config = yaml.safe_load(f)
+        dev_config = repo_index.config("environments.dev.yaml")
+        prod_config = repo_index.config("environments.prod.yaml")
         
         # Dev should have localhost URLs
         assert "localhost" in str(dev_config.get("n8n", {}).get("base_url", "")).lower()
@@ -161,13 +132,11 @@ class TestConfigValidation:
         prod_n8n_url = str(prod_config.get("n8n", {}).get("base_url", "")).lower()
         assert "localhost" not in prod_n8n_url or "dev" not in prod_n8n_url
     
-    def test_mock_secrets_retrieval(self, config_dir):
+    def test_mock_secrets_retrieval(self, repo_index):
         """Test that configs reference secrets via ARN (mocking not required for this test)."""
         # This test verifies that configs reference secrets via ARN
         # We don't need to actually mock boto3 for this validation
-        config_file = config_dir / "environments.dev.yaml"
-        with open(config_file, 'r') as f:
-            config = yaml.safe_load(f)
+        config = repo_index.config("environments.dev.yaml")
         
         # Verify config references secrets via ARN
         if "n8n" in config and "api_key_secret_arn" in config["n8n"]:
@@ -0,0 +1,180 @@
+"""
+Tests for the batch contact normalizer.
+
+The parity tests run shared/js_snippets/normalize_contact.js in the session
+node worker pool on the cases in tests/mocks/contact_normalization_cases.json,
+plus seeded random contacts, and require identical output from the Python
+implementation.
+"""
+import json
+import random
+import shutil
+import subprocess
+import sys
+import pytest
+from pathlib import Path
+
+from contact_normalizer import (
+    ContactNormalizationError, js_number, normalize_contact, normalize_contacts, parse_js_date
+)
+
+REPO_ROOT = Path(__file__).parent.parent
+
+requires_node = pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+
+
+def run_node(node_pool, contacts):
+    """normalizeContact() results from node, as {"value": ...} or {"error": ...} per contact."""
+    return node_pool.map("normalizeContact", [[contact] for contact in contacts])
+
+
+def run_python(contacts):
+    """normalize_contacts() results in the same shape as run_node."""
+    normalized, errors = normalize_contacts(contacts)
+    messages = {error["index"]: error["error"] for error in errors}
+    return [
+        {"error": messages[index]} if index in messages else {"value": record}
+        for index, record in enumerate(normalized)
+    ]
+
+
+def random_contacts(count, seed):
+    """Contacts mixing aliases, JS-falsy values, numbers, whitespace and date formats."""
+    rng = random.Random(seed)
+    values = [
+        None, "", " ", 0, 1, 1.5, 1e21, 1e-7, True, False, [], ["a", " b "], {}, {"k": 1},
+        "New", " QUALIFIED ", "Converted", "web", "  Acme Corp  ", "(555) 123-4567", "555-123-4567",
+        "15551234567", "+44 20 7946 0958", 5551234567, "a,b,,c", "x" * 55,
+        "2025-11-20", "2025-11-20T10:00:00Z", "2025-11-20T10:00:00.5+02:00", "11/20/2025 10:30",
+        "20 Nov 2025 10:00:00 GMT", "Nov 20, 2025", "2025-02-29", 1763632800000, "not a date",
+        "123e4567-e89b-12d3-a456-426614174000", " 123E4567-E89B-12D3-A456-426614174000 ",
+    ]
+    valid_emails = ["user@example.com", " User@Example.COM ", "a@b.c"]
+    invalid_emails = ["bad-email", "", None, 5, "x y@z.io"]
+    keys = [
+        "email", "Email", "email_address", "first_name", "firstName", "first", "First Name",
+        "last_name", "lastName", "company", "Organization", "phone", "Phone", "phone_number",
+        "title", "jobTitle", "source", "leadSource", "status", "Status", "lead_status", "tags",
+        "Tags", "tag", "created_at", "createdAt", "updated", "id", "Id", "ID", "risk_score",
+        "riskScore", "enrichment_status", "lastEnrichedAt", "custom_one", "metadata",
+    ]
+    contacts = []
+    for _ in range(count):
+        # Mostly valid emails, so most contacts reach the field normalizers
+        contact = {"email": rng.choice(valid_emails if rng.random() < 0.8 else invalid_emails)}
+        for key in rng.sample(keys, rng.randint(1, 12)):
+            if key in ("email", "Email", "email_address"):
+                contact[key] = rng.choice(valid_emails + invalid_emails)
+            elif key in ("risk_score", "riskScore"):
+                contact[key] = rng.choice([None, 0, 42, 101, -1, "50", 99.5])
+            elif key == "enrichment_status":
+                contact[key] = rng.choice(["pending", "COMPLETED", "other", 0, None])
+            else:
+                contact[key] = rng.choice(values)
+        contacts.append(contact)
+    return contacts
+
+
+@pytest.fixture(scope="module")
+def shared_cases():
+    """tests/mocks/contact_normalization_cases.json."""
+    with open(REPO_ROOT / "tests" / "mocks" / "contact_normalization_cases.json") as f:
+        return json.load(f)
+
+
+class TestParityWithNormalizeContactJs:
+    """The Python normalizer must match normalize_contact.js exactly."""
+
+    def test_shared_cases(self, node_pool, shared_cases):
+        """Every shared fixture normalizes (or is rejected) identically."""
+        expected = run_node(node_pool, shared_cases)
+        actual = run_python(shared_cases)
+        for index, case in enumerate(shared_cases):
+            assert actual[index] == expected[index], f"case {index}: {case!r}"
+
+    def test_random_contacts(self, node_pool):
+        """Seeded random contacts normalize identically."""
+        contacts = random_contacts(1500, seed=14)
+        expected = run_node(node_pool, contacts)
+        actual = run_python(contacts)
+        mismatches = [
+            (contact, actual[index], expected[index])
+            for index, contact in enumerate(contacts) if actual[index] != expected[index]
+        ]
+        assert not mismatches, mismatches[:3]
+
+    @requires_node
+    def test_number_formatting(self):
+        """String(number) formatting matches JavaScript."""
+        numbers = [0, 1, -1, 1.5, 100.0, 123.456, 1e21, 1e20, 1e-6, 1e-7, 0.1 + 0.2, 2 ** 53 + 1, -2.5e-9, 5e300]
+        completed = subprocess.run(
+            ["node", "-e", "console.log(JSON.stringify(JSON.parse(process.argv[1]).map(String)))", json.dumps(numbers)],
+            capture_output=True, text=True, check=True
+        )
+        assert [js_number(number) for number in numbers] == json.loads(completed.stdout)
+
+
+class TestContactNormalizer:
+    """Behaviour that holds without node."""
+
+    def test_aliases_and_normalization(self):
+        contact = normalize_contact({
+            "Email": " Jane@Example.COM ", "firstName": " Jane ", "phone_number": "(555) 123-4567",
+            "Status": "QUALIFIED", "tags": "vip, ,enterprise", "crm_id": "C-1",
+        })
+        assert contact["email"] == "jane@example.com"
+        assert contact["first_name"] == "Jane"
+        assert contact["phone"] == "+15551234567"
+        assert contact["status"] == "qualified"
+        assert contact["tags"] == ["vip", "enterprise"]
+        assert contact["custom_fields"] == {"crm_id": "C-1"}
+        assert "id" not in contact
+
+    def test_rejections_keep_batch_alignment(self):
+        """Rejected contacts leave None in place and are reported by index."""
+        normalized, errors = normalize_contacts([{"email": "a@b.co"}, None, {"email": "nope"}, {"email": "c@d.io"}])
+        assert [record is not None for record in normalized] == [True, False, False, True]
+        assert errors == [
+            {"index": 1, "error": "Contact data must be an object"},
+            {"index": 2, "error": "Invalid email format: nope"},
+        ]
+        with pytest.raises(ContactNormalizationError, match="Email is required"):
+            normalize_contact({"first_name": "x"})
+
+    def test_memoized_tags_are_not_shared(self):
+        """Contacts with the same tag string get independent tag lists."""
+        normalized, _ = normalize_contacts([{"email": "a@b.co", "tags": "x,y"}, {"email": "c@d.io", "tags": "x,y"}])
+        normalized[0]["tags"].append("z")
+        assert normalized[1]["tags"] == ["x", "y"]
+
+    @pytest.mark.parametrize("text, expected", [
+        ("2025-11-20", "2025-11-20T00:00:00.000Z"),
+        ("2025-02-30", "2025-03-02T00:00:00.000Z"),
+        ("2025-11-20T10:00:00+05:30", "2025-11-20T04:30:00.000Z"),
+        ("11/20/25 10:30", "2025-11-20T10:30:00.000Z"),
+        ("Thu, 20 Nov 2025 10:00:00 +0200", "2025-11-20T08:00:00.000Z"),
+        ("2025-13-01", None),
+        ("tomorrow", None),
+    ])
+    def test_date_formats(self, text, expected):
+        contact = normalize_contact({"email": "a@b.co", "created_at": text})
+        assert contact["created_at"] == expected
+        assert (parse_js_date(text) is None) == (expected is None)
+
+
+def test_cli_writes_normalized_and_rejects(repo_root, tmp_path):
+    """The CLI streams NDJSON, writing normalized contacts and rejects separately."""
+    source = tmp_path / "contacts.ndjson"
+    source.write_text('{"Email": "A@B.co"}\n{"email": "bad"}\n{oops\n')
+    output = tmp_path / "normalized.ndjson"
+    rejects = tmp_path / "rejects.ndjson"
+
+    subprocess.run(
+        [sys.executable, str(repo_root / "ops" / "scripts" / "contact_normalizer.py"), str(source),
+         "--output", str(output), "--rejects", str(rejects)],
+        check=True, capture_output=True, text=True
+    )
+
+    assert [json.loads(line)["email"] for line in output.read_text().splitlines()] == ["a@b.co"]
+    rejected = [json.loads(line) for line in rejects.read_text().splitlines()]
+    assert [(r["line"], r["error"].split(":")[0]) for r in rejected] == [(2, "Invalid email format"), (3, "Invalid JSON")]
@@ -0,0 +1,308 @@
+"""
+Tests for the pooled n8n API client and the concurrent workflow deploy,
+run against the local n8n API stub.
+"""
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import pytest
+from pathlib import Path
+
+from deploy_workflows import (
+    content_hash, deploy_body, deploy_workflows, iter_workflow_files, plan_deployment
+)
+from n8n_client import N8nApiError, N8nClient, RetryPolicy
+
+REPO_ROOT = Path(__file__).parent.parent
+DEPLOY_SCRIPT = REPO_ROOT / "ops" / "scripts" / "deploy_workflows.py"
+NO_DELAY = RetryPolicy(attempts=3, delay_ms=0)
+
+
+def write_workflow(directory: Path, name: str, workflow) -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{name}.json"
+    path.write_text(workflow if isinstance(workflow, str) else json.dumps(workflow))
+    return path
+
+
+def make_workflow(name: str, **extra):
+    return {"name": name, "nodes": [{"name": "Start", "type": "n8n-nodes-base.start"}], "connections": {}, **extra}
+
+
+def deploy(stub, workflow_files, concurrency=4, retry=NO_DELAY, **options):
+    async def run():
+        async with N8nClient(stub.base_url, stub.api_key, concurrency=concurrency, retry=retry,
+                             rng=random.Random(0)) as client:
+            return await deploy_workflows(client, workflow_files, **options)
+    return asyncio.run(run())
+
+
+class TestRetryPolicy:
+    """Test retry settings and backoff."""
+
+    @pytest.mark.parametrize("environment,attempts,delay_ms", [("dev", 3, 1000), ("prod", 5, 2000)])
+    def test_reads_environment_config(self, environment, attempts, delay_ms):
+        retry = RetryPolicy.for_environment(environment)
+        assert (retry.attempts, retry.delay_ms) == (attempts, delay_ms)
+
+    def test_missing_environment_uses_defaults(self):
+        assert RetryPolicy.for_environment("staging") == RetryPolicy()
+
+    def test_backoff_is_jittered_and_capped(self):
+        retry = RetryPolicy(attempts=10, delay_ms=100, max_delay_ms=1000)
+        rng = random.Random(1)
+        delays = [retry.delay(attempt, rng) for attempt in range(10) for _ in range(50)]
+        assert all(0 <= delay <= 1.0 for delay in delays)
+        assert len(set(delays)) == len(delays)
+        assert max(retry.delay(0, rng) for _ in range(50)) <= 0.1
+
+
+class TestN8nClient:
+    """Test the pooled client against the stub."""
+
+    def test_requests_reuse_pooled_connections(self, n8n_stub):
+        async def run():
+            async with N8nClient(n8n_stub.base_url, n8n_stub.api_key, concurrency=4, retry=NO_DELAY) as client:
+                await asyncio.gather(*(client.create_workflow(make_workflow(f"wf_{i}")) for i in range(60)))
+                return await client.list_workflows()
+
+        workflows = asyncio.run(run())
+        assert len(workflows) == 60
+        assert n8n_stub.connections <= 4
+
+    def test_list_follows_pagination(self, n8n_stub):
+        for index in range(600):
+            n8n_stub.add_workflow(make_workflow(f"wf_{index}"))
+
+        async def run():
+            async with N8nClient(n8n_stub.base_url, n8n_stub.api_key) as client:
+                return await client.list_workflows()
+
+        assert len(asyncio.run(run())) == 600
+        assert n8n_stub.requests.count(("GET", "/api/v1/workflows")) == 3
+
+    @pytest.mark.parametrize("status", [503, 429, None])
+    def test_transient_failures_are_retried(self, n8n_stub, status):
+        stored = n8n_stub.add_workflow(make_workflow("lead_intake"))
+        n8n_stub.fail_next(2, status=status)
+
+        async def run():
+            async with N8nClient(n8n_stub.base_url, n8n_stub.api_key, retry=NO_DELAY) as client:
+                updated = await client.update_workflow(stored["id"], make_workflow("lead_intake"))
+                return updated, client.retries
+
+        updated, retries = asyncio.run(run())
+        assert updated["name"] == "lead_intake"
+        assert retries == 2
+
+    def test_creates_are_retried_on_rate_limits(self, n8n_stub):
+        n8n_stub.fail_next(2, status=429, method="POST")
+
+        async def run():
+            async with N8nClient(n8n_stub.base_url, n8n_stub.api_key, retry=NO_DELAY) as client:
+                return await client.create_workflow(make_workflow("lead_intake"))
+
+        assert asyncio.run(run())["name"] == "lead_intake"
+        assert len(n8n_stub.workflows) == 1
+
+    @pytest.mark.parametrize("status", [503, None])
+    def test_creates_are_not_retried_once_sent(self, n8n_stub, status):
+        n8n_stub.fail_next(1, status=status, method="POST")
+
+        async def run():
+            async with N8nClient(n8n_stub.base_url, n8n_stub.api_key, retry=NO_DELAY) as client:
+                await client.create_workflow(make_workflow("lead_intake"))
+
+        with pytest.raises(N8nApiError):
+            asyncio.run(run())
+        assert n8n_stub.requests.count(("POST", "/api/v1/workflows")) == 1
+
+    def test_timed_out_create_is_not_duplicated(self, n8n_stub):
+        n8n_stub.delay_next(0.5, method="POST")
+
+        async def run():
+            async with N8nClient(n8n_stub.base_url, n8n_stub.api_key, retry=NO_DELAY, timeout=0.1) as client:
+                await client.create_workflow(make_workflow("lead_intake"))
+
+        with pytest.raises(N8nApiError, match="timed out"):
+            asyncio.run(run())
+        assert [workflow["name"] for workflow in n8n_stub.workflows.values()] == ["lead_intake"]
+        assert n8n_stub.requests.count(("POST", "/api/v1/workflows")) == 1
+
+    def test_refused_connections_are_retried_for_creates(self):
+        with socket.socket() as listener:
+            listener.bind(("127.0.0.1", 0))
+            closed_port = listener.getsockname()[1]
+
+        async def run():
+            async with N8nClient(f"http://127.0.0.1:{closed_port}", "key",
+                                 retry=RetryPolicy(attempts=2, delay_ms=0)) as client:
+                try:
+                    await client.create_workflow(make_workflow("lead_intake"))
+                finally:
+                    retries.append(client.retries)
+
+        retries = []
+        with pytest.raises(N8nApiError, match="RequestNotSentError"):
+            asyncio.run(run())
+        assert retries == [2]
+
+
+class TestContentHash:
+    """Test workflow canonicalization."""
+
+    def test_volatile_fields_do_not_change_the_hash(self):
+        local = {
+            "name": "lead_intake",
+            "nodes": [
+                {"id": "a1", "name": "Webhook", "type": "n8n-nodes-base.webhook", "position": [0, 0]},
+                {"id": "b2", "name": "Set", "type": "n8n-nodes-base.set", "position": [200, 0]},
+            ],
+            "connections": {"Webhook": {"main": [[{"node": "Set", "type": "main", "index": 0}]]}},
+            "settings": {},
+        }
+        remote = {
+            "id": "42", "active": True, "updatedAt": "2026-10-16T10:00:00Z",
+            "meta": {"instanceId": "35bad3ea"}, "staticData": {"lastPoll": 1}, "tags": [],
+            "name": "lead_intake",
+            "nodes": [
+                {"name": "Set", "type": "n8n-nodes-base.set", "position": [250, 40], "id": "zz"},
+                {"type": "n8n-nodes-base.webhook", "name": "Webhook", "position": [10, 0], "id": "yy"},
+            ],
+            "connections": {"Webhook": {"main": [[{"index": 0, "type": "main", "node": "Set"}]]}},
+        }
+        assert content_hash(local) == content_hash(remote)
+
+    @pytest.mark.parametrize("change", [
+        {"name": "lead_intake_v2"},
+        {"settings": {"timezone": "UTC"}},
+        {"connections": {}},
+        {"nodes": [{"name": "Webhook", "type": "n8n-nodes-base.webhook", "parameters": {"path": "leads"}}]},
+    ])
+    def test_content_changes_change_the_hash(self, change):
+        workflow = {"name": "lead_intake", "nodes": [{"name": "Webhook", "type": "n8n-nodes-base.webhook"}],
+                    "connections": {"Webhook": {"main": [[]]}}}
+        assert content_hash({**workflow, **change}) != content_hash(workflow)
+
+
+class TestDeployWorkflows:
+    """Test deployment planning and execution."""
+
+    def test_body_keeps_only_accepted_fields(self, tmp_path):
+        workflow = make_workflow("", id="abc", active=True, tags=[], pinData={}, meta={})
+        body = deploy_body(workflow, tmp_path / "daily_digest.json")
+        assert body == {"name": "daily_digest", "nodes": workflow["nodes"], "connections": {}, "settings": {}}
+
+    def test_iter_workflow_files_excludes_metadata_and_packs(self, tmp_path):
+        write_workflow(tmp_path / "domains" / "crm", "lead_intake", make_workflow("lead_intake"))
+        write_workflow(tmp_path / "metadata", "catalog", {})
+        write_workflow(tmp_path / "packs", "crm_pack", {})
+        assert [path.name for path in iter_workflow_files(tmp_path)] == ["lead_intake.json"]
+
+    def test_plan_skips_placeholders_and_handles_duplicates(self, tmp_path):
+        files = [
+            write_workflow(tmp_path / "a", "empty", ""),
+            write_workflow(tmp_path / "a", "stub", {"_metadata": {"owner": "crm"}}),
+            write_workflow(tmp_path / "a", "backup", make_workflow("backup")),
+            write_workflow(tmp_path / "b", "backup", make_workflow("backup")),
+            write_workflow(tmp_path / "a", "digest", make_workflow("digest")),
+            write_workflow(tmp_path / "b", "digest", make_workflow("digest", settings={"timezone": "UTC"})),
+            write_workflow(tmp_path / "a", "broken", "{not json"),
+            write_workflow(tmp_path / "a", "listed", {**make_workflow("listed"), "name": ["listed"]}),
+        ]
+        plan = {(Path(entry["file"]).parent.name, Path(entry["file"]).stem): entry
+                for entry in plan_deployment(files, [{"id": "7", "name": "backup"}])}
+        assert plan[("a", "empty")]["action"] == plan[("a", "stub")]["action"] == "skipped"
+        assert plan[("a", "backup")]["action"] == "update" and plan[("a", "backup")]["id"] == "7"
+        assert plan[("b", "backup")]["duplicate_of"] == plan[("a", "backup")]["file"]
+        assert plan[("a", "digest")]["action"] == "create"
+        assert plan[("b", "digest")]["action"] == "failed"
+        assert plan[("a", "broken")]["action"] == "failed"
+        assert plan[("a", "listed")]["action"] == "failed"
+        assert plan[("a", "listed")]["error"] == "'name' must be a string"
+
+    def test_deploy_creates_and_updates(self, n8n_stub, tmp_path):
+        existing = n8n_stub.add_workflow(make_workflow("lead_intake", nodes=[]))
+        files = [write_workflow(tmp_path, name, make_workflow(name)) for name in ("lead_intake", "lead_enrichment")]
+
+        report = deploy(n8n_stub, files)
+
+        assert report["summary"]["created"] == report["summary"]["updated"] == 1
+        assert report["summary"]["failed"] == 0
+        names = {workflow["name"]: workflow for workflow in n8n_stub.workflows.values()}
+        assert set(names) == {"lead_intake", "lead_enrichment"}
+        assert names["lead_intake"]["id"] == existing["id"]
+        assert names["lead_intake"]["nodes"] == make_workflow("lead_intake")["nodes"]
+
+    def test_unchanged_workflows_are_not_pushed(self, n8n_stub, tmp_path):
+        files = [write_workflow(tmp_path, f"wf_{index}", make_workflow(f"wf_{index}")) for index in range(20)]
+        deploy(n8n_stub, files)
+        n8n_stub.requests.clear()
+        report = deploy(n8n_stub, files)
+        assert report["summary"]["unchanged"] == 20
+        assert report["summary"]["updated"] == report["summary"]["created"] == 0
+        assert n8n_stub.requests == [("GET", "/api/v1/workflows")]
+
+    def test_only_changed_workflows_are_pushed(self, n8n_stub, tmp_path):
+        files = [write_workflow(tmp_path, f"wf_{index}", make_workflow(f"wf_{index}")) for index in range(5)]
+        deploy(n8n_stub, files)
+        write_workflow(tmp_path, "wf_3", make_workflow("wf_3", settings={"timezone": "UTC"}))
+        report = deploy(n8n_stub, files)
+        assert [entry["name"] for entry in report["workflows"] if entry["action"] == "updated"] == ["wf_3"]
+        assert report["summary"]["unchanged"] == 4
+
+    def test_force_pushes_unchanged_workflows(self, n8n_stub, tmp_path):
+        files = [write_workflow(tmp_path, "wf", make_workflow("wf"))]
+        deploy(n8n_stub, files)
+        assert deploy(n8n_stub, files, force=True)["summary"]["updated"] == 1
+
+    def test_stale_remote_workflows_are_reported(self, n8n_stub, tmp_path):
+        n8n_stub.add_workflow(make_workflow("retired_flow"))
+        files = [write_workflow(tmp_path, "wf", make_workflow("wf"))]
+        assert deploy(n8n_stub, files)["summary"]["stale"] == 0
+        report = deploy(n8n_stub, files, report_stale=True)
+        assert report["summary"]["stale"] == 1
+        assert report["summary"]["files"] == 1
+        assert {"file": None, "name": "retired_flow", "action": "stale", "id": "1"} in report["workflows"]
+        assert len(n8n_stub.workflows) == 2
+
+    def test_deploy_many_workflows_over_few_connections(self, n8n_stub, tmp_path):
+        files = [write_workflow(tmp_path, f"wf_{index}", make_workflow(f"wf_{index}")) for index in range(200)]
+        n8n_stub.fail_next(3, status=503)
+        report = deploy(n8n_stub, files, concurrency=8)
+        assert report["summary"]["created"] == 200
+        assert report["summary"]["retries"] == 3
+        assert report["summary"]["connections"] <= 8
+        assert n8n_stub.connections <= 8
+
+    def test_failed_workflows_are_reported(self, n8n_stub, tmp_path):
+        files = [write_workflow(tmp_path, "wf", make_workflow("wf"))]
+        n8n_stub.fail_next(5, status=500, method="POST")
+        report = deploy(n8n_stub, files, retry=RetryPolicy(attempts=1, delay_ms=0))
+        assert report["summary"]["failed"] == 1
+        assert "HTTP 500" in report["workflows"][0]["error"]
+
+    def test_dry_run_sends_no_writes(self, n8n_stub, tmp_path):
+        files = [write_workflow(tmp_path, "wf", make_workflow("wf"))]
+        report = deploy(n8n_stub, files, dry_run=True)
+        assert report["workflows"][0]["action"] == "create"
+        assert n8n_stub.requests == [("GET", "/api/v1/workflows")]
+
+
+def test_cli_deploys_and_writes_report(n8n_stub, tmp_path):
+    """The CLI deploys a workflows directory and exits 0."""
+    workflows_dir = tmp_path / "workflows"
+    write_workflow(workflows_dir / "domains" / "crm", "lead_intake", make_workflow("lead_intake"))
+    report_file = tmp_path / "deploy-report.json"
+    result = subprocess.run(
+        [sys.executable, str(DEPLOY_SCRIPT), "--environment", "dev", "--base-url", n8n_stub.base_url,
+         "--workflows-dir", str(workflows_dir), "--report", str(report_file)],
+        capture_output=True, text=True, env={**os.environ, "N8N_API_KEY": n8n_stub.api_key}
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert json.loads(report_file.read_text())["summary"]["created"] == 1
+    assert [workflow["name"] for workflow in n8n_stub.workflows.values()] == ["lead_intake"]
@@ -0,0 +1,115 @@
+"""
+Tests for the email domain risk classifier and its JavaScript counterpart.
+"""
+import json
+import shutil
+import subprocess
+import sys
+import pytest
+from pathlib import Path
+
+from email_domains import (
+    DOMAIN_LISTS_FILE, EMBED_BEGIN, EMBED_END, HIGH_RISK, LOW_RISK, DomainClassifier, load_domain_classifier,
+    load_domain_lists
+)
+
+REPO_ROOT = Path(__file__).parent.parent
+COMPUTE_RISK_SCORE_JS = REPO_ROOT / "shared" / "js_snippets" / "compute_risk_score.js"
+
+SAMPLE_DOMAINS = [
+    "mailinator.com", "MAILINATOR.COM", "inbox.mailinator.com", "a.b.temp-mail.org", "notmailinator.com",
+    "mailinator.com.example.org", "gmail.com", "GMail.com", "mail.gmail.com", "example.org", "localhost",
+    "", ".", "com", "throwaway.email.", "b..tempmail.com",
+]
+
+
+class TestDomainClassifier:
+    """Test suffix and exact matching."""
+
+    def test_high_risk_matches_domain_and_subdomains(self):
+        classifier = DomainClassifier(["mailinator.com"], ["gmail.com"])
+        assert classifier.classify("mailinator.com") == HIGH_RISK
+        assert classifier.classify("Inbox.Mailinator.COM") == HIGH_RISK
+        assert classifier.classify("notmailinator.com") is None
+        assert classifier.classify("mailinator.com.example.org") is None
+
+    def test_low_risk_matches_exactly(self):
+        classifier = DomainClassifier(["mailinator.com"], ["gmail.com"])
+        assert classifier.classify("GMAIL.com") == LOW_RISK
+        assert classifier.classify("mail.gmail.com") is None
+
+    def test_shared_lists_file(self):
+        """The shared lists file loads and covers the providers compute_risk_score.js used to hard-code."""
+        classifier = load_domain_classifier()
+        assert load_domain_classifier() is classifier
+        for domain in ["tempmail.com", "10minutemail.com", "guerrillamail.com", "mailinator.com",
+                       "throwaway.email", "temp-mail.org"]:
+            assert classifier.is_high_risk(domain)
+        for domain in ["gmail.com", "yahoo.com", "outlook.com", "hotmail.com", "icloud.com",
+                       "protonmail.com", "aol.com"]:
+            assert classifier.is_low_risk(domain)
+
+
+class TestEmbeddedLists:
+    """The copy of the lists compute_risk_score.js falls back to inside n8n."""
+
+    def test_embedded_lists_match_data_file(self):
+        source = COMPUTE_RISK_SCORE_JS.read_text(encoding='utf-8')
+        block = source[source.index(EMBED_BEGIN) + len(EMBED_BEGIN):source.index(EMBED_END)].strip()
+        assert block.startswith("const DEFAULT_DOMAIN_LISTS = ") and block.endswith(";")
+        assert json.loads(block[len("const DEFAULT_DOMAIN_LISTS = "):-1]) == load_domain_lists()
+
+    def test_check_detects_stale_snippet(self, tmp_path):
+        script = str(REPO_ROOT / "ops" / "scripts" / "email_domains.py")
+        snippet = tmp_path / "compute_risk_score.js"
+        snippet.write_text(COMPUTE_RISK_SCORE_JS.read_text(encoding='utf-8'))
+        lists = tmp_path / "lists.json"
+        lists.write_text(json.dumps({"high_risk": ["spam.example"], "low_risk": []}))
+
+        def run(*args):
+            return subprocess.run([sys.executable, script, "--snippet", str(snippet), "--lists", str(lists), *args],
+                                  capture_output=True, text=True)
+
+        assert run("--check").returncode == 1
+        assert run("--embed").returncode == 0
+        assert run("--check").returncode == 0
+        assert '"spam.example"' in snippet.read_text()
+
+
+# Loads the snippet in a context where require() fails, as in an n8n Code node
+LOAD_WITHOUT_REQUIRE = """
+const fs = require('fs');
+const vm = require('vm');
+const module = { exports: {} };
+vm.runInNewContext(fs.readFileSync(process.argv[1], 'utf8'), {
+  module, exports: module.exports, require() { throw new Error('require is not defined'); }
+});
+const { calculateEmailDomainRisk } = module.exports;
+"""
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+@pytest.mark.parametrize("loader", [
+    "const { calculateEmailDomainRisk } = require(process.argv[1]);",
+    LOAD_WITHOUT_REQUIRE,
+], ids=["lists_file", "embedded_fallback"])
+def test_javascript_classifier_agrees(loader):
+    """compute_risk_score.js classifies domains like the lists file, with or without require()."""
+    script = loader + """
+    const domains = JSON.parse(process.argv[2]);
+    console.log(JSON.stringify(domains.map(domain => calculateEmailDomainRisk('user@' + domain, 10))));
+    """
+    completed = subprocess.run(
+        ["node", "-e", script, str(COMPUTE_RISK_SCORE_JS), json.dumps(SAMPLE_DOMAINS)],
+        capture_output=True, text=True, check=True
+    )
+    classifier = load_domain_classifier(DOMAIN_LISTS_FILE)
+    expected = {HIGH_RISK: 10, LOW_RISK: 1}
+    for domain, js_risk in zip(SAMPLE_DOMAINS, json.loads(completed.stdout)):
+        if not domain:
+            continue
+        classification = classifier.classify(domain)
+        if classification is not None:
+            assert js_risk == expected[classification], domain
+        else:
+            assert js_risk in (3, 5), domain
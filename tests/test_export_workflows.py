@@ -0,0 +1,154 @@
+"""
+Tests for the paginated, concurrent workflow exporter, run against the
+local n8n API stub.
+"""
+import asyncio
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import pytest
+from pathlib import Path
+
+from export_workflows import CHECKPOINT_FILE, MANIFEST_FILE, canonical_json, export_workflows
+from n8n_client import N8nApiError, N8nClient, RetryPolicy
+
+REPO_ROOT = Path(__file__).parent.parent
+EXPORT_SCRIPT = REPO_ROOT / "ops" / "scripts" / "export_workflows.py"
+NO_RETRY = RetryPolicy(attempts=0, delay_ms=0)
+
+
+def add_workflows(stub, count):
+    for index in range(count):
+        stub.add_workflow({
+            "name": f"wf_{index}",
+            "nodes": [{"id": f"n{index}", "name": "Start", "type": "n8n-nodes-base.start", "position": [0, index]}],
+            "connections": {},
+            "settings": {},
+            "pinData": {"Start": [{"json": {"index": index}}]},
+            "updatedAt": "2026-10-16T10:00:00.000Z",
+        })
+
+
+def export(stub, output_dir, concurrency=4, page_size=10, retry=NO_RETRY, resume=False, client_hook=None):
+    async def run():
+        async with N8nClient(stub.base_url, stub.api_key, concurrency=concurrency, retry=retry) as client:
+            if client_hook:
+                client_hook(client)
+            return await export_workflows(client, output_dir, page_size, resume)
+    return asyncio.run(run())
+
+
+def fetch_counts(stub):
+    return {path: stub.requests.count(("GET", path)) for method, path in stub.requests
+            if method == "GET" and path != "/api/v1/workflows"}
+
+
+class TestExportWorkflows:
+    """Test exporting, checkpoints and resuming."""
+
+    def test_exports_every_page_in_canonical_form(self, n8n_stub, tmp_path):
+        add_workflows(n8n_stub, 45)
+        result = export(n8n_stub, tmp_path)
+
+        assert result["summary"]["exported"] == 45
+        assert result["summary"]["pages"] == 5
+        assert n8n_stub.requests.count(("GET", "/api/v1/workflows")) == 5
+        assert set(fetch_counts(n8n_stub).values()) == {1}
+        for workflow_id, workflow in n8n_stub.workflows.items():
+            data = (tmp_path / "workflows" / f"{workflow_id}.json").read_bytes()
+            assert data == canonical_json(workflow)
+            assert json.loads(data)["pinData"] == workflow["pinData"]
+        assert not (tmp_path / CHECKPOINT_FILE).exists()
+
+    def test_manifest_lists_files_and_hashes(self, n8n_stub, tmp_path):
+        add_workflows(n8n_stub, 12)
+        export(n8n_stub, tmp_path)
+        manifest = json.loads((tmp_path / MANIFEST_FILE).read_text())
+        assert manifest["count"] == 12
+        for entry in manifest["workflows"]:
+            data = (tmp_path / entry["file"]).read_bytes()
+            assert entry["sha256"] == hashlib.sha256(data).hexdigest()
+            assert entry["bytes"] == len(data)
+            assert entry["name"] == n8n_stub.workflows[entry["id"]]["name"]
+
+    def test_empty_instance(self, n8n_stub, tmp_path):
+        result = export(n8n_stub, tmp_path)
+        assert result["manifest"]["count"] == 0
+
+    def test_connections_are_pooled(self, n8n_stub, tmp_path):
+        add_workflows(n8n_stub, 100)
+        result = export(n8n_stub, tmp_path, concurrency=4, page_size=25)
+        assert result["summary"]["exported"] == 100
+        assert n8n_stub.connections <= 4
+
+    def test_failed_fetches_are_retried_on_resume(self, n8n_stub, tmp_path):
+        add_workflows(n8n_stub, 20)
+        n8n_stub.fail_next(1, status=500, path="/api/v1/workflows/7")
+        result = export(n8n_stub, tmp_path)
+
+        assert list(result["failed"]) == ["7"]
+        assert "manifest" not in result
+        assert (tmp_path / CHECKPOINT_FILE).exists()
+
+        n8n_stub.requests.clear()
+        result = export(n8n_stub, tmp_path, resume=True)
+        assert result["summary"]["exported"] == 20
+        assert n8n_stub.requests == [("GET", "/api/v1/workflows/7")]
+        assert (tmp_path / MANIFEST_FILE).exists()
+
+    def test_interrupted_listing_resumes_from_checkpoint(self, n8n_stub, tmp_path):
+        add_workflows(n8n_stub, 30)
+
+        def fail_second_page(client):
+            list_page = client.list_workflow_page
+
+            async def failing(cursor=None, *args, **kwargs):
+                if cursor == "10":
+                    raise N8nApiError("GET", "/workflows", 503, "unavailable")
+                return await list_page(cursor, *args, **kwargs)
+            client.list_workflow_page = failing
+
+        with pytest.raises(N8nApiError):
+            export(n8n_stub, tmp_path, client_hook=fail_second_page)
+        checkpoint = json.loads((tmp_path / CHECKPOINT_FILE).read_text())
+        assert checkpoint["cursor"] == "10"
+        assert len(checkpoint["exported"]) == 10
+
+        with pytest.raises(FileExistsError):
+            export(n8n_stub, tmp_path)
+
+        n8n_stub.requests.clear()
+        result = export(n8n_stub, tmp_path, resume=True)
+        assert result["manifest"]["count"] == 30
+        assert sum(fetch_counts(n8n_stub).values()) == 20
+
+    def test_workflows_deleted_during_export_are_not_failures(self, n8n_stub, tmp_path):
+        add_workflows(n8n_stub, 5)
+
+        def delete_after_listing(client):
+            list_page = client.list_workflow_page
+
+            async def listing(*args, **kwargs):
+                page = await list_page(*args, **kwargs)
+                n8n_stub.workflows.pop("3", None)
+                return page
+            client.list_workflow_page = listing
+
+        result = export(n8n_stub, tmp_path, client_hook=delete_after_listing)
+        assert result["summary"]["deleted"] == 1
+        assert result["manifest"]["count"] == 4
+
+
+def test_cli_exports_instance(n8n_stub, tmp_path):
+    """The CLI exports through the wrapper script and exits 0."""
+    add_workflows(n8n_stub, 3)
+    output = tmp_path / "export"
+    result = subprocess.run(
+        ["bash", str(REPO_ROOT / "ops" / "scripts" / "export_workflows.sh"),
+         "--base-url", n8n_stub.base_url, "--output", str(output)],
+        capture_output=True, text=True, env={**os.environ, "N8N_API_KEY": n8n_stub.api_key}
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert json.loads((output / MANIFEST_FILE).read_text())["count"] == 3
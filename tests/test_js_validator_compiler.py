@@ -0,0 +1,154 @@
+"""
+Tests for the precompiled JavaScript payload validator.
+
+The conformance tests run shared/js_snippets/validate_payload_compiled.js
+in the session node worker pool and compare its verdicts with jsonschema's
+Draft7Validator, asserting email and date-time the way validatePayload()
+does, on the schema payload fixtures and their mutations.
+"""
+import json
+import re
+import subprocess
+import sys
+import pytest
+from pathlib import Path
+from jsonschema import Draft7Validator, FormatChecker
+
+from contact_normalizer import parse_js_date
+from js_validator_compiler import OUTPUT_FILE, SchemaCompileError, compile_module, compile_schema, load_schemas
+from tests.test_schema_compiler import SCHEMA_TYPES, mutations, schema_type_of
+
+REPO_ROOT = Path(__file__).parent.parent
+
+# validatePayload()'s format checks: isValidEmail() and isValidDateTime()
+JS_FORMATS = FormatChecker(formats=())
+JS_FORMATS.checks("email")(lambda value: not isinstance(value, str)
+                           or re.fullmatch(r"[^\s@]+@[^\s@]+\.[^\s@]+", value) is not None)
+JS_FORMATS.checks("date-time")(lambda value: not isinstance(value, str)
+                               or ("T" in value and parse_js_date(value) is not None))
+
+
+@pytest.fixture(scope="module")
+def payload_fixtures():
+    """tests/mocks/schema_payloads.json."""
+    with open(REPO_ROOT / "tests" / "mocks" / "schema_payloads.json") as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="module")
+def draft7():
+    """Draft7Validators for shared/schemas with validatePayload()'s format checks."""
+    return {
+        schema_type: Draft7Validator(schema, format_checker=JS_FORMATS)
+        for schema_type, schema in load_schemas().items()
+    }
+
+
+def run_compiled(node_pool, calls):
+    """validatePayloadCompiled() results for [payload, schema_type] calls."""
+    return [result["value"] for result in node_pool.map("validatePayloadCompiled", calls)]
+
+
+class TestCompiledJsValidatorConformance:
+    """validatePayloadCompiled() verdicts must match the Draft 7 schemas."""
+
+    def test_generated_snippet_is_up_to_date(self):
+        """The checked-in snippet is what the compiler generates from shared/schemas."""
+        assert OUTPUT_FILE.read_text(encoding="utf-8") == compile_module(load_schemas())
+
+    def test_fixture_verdicts_match(self, node_pool, draft7, payload_fixtures):
+        """Every fixture against every schema."""
+        calls = [[payload, schema_type] for payload in payload_fixtures.values() for schema_type in SCHEMA_TYPES]
+        results = run_compiled(node_pool, calls)
+        for (payload, schema_type), result in zip(calls, results):
+            assert result["valid"] == draft7[schema_type].is_valid(payload), (schema_type, payload, result)
+
+    def test_valid_fixtures_pass(self, node_pool, payload_fixtures):
+        """valid_<type> fixtures pass their own schema, unlike with validatePayload()."""
+        calls = [[payload, schema_type_of(name)] for name, payload in payload_fixtures.items()
+                 if name.startswith("valid_")]
+        assert [result["errors"] for result in run_compiled(node_pool, calls)] == [[]] * len(calls)
+
+    def test_mutated_payload_verdicts_match(self, node_pool, draft7, payload_fixtures):
+        """Dropped keys, wrong types, extra keys and nested changes get the Draft 7 verdict."""
+        calls = [
+            [mutated, schema_type_of(name)]
+            for name, payload in payload_fixtures.items()
+            for mutated in mutations(payload)
+        ]
+        results = run_compiled(node_pool, calls)
+        mismatches = [
+            (schema_type, payload, result)
+            for (payload, schema_type), result in zip(calls, results)
+            if result["valid"] != draft7[schema_type].is_valid(payload)
+        ]
+        assert len(calls) > 500
+        assert not mismatches, mismatches[:3]
+
+    @pytest.mark.parametrize("first_name", ["😀" * 100, "😀" * 101, "a" * 99 + "😀", "a" * 100 + "😀"])
+    def test_string_lengths_count_code_points(self, node_pool, draft7, first_name):
+        """maxLength counts an astral-plane character once, as Draft 7 does, not as two UTF-16 units."""
+        payload = {"email": "a@b.co", "first_name": first_name}
+        result = node_pool.call("validatePayloadCompiled", payload, "contact")
+        assert result["valid"] == draft7["contact"].is_valid(payload) == (len(first_name) <= 100)
+
+
+class TestCompiledJsValidatorMessages:
+    """Error messages use validatePayload()'s wording."""
+
+    @pytest.mark.parametrize("payload, schema_type", [
+        ({"id": "not-a-uuid", "type": "contact.created", "source": "n8n", "env": "dev",
+          "timestamp": "2025-11-20T10:00:00Z", "payload": {}}, "event"),
+        ({"type": "contact.created"}, "event"),
+        ({"email": "not-an-email", "status": "archived"}, "contact"),
+        ({"email": "", "first_name": "x" * 101}, "contact"),
+        ({"email": "a@b.co", "status": "new", "bogus": 1}, "contact"),
+        (None, "contact"),
+        ({"email": "a@b.co"}, 5),
+        ({"email": "a@b.co"}, "lead"),
+    ])
+    def test_messages_match_validate_payload(self, node_pool, payload, schema_type):
+        [original] = node_pool.map("validatePayload", [[payload, schema_type]])
+        [compiled] = node_pool.map("validatePayloadCompiled", [[payload, schema_type]])
+        assert compiled == original
+
+    def test_nested_fields_are_named_by_path(self, node_pool, payload_fixtures):
+        deploy = json.loads(json.dumps(payload_fixtures["valid_infra_deploy"]))
+        deploy["post_deploy_checks"] = {"checks": [{"name": "smoke", "status": "passed"}, {"status": "ok"}]}
+        deploy["triggered_by"]["extra"] = True
+        result = node_pool.call("validatePayloadCompiled", deploy, "infra_deploy")
+        assert result["errors"] == [
+            "Unexpected field: triggered_by.extra",
+            "Missing required field: post_deploy_checks.checks[1].name",
+            "post_deploy_checks.checks[1].status: value must be one of: passed, failed, skipped",
+        ]
+
+
+class TestJsValidatorCompiler:
+    """Compiler behaviour that holds without node."""
+
+    def test_unsupported_schemas_are_rejected(self):
+        with pytest.raises(SchemaCompileError, match="unsupported keyword"):
+            compile_schema({"type": "object", "properties": {"a": {"oneOf": []}}}, "x")
+        with pytest.raises(SchemaCompileError, match="enum members"):
+            compile_schema({"type": "object", "properties": {"a": {"enum": [{"k": 1}]}}}, "x")
+        with pytest.raises(SchemaCompileError, match="top-level type"):
+            compile_schema({"type": "array"}, "x")
+
+    def test_constants_are_hoisted(self):
+        """Patterns and enum sets are built once at module level, not per call."""
+        source = compile_schema(load_schemas()["contact"], "contact")
+        body = source[source.index("function validateContact"):]
+        assert "new RegExp" not in body and "new Set" not in body
+        assert "CONTACT_PATTERN_" in body and "CONTACT_ENUM_" in body
+
+    def test_check_mode_reports_stale_output(self, tmp_path):
+        output = tmp_path / "validate_payload_compiled.js"
+        script = str(REPO_ROOT / "ops" / "scripts" / "js_validator_compiler.py")
+        subprocess.run([sys.executable, script, "--output", str(output)], check=True, capture_output=True)
+        fresh = subprocess.run([sys.executable, script, "--output", str(output), "--check"], capture_output=True)
+        output.write_text(output.read_text() + "// edited\n")
+        stale = subprocess.run([sys.executable, script, "--output", str(output), "--check"],
+                               capture_output=True, text=True)
+        assert fresh.returncode == 0
+        assert stale.returncode == 1 and "out of date" in stale.stderr
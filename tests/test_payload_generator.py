@@ -0,0 +1,110 @@
+"""
+Tests for the schema-driven payload generator used by the validation benchmarks.
+
+Generated payloads are checked with jsonschema's Draft7Validator, asserting
+email and date-time the way validatePayload() does.
+"""
+import json
+import random
+import re
+import subprocess
+import sys
+import pytest
+from collections import Counter
+from pathlib import Path
+from jsonschema import Draft7Validator
+
+BENCHMARKS_DIR = Path(__file__).parent.parent / "ops" / "benchmarks"
+if str(BENCHMARKS_DIR) not in sys.path:
+    sys.path.insert(0, str(BENCHMARKS_DIR))
+
+from payload_generator import ERROR_KEYWORDS, PayloadGenerator, sample_pattern  # noqa: E402
+from tests.test_js_validator_compiler import JS_FORMATS  # noqa: E402
+from tests.test_schema_compiler import SCHEMA_TYPES  # noqa: E402
+
+REPO_ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture(scope="module")
+def validators():
+    """Draft7Validators for shared/schemas with validatePayload()'s format checks."""
+    return {
+        schema_type: Draft7Validator(
+            json.loads((REPO_ROOT / "shared" / "schemas" / f"{schema_type}.schema.json").read_text()),
+            format_checker=JS_FORMATS
+        )
+        for schema_type in SCHEMA_TYPES
+    }
+
+
+class TestPayloadGenerator:
+    """Test valid and invalid payload generation."""
+
+    @pytest.mark.parametrize("schema_type", SCHEMA_TYPES)
+    def test_valid_payloads_validate(self, validators, schema_type):
+        generator = PayloadGenerator.for_schema_type(schema_type, seed=1)
+        for _ in range(300):
+            payload = generator.valid()
+            errors = [error.message for error in validators[schema_type].iter_errors(payload)]
+            assert not errors, (payload, errors)
+
+    @pytest.mark.parametrize("schema_type", SCHEMA_TYPES)
+    def test_invalid_payloads_fail_with_their_error_kind(self, validators, schema_type):
+        """Every invalid payload fails, and the validator reports the injected kind of error."""
+        generated = PayloadGenerator.for_schema_type(schema_type, seed=2).generate(1500, invalid_rate=1.0)
+        for item in generated:
+            keywords = ERROR_KEYWORDS[item.error_kind]
+            reported = {error.validator for error in validators[schema_type].iter_errors(item.payload)}
+            assert reported & ({keywords} if isinstance(keywords, str) else set(keywords)), item
+        assert {item.error_kind for item in generated} == set(PayloadGenerator.for_schema_type(schema_type).kinds)
+
+    def test_nested_errors_are_generated(self):
+        generated = PayloadGenerator.for_schema_type("infra_deploy", seed=3).generate(2000, invalid_rate=1.0)
+        paths = {item.error_path for item in generated}
+        assert any(re.fullmatch(r"post_deploy_checks\.checks\[\d+\]\.\w+", path) for path in paths)
+        assert "triggered_by.type" in paths
+
+    def test_error_mix_is_respected(self):
+        generated = PayloadGenerator.for_schema_type("contact", seed=4).generate(
+            4000, invalid_rate=0.5, mix={"enum": 3, "pattern": 1, "range": 0}
+        )
+        counts = Counter(item.error_kind for item in generated)
+        assert set(counts) == {None, "enum", "pattern"}
+        assert 1700 < counts[None] < 2300
+        assert 2.4 < counts["enum"] / counts["pattern"] < 3.8
+
+    def test_impossible_error_kinds_are_rejected(self):
+        generator = PayloadGenerator.for_schema_type("event")
+        assert "range" not in generator.kinds
+        with pytest.raises(ValueError, match="not possible"):
+            generator.invalid("range")
+
+    def test_generation_is_deterministic(self):
+        first = PayloadGenerator.for_schema_type("incident", seed=5).generate(200)
+        second = PayloadGenerator.for_schema_type("incident", seed=5).generate(200)
+        assert first == second
+
+    @pytest.mark.parametrize("pattern", [
+        "^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
+        "^\\+?[1-9]\\d{1,14}$",
+        "^[a-z0-9]+(\\.[a-z0-9]+)+$",
+        "^(dev|staging|prod)-\\w{3,}$",
+    ])
+    def test_pattern_samples_match(self, pattern):
+        rng = random.Random(6)
+        for _ in range(200):
+            assert re.search(pattern, sample_pattern(pattern, rng))
+
+
+def test_cli_writes_payloads_and_labels(tmp_path):
+    """The CLI writes NDJSON payloads and a label per line."""
+    output, labels = tmp_path / "events.ndjson", tmp_path / "labels.ndjson"
+    subprocess.run(
+        [sys.executable, str(BENCHMARKS_DIR / "payload_generator.py"), "event", "--count", "50",
+         "--invalid-rate", "0.5", "--mix", "enum", "--output", str(output), "--labels", str(labels)],
+        check=True, capture_output=True, text=True
+    )
+    payloads = [json.loads(line) for line in output.read_text().splitlines()]
+    label_rows = [json.loads(line) for line in labels.read_text().splitlines()]
+    assert len(payloads) == len(label_rows) == 50
+    assert {row["error_kind"] for row in label_rows} == {None, "enum"}
@@ -0,0 +1,70 @@
+"""
+Tests for the lazily built repository index behind the repo_index fixture.
+"""
+import json
+import pytest
+
+from tests.repo_index import RepoIndex
+
+
+@pytest.fixture
+def tmp_repo(tmp_path):
+    """A small repository tree with valid, empty and broken files."""
+    workflows = tmp_path / "workflows"
+    for directory in ("domains/crm", "metadata", "packs/starter"):
+        (workflows / directory).mkdir(parents=True)
+    (workflows / "domains" / "crm" / "lead_intake.json").write_text(json.dumps({"name": "Lead intake"}))
+    (workflows / "domains" / "crm" / "placeholder.json").write_text("")
+    (workflows / "domains" / "crm" / "broken.json").write_text("{not json")
+    (workflows / "metadata" / "catalog.json").write_text("{}")
+    (workflows / "packs" / "starter" / "pack.json").write_text("{}")
+
+    schemas = tmp_path / "shared" / "schemas"
+    schemas.mkdir(parents=True)
+    (schemas / "event.schema.json").write_text(json.dumps({"type": "object"}))
+    config = tmp_path / "shared" / "config"
+    config.mkdir(parents=True)
+    (config / "environments.dev.yaml").write_text("environment: dev\n")
+    (config / "environments.bad.yaml").write_text("environment: [dev\n")
+    return tmp_path
+
+
+class TestRepoIndex:
+    """Test file discovery, parsing and caching."""
+
+    def test_workflow_files_exclude_metadata_and_packs(self, tmp_repo):
+        index = RepoIndex(tmp_repo)
+        assert [path.name for path in index.workflow_files] == ["broken.json", "lead_intake.json", "placeholder.json"]
+
+    def test_parse_results(self, tmp_repo):
+        workflows = {parsed.path.name: parsed for parsed in RepoIndex(tmp_repo).workflows}
+        assert workflows["lead_intake.json"].data == {"name": "Lead intake"}
+        assert workflows["placeholder.json"].empty
+        assert workflows["broken.json"].error.startswith("JSONDecodeError")
+        assert not workflows["broken.json"].empty
+
+    def test_schema_and_config_accessors(self, tmp_repo):
+        index = RepoIndex(tmp_repo)
+        assert index.schema("event.schema.json") == {"type": "object"}
+        assert index.config("environments.dev.yaml") == {"environment": "dev"}
+        with pytest.raises(ValueError, match="environments.bad.yaml"):
+            index.config("environments.bad.yaml")
+
+    def test_files_are_parsed_once(self, tmp_repo):
+        """Later accesses return the same objects, even after the files change."""
+        index = RepoIndex(tmp_repo)
+        workflows, configs = index.workflows, index.configs
+        text = index.file_text(tmp_repo / "shared" / "config" / "environments.dev.yaml")
+        (tmp_repo / "shared" / "config" / "environments.dev.yaml").write_text("environment: prod\n")
+        assert index.workflows is workflows
+        assert index.configs is configs
+        assert index.config("environments.dev.yaml") == {"environment": "dev"}
+        assert index.file_text(tmp_repo / "shared" / "config" / "environments.dev.yaml") == text
+
+    def test_session_fixture_matches_repository(self, repo_index, workflows_dir):
+        """The repo_index fixture sees the same workflow files as a direct scan."""
+        scanned = sorted(
+            path for path in workflows_dir.rglob("*.json")
+            if "metadata" not in path.parts and "packs" not in path.parts
+        )
+        assert repo_index.workflow_files == scanned
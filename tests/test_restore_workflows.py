@@ -0,0 +1,182 @@
+"""
+Tests for restoring backup store snapshots into n8n, run against a local
+backup store and the n8n API stub.
+"""
+import asyncio
+import gzip
+import json
+import os
+import subprocess
+import sys
+import pytest
+from datetime import datetime, timezone
+from pathlib import Path
+
+from backup_store import BackupStore, LocalStorage, blob_key
+from n8n_client import N8nClient, RetryPolicy
+from restore_workflows import remap_references, restore_snapshot, select_workflow_files
+
+REPO_ROOT = Path(__file__).parent.parent
+RESTORE_SCRIPT = REPO_ROOT / "ops" / "scripts" / "restore_workflows.py"
+NO_RETRY = RetryPolicy(attempts=0, delay_ms=0)
+SNAPSHOT = "2026-10-16T02-00-00Z-daily"
+
+
+def workflow(name, calls=()):
+    nodes = [{"name": "Start", "type": "n8n-nodes-base.start", "parameters": {}}]
+    for index, target in enumerate(calls):
+        nodes.append({"name": f"Call {index}", "type": "n8n-nodes-base.executeWorkflow",
+                      "parameters": {"workflowId": target}})
+    return {"name": name, "nodes": nodes, "connections": {}, "settings": {}}
+
+
+def write_workflows(workflows_dir, workflows):
+    for relative_path, content in workflows.items():
+        path = workflows_dir / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(content))
+
+
+@pytest.fixture
+def store(tmp_path):
+    """A local store holding one snapshot of a small workflows tree."""
+    workflows_dir = tmp_path / "src" / "workflows"
+    write_workflows(workflows_dir, {
+        "shared/log_event.json": workflow("log_event"),
+        "crm/lead_intake.json": workflow("lead_intake", calls=["log_event"]),
+        "crm/lead_enrichment.json": workflow("lead_enrichment", calls=[{"__rl": True, "value": "lead_intake"}]),
+        "crm/placeholder.json": {"_metadata": {"status": "planned"}},
+        "metadata/workflows_catalog.json": {"catalog": {}},
+    })
+    backup_store = BackupStore(LocalStorage(tmp_path / "store"))
+    backup_store.snapshot([workflows_dir], "daily", now=datetime(2026, 10, 16, 2, 0, tzinfo=timezone.utc))
+    return backup_store
+
+
+def restore(stub, store, output_dir, dry_run=False, prefixes=("workflows/",)):
+    async def run():
+        async with N8nClient(stub.base_url, stub.api_key, concurrency=4, retry=NO_RETRY) as client:
+            return await restore_snapshot(client, store, SNAPSHOT, output_dir, list(prefixes), dry_run)
+    return asyncio.run(run())
+
+
+def by_name(stub):
+    return {workflow["name"]: workflow for workflow in stub.workflows.values()}
+
+
+def call_target(workflow, index=0):
+    return workflow["nodes"][index + 1]["parameters"]["workflowId"]
+
+
+class TestRestoreSnapshot:
+    """Test verified downloads and dependency-ordered imports."""
+
+    def test_restores_dependencies_first_and_links_new_ids(self, n8n_stub, store, tmp_path):
+        for index in range(5):
+            n8n_stub.add_workflow(workflow(f"unrelated_{index}"))
+        report = restore(n8n_stub, store, tmp_path / "restore")
+
+        summary = report["summary"]
+        assert summary["files"] == 4
+        assert summary["downloaded"] == 4
+        assert summary["created"] == 3
+        assert summary["skipped"] == 1
+        assert summary["dependency_depth"] == 3
+        restored = by_name(n8n_stub)
+        # Ids are assigned in creation order
+        assert int(restored["log_event"]["id"]) < int(restored["lead_intake"]["id"]) \
+            < int(restored["lead_enrichment"]["id"])
+        assert call_target(restored["lead_intake"]) == restored["log_event"]["id"]
+        assert call_target(restored["lead_enrichment"]) == {"__rl": True, "value": restored["lead_intake"]["id"]}
+        assert (tmp_path / "restore" / "workflows" / "crm" / "lead_intake.json").exists()
+
+    def test_rerun_changes_nothing(self, n8n_stub, store, tmp_path):
+        restore(n8n_stub, store, tmp_path / "restore")
+        requests_before = len(n8n_stub.requests)
+        report = restore(n8n_stub, store, tmp_path / "restore")
+
+        assert report["summary"]["unchanged"] == 3
+        assert report["summary"]["cached"] == 4
+        assert report["summary"]["downloaded"] == 0
+        assert n8n_stub.requests[requests_before:] == [("GET", "/api/v1/workflows")]
+
+    def test_corrupted_blob_is_not_imported_and_fails_dependents(self, n8n_stub, store, tmp_path):
+        digest = store.manifest(SNAPSHOT)["files"]["workflows/shared/log_event.json"]["sha256"]
+        store.storage.put(blob_key(digest), gzip.compress(b'{"name": "tampered"}'))
+        report = restore(n8n_stub, store, tmp_path / "restore")
+
+        assert report["summary"]["verification_failures"] == 1
+        assert report["summary"]["failed"] == 3
+        errors = {entry["file"]: entry.get("error", "") for entry in report["workflows"]}
+        assert "does not match the manifest" in errors["workflows/shared/log_event.json"]
+        assert "workflows/shared/log_event.json" in errors["workflows/crm/lead_intake.json"]
+        assert "workflows/crm/lead_intake.json" in errors["workflows/crm/lead_enrichment.json"]
+        assert not (tmp_path / "restore" / "workflows" / "shared" / "log_event.json").exists()
+        assert n8n_stub.workflows == {}
+
+    def test_unhashable_name_fails_only_that_workflow(self, n8n_stub, tmp_path):
+        workflows_dir = tmp_path / "src" / "workflows"
+        write_workflows(workflows_dir, {"log_event.json": workflow("log_event"),
+                                        "listed.json": {**workflow("listed"), "name": ["listed"]}})
+        backup_store = BackupStore(LocalStorage(tmp_path / "store"))
+        backup_store.snapshot([workflows_dir], "daily", now=datetime(2026, 10, 16, 2, 0, tzinfo=timezone.utc))
+        report = restore(n8n_stub, backup_store, tmp_path / "restore")
+
+        errors = {entry["file"]: entry.get("error") for entry in report["workflows"]}
+        assert errors["workflows/listed.json"] == "'name' must be a string"
+        assert report["summary"]["created"] == 1
+        assert set(by_name(n8n_stub)) == {"log_event"}
+
+    def test_dry_run_only_reports(self, n8n_stub, store, tmp_path):
+        n8n_stub.add_workflow(workflow("log_event"))
+        report = restore(n8n_stub, store, tmp_path / "restore", dry_run=True)
+
+        assert report["summary"]["planned"] == 2
+        assert report["summary"]["unchanged"] == 1
+        assert all(method == "GET" for method, _ in n8n_stub.requests)
+
+    def test_cycles_are_linked_on_rerun(self, n8n_stub, tmp_path):
+        workflows_dir = tmp_path / "src" / "workflows"
+        write_workflows(workflows_dir, {"ping.json": workflow("ping", ["pong"]), "pong.json": workflow("pong", ["ping"])})
+        backup_store = BackupStore(LocalStorage(tmp_path / "store"))
+        backup_store.snapshot([workflows_dir], "daily", now=datetime(2026, 10, 16, 2, 0, tzinfo=timezone.utc))
+
+        first = restore(n8n_stub, backup_store, tmp_path / "restore")
+        assert first["summary"]["cycles"] == [["workflows/ping.json", "workflows/pong.json"]]
+        assert first["summary"]["created"] == 2
+        restore(n8n_stub, backup_store, tmp_path / "restore")
+
+        restored = by_name(n8n_stub)
+        assert call_target(restored["ping"]) == restored["pong"]["id"]
+        assert call_target(restored["pong"]) == restored["ping"]["id"]
+        assert restore(n8n_stub, backup_store, tmp_path / "restore")["summary"]["unchanged"] == 2
+
+
+def test_select_workflow_files():
+    manifest = {"files": {
+        "workflows/crm/lead_intake.json": {}, "workflows/metadata/workflows_catalog.json": {},
+        "workflows/README.md": {}, "shared/config/environments.dev.yaml": {},
+        "n8n-export/workflows/12.json": {}, "n8n-export/manifest.json": {},
+    }}
+    assert list(select_workflow_files(manifest, ["workflows/"])) == ["workflows/crm/lead_intake.json"]
+    assert list(select_workflow_files(manifest, ["n8n-export/workflows/"])) == ["n8n-export/workflows/12.json"]
+
+
+def test_remap_references_leaves_unknown_targets():
+    remapped = remap_references(workflow("lead_intake", ["log_event", "external"]), {"log_event": "42"})
+    assert call_target(remapped, 0) == "42"
+    assert call_target(remapped, 1) == "external"
+
+
+def test_cli_restores_newest_snapshot(n8n_stub, store, tmp_path):
+    report_file = tmp_path / "restore-report.json"
+    result = subprocess.run(
+        [sys.executable, str(RESTORE_SCRIPT), "--store", str(store.storage.root), "--base-url", n8n_stub.base_url,
+         "--output", str(tmp_path / "restore"), "--report", str(report_file)],
+        capture_output=True, text=True, env={**os.environ, "N8N_API_KEY": n8n_stub.api_key}
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    summary = json.loads(report_file.read_text())["summary"]
+    assert summary["snapshot"] == SNAPSHOT
+    assert summary["created"] == 3
+    assert set(by_name(n8n_stub)) == {"log_event", "lead_intake", "lead_enrichment"}
@@ -0,0 +1,154 @@
+"""
+Tests for the bulk risk scorer.
+
+The parity tests score contacts with shared/js_snippets/compute_risk_score.js
+in the session node worker pool and require identical scores and rejections
+from Python.
+"""
+import json
+import random
+import subprocess
+import sys
+import pytest
+from pathlib import Path
+
+from contact_normalizer import normalize_contacts
+from risk_scorer import REJECTED, RiskScoreError, compute_risk_score, score_contacts
+
+REPO_ROOT = Path(__file__).parent.parent
+
+
+def run_node(node_pool, contacts, options=None):
+    """computeRiskScore() results from node, as {"value": ...} or {"error": ...} per contact."""
+    return node_pool.map("computeRiskScore", [[contact, options or {}] for contact in contacts])
+
+
+def run_python(contacts, options=None):
+    """score_contacts() results in the same shape as run_node."""
+    scores, errors = score_contacts(contacts, options)
+    messages = {error["index"]: error["error"] for error in errors}
+    return [
+        {"error": messages[index]} if index in messages else {"value": score}
+        for index, score in enumerate(scores.tolist())
+    ]
+
+
+def random_contacts(count, seed):
+    """Contacts covering every branch of every factor, with JS-falsy and non-string values."""
+    rng = random.Random(seed)
+    choices = {
+        "email": [None, "", 5, "user@gmail.com", "User@GMAIL.com", "a@corp.example.com", "a@b..com",
+                  "a@localhost", "no-at-sign", "x@y@z.com", "123@corp.com", "Test@corp.com",
+                  "mytemp@corp.com", "a@sub.mailinator.com", "a@TempMail.com", "spam@x.io", " a@b.co"],
+        "phone": [None, "", 0, "123", "+15551234567", "5555555555", "555-555-5555", "(555) 123-4567",
+                  5551234567, "   1234567  ", "１２３４５６７８９０", ["555", "123", "4567"]],
+        "company": [None, "", "   ", "Acme", " TEST ", "n/a", "NA", "Unknown Corp", 0, False],
+        "source": [None, "", 0, "website", " Referral ", "SPAM", "ads", 7, True, ["web"]],
+        "status": [None, "", "lost", " LOST ", "qualified", "new", 0, ["lost"]],
+        "first_name": [None, "", "Ann", 0, " "],
+        "last_name": [None, "", "Lee", False, []],
+    }
+    contacts = []
+    for _ in range(count):
+        contacts.append({field: rng.choice(values) for field, values in choices.items() if rng.random() < 0.85})
+    return contacts
+
+
+@pytest.fixture(scope="module")
+def shared_cases():
+    """tests/mocks/contact_normalization_cases.json, raw and normalized."""
+    with open(REPO_ROOT / "tests" / "mocks" / "contact_normalization_cases.json") as f:
+        raw = json.load(f)
+    normalized, _ = normalize_contacts(raw)
+    return raw + [record for record in normalized if record is not None]
+
+
+class TestParityWithComputeRiskScoreJs:
+    """score_contacts() must match computeRiskScore() exactly."""
+
+    def test_shared_cases(self, node_pool, shared_cases):
+        assert run_python(shared_cases) == run_node(node_pool, shared_cases)
+
+    def test_random_contacts(self, node_pool):
+        contacts = random_contacts(3000, seed=15)
+        expected = run_node(node_pool, contacts)
+        actual = run_python(contacts)
+        mismatches = [
+            (contact, actual[index], expected[index])
+            for index, contact in enumerate(contacts) if actual[index] != expected[index]
+        ]
+        assert not mismatches, mismatches[:3]
+        assert len({result.get("value") for result in expected}) > 20
+
+    @pytest.mark.parametrize("options", [
+        {"phoneWeight": 5},
+        {"emailDomainWeight": 0, "dataCompletenessWeight": 35},
+        {"companyWeight": 12.5, "statusWeight": 40},
+    ])
+    def test_weight_options(self, node_pool, options):
+        contacts = random_contacts(500, seed=len(json.dumps(options)))
+        assert run_python(contacts, options) == run_node(node_pool, contacts, options)
+
+
+class TestRiskScorer:
+    """Behaviour that holds without node."""
+
+    def test_low_and_high_risk_contacts(self):
+        good = {"email": "ann@gmail.com", "first_name": "Ann", "last_name": "Lee", "company": "Acme",
+                "phone": "+15551234567", "source": "referral", "status": "qualified"}
+        bad = {"email": "test@mailinator.com", "company": "fake", "phone": "111", "source": "spam", "status": "lost"}
+        assert compute_risk_score(good) == 2
+        assert compute_risk_score(bad) > 60
+        assert compute_risk_score({}) == 75  # 74.5 rounds up, as Math.round does
+
+    def test_rejections_keep_batch_alignment(self):
+        """Contacts the JS throws on are REJECTED in place and reported by index."""
+        scores, errors = score_contacts([{"email": "a@b.co"}, None, {"company": 42}, {}])
+        assert scores[[1, 2]].tolist() == [REJECTED, REJECTED]
+        assert scores[[0, 3]].min() >= 0
+        assert errors == [
+            {"index": 1, "error": "Contact data must be an object"},
+            {"index": 2, "error": "company.trim is not a function"},
+        ]
+        with pytest.raises(RiskScoreError):
+            compute_risk_score("not a contact")
+
+    def test_many_distinct_failing_values(self):
+        """Unhashable values are all distinct; each failing one is reported once, at its own index."""
+        contacts = [{"company": {"name": index}} if index % 2 else {"email": "a@b.co"} for index in range(2000)]
+        scores, errors = score_contacts(contacts)
+        assert [error["index"] for error in errors] == list(range(1, 2000, 2))
+        assert (scores[1::2] == REJECTED).all()
+        assert (scores[::2] >= 0).all()
+
+
+def test_cli_writes_scores_into_metadata(repo_root, tmp_path):
+    """The CLI adds metadata.risk_score to each contact, keeping existing metadata."""
+    source = tmp_path / "contacts.ndjson"
+    source.write_text('{"email": "ann@gmail.com", "metadata": {"enrichment_status": "completed"}}\n'
+                      '{"email": "x@y.io", "company": 1}\n')
+    output = tmp_path / "scored.ndjson"
+
+    result = subprocess.run(
+        [sys.executable, str(repo_root / "ops" / "scripts" / "risk_scorer.py"), str(source), "--output", str(output)],
+        check=True, capture_output=True, text=True
+    )
+
+    scored = [json.loads(line) for line in output.read_text().splitlines()]
+    assert len(scored) == 1
+    assert scored[0]["metadata"]["enrichment_status"] == "completed"
+    assert scored[0]["metadata"]["risk_score"] == compute_risk_score({"email": "ann@gmail.com"})
+    assert "company.trim is not a function" in result.stderr
+
+
+def test_cli_writes_array_contacts_unscored(repo_root):
+    """JSON arrays score like JS objects, but the CLI passes them through unchanged with a warning."""
+    result = subprocess.run(
+        [sys.executable, str(repo_root / "ops" / "scripts" / "risk_scorer.py"), "-"],
+        input='[1,2]\n{"email":"a@b.com"}\n', check=True, capture_output=True, text=True
+    )
+
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    assert lines[0] == [1, 2]
+    assert lines[1]["metadata"]["risk_score"] == compute_risk_score({"email": "a@b.com"})
+    assert "line 1: contact is not an object" in result.stderr
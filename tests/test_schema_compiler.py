@@ -0,0 +1,147 @@
+"""
+Tests for the ahead-of-time schema compiler.
+
+The conformance tests compare compiled verdicts with jsonschema's
+Draft7Validator on the schema payload fixtures, every fixture against every
+schema, and systematic mutations of each fixture.
+"""
+import copy
+import json
+import pytest
+from pathlib import Path
+from jsonschema import Draft7Validator
+
+from schema_compiler import SchemaCompileError, compile_schema, compiled_module_path, load_validator
+
+REPO_ROOT = Path(__file__).parent.parent
+SCHEMA_TYPES = ["event", "contact", "incident", "infra_deploy"]
+REPLACEMENT_VALUES = [None, True, 0, 7, -1, 101, 1.5, "", "x", "dev", "a" * 300, [], ["x"], [1], {}, {"k": "v"}]
+
+
+@pytest.fixture(scope="module")
+def schemas():
+    """Parsed shared/schemas keyed by schema type."""
+    return {
+        schema_type: json.loads((REPO_ROOT / "shared" / "schemas" / f"{schema_type}.schema.json").read_text())
+        for schema_type in SCHEMA_TYPES
+    }
+
+
+@pytest.fixture(scope="module")
+def compiled(tmp_path_factory):
+    """Compiled validators, cached in a temporary directory."""
+    cache_dir = tmp_path_factory.mktemp("schema_validators")
+    return {schema_type: load_validator(schema_type, cache_dir=cache_dir) for schema_type in SCHEMA_TYPES}
+
+
+@pytest.fixture(scope="module")
+def payload_fixtures():
+    """tests/mocks/schema_payloads.json."""
+    with open(REPO_ROOT / "tests" / "mocks" / "schema_payloads.json") as f:
+        return json.load(f)
+
+
+def mutations(payload):
+    """Yield variants of a payload: keys dropped, replaced with other types, extra keys, nested changes."""
+    yield payload
+    if not isinstance(payload, dict):
+        return
+    yield {**payload, "unexpected_field": "x"}
+    for key in payload:
+        yield {k: v for k, v in payload.items() if k != key}
+        for value in REPLACEMENT_VALUES:
+            yield {**payload, key: value}
+        if isinstance(payload[key], dict):
+            for nested in mutations(payload[key]):
+                yield {**payload, key: nested}
+        if isinstance(payload[key], list):
+            for value in REPLACEMENT_VALUES:
+                yield {**payload, key: payload[key] + [value]}
+
+
+def schema_type_of(fixture_name):
+    """Schema type a fixture is written for, from its name (e.g. invalid_event_bad_uuid -> event)."""
+    return next(t for t in sorted(SCHEMA_TYPES, key=len, reverse=True) if f"_{t}" in fixture_name)
+
+
+class TestCompiledValidatorConformance:
+    """Compiled validators must give the same verdicts as Draft7Validator."""
+
+    def test_fixture_verdicts_match(self, schemas, compiled, payload_fixtures):
+        """Every fixture gets the same verdict from both validators, against every schema."""
+        for schema_type in SCHEMA_TYPES:
+            reference = Draft7Validator(schemas[schema_type])
+            for name, payload in payload_fixtures.items():
+                expected = reference.is_valid(payload)
+                assert (compiled[schema_type](payload) == []) == expected, f"{name} against {schema_type}"
+
+    def test_fixtures_validate_against_their_own_schema(self, compiled, payload_fixtures):
+        """valid_* fixtures pass and invalid_* fixtures with asserted keywords fail."""
+        for name, payload in payload_fixtures.items():
+            errors = compiled[schema_type_of(name)](payload)
+            if name.startswith("valid_"):
+                assert errors == [], name
+        assert compiled["event"](payload_fixtures["invalid_event_missing_required"])
+        assert compiled["event"](payload_fixtures["invalid_event_bad_uuid"])
+
+    def test_mutated_payload_verdicts_match(self, schemas, compiled, payload_fixtures):
+        """Mutations of every fixture get the same verdict from both validators."""
+        checked = 0
+        for name, payload in payload_fixtures.items():
+            schema_type = schema_type_of(name)
+            reference = Draft7Validator(schemas[schema_type])
+            for variant in mutations(copy.deepcopy(payload)):
+                expected = reference.is_valid(variant)
+                assert (compiled[schema_type](variant) == []) == expected, f"{name}: {variant!r}"
+                checked += 1
+        assert checked > 500
+
+    @pytest.mark.parametrize("payload", [None, [], "event", 3, True])
+    def test_non_object_payloads(self, schemas, compiled, payload):
+        """Non-object payloads are rejected by every schema, like Draft7Validator does."""
+        for schema_type in SCHEMA_TYPES:
+            assert (compiled[schema_type](payload) == []) == Draft7Validator(schemas[schema_type]).is_valid(payload)
+
+
+class TestSchemaCompiler:
+    """Test code generation and the on-disk cache."""
+
+    def test_errors_name_the_failing_field(self, compiled, payload_fixtures):
+        """Error messages carry a JSON path to the offending value."""
+        errors = compiled["event"](payload_fixtures["invalid_event_bad_uuid"])
+        assert len(errors) == 1
+        assert errors[0].startswith("$.id: 'not-a-uuid' does not match")
+
+    def test_cache_is_keyed_by_schema_content(self, tmp_path):
+        """Changing a schema compiles a new module and removes the stale one."""
+        schemas_dir = tmp_path / "schemas"
+        cache_dir = tmp_path / "cache"
+        schemas_dir.mkdir()
+        schema_file = schemas_dir / "sample.schema.json"
+
+        schema_file.write_text(json.dumps({"type": "object", "required": ["a"]}))
+        first = load_validator("sample", schemas_dir, cache_dir)
+        first_path = compiled_module_path("sample", schema_file.read_bytes(), cache_dir)
+        assert first({"a": 1}) == [] and first({})
+        assert load_validator("sample", schemas_dir, cache_dir) is first
+
+        schema_file.write_text(json.dumps({"type": "object", "required": ["b"]}))
+        second = load_validator("sample", schemas_dir, cache_dir)
+        assert second({"b": 1}) == [] and second({"a": 1})
+        assert not first_path.exists()
+        assert [p.name for p in cache_dir.glob("sample_*.py")] == [
+            compiled_module_path("sample", schema_file.read_bytes(), cache_dir).name
+        ]
+
+    def test_unsupported_keywords_are_rejected(self):
+        """Schemas the compiler cannot translate fail loudly instead of validating loosely."""
+        with pytest.raises(SchemaCompileError, match="oneOf"):
+            compile_schema({"type": "object", "properties": {"a": {"oneOf": [{"type": "string"}]}}}, "sample")
+
+    def test_json_equality_in_enums(self, tmp_path):
+        """Booleans do not match numeric enum members, as in JSON Schema."""
+        namespace = {}
+        exec(compile_schema({"enum": [1, "a", [0]]}, "sample"), namespace)
+        validate = namespace["validate"]
+        assert validate(1) == [] and validate(1.0) == [] and validate([0]) == []
+        assert validate(True) and validate([False]) and validate("b")
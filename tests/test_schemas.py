@@ -1,48 +1,38 @@
 """
 Tests for JSON schema validation and structure.
 """
-import json
 import pytest
-from pathlib import Path
 from jsonschema import validate, Draft7Validator, SchemaError, ValidationError
 
 
 class TestSchemaValidation:
     """Test schema file validation and structure."""
     
-    def test_all_schemas_are_valid_json(self, schemas_dir):
+    def test_all_schemas_are_valid_json(self, repo_index):
         """Test that all schema files are valid JSON."""
-        schema_files = list(schemas_dir.glob("*.json"))
-        assert len(schema_files) > 0, "No schema files found"
+        assert len(repo_index.schemas) > 0, "No schema files found"
         
-        for schema_file in schema_files:
-            with open(schema_file, 'r') as f:
-                try:
-                    json.load(f)
-                except json.JSONDecodeError as e:
-                    pytest.fail(f"Invalid JSON in {schema_file}: {e}")
+        for parsed in repo_index.schemas.values():
+            if parsed.error or parsed.empty:
+                pytest.fail(f"Invalid JSON in {parsed.path}: {parsed.error or 'empty file'}")
     
-    def test_all_schemas_are_valid_json_schema(self, schemas_dir):
+    def test_all_schemas_are_valid_json_schema(self, repo_index):
         """Test that all schema files are valid JSON Schema Draft 7."""
-        schema_files = list(schemas_dir.glob("*.json"))
-        assert len(schema_files) > 0, "No schema files found"
+        assert len(repo_index.schemas) > 0, "No schema files found"
         
-        for schema_file in schema_files:
-            with open(schema_file, 'r') as f:
-                schema = json.load(f)
+        for schema_name in repo_index.schemas:
+            schema_file = repo_index.schemas[schema_name].path
+            schema = repo_index.schema(schema_name)
             
             try:
                 Draft7Validator.check_schema(schema)
             except SchemaError as e:
                 pytest.fail(f"Invalid JSON Schema in {schema_file}: {e}")
     
-    def test_event_schema_structure(self, schemas_dir):
+    def test_event_schema_structure(self, repo_index):
         """Test event schema has required structure."""
-        schema_file = schemas_dir / "event.schema.json"
-        assert schema_file.exists(), "event.schema.json not found"
-        
-        with open(schema_file, 'r') as f:
-            schema = json.load(f)
+        assert "event.schema.json" in repo_index.schemas, "event.schema.json not found"
+        schema = repo_index.schema("event.schema.json")
         
         assert schema.get("$schema") == "http://json-schema.org/draft-07/schema#"
         assert schema.get("type") == "object"
@@ -52,61 +42,48 @@ class TestSchemaValidation:
         assert "type" in schema["required"]
         assert "timestamp" in schema["required"]
     
-    def test_contact_schema_structure(self, schemas_dir):
+    def test_contact_schema_structure(self, repo_index):
         """Test contact schema has required structure."""
-        schema_file = schemas_dir / "contact.schema.json"
-        assert schema_file.exists(), "contact.schema.json not found"
-        
-        with open(schema_file, 'r') as f:
-            schema = json.load(f)
+        assert "contact.schema.json" in repo_index.schemas, "contact.schema.json not found"
+        schema = repo_index.schema("contact.schema.json")
         
         assert schema.get("type") == "object"
         assert "email" in schema["required"]
         assert "properties" in schema
         assert "email" in schema["properties"]
     
-    def test_incident_schema_structure(self, schemas_dir):
+    def test_incident_schema_structure(self, repo_index):
         """Test incident schema has required structure."""
-        schema_file = schemas_dir / "incident.schema.json"
-        assert schema_file.exists(), "incident.schema.json not found"
-        
-        with open(schema_file, 'r') as f:
-            schema = json.load(f)
+        assert "incident.schema.json" in repo_index.schemas, "incident.schema.json not found"
+        schema = repo_index.schema("incident.schema.json")
         
         assert schema.get("type") == "object"
         assert "id" in schema["required"]
         assert "severity" in schema["required"]
         assert "error" in schema["required"]
     
-    def test_infra_deploy_schema_structure(self, schemas_dir):
+    def test_infra_deploy_schema_structure(self, repo_index):
         """Test infra_deploy schema has required structure."""
-        schema_file = schemas_dir / "infra_deploy.schema.json"
-        assert schema_file.exists(), "infra_deploy.schema.json not found"
-        
-        with open(schema_file, 'r') as f:
-            schema = json.load(f)
+        assert "infra_deploy.schema.json" in repo_index.schemas, "infra_deploy.schema.json not found"
+        schema = repo_index.schema("infra_deploy.schema.json")
         
         assert schema.get("type") == "object"
         assert "id" in schema["required"]
         assert "deployment_type" in schema["required"]
         assert "status" in schema["required"]
     
-    def test_event_schema_validation_valid(self, schemas_dir, valid_event_payload):
+    def test_event_schema_validation_valid(self, repo_index, valid_event_payload):
         """Test event schema validates valid payload."""
-        schema_file = schemas_dir / "event.schema.json"
-        with open(schema_file, 'r') as f:
-            schema = json.load(f)
+        schema = repo_index.schema("event.schema.json")
         
         try:
             validate(instance=valid_event_payload, schema=schema)
         except ValidationError as e:
             pytest.fail(f"Valid payload failed validation: {e}")
     
-    def test_event_schema_validation_invalid(self, schemas_dir):
+    def test_event_schema_validation_invalid(self, repo_index):
         """Test event schema rejects invalid payload."""
-        schema_file = schemas_dir / "event.schema.json"
-        with open(schema_file, 'r') as f:
-            schema = json.load(f)
+        schema = repo_index.schema("event.schema.json")
         
         invalid_payload = {
             "id": "invalid-id",  # Not UUID format
@@ -117,22 +94,18 @@ class TestSchemaValidation:
         with pytest.raises(ValidationError):
             validate(instance=invalid_payload, schema=schema)
     
-    def test_contact_schema_validation_valid(self, schemas_dir, valid_contact_payload):
+    def test_contact_schema_validation_valid(self, repo_index, valid_contact_payload):
         """Test contact schema validates valid payload."""
-        schema_file = schemas_dir / "contact.schema.json"
-        with open(schema_file, 'r') as f:
-            schema = json.load(f)
+        schema = repo_index.schema("contact.schema.json")
         
         try:
             validate(instance=valid_contact_payload, schema=schema)
         except ValidationError as e:
             pytest.fail(f"Valid payload failed validation: {e}")
     
-    def test_contact_schema_validation_invalid_email(self, schemas_dir):
+    def test_contact_schema_validation_invalid_email(self, repo_index):
         """Test contact schema rejects invalid email."""
-        schema_file = schemas_dir / "contact.schema.json"
-        with open(schema_file, 'r') as f:
-            schema = json.load(f)
+        schema = repo_index.schema("contact.schema.json")
         
         invalid_payload = {
             "email": "not-an-email"  # Invalid email format
@@ -148,35 +121,29 @@ class TestSchemaValidation:
         # For now, we verify the schema defines email format validation
         assert "format" in schema["properties"]["email"]
     
-    def test_incident_schema_validation_valid(self, schemas_dir, valid_incident_payload):
+    def test_incident_schema_validation_valid(self, repo_index, valid_incident_payload):
         """Test incident schema validates valid payload."""
-        schema_file = schemas_dir / "incident.schema.json"
-        with open(schema_file, 'r') as f:
-            schema = json.load(f)
+        schema = repo_index.schema("incident.schema.json")
         
         try:
             validate(instance=valid_incident_payload, schema=schema)
         except ValidationError as e:
             pytest.fail(f"Valid payload failed validation: {e}")
     
-    def test_infra_deploy_schema_validation_valid(self, schemas_dir, valid_infra_deploy_payload):
+    def test_infra_deploy_schema_validation_valid(self, repo_index, valid_infra_deploy_payload):
         """Test infra_deploy schema validates valid payload."""
-        schema_file = schemas_dir / "infra_deploy.schema.json"
-        with open(schema_file, 'r') as f:
-            schema = json.load(f)
+        schema = repo_index.schema("infra_deploy.schema.json")
         
         try:
             validate(instance=valid_infra_deploy_payload, schema=schema)
         except ValidationError as e:
             pytest.fail(f"Valid payload failed validation: {e}")
     
-    def test_schema_versioning_structure(self, schemas_dir):
+    def test_schema_versioning_structure(self, repo_index):
         """Test that schemas have versioning structure."""
-        schema_files = list(schemas_dir.glob("*.json"))
-        
-        for schema_file in schema_files:
-            with open(schema_file, 'r') as f:
-                schema = json.load(f)
+        for schema_name in repo_index.schemas:
+            schema_file = repo_index.schemas[schema_name].path
+            schema = repo_index.schema(schema_name)
             
             # Check for $id with version
             assert "$id" in schema, f"{schema_file} missing $id"
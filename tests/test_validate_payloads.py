@@ -0,0 +1,120 @@
+"""
+Tests for bulk NDJSON payload validation.
+"""
+import gzip
+import io
+import json
+import subprocess
+import sys
+import pytest
+from pathlib import Path
+
+from validate_payloads import error_kind, iter_chunks, validate_stream
+
+
+REPO_ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture(scope="module")
+def payloads():
+    """tests/mocks/schema_payloads.json."""
+    with open(REPO_ROOT / "tests" / "mocks" / "schema_payloads.json") as f:
+        return json.load(f)
+
+
+def ndjson(records):
+    """Encode records (str entries are written verbatim) as NDJSON bytes."""
+    return "".join((r if isinstance(r, str) else json.dumps(r)) + "\n" for r in records).encode()
+
+
+class TestValidateStream:
+    """Test streaming validation and its summary."""
+
+    def test_counts_failures_and_histogram(self, payloads, tmp_path):
+        """Invalid records and unparseable lines are written to the failures file with line numbers."""
+        lines = [
+            payloads["valid_event"],
+            payloads["invalid_event_bad_uuid"],
+            "",
+            "{not json",
+            payloads["valid_event"],
+        ]
+        failures = io.StringIO()
+        summary = validate_stream(io.BytesIO(ndjson(lines)), "event", failures, cache_dir=tmp_path)
+
+        assert summary["records"] == 4
+        assert summary["valid"] == 2
+        assert summary["invalid"] == 2
+        assert summary["error_histogram"] == {"$.id: pattern": 1, "$: invalid JSON": 1}
+
+        written = [json.loads(line) for line in failures.getvalue().splitlines()]
+        assert [failure["line"] for failure in written] == [2, 4]
+        assert written[1]["record"] == "{not json"
+
+    def test_parallel_matches_serial(self, payloads, tmp_path):
+        """The process pool gives the same failures, in input order, as validating in-process."""
+        records = []
+        for index in range(500):
+            record = dict(payloads["valid_event"])
+            if index % 7 == 0:
+                record["env"] = "qa"
+            if index % 11 == 0:
+                del record["timestamp"]
+            records.append(record)
+        data = ndjson(records)
+
+        serial_out, parallel_out = io.StringIO(), io.StringIO()
+        serial = validate_stream(io.BytesIO(data), "event", serial_out, jobs=1, chunk_size=16, cache_dir=tmp_path)
+        parallel = validate_stream(io.BytesIO(data), "event", parallel_out, jobs=3, chunk_size=16, cache_dir=tmp_path)
+
+        assert serial_out.getvalue() == parallel_out.getvalue()
+        assert serial["error_histogram"] == parallel["error_histogram"]
+        assert parallel["invalid"] == len([i for i in range(500) if i % 7 == 0 or i % 11 == 0])
+        assert parallel["error_histogram"]["$: missing required property 'timestamp'"] == 46
+
+    def test_chunks_are_read_lazily(self):
+        """Chunks are produced on demand, never by reading the whole stream."""
+        consumed = []
+
+        def lines():
+            for index in range(10):
+                consumed.append(index)
+                yield b"{}\n"
+
+        chunks = iter_chunks(lines(), chunk_size=3)
+        assert next(chunks) == [(1, b"{}\n"), (2, b"{}\n"), (3, b"{}\n")]
+        assert len(consumed) == 3
+
+
+class TestErrorKind:
+    """Test histogram keys."""
+
+    @pytest.mark.parametrize("message, expected", [
+        ("$.id: 'abc' does not match '^[0-9a-f]+$'", "$.id: pattern"),
+        ("$.env: 'qa' is not one of ['dev', 'staging', 'prod']", "$.env: enum"),
+        ("$.meta.tags[3]: expected type string, got 5", "$.meta.tags[]: expected type string"),
+        ("$: missing required property 'id'", "$: missing required property 'id'"),
+        ("$: unexpected property 'extra'", "$: unexpected property"),
+        ("$.score: 101 violates maximum 100", "$.score: maximum"),
+    ])
+    def test_values_are_dropped(self, message, expected):
+        assert error_kind(message) == expected
+
+
+def test_cli_reads_gzip_and_fails_on_invalid(repo_root, payloads, tmp_path):
+    """The CLI validates .gz dumps, writes failures and the report, and exits non-zero on failures."""
+    dump = tmp_path / "contacts.ndjson.gz"
+    with gzip.open(dump, "wb") as f:
+        f.write(ndjson([payloads["valid_contact"], {**payloads["valid_contact"], "status": "unknown"}]))
+    failures = tmp_path / "failures.ndjson"
+    report = tmp_path / "report.json"
+
+    result = subprocess.run(
+        [sys.executable, str(repo_root / "ops" / "scripts" / "validate_payloads.py"), "contact", str(dump),
+         "--failures", str(failures), "--report", str(report), "--jobs", "2", "--chunk-size", "1"],
+        capture_output=True, text=True
+    )
+
+    assert result.returncode == 1, result.stderr
+    assert json.loads(report.read_text())["invalid"] == 1
+    assert [json.loads(line)["line"] for line in failures.read_text().splitlines()] == [2]
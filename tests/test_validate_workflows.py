@@ -0,0 +1,211 @@
+"""
+Tests for the parallel workflow validation engine.
+"""
+import json
+import subprocess
+import sys
+import pytest
+
+import validate_workflows as validator
+from validate_workflows import iter_workflow_files, validate_workflow_file, validate_workflows
+
+SCHEMA_TYPES = ["contact", "event", "incident", "infra_deploy"]
+
+
+def write(workflows_dir, rel, content):
+    """Write a workflow file (dicts are JSON-encoded) and return its path."""
+    path = workflows_dir / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content if isinstance(content, str) else json.dumps(content))
+    return path
+
+
+def checks(result):
+    """Names of the checks that reported errors for a file."""
+    return [error["check"] for error in result["errors"]]
+
+
+VALID_WORKFLOW = {
+    "name": "Lead Intake",
+    "nodes": [
+        {"name": "Webhook", "type": "n8n-nodes-base.webhook", "parameters": {"path": "lead-intake"}},
+        {"name": "Validate", "type": "n8n-nodes-base.code",
+         "parameters": {"jsCode": "return validatePayload($json, 'contact');"}},
+    ],
+    "connections": {"Webhook": {"main": [[{"node": "Validate", "type": "main", "index": 0}]]}},
+}
+
+
+class TestWorkflowChecks:
+    """Test the individual checks on single files."""
+
+    def test_valid_workflow(self, tmp_path):
+        """A well-formed workflow in a domain directory has no findings."""
+        path = write(tmp_path, "domains/crm/lead_intake.json", VALID_WORKFLOW)
+        result = validate_workflow_file(path, tmp_path, SCHEMA_TYPES)
+        assert result == {"file": "domains/crm/lead_intake.json", "status": "valid", "errors": [], "warnings": []}
+
+    @pytest.mark.parametrize("content", ["", "  \n", '{"_metadata": {"purpose": "stub"}}'])
+    def test_placeholders_are_skipped(self, tmp_path, content):
+        """Empty files and _metadata-only stubs are placeholders, even outside domain dirs."""
+        path = write(tmp_path, "meta/workflow_health_check.json", content)
+        assert validate_workflow_file(path, tmp_path, SCHEMA_TYPES)["status"] == "placeholder"
+
+    def test_invalid_json(self, tmp_path):
+        """Syntax errors are reported with the json_syntax check."""
+        path = write(tmp_path, "domains/crm/broken.json", '{"name": "x",')
+        result = validate_workflow_file(path, tmp_path, SCHEMA_TYPES)
+        assert result["status"] == "invalid"
+        assert checks(result) == ["json_syntax"]
+
+    def test_structure_errors(self, tmp_path):
+        """Missing types, duplicate names and dangling connections are structure errors."""
+        workflow = {
+            "nodes": [{"name": "A", "type": "n8n-nodes-base.code"}, {"name": "A"}],
+            "connections": {"A": {"main": [[{"node": "Missing"}]]}, "Ghost": {}},
+        }
+        path = write(tmp_path, "domains/shared/log_event.json", workflow)
+        messages = [error["message"] for error in validate_workflow_file(path, tmp_path, SCHEMA_TYPES)["errors"]]
+        assert messages == [
+            "Node 1 is missing a 'type'",
+            "Duplicate node name: A",
+            "Connection from A to unknown node: Missing",
+            "Connection from unknown node: Ghost",
+        ]
+
+    @pytest.mark.parametrize("workflow, message", [
+        ({"nodes": [{"name": "a", "type": "x"}], "connections": {"a": {"main": 5}}},
+         "Connections of a (main) must be a list"),
+        ({"nodes": [{"name": "a", "type": "x"}], "connections": {"a": {"main": [7]}}},
+         "Connection branch of a (main) must be a list"),
+        ({"nodes": [{"name": "a", "type": "x"}], "connections": {"a": {"main": [["b"]]}}},
+         "Connection target of a (main) must be an object"),
+        ({"nodes": [{"name": "a", "type": "x"}], "connections": {"a": {"main": [[{"node": ["b"]}]]}}},
+         "Connection target of a (main) must name a node"),
+        ({"nodes": [{"name": "a", "type": "x"}], "connections": {"a": []}}, "Connections of a must be an object"),
+        ({"nodes": [{"name": ["a"], "type": "x"}], "connections": {}}, "Node 0 'name' must be a string"),
+    ])
+    def test_malformed_structure_is_reported(self, tmp_path, workflow, message):
+        """Malformed connections and node names are structure errors, not crashes."""
+        path = write(tmp_path, "domains/shared/log_event.json", workflow)
+        result = validate_workflow_file(path, tmp_path, SCHEMA_TYPES)
+        assert result["status"] == "invalid"
+        assert message in [error["message"] for error in result["errors"]]
+
+    def test_unknown_schema_reference(self, tmp_path):
+        """validatePayload calls and .schema.json references must name existing schemas."""
+        workflow = json.loads(json.dumps(VALID_WORKFLOW))
+        workflow["nodes"][1]["parameters"]["jsCode"] = (
+            "validatePayload($json, \"invoice\"); // see shared/schemas/order.schema.json"
+        )
+        path = write(tmp_path, "domains/crm/lead_intake.json", workflow)
+        result = validate_workflow_file(path, tmp_path, SCHEMA_TYPES)
+        assert [error["message"] for error in result["errors"]] == [
+            "Unknown schema reference: invoice",
+            "Unknown schema reference: order",
+        ]
+
+    def test_location_and_naming(self, tmp_path):
+        """Files outside approved directories fail; non-snake_case names only warn."""
+        path = write(tmp_path, "active-workflows/Lead-Intake.json", VALID_WORKFLOW)
+        result = validate_workflow_file(path, tmp_path, SCHEMA_TYPES)
+        assert checks(result) == ["location"]
+        assert [warning["check"] for warning in result["warnings"]] == ["naming"]
+
+    def test_file_outside_workflows_dir(self, tmp_path):
+        """A file outside the workflows dir is reported as a location error, not a crash."""
+        path = write(tmp_path, "elsewhere/lead_intake.json", VALID_WORKFLOW)
+        result = validate_workflow_file(path, tmp_path / "workflows", SCHEMA_TYPES)
+        assert result["file"] == path.as_posix()
+        assert result["status"] == "invalid"
+        assert checks(result) == ["location"]
+        assert "not under the workflows dir" in result["errors"][0]["message"]
+
+
+class TestValidationReport:
+    """Test the aggregated report and CLI."""
+
+    def test_parallel_report_matches_serial(self, tmp_path):
+        """The process pool produces the same per-file results, in file order."""
+        for index in range(10):
+            write(tmp_path, f"domains/crm/lead_{index}.json", VALID_WORKFLOW)
+        write(tmp_path, "domains/crm/broken.json", "{")
+        write(tmp_path, "metadata/workflows_catalog.json", "{}")
+        files = iter_workflow_files(tmp_path)
+
+        serial = validate_workflows(files, tmp_path, SCHEMA_TYPES, jobs=1)
+        parallel = validate_workflows(files, tmp_path, SCHEMA_TYPES, jobs=3)
+
+        assert len(files) == 11
+        assert serial["files"] == parallel["files"]
+        assert parallel["summary"]["invalid"] == 1
+        assert parallel["summary"]["valid"] == 10
+
+    def test_unexpected_failure_marks_file_invalid(self, tmp_path, monkeypatch):
+        """An exception while checking one file becomes an invalid entry; the other files are still checked."""
+        write(tmp_path, "domains/crm/lead_intake.json", VALID_WORKFLOW)
+        write(tmp_path, "domains/crm/lead_scoring.json", {**VALID_WORKFLOW, "name": "Lead Scoring"})
+        original = validator.check_structure
+
+        def check_structure(workflow):
+            if workflow.get("name") == "Lead Scoring":
+                raise RuntimeError("boom")
+            return original(workflow)
+
+        monkeypatch.setattr(validator, "check_structure", check_structure)
+
+        report = validate_workflows(iter_workflow_files(tmp_path), tmp_path, SCHEMA_TYPES, jobs=1)
+        assert [entry["status"] for entry in report["files"]] == ["valid", "invalid"]
+        assert report["files"][1]["errors"] == [
+            {"check": "internal", "message": "Validation failed: RuntimeError: boom"}
+        ]
+
+    def test_cli_writes_report_and_fails_on_errors(self, repo_root, tmp_path):
+        """The CLI exits non-zero on errors and writes the JSON report."""
+        write(tmp_path, "domains/crm/lead_intake.json", VALID_WORKFLOW)
+        write(tmp_path, "domains/crm/broken.json", "[")
+        report_path = tmp_path / "report.json"
+
+        result = subprocess.run(
+            [sys.executable, str(repo_root / "ops" / "scripts" / "validate_workflows.py"),
+             "--workflows-dir", str(tmp_path), "--report", str(report_path), "--jobs", "2"],
+            capture_output=True, text=True
+        )
+
+        assert result.returncode == 1
+        report = json.loads(report_path.read_text())
+        assert report["summary"]["files"] == 2
+        assert [entry["status"] for entry in report["files"]] == ["invalid", "valid"]
+
+    def test_cli_reports_malformed_connections(self, repo_root, tmp_path):
+        """Malformed connections fail the run with a report instead of a traceback."""
+        write(tmp_path, "domains/crm/lead_intake.json", VALID_WORKFLOW)
+        write(tmp_path, "domains/crm/broken.json", {"nodes": [{"name": "a", "type": "x"}],
+                                                     "connections": {"a": {"main": 5}}})
+        report_path = tmp_path / "report.json"
+
+        result = subprocess.run(
+            [sys.executable, str(repo_root / "ops" / "scripts" / "validate_workflows.py"),
+             "--workflows-dir", str(tmp_path), "--report", str(report_path), "--jobs", "2"],
+            capture_output=True, text=True
+        )
+
+        assert result.returncode == 1
+        assert "Traceback" not in result.stderr
+        assert json.loads(report_path.read_text())["summary"]["invalid"] == 1
+
+    def test_cli_reports_files_outside_workflows_dir(self, repo_root, tmp_path):
+        """Paths outside --workflows-dir are reported as invalid instead of crashing the run."""
+        workflows_dir = tmp_path / "workflows"
+        inside = write(workflows_dir, "domains/crm/lead_intake.json", VALID_WORKFLOW)
+        outside = write(tmp_path, "x.json", VALID_WORKFLOW)
+
+        result = subprocess.run(
+            [sys.executable, str(repo_root / "ops" / "scripts" / "validate_workflows.py"),
+             "--workflows-dir", str(workflows_dir), "--jobs", "1", str(inside), str(outside)],
+            capture_output=True, text=True
+        )
+
+        assert result.returncode == 1
+        assert "Traceback" not in result.stderr
+        assert f"{outside.as_posix()} [location]" in result.stdout
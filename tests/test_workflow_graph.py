@@ -0,0 +1,113 @@
+"""
+Tests for the workflow dependency graph.
+"""
+import subprocess
+import sys
+import pytest
+
+from workflow_graph import WorkflowGraph
+
+
+def catalog_with(dependencies):
+    """Wrap an id -> dependencies mapping in the catalog structure."""
+    return {
+        "catalog": {
+            "workflows": [
+                {"id": workflow_id, "dependencies": deps}
+                for workflow_id, deps in dependencies.items()
+            ]
+        }
+    }
+
+
+class TestWorkflowGraph:
+    """Test ordering, cycle detection and transitive closure."""
+
+    def test_topological_order_puts_dependencies_first(self):
+        """Every workflow appears after all of its dependencies."""
+        graph = WorkflowGraph({
+            "lead_intake": ["normalize_contact", "log_event"],
+            "normalize_contact": ["log_event"],
+            "error_central_handler": ["log_event", "notify_slack"],
+            "log_event": [],
+            "notify_slack": ["log_event"],
+        })
+        order = graph.topological_order()
+        assert sorted(order) == graph.nodes
+        position = {workflow_id: i for i, workflow_id in enumerate(order)}
+        assert position["log_event"] < position["notify_slack"] < position["error_central_handler"]
+        assert position["normalize_contact"] < position["lead_intake"]
+        assert not graph.has_cycles()
+
+    def test_transitive_dependencies_and_dependents(self):
+        """Closures follow chains of dependencies in both directions."""
+        graph = WorkflowGraph({
+            "a": ["b"],
+            "b": ["c"],
+            "c": [],
+            "d": ["c"],
+        })
+        assert graph.dependencies("a") == ["b", "c"]
+        assert graph.dependencies("c") == []
+        assert graph.dependents("c") == ["a", "b", "d"]
+        assert graph.dependents("a") == []
+
+    def test_cycles_are_detected_and_grouped(self):
+        """Cycles are reported once and their members depend on each other."""
+        graph = WorkflowGraph({
+            "a": ["b"],
+            "b": ["c"],
+            "c": ["a", "d"],
+            "d": [],
+            "self_caller": ["self_caller"],
+        })
+        assert graph.cycles() == [["a", "b", "c"], ["self_caller"]]
+        assert graph.dependencies("a") == ["a", "b", "c", "d"]
+        assert graph.dependents("d") == ["a", "b", "c"]
+        order = graph.topological_order()
+        assert order.index("d") < order.index("a")
+
+    def test_from_catalog_tracks_missing_dependencies(self):
+        """Dependencies without a catalog entry become nodes listed in missing."""
+        graph = WorkflowGraph.from_catalog(catalog_with({
+            "lead_intake": ["log_event", "retired_workflow"],
+            "log_event": [],
+        }))
+        assert graph.missing == {"retired_workflow"}
+        assert graph.dependents("retired_workflow") == ["lead_intake"]
+
+    def test_unknown_workflow_raises(self):
+        """Querying an ID that is not in the graph raises KeyError."""
+        graph = WorkflowGraph({"a": []})
+        with pytest.raises(KeyError):
+            graph.dependents("missing")
+
+    def test_deep_chain_does_not_recurse(self):
+        """Long dependency chains are handled without hitting the recursion limit."""
+        length = sys.getrecursionlimit() * 2
+        graph = WorkflowGraph({f"wf{i:05d}": [f"wf{i + 1:05d}"] for i in range(length)})
+        order = graph.topological_order()
+        assert order[0] == f"wf{length:05d}"
+        assert len(graph.dependents(f"wf{length:05d}")) == length
+
+    def test_repository_catalog_has_no_cycles(self, repo_root):
+        """The committed catalog can be ordered for deployment."""
+        from generate_catalog import load_catalog_file
+        catalog = load_catalog_file(repo_root / "workflows" / "metadata" / "workflows_catalog.yaml")
+        graph = WorkflowGraph.from_catalog(catalog)
+        assert graph.cycles() == []
+        assert "lead_intake" in graph.dependents("log_event")
+
+
+class TestWorkflowGraphCli:
+    """Test the workflow_graph.py command line."""
+
+    def test_blast_radius_query(self, repo_root):
+        """dependents lists the workflows affected by changing a workflow."""
+        result = subprocess.run(
+            [sys.executable, str(repo_root / "ops" / "scripts" / "workflow_graph.py"),
+             "--catalog", str(repo_root / "workflows" / "metadata" / "workflows_catalog.yaml"),
+             "dependents", "error_central_handler"],
+            capture_output=True, text=True, check=True
+        )
+        assert "lead_intake" in result.stdout.split()
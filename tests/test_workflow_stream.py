@@ -0,0 +1,62 @@
+"""
+Tests for streaming partial parsing of workflow exports.
+"""
+import json
+import pytest
+from pathlib import Path
+
+from workflow_stream import CATALOG_FIELDS, stream_workflow_json
+
+
+def expected_fields(workflow, fields):
+    """Build the expected result: kept keys decoded, others mapped to None."""
+    return {key: (value if key in fields else None) for key, value in workflow.items()}
+
+
+class TestStreamWorkflowJson:
+    """Test stream_workflow_json against json.load."""
+    
+    @pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+    def test_matches_json_load_on_exports(self, workflows_dir, chunk_size):
+        """Test that exported workflows stream to the same kept values."""
+        for workflow_file in sorted((workflows_dir / "active-workflows").glob("*.json")):
+            with open(workflow_file, 'r') as f:
+                workflow = json.load(f)
+            
+            streamed = stream_workflow_json(workflow_file, CATALOG_FIELDS, chunk_size=chunk_size)
+            
+            assert streamed == expected_fields(workflow, CATALOG_FIELDS), workflow_file
+    
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 5])
+    def test_skips_tricky_values(self, tmp_path, chunk_size):
+        """Test escapes, brackets inside strings and scalars across chunk boundaries."""
+        workflow = {
+            "pinData": {"Node": [{"json": {"text": 'quote \\" and } ] { [ "inside"', "n": [1, 2.5e3, None]}}]},
+            "name": "Tricky \"name\" \\",
+            "active": False,
+            "meta": "\\\\",
+            "tags": ["a", {"b": []}],
+            "count": -12,
+        }
+        workflow_file = tmp_path / "tricky.json"
+        workflow_file.write_text(json.dumps(workflow, indent=1))
+        
+        streamed = stream_workflow_json(workflow_file, {"name", "tags", "count"}, chunk_size=chunk_size)
+        
+        assert streamed == expected_fields(workflow, {"name", "tags", "count"})
+    
+    def test_empty_object(self, tmp_path):
+        """Test that an empty object streams to an empty dict."""
+        workflow_file = tmp_path / "empty.json"
+        workflow_file.write_text(" { } ")
+        
+        assert stream_workflow_json(workflow_file) == {}
+    
+    @pytest.mark.parametrize("content", ["", "[]", '{"name": "x"', '{"name" "x"}', '{"nodes": [1, 2}'])
+    def test_malformed_input_raises(self, tmp_path, content):
+        """Test that truncated or malformed files raise ValueError."""
+        workflow_file = tmp_path / "broken.json"
+        workflow_file.write_text(content)
+        
+        with pytest.raises(ValueError):
+            stream_workflow_json(workflow_file)
@@ -1,70 +1,50 @@
 """
 Tests for workflow JSON file structure and naming conventions.
 """
-import json
 import pytest
-from pathlib import Path
 import re
 
 
 class TestWorkflowFileStructure:
     """Test workflow JSON file structure."""
     
-    def test_workflow_files_valid_json(self, workflows_dir):
+    def test_workflow_files_valid_json(self, repo_index):
         """Test that all workflow JSON files are valid JSON."""
-        workflow_files = list(workflows_dir.rglob("*.json"))
-        
-        # Filter out metadata and pack files
-        workflow_files = [f for f in workflow_files 
-                          if "metadata" not in str(f) and "packs" not in str(f)]
-        
-        if len(workflow_files) == 0:
+        if len(repo_index.workflows) == 0:
             pytest.skip("No workflow JSON files found")
         
-        for workflow_file in workflow_files:
-            # Skip empty files (placeholders)
-            if workflow_file.stat().st_size == 0:
-                continue
-                
-            with open(workflow_file, 'r') as f:
-                try:
-                    json.load(f)
-                except json.JSONDecodeError as e:
-                    pytest.fail(f"Invalid JSON in {workflow_file}: {e}")
+        for workflow in repo_index.workflows:
+            if workflow.error:
+                pytest.fail(f"Invalid JSON in {workflow.path}: {workflow.error}")
     
-    def test_workflow_files_have_name(self, workflows_dir):
+    def test_workflow_files_have_name(self, repo_index):
         """Test that workflow files have name field."""
-        workflow_files = list(workflows_dir.rglob("*.json"))
-        workflow_files = [f for f in workflow_files 
-                          if "metadata" not in str(f) and "packs" not in str(f)]
-        
-        if len(workflow_files) == 0:
+        if len(repo_index.workflows) == 0:
             pytest.skip("No workflow JSON files found")
         
-        for workflow_file in workflow_files:
+        for parsed in repo_index.workflows:
             # Skip empty files (placeholders)
-            if workflow_file.stat().st_size == 0:
+            if parsed.empty:
                 continue
-                
-            with open(workflow_file, 'r') as f:
-                workflow = json.load(f)
+            if parsed.error:
+                pytest.fail(f"Invalid JSON in {parsed.path}: {parsed.error}")
+            
+            workflow = parsed.data
             
             # n8n workflows typically have a 'name' field
             # Some may be empty or have different structure
             if len(workflow) > 0:
                 # Check if it's a valid n8n workflow structure
                 assert isinstance(workflow, dict), \
-                    f"{workflow_file} should be a JSON object"
+                    f"{parsed.path} should be a JSON object"
 
 
 class TestWorkflowNamingConventions:
     """Test workflow naming conventions."""
     
-    def test_workflow_file_naming(self, workflows_dir):
+    def test_workflow_file_naming(self, repo_index):
         """Test that workflow files follow naming conventions."""
-        workflow_files = list(workflows_dir.rglob("*.json"))
-        workflow_files = [f for f in workflow_files 
-                          if "metadata" not in str(f) and "packs" not in str(f)]
+        workflow_files = repo_index.workflow_files
         
         if len(workflow_files) == 0:
             pytest.skip("No workflow JSON files found")
@@ -83,22 +63,19 @@ class TestWorkflowNamingConventions:
 class TestWorkflowMetadataRequirements:
     """Test workflow metadata requirements."""
     
-    def test_workflows_have_metadata_if_populated(self, workflows_dir):
+    def test_workflows_have_metadata_if_populated(self, repo_index):
         """Test that populated workflows have metadata."""
-        workflow_files = list(workflows_dir.rglob("*.json"))
-        workflow_files = [f for f in workflow_files 
-                          if "metadata" not in str(f) and "packs" not in str(f)]
-        
-        if len(workflow_files) == 0:
+        if len(repo_index.workflows) == 0:
             pytest.skip("No workflow JSON files found")
         
-        for workflow_file in workflow_files:
+        for parsed in repo_index.workflows:
             # Skip empty files (placeholders)
-            if workflow_file.stat().st_size == 0:
+            if parsed.empty:
                 continue
-                
-            with open(workflow_file, 'r') as f:
-                workflow = json.load(f)
+            if parsed.error:
+                pytest.fail(f"Invalid JSON in {parsed.path}: {parsed.error}")
+            
+            workflow = parsed.data
             
             # If workflow has content, it should have basic structure
             if isinstance(workflow, dict) and len(workflow) > 0:
@@ -107,7 +84,7 @@ class TestWorkflowMetadataRequirements:
                 # Empty files are acceptable (placeholders)
                 if len(workflow) > 1:
                     assert has_structure, \
-                        f"{workflow_file} should have workflow structure (name, nodes, or id)"
+                        f"{parsed.path} should have workflow structure (name, nodes, or id)"
 
 
 class TestMockWorkflowExecution: